@@ -0,0 +1,316 @@
+"""
+Query-count budgets for every GET route of the REST API.
+
+``BUDGETS`` maps a route name (``<basename>-<action>``, see
+``jf_manager_backend/rest_urls.py``) to the number of SQL queries the route
+issues for a superuser at two dataset sizes (``SMALL`` and ``LARGE``, built
+by ``populate()``).  ``test_query_budgets`` requests every registered route
+at both sizes and checks two things:
+
+- ceilings: each size may use at most its budget plus ``CEILING_SLACK``
+  queries, so a harmless extra lookup does not break the build;
+- growth: ``large - small`` must not exceed the budgeted growth.  This check
+  has no slack, it is the one that catches new N+1 queries.
+
+Routes whose query count grows with the data are known N+1 problems and must
+say so with a ``known_n_plus_one`` reason; every other route has equal
+budgets.  New endpoints need a budget (or an ``EXEMPT`` reason).  Set
+``QUERY_BUDGET_REPORT`` to a file name (or ``-`` for stdout) to get a report
+that lists the known N+1 routes separately from the other routes.
+"""
+
+from dataclasses import dataclass
+from datetime import date, time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group as AuthGroup
+from django.urls import reverse
+
+from departments.models import Department, UserDepartmentRole
+from external_sync.models import SyncJob, SyncRun
+from health.dataset import DatasetSize, generate_dataset
+from jf_manager_backend.rest_urls import api
+from members.models import EmailMessage, Event, EventType, Group, Member, MemberList, MemberListEntry, Parent
+from orders.models import EmailLayoutTemplate, EmailTemplate
+from qualifications.models import Qualification, QualificationType, SpecialTask, SpecialTaskType
+from training.models import LibraryBlock, LibraryBlockCategory, LibraryBlockTag, TrainingBlock, TrainingSession
+
+SMALL = DatasetSize(departments=1, members=4, attendances=12, transactions=12, orders=4, items=4)
+LARGE = DatasetSize(departments=2, members=16, attendances=96, transactions=60, orders=16, items=12)
+SIZES = {"small": SMALL, "large": LARGE}
+
+# Extra queries allowed on top of each ceiling; the growth check has no slack
+CEILING_SLACK = 2
+
+
+@dataclass(frozen=True)
+class Budget:
+    small: int
+    large: int
+    query: str = ""  # query string; ``{member}``, ``{year}``, ``{code}`` are filled in
+    known_n_plus_one: str = ""  # why the route issues queries per row; to be fixed, not to be copied
+
+    @property
+    def growth(self) -> int:
+        return self.large - self.small
+
+
+# Detail routes of viewsets without a class-level ``queryset``/``serializer_class``
+ROUTE_MODELS = {
+    "admin-groups": AuthGroup,
+    "department-roles": UserDepartmentRole,
+    "training-blocks": TrainingBlock,
+    "training-library": LibraryBlock,
+}
+
+# Detail routes keyed by something other than the primary key
+ROUTE_PKS = {"email-layout-templates": "general"}
+
+EXEMPT = {
+    "attachment-detail": "Dateianhänge brauchen echte Dateien; nicht Teil der Budget-Daten",
+    "attachment-download": "Dateianhänge brauchen echte Dateien; nicht Teil der Budget-Daten",
+}
+
+BUDGETS = {
+    "admin-groups-detail": Budget(4, 4),
+    "admin-groups-list": Budget(4, 4),
+    "admin-permissions-detail": Budget(1, 1),
+    "admin-permissions-list": Budget(2, 2),
+    "admin-users-detail": Budget(5, 5),
+    "admin-users-list": Budget(4, 4),
+    "attachment-list": Budget(1, 1),
+    "attendance-by-member": Budget(2, 2, "member_id={member}"),
+    "attendance-detail": Budget(1, 1),
+    "attendance-list": Budget(2, 2),
+    "category-detail": Budget(1, 1),
+    "category-items": Budget(13, 33, known_n_plus_one="Bestandssumme je Artikel und Variante"),
+    "category-list": Budget(2, 2),
+    "customuser-detail": Budget(9, 9),
+    "customuser-list": Budget(8, 8),
+    "customuser-me": Budget(2, 2),
+    "department-roles-detail": Budget(2, 2),
+    "department-roles-list": Budget(3, 3),
+    "departments-detail": Budget(1, 1),
+    "departments-list": Budget(2, 2),
+    "email-layout-templates-detail": Budget(1, 1),
+    "email-layout-templates-list": Budget(1, 1),
+    "email-templates-default-content": Budget(0, 0, "template_type=order_created"),
+    "email-templates-detail": Budget(1, 1),
+    "email-templates-layouts": Budget(0, 0),
+    "email-templates-list": Budget(2, 2),
+    "email-templates-types": Budget(0, 0),
+    "email-templates-variables": Budget(0, 0),
+    "emailmessage-detail": Budget(4, 4),
+    "emailmessage-list": Budget(6, 18, known_n_plus_one="Empfänger-Mitglied je Nachricht"),
+    "emailmessage-template-variables": Budget(0, 0),
+    "event-detail": Budget(2, 2),
+    "event-list": Budget(3, 3),
+    "eventtype-detail": Budget(1, 1),
+    "eventtype-list": Budget(2, 2),
+    "group-detail": Budget(1, 1),
+    "group-list": Budget(2, 2),
+    "item-detail": Budget(10, 10),
+    "item-list": Budget(14, 36, known_n_plus_one="Bestandssumme je Artikel und Variante"),
+    "item-scan": Budget(4, 4, "code={code}"),
+    "item-search": Budget(0, 0),
+    "item-stock": Budget(8, 8),
+    "item-variants": Budget(7, 7),
+    "itemvariant-detail": Budget(2, 2),
+    "itemvariant-list": Budget(6, 14, known_n_plus_one="Bestandssumme je Variante"),
+    "itemvariant-search": Budget(0, 0),
+    "itemvariant-stock": Budget(3, 3),
+    "ldap-department-mappings-list": Budget(2, 2),
+    "member-attachments": Budget(4, 4),
+    "member-detail": Budget(4, 4),
+    "member-events": Budget(6, 6),
+    "member-export-excel": Budget(3, 3),
+    "member-list": Budget(12, 36, known_n_plus_one="Gruppenmitglieder und Anwesenheiten je Mitglied"),
+    "member-parents": Budget(4, 4),
+    "member-statistics": Budget(12, 14, known_n_plus_one="Zählung je Gruppe und Status"),
+    "memberlist-attachments": Budget(2, 2),
+    "memberlist-detail": Budget(32, 116, known_n_plus_one="Mitglied, Status und Gruppe je Listeneintrag"),
+    "memberlist-export-excel": Budget(4, 4),
+    "memberlist-list": Budget(4, 4),
+    "oidc-group-mappings-list": Budget(2, 2),
+    "order-by-member": Budget(7, 7, "member_id={member}", known_n_plus_one="Status-Zusammenfassung je Bestellung"),
+    "order-detail": Budget(5, 5),
+    "order-detail-with-history": Budget(7, 11, known_n_plus_one="Statushistorie je Bestellposition"),
+    "order-export": Budget(4, 4),
+    "order-list": Budget(9, 21, known_n_plus_one="Status-Zusammenfassung je Bestellung"),
+    "order-pending": Budget(10, 22, known_n_plus_one="Status-Zusammenfassung je Bestellung"),
+    "order-recent": Budget(8, 14, known_n_plus_one="Status-Zusammenfassung je Bestellung"),
+    "order-statistics": Budget(19, 19),
+    "orderableitem-by-category": Budget(1, 1, "category=Uniformen"),
+    "orderableitem-categories": Budget(1, 1),
+    "orderableitem-detail": Budget(1, 1),
+    "orderableitem-list": Budget(2, 2),
+    "orderableitem-popular": Budget(1, 1),
+    "orderableitem-sizes": Budget(1, 1),
+    "orderitem-detail": Budget(1, 1),
+    "orderitem-history": Budget(2, 2),
+    "orderitem-list": Budget(2, 2),
+    "orderitem-statistics": Budget(5, 5),
+    "orderstatus-active": Budget(1, 1),
+    "orderstatus-detail": Budget(1, 1),
+    "orderstatus-list": Budget(2, 2),
+    "orderstatus-next-statuses": Budget(2, 2),
+    "orderstatus-workflow": Budget(0, 0),
+    "parent-detail": Budget(2, 2),
+    "parent-list": Budget(3, 3),
+    "qualification-specialtask-types-detail": Budget(1, 1),
+    "qualification-specialtask-types-list": Budget(2, 2),
+    "qualification-specialtasks-attachments": Budget(3, 3),
+    "qualification-specialtasks-detail": Budget(2, 2),
+    "qualification-specialtasks-list": Budget(3, 3),
+    "qualification-types-detail": Budget(1, 1),
+    "qualification-types-list": Budget(2, 2),
+    "qualifications-attachments": Budget(3, 3),
+    "qualifications-detail": Budget(2, 2),
+    "qualifications-list": Budget(3, 3),
+    "qualifications-statistics": Budget(8, 8),
+    "service-attendance-chart": Budget(4, 4),
+    "service-attendance-summary": Budget(13, 13),
+    "service-detail": Budget(13, 13),
+    "service-list": Budget(18, 32, known_n_plus_one="Anwesenheitszählung je Dienst"),
+    "service-statistics": Budget(19, 19),
+    "service-year-report": Budget(5, 5),
+    "settings-email": Budget(0, 0),
+    "settings-general": Budget(0, 0),
+    "settings-ldap": Budget(1, 1),
+    "settings-list": Budget(2, 2),
+    "settings-member": Budget(0, 0),
+    "settings-oidc": Budget(1, 1),
+    "settings-order": Budget(0, 0),
+    "settings-permissions": Budget(0, 0),
+    "settings-service": Budget(0, 0),
+    "status-detail": Budget(1, 1),
+    "status-list": Budget(2, 2),
+    "stock-as-of": Budget(6, 6, "date=2025-06-01"),
+    "stock-detail": Budget(2, 2),
+    "stock-ledger-check": Budget(2, 2),
+    "stock-list": Budget(7, 29, known_n_plus_one="Kategorie je Bestandszeile"),
+    "storagelocation-department-rollup": Budget(1, 1),
+    "storagelocation-detail": Budget(1, 1),
+    "storagelocation-for-member": Budget(2, 2),
+    "storagelocation-list": Budget(2, 2),
+    "storagelocation-member-equipment": Budget(4, 4),
+    "storagelocation-rollup": Budget(2, 2),
+    "storagelocation-stock": Budget(5, 5),
+    "sync-jobs-detail": Budget(2, 2),
+    "sync-jobs-garbage-collection-preview": Budget(4, 4),
+    "sync-jobs-list": Budget(3, 3),
+    "sync-runs-detail": Budget(1, 1),
+    "sync-runs-list": Budget(2, 2),
+    "training-blocks-attachments": Budget(3, 3),
+    "training-blocks-detail": Budget(4, 4),
+    "training-blocks-list": Budget(5, 5),
+    "training-blocks-media": Budget(3, 3),
+    "training-library-attachments": Budget(3, 3),
+    "training-library-categories-detail": Budget(1, 1),
+    "training-library-categories-list": Budget(2, 2),
+    "training-library-detail": Budget(3, 3),
+    "training-library-list": Budget(3, 3),
+    "training-library-media": Budget(3, 3),
+    "training-library-tags-detail": Budget(1, 1),
+    "training-library-tags-list": Budget(2, 2),
+    "training-library-usages": Budget(6, 6),
+    "training-sessions-detail": Budget(7, 7),
+    "training-sessions-handout": Budget(7, 7),
+    "training-sessions-list": Budget(6, 6),
+    "transaction-detail": Budget(1, 1),
+    "transaction-discard-statistics": Budget(6, 6),
+    "transaction-list": Budget(2, 2),
+}
+
+
+def populate(size):
+    """Generated data set plus a few rows per member for the apps the generator does not cover."""
+    generate_dataset(size, seed=1)
+    members = list(Member.objects.order_by("pk"))
+    groups = list(Group.objects.order_by("pk"))
+    event_type = EventType.objects.create(name="Geburtstag")
+    member_list = MemberList.objects.create(name="Zeltlager")
+    qualification_type = QualificationType.objects.create(name="Grundlehrgang", expires=True, validity_period=24)
+    task_type = SpecialTaskType.objects.create(name="Jugendsprecher")
+    for index, member in enumerate(members):
+        parent = Parent.objects.create(name="Elternteil", lastname=member.lastname, email=f"eltern{index}@example.com")
+        parent.children.add(member)
+        Event.objects.create(type=event_type, member=member, datetime=date(2025, 5, 1))
+        MemberListEntry.objects.create(member_list=member_list, member=member, checked=index % 2 == 0)
+        Qualification.objects.create(type=qualification_type, member=member, date_acquired=date(2024, 3, 1))
+        SpecialTask.objects.create(task=task_type, member=member, start_date=date(2025, 1, 1))
+        EmailMessage.objects.create(
+            subject=f"Info {index}", body_html="<p>Hallo</p>", recipient_type="individual", recipient_member=member
+        )
+
+    category = LibraryBlockCategory.objects.create(name="Technik")
+    tag = LibraryBlockTag.objects.create(name="Knoten")
+    for index in range(len(members) // 2):
+        library_block = LibraryBlock.objects.create(title=f"Baustein {index}", category=category)
+        library_block.tags.add(tag)
+        session = TrainingSession.objects.create(
+            title=f"Übung {index}", date=date(2025, 6, 1 + index), start_time=time(18), end_time=time(20)
+        )
+        session.groups.set(groups[:2])
+        for position in range(2):
+            block = TrainingBlock.objects.create(
+                session=session, title=f"Block {position}", library_block=library_block, position_order=position
+            )
+            block.groups.set(groups[:1])
+
+    EmailTemplate.objects.create(
+        name="Bestellung", template_type="order_created", subject_template="Bestellung", html_template="<p></p>"
+    )
+    EmailLayoutTemplate.objects.create(layout_type="general", html_content="{{ content }}")
+    group = AuthGroup.objects.create(name="Jugendwarte")
+    user = get_user_model().objects.create_user(username="jugendwart", password="pw12345")
+    role = UserDepartmentRole.objects.create(user=user, department=Department.objects.order_by("pk").first())
+    role.groups.add(group)
+
+    job = SyncJob.objects.create(name="Spond", provider=SyncJob.Provider.SPOND)
+    for _ in range(len(members) // 2):
+        SyncRun.objects.create(job=job, status=SyncRun.Status.SUCCEEDED)
+
+
+def _model_of(basename, viewset):
+    if basename in ROUTE_MODELS:
+        return ROUTE_MODELS[basename]
+    queryset = getattr(viewset, "queryset", None)
+    if queryset is not None:
+        return queryset.model
+    serializer_class = getattr(viewset, "serializer_class", None)
+    meta = getattr(serializer_class, "Meta", None)
+    return getattr(meta, "model", None)
+
+
+def iter_routes():
+    """``(route name, basename, viewset, url kwargs names)`` of every router route answering GET."""
+    for pattern in api.urls:
+        actions = getattr(pattern.callback, "actions", None) or {}
+        if "get" not in actions or "format" in pattern.pattern.regex.groupindex:
+            continue
+        callback = pattern.callback
+        yield pattern.name, callback.initkwargs["basename"], callback.cls, tuple(pattern.pattern.regex.groupindex)
+
+
+def build_path(name, basename, viewset, kwarg_names, context):
+    """URL of the route with the first object of its model as ``pk``; ``None`` if it cannot be built."""
+    kwargs = {}
+    for kwarg in kwarg_names:
+        if kwarg == "pk" and basename in ROUTE_PKS:
+            kwargs["pk"] = ROUTE_PKS[basename]
+        elif kwarg == "pk":
+            model = _model_of(basename, viewset)
+            obj = model._default_manager.order_by("pk").first() if model is not None else None
+            if obj is None:
+                return None
+            kwargs["pk"] = obj.pk
+        elif kwarg == "member_id":
+            kwargs["member_id"] = context["member"]
+        else:
+            return None
+    path = reverse(name, kwargs=kwargs)
+    budget = BUDGETS.get(name)
+    if budget is not None and budget.query:
+        path += "?" + budget.query.format(**context)
+    return path
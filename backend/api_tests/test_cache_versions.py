@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from departments.access import ACCESS_CACHE_VERSION_KEY, bump_access_cache_version, get_access_cache_version
+from departments.models import Department, UserDepartmentRole
+from jf_manager_backend.cache_versions import bump_cache_version, get_cache_version
+
+KEY = "test_cache_versions:version"
+
+
+class CacheVersionTest(SimpleTestCase):
+    def tearDown(self):
+        cache.delete_many([KEY, ACCESS_CACHE_VERSION_KEY])
+
+    def test_bump_changes_the_version(self):
+        version = get_cache_version(KEY)
+        bump_cache_version(KEY)
+        self.assertGreater(get_cache_version(KEY), version)
+
+    def test_evicted_version_does_not_restart_below_used_versions(self):
+        get_cache_version(KEY)
+        bump_cache_version(KEY)
+        used = get_cache_version(KEY)
+
+        cache.delete(KEY)
+        self.assertGreater(get_cache_version(KEY), used)
+
+        cache.delete(KEY)
+        bump_cache_version(KEY)
+        self.assertGreater(get_cache_version(KEY), used)
+
+    def test_access_version_is_not_reused_after_eviction(self):
+        """Access contexts cached before a role revocation must stay unreachable."""
+        bump_access_cache_version()
+        revoked = get_access_cache_version()
+        cache.delete(ACCESS_CACHE_VERSION_KEY)
+        self.assertGreater(get_access_cache_version(), revoked)
+
+
+class CacheVersionTransactionTest(TestCase):
+    def tearDown(self):
+        cache.delete(KEY)
+
+    def test_bump_inside_a_transaction_is_repeated_after_commit(self):
+        """Entries cached from the old rows while the transaction was open must not survive the commit."""
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_cache_version(KEY)
+            during_transaction = get_cache_version(KEY)
+
+        self.assertGreater(get_cache_version(KEY), during_transaction)
+
+    def test_department_role_change_bumps_access_version_after_commit(self):
+        user = get_user_model().objects.create_user(username="cache_version_user", password="pw12345")
+        department = Department.objects.create(name="Abteilung Nord", code="nord")
+        with self.captureOnCommitCallbacks(execute=True):
+            UserDepartmentRole.objects.create(user=user, department=department)
+            during_transaction = get_access_cache_version()
+
+        self.assertGreater(get_access_cache_version(), during_transaction)
@@ -0,0 +1,80 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from inventory.models import Category, Item
+from members.models import Status
+
+
+class ConditionalGetTest(TestCase):
+    URL = "/api/v1/statuses/"
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_superuser(
+            username="etag_admin", email="etag_admin@example.com", password="pw12345"
+        )
+        self.client.force_authenticate(user=self.user)
+        Status.objects.create(name="Aktiv", color="#00ff00")
+
+    def test_matching_etag_returns_304_without_querying_the_collection(self):
+        etag = self.client.get(self.URL)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertFalse(any("members_status" in query["sql"] for query in queries.captured_queries))
+
+    def test_weak_etag_from_proxy_matches(self):
+        etag = self.client.get(self.URL)["ETag"]
+
+        response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=f"W/{etag}")
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_save_and_delete_change_the_etag(self):
+        first = self.client.get(self.URL)["ETag"]
+        status = Status.objects.create(name="Passiv", color="#cccccc")
+        second = self.client.get(self.URL)["ETag"]
+        status.delete()
+
+        response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=second)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_etag_depends_on_user_and_query(self):
+        etag = self.client.get(self.URL)["ETag"]
+        other = get_user_model().objects.create_superuser(
+            username="etag_other", email="etag_other@example.com", password="pw12345"
+        )
+
+        self.assertNotEqual(self.client.get(f"{self.URL}?department=1")["ETag"], etag)
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self.client.get(self.URL, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_category_etag_follows_item_changes(self):
+        category = Category.objects.create(name="Bekleidung")
+        url = "/api/v1/inventory/categories/"
+        etag = self.client.get(url)["ETag"]
+
+        Item.objects.create(name="Jacke", category=category)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"][0]["item_count"], 1)
+
+    def test_retrieve_and_writes(self):
+        status = Status.objects.get()
+        etag = self.client.get(f"{self.URL}{status.pk}/")["ETag"]
+
+        self.assertEqual(self.client.get(f"{self.URL}{status.pk}/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        response = self.client.patch(f"{self.URL}{status.pk}/", {"name": "Aktiv (neu)"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+        self.assertEqual(self.client.get(f"{self.URL}{status.pk}/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
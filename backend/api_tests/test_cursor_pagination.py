@@ -0,0 +1,121 @@
+import base64
+import json
+from datetime import date, datetime, timedelta
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from inventory.models import Item, StorageLocation, Transaction
+from members.models import Event, EventType, Member
+from servicebook.models import Attendance, Service
+
+
+class CursorPaginationTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_superuser(
+            username="cursor_admin", email="cursor_admin@example.com", password="pw12345"
+        )
+        self.client.force_authenticate(user=self.user)
+        member = Member.objects.create(name="Max", lastname="Mustermann")
+        event_type = EventType.objects.create(name="Ehrung")
+        # Many events share a date, so the id tie-breaker decides the order.
+        days = [date(2026, 3, 1)] * 7 + [date(2026, 2, 1), date(2026, 4, 1), date(2026, 1, 1)]
+        for day in days:
+            Event.objects.create(member=member, type=event_type, datetime=day)
+        self.expected = list(Event.objects.order_by("-datetime", "-pk").values_list("pk", flat=True))
+
+    def walk(self, url, direction="next"):
+        ids, pages = [], 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, response.data)
+            self.assertNotIn("count", response.data)
+            page_ids = [row["id"] for row in response.data["results"]]
+            ids = ids + page_ids if direction == "next" else page_ids + ids
+            url = response.data[direction]
+            pages += 1
+        return ids, pages
+
+    def test_walks_forward_without_gaps_or_duplicates(self):
+        ids, pages = self.walk("/api/v1/events/?pagination=cursor&limit=3")
+
+        self.assertEqual(ids, self.expected)
+        self.assertEqual(pages, 4)
+
+    def test_previous_links_walk_back(self):
+        response = self.client.get("/api/v1/events/?pagination=cursor&limit=3")
+        last_page = self.client.get(self.client.get(self.client.get(response.data["next"]).data["next"]).data["next"])
+        self.assertIsNone(last_page.data["next"])
+
+        ids, _ = self.walk(last_page.data["previous"], direction="previous")
+
+        self.assertEqual(ids, self.expected[:9])
+
+    def test_links_keep_filters_and_drop_offset(self):
+        response = self.client.get(
+            f"/api/v1/events/?pagination=cursor&limit=2&offset=4&member={Member.objects.get().pk}"
+        )
+
+        query = parse_qs(urlparse(response.data["next"]).query)
+        self.assertEqual([row["id"] for row in response.data["results"]], self.expected[:2])
+        self.assertNotIn("offset", query)
+        self.assertEqual(query["pagination"], ["cursor"])
+        self.assertIn("member", query)
+
+    def test_offset_pagination_stays_the_default(self):
+        response = self.client.get("/api/v1/events/?limit=3&offset=3")
+
+        self.assertEqual(response.data["count"], 10)
+        self.assertEqual(len(response.data["results"]), 3)
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/api/v1/events/?cursor=kaputt")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_tampered_cursor(self):
+        for position in ({"v": "x", "id": 1, "r": 0}, {"v": None, "id": 1, "r": 0}, {"v": "2026-03-01", "id": "x"}):
+            cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+            with self.subTest(position=position):
+                response = self.client.get(f"/api/v1/events/?cursor={cursor}")
+
+                self.assertEqual(response.status_code, 404)
+                self.assertEqual(response.data["detail"], "Ungültiger Cursor.")
+
+    def test_transaction_journal(self):
+        item = Item.objects.create(name="Helm")
+        depot = StorageLocation.objects.create(name="Kleiderkammer")
+        for quantity in range(1, 8):
+            Transaction.objects.create(transaction_type="IN", item=item, target=depot, quantity=quantity)
+
+        ids, _ = self.walk("/api/v1/inventory/transactions/?pagination=cursor&limit=2")
+
+        self.assertEqual(ids, list(Transaction.objects.order_by("-date", "-pk").values_list("pk", flat=True)))
+
+    def test_rows_without_ordering_value_come_last(self):
+        """Attendances are ordered by their service start, but the service is optional."""
+        member = Member.objects.get()
+        start = timezone.make_aware(datetime(2026, 3, 1, 18, 0))
+        for days in (0, 0, 7, 14):
+            service = Service.objects.create(start=start + timedelta(days=days), end=start + timedelta(days=days))
+            Attendance.objects.create(person=member, service=service, state="A")
+        for _ in range(3):
+            Attendance.objects.create(person=member, state="E")
+        with_service = Attendance.objects.filter(service__isnull=False).order_by("-service__start", "-pk")
+        without_service = Attendance.objects.filter(service__isnull=True).order_by("-pk")
+        expected = [*with_service.values_list("pk", flat=True), *without_service.values_list("pk", flat=True)]
+
+        for limit in (2, 3, 5):
+            with self.subTest(limit=limit):
+                ids, _ = self.walk(f"/api/v1/servicebook/attendances/?pagination=cursor&limit={limit}")
+                self.assertEqual(ids, expected)
+
+                response = self.client.get(f"/api/v1/servicebook/attendances/?pagination=cursor&limit={limit}")
+                while response.data["next"]:
+                    response = self.client.get(response.data["next"])
+                ids, _ = self.walk(response.data["previous"], direction="previous")
+                self.assertEqual(ids, expected[: len(expected) - len(response.data["results"])])
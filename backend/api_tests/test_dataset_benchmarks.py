@@ -0,0 +1,72 @@
+from django.test import TestCase
+
+from departments.models import Department
+from health.benchmarks import BenchmarkContext, compare_reports, measure, select_benchmarks
+from health.dataset import DatasetSize, generate_dataset
+from inventory.ledger import check_stock_ledger
+from servicebook.models import Attendance, AttendanceYearSummary
+
+TINY = DatasetSize(departments=2, members=40, attendances=300, transactions=200, orders=20, items=12)
+
+
+class DatasetGeneratorTest(TestCase):
+    def test_generates_requested_volumes_with_consistent_derived_data(self):
+        counts = generate_dataset(TINY, seed=7)
+
+        self.assertEqual(counts["departments"], 2)
+        self.assertEqual(counts["members"], 40)
+        self.assertEqual(counts["attendances"], 300)
+        self.assertEqual(counts["transactions"], 200)
+        self.assertEqual(counts["orders"], 20)
+        self.assertEqual(Department.objects.get(code="bench-001").members.count(), 20)
+        # bulk_create skips signals: rollup and stock rows are rebuilt afterwards
+        self.assertEqual(
+            sum(summary.total for summary in AttendanceYearSummary.objects.all()), Attendance.objects.count()
+        )
+        report = check_stock_ledger()
+        self.assertEqual(report.drift, [])
+        self.assertEqual(report.negative_balances, 0)
+
+    def test_same_seed_produces_same_rows(self):
+        def fingerprint():
+            return list(Attendance.objects.order_by("pk").values_list("person__lastname", "service__start", "state"))
+
+        generate_dataset(TINY, seed=3)
+        first = fingerprint()
+        Department.objects.filter(code__startswith="bench-").delete()
+        Attendance.objects.all().delete()
+        generate_dataset(TINY, seed=3)
+
+        self.assertEqual(fingerprint()[-len(first) :], first)
+
+
+class BenchmarkSuiteTest(TestCase):
+    def test_measure_records_timings_and_queries(self):
+        generate_dataset(TINY)
+        case = select_benchmarks(["servicebook.top_lists"])[0]
+
+        result = measure(case, BenchmarkContext(), repeat=2)
+
+        self.assertEqual(result["name"], "servicebook.top_lists")
+        self.assertEqual(result["runs"], 2)
+        self.assertEqual(result["queries"], 3)
+        self.assertLessEqual(result["min_ms"], result["max_ms"])
+
+    def test_viewset_cases_answer_200(self):
+        generate_dataset(TINY)
+        context = BenchmarkContext()
+
+        for case in select_benchmarks(["api.*"]):
+            with self.subTest(case=case.name):
+                case.func(context)
+
+    def test_compare_reports(self):
+        baseline = {"results": [{"name": "a", "median_ms": 10.0, "queries": 3}]}
+        current = {
+            "results": [{"name": "a", "median_ms": 12.0, "queries": 5}, {"name": "b", "median_ms": 1.0, "queries": 1}]
+        }
+
+        rows = compare_reports(baseline, current)
+
+        self.assertEqual(rows[0], ("a", 10.0, 12.0, 20.0, 3, 5))
+        self.assertEqual(rows[1], ("b", None, 1.0, None, None, 1))
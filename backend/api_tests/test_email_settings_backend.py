@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from dynamic_preferences.registries import global_preferences_registry
+
+from jf_manager_backend.email_backend import PreferencesEmailBackend, get_default_from_email, get_email_settings
+
+
+class EmailSettingsBackendTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.preferences = global_preferences_registry.manager()
+
+    def test_middleware_no_longer_reloads_preferences(self):
+        self.assertNotIn("jf_manager_backend.email_middleware.EmailConfigMiddleware", settings.MIDDLEWARE)
+
+    @override_settings(EMAIL_HOST="fallback.example.com", DEFAULT_FROM_EMAIL="fallback@example.com")
+    def test_empty_preferences_fall_back_to_settings(self):
+        self.preferences["email__email_host"] = ""
+        self.preferences["email__default_from_email"] = ""
+
+        email_settings = get_email_settings()
+
+        self.assertEqual(email_settings["host"], "fallback.example.com")
+        self.assertEqual(get_default_from_email(), "fallback@example.com")
+
+    def test_snapshot_is_cached_until_preference_changes(self):
+        self.preferences["email__email_host"] = "smtp.one.example.com"
+        self.assertEqual(get_email_settings()["host"], "smtp.one.example.com")
+
+        with self.assertNumQueries(0):
+            get_email_settings()
+
+        self.preferences["email__email_host"] = "smtp.two.example.com"
+        self.assertEqual(get_email_settings()["host"], "smtp.two.example.com")
+
+    def test_backend_uses_preferences_and_explicit_arguments(self):
+        self.preferences["email__email_host"] = "smtp.example.com"
+        self.preferences["email__email_port"] = 2525
+        self.preferences["email__email_use_tls"] = True
+        self.preferences["email__email_use_ssl"] = False
+
+        backend = PreferencesEmailBackend()
+        self.assertEqual(backend.host, "smtp.example.com")
+        self.assertEqual(backend.port, 2525)
+        self.assertTrue(backend.use_tls)
+
+        backend = PreferencesEmailBackend(host="override.example.com")
+        self.assertEqual(backend.host, "override.example.com")
+        self.assertEqual(backend.port, 2525)
+
+    @override_settings(EMAIL_HOST_PASSWORD="fallback-secret")
+    def test_password_is_read_at_connection_time_and_not_cached(self):
+        self.preferences["email__email_host_password"] = "smtp-secret"
+
+        email_settings = get_email_settings()
+
+        self.assertNotIn("password", email_settings)
+        self.assertNotIn("smtp-secret", repr(email_settings))
+        self.assertEqual(PreferencesEmailBackend().password, "smtp-secret")
+
+        self.preferences["email__email_host_password"] = ""
+        self.assertEqual(PreferencesEmailBackend().password, "fallback-secret")
+        self.assertEqual(PreferencesEmailBackend(password="explicit").password, "explicit")
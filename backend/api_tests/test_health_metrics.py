@@ -0,0 +1,99 @@
+import re
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from health.metrics import MetricsRegistry, registry, render_prometheus
+
+
+class RenderPrometheusTest(SimpleTestCase):
+    def test_histogram_buckets_are_cumulative_and_ordered(self):
+        metrics = MetricsRegistry()
+        labels = (("method", "GET"), ("view", "item-list"))
+        metrics.observe("jf_http_db_queries", labels, 3, (1, 5, 10))
+        metrics.observe("jf_http_db_queries", labels, 7, (1, 5, 10))
+
+        text = render_prometheus(metrics.snapshot())
+
+        self.assertIn("# TYPE jf_http_db_queries histogram", text)
+        self.assertIn(
+            'jf_http_db_queries_bucket{method="GET",view="item-list",le="1"} 0\n'
+            'jf_http_db_queries_bucket{method="GET",view="item-list",le="5"} 1\n'
+            'jf_http_db_queries_bucket{method="GET",view="item-list",le="10"} 2\n'
+            'jf_http_db_queries_bucket{method="GET",view="item-list",le="+Inf"} 2\n'
+            'jf_http_db_queries_count{method="GET",view="item-list"} 2\n'
+            'jf_http_db_queries_sum{method="GET",view="item-list"} 10\n',
+            text,
+        )
+
+    def test_label_values_are_escaped(self):
+        metrics = MetricsRegistry()
+        metrics.inc("jf_cache_gets_total", (("result", 'a"b\\c'),))
+
+        self.assertIn('jf_cache_gets_total{result="a\\"b\\\\c"} 1', render_prometheus(metrics.snapshot()))
+
+
+class MetricsEndpointTest(TestCase):
+    URL = "/health/metrics/"
+
+    def setUp(self):
+        registry.reset()
+        self.client = APIClient()
+        user = get_user_model().objects.create_superuser(
+            username="metrics_admin", email="metrics_admin@example.com", password="pw12345"
+        )
+        self.client.force_login(user)
+
+    def sample(self, text, series):
+        match = re.search(rf"^{re.escape(series)} (\S+)$", text, re.MULTILINE)
+        self.assertIsNotNone(match, f"{series} missing")
+        return float(match.group(1))
+
+    def test_records_requests_queries_and_sizes_per_view(self):
+        self.client.get("/api/v1/statuses/")
+        self.client.get("/api/v1/statuses/")
+        self.client.get("/health/")
+
+        response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        text = response.content.decode()
+        labels = 'method="GET",view="status-list"'
+        self.assertEqual(self.sample(text, f'jf_http_requests_total{{{labels},status="200"}}'), 2)
+        self.assertEqual(self.sample(text, f"jf_http_request_duration_seconds_count{{{labels}}}"), 2)
+        self.assertGreater(self.sample(text, f"jf_http_db_queries_sum{{{labels}}}"), 0)
+        self.assertGreater(self.sample(text, f"jf_http_response_size_bytes_sum{{{labels}}}"), 0)
+        self.assertEqual(self.sample(text, 'jf_http_db_queries_sum{method="GET",view="health_check"}'), 0)
+
+    def test_cache_hits_and_misses(self):
+        cache.set("metrics-test", 1)
+        self.client.get("/health/")  # instruments the cache of this thread
+        registry.reset()
+        cache.get("metrics-test")
+        cache.get("metrics-test-missing")
+
+        text = self.client.get(self.URL).content.decode()
+
+        self.assertGreaterEqual(self.sample(text, 'jf_cache_gets_total{result="hit"}'), 1)
+        self.assertGreaterEqual(self.sample(text, 'jf_cache_gets_total{result="miss"}'), 1)
+
+    @override_settings(METRICS_TOKEN="geheim")
+    def test_token(self):
+        self.assertEqual(self.client.get(self.URL).status_code, 403)
+        self.assertEqual(self.client.get(self.URL, HTTP_AUTHORIZATION="Bearer geheim").status_code, 200)
+
+    def test_without_token_only_staff_may_read(self):
+        self.client.logout()
+        self.assertEqual(self.client.get(self.URL).status_code, 403)
+
+        get_user_model().objects.create_user(username="metrics_member", password="pw12345")
+        self.client.login(username="metrics_member", password="pw12345")
+        self.assertEqual(self.client.get(self.URL).status_code, 403)
+
+    @override_settings(METRICS_PUBLIC=True)
+    def test_public_metrics(self):
+        self.client.logout()
+        self.assertEqual(self.client.get(self.URL).status_code, 200)
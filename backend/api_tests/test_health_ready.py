@@ -0,0 +1,128 @@
+import time
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from external_sync.models import SyncJob, SyncRun
+from health import checks
+
+
+def _ok():
+    return {"status": "ok"}
+
+
+def _down():
+    raise ConnectionError("refused")
+
+
+def _hangs():
+    time.sleep(1)
+    return {"status": "ok"}
+
+
+@override_settings(READINESS_PROBE_TIMEOUT=0.2, READINESS_CACHE_SECONDS=60)
+class ReadinessEndpointTest(TestCase):
+    URL = "/health/ready/"
+
+    def setUp(self):
+        checks._cached_report = None
+
+    def _probes(self, **overrides):
+        probes = {name: _ok for name in checks.PROBES}
+        probes.update(overrides)
+        return patch.dict(checks.PROBES, probes)
+
+    def test_all_probes_ok(self):
+        with self._probes():
+            response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "ok")
+        self.assertEqual(set(response.json()["checks"]), {"database", "cache", "queue", "smtp", "sync"})
+
+    def test_failing_database_answers_503(self):
+        with self._probes(database=_down):
+            response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["checks"]["database"]["status"], "error")
+        self.assertIn("refused", response.json()["checks"]["database"]["detail"])
+
+    def test_failing_smtp_only_degrades(self):
+        with self._probes(smtp=_down):
+            response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "warning")
+        self.assertEqual(response.json()["checks"]["smtp"]["status"], "warning")
+
+    def test_hanging_probe_times_out(self):
+        start = time.monotonic()
+        with self._probes(cache=_hangs):
+            response = self.client.get(self.URL)
+
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("Zeitüberschreitung", response.json()["checks"]["cache"]["detail"])
+
+    def test_report_is_cached(self):
+        with self._probes():
+            first = self.client.get(self.URL).json()
+        with self._probes(database=_down):
+            second = self.client.get(self.URL)
+
+        self.assertFalse(first["cached"])
+        self.assertEqual(second.status_code, 200)
+        self.assertTrue(second.json()["cached"])
+        self.assertEqual(second.json()["checked_at"], first["checked_at"])
+
+    def test_liveness_endpoint_does_not_run_probes(self):
+        with self._probes(database=_down):
+            response = self.client.get("/health/")
+
+        self.assertEqual(response.json(), {"status": "ok"})
+        self.assertIsNone(checks._cached_report)
+
+
+class ProbeTest(TestCase):
+    def test_database_reports_latency(self):
+        result = checks.check_database()
+
+        self.assertEqual(result["status"], "ok")
+        self.assertGreaterEqual(result["latency_ms"], 0)
+
+    @override_settings(RQ_QUEUES={})
+    def test_queue_skipped_without_redis(self):
+        self.assertEqual(checks.check_queue(), {"status": "skipped"})
+
+    def test_sync_reports_last_success_and_overdue_jobs(self):
+        now = timezone.now()
+        fresh = SyncJob.objects.create(
+            name="Spond",
+            provider="spond",
+            run_mode=SyncJob.RunMode.INTERVAL,
+            interval_minutes=60,
+            last_success_at=now - timezone.timedelta(minutes=5),
+        )
+        stale = SyncJob.objects.create(
+            name="Kalender",
+            provider="spond",
+            run_mode=SyncJob.RunMode.INTERVAL,
+            interval_minutes=10,
+            last_success_at=now - timezone.timedelta(hours=1),
+        )
+        SyncJob.objects.create(name="Manuell", provider="spond", run_mode=SyncJob.RunMode.MANUAL)
+        SyncRun.objects.create(
+            job=fresh, status=SyncRun.Status.SUCCEEDED, finished_at=now - timezone.timedelta(minutes=5)
+        )
+        SyncRun.objects.create(
+            job=stale, status=SyncRun.Status.SUCCEEDED, finished_at=now - timezone.timedelta(hours=1)
+        )
+        SyncRun.objects.create(job=stale, status=SyncRun.Status.FAILED, finished_at=now)
+
+        result = checks.check_sync()
+
+        self.assertEqual(result["status"], "warning")
+        self.assertAlmostEqual(result["last_success_age_seconds"], 300, delta=30)
+        self.assertEqual([job["name"] for job in result["overdue_jobs"]], ["Kalender"])
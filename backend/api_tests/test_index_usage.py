@@ -0,0 +1,136 @@
+"""
+EXPLAIN-based checks that the hot queries keep using their indexes.
+
+The plans are taken from ``QuerySet.explain()`` and must mention the index by
+name, which holds for SQLite ("SEARCH … USING INDEX name") and PostgreSQL
+("Index Scan using name", "Bitmap Index Scan on name").  PostgreSQL prefers a
+sequential scan on the few rows of a test database, so sequential scans are
+disabled for the transaction there.
+"""
+
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from external_sync.models import SyncBinding, SyncJob
+from inventory.models import Item, StorageLocation, Transaction
+from members.models import EmailMessage, EmailRecipient, Event, Member
+from orders.models import Order, OrderableItem, OrderItem, OrderStatus
+from qualifications.models import Qualification, QualificationType
+
+
+def index_name(model, fields):
+    """Name of the index of ``model`` on exactly ``fields`` (fails loudly if it was removed)."""
+    for index in model._meta.indexes:
+        if list(index.fields) == list(fields):
+            return index.name
+    raise AssertionError(f"{model.__name__} hat keinen Index auf {fields}")
+
+
+class IndexUsageTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = Member.objects.create(name="Erika", lastname="Musterfrau")
+        cls.location = StorageLocation.objects.create(name="Kleiderkammer")
+        cls.status = OrderStatus.objects.create(name="Bestellt", code="index_ordered")
+        cls.job = SyncJob.objects.create(name="Spond", provider="spond")
+        cls.message = EmailMessage.objects.create(subject="Info", body_html="<p>Hallo</p>")
+
+    def setUp(self):
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertUsesIndex(self, queryset, *names):
+        plan = queryset.explain()
+        for name in names:
+            self.assertIn(name, plan, f"Index {name} wird nicht verwendet:\n{plan}\n{queryset.query}")
+
+    def test_transactions_of_a_location_newest_first(self):
+        # Transaction list with ?source= / ?target= in its default ordering: no sort step needed
+        self.assertUsesIndex(
+            Transaction.objects.filter(source=self.location).order_by("-date")[:100],
+            index_name(Transaction, ["source", "-date"]),
+        )
+        self.assertUsesIndex(
+            Transaction.objects.filter(target=self.location).order_by("-date")[:100],
+            index_name(Transaction, ["target", "-date"]),
+        )
+
+    def test_events_of_a_member(self):
+        self.assertUsesIndex(
+            Event.objects.filter(member=self.member).order_by("-datetime"),
+            index_name(Event, ["member", "-datetime"]),
+        )
+        self.assertUsesIndex(Event.objects.order_by("-datetime")[:100], index_name(Event, ["-datetime"]))
+
+    def test_expired_and_expiring_qualifications(self):
+        today = date.today()
+        name = index_name(Qualification, ["date_expires"])
+
+        self.assertUsesIndex(Qualification.objects.filter(date_expires__lt=today), name)
+        self.assertUsesIndex(
+            Qualification.objects.filter(
+                date_expires__gte=today, date_expires__lte=today + timedelta(days=90)
+            ).order_by("date_expires"),
+            name,
+        )
+
+    def test_order_items_in_a_status(self):
+        orders = Order.objects.filter(order_date__lt=timezone.now()).values("pk")
+
+        self.assertUsesIndex(
+            OrderItem.objects.filter(order__in=orders, status=self.status),
+            index_name(OrderItem, ["status", "order"]),
+        )
+
+    def test_sync_bindings_pending_garbage_collection(self):
+        bindings = self.job.bindings.filter(is_deleted_in_source=True, pending_garbage_collection=True)
+
+        self.assertUsesIndex(
+            bindings.order_by("object_type", "external_name", "external_id")[:100],
+            index_name(SyncBinding, ["job", "object_type", "external_name", "external_id"]),
+        )
+
+    def test_recipients_of_a_message_by_status(self):
+        self.assertUsesIndex(
+            EmailRecipient.objects.filter(email_message=self.message, status="failed"),
+            index_name(EmailRecipient, ["email_message", "status"]),
+        )
+
+    def test_member_list_default_ordering(self):
+        self.assertUsesIndex(
+            Member.objects.order_by("lastname", "name")[:100], index_name(Member, ["lastname", "name"])
+        )
+
+    def test_indexed_queries_return_rows(self):
+        """The partial indexes must not hide rows the queries ask for."""
+        qualification_type = QualificationType.objects.create(name="Sprechfunker", expires=True, validity_period=12)
+        Qualification.objects.create(
+            type=qualification_type,
+            member=self.member,
+            date_acquired=date(2020, 1, 1),
+            date_expires=date.today() - timedelta(days=1),
+        )
+        item = Item.objects.create(name="Helm")
+        Transaction.objects.create(transaction_type="IN", item=item, target=self.location, quantity=1)
+        order = Order.objects.create(member=self.member)
+        OrderItem.objects.create(order=order, item=OrderableItem.objects.create(name="Helm"), status=self.status)
+        SyncBinding.objects.create(
+            job=self.job,
+            object_type=SyncBinding.ObjectType.MEMBER,
+            external_id="m-1",
+            content_type_id=1,
+            object_id=self.member.pk,
+            is_deleted_in_source=True,
+            pending_garbage_collection=True,
+        )
+
+        self.assertEqual(Qualification.objects.filter(date_expires__lt=date.today()).count(), 1)
+        self.assertEqual(Transaction.objects.filter(target=self.location).count(), 1)
+        self.assertEqual(OrderItem.objects.filter(status=self.status, order=order).count(), 1)
+        self.assertEqual(
+            self.job.bindings.filter(is_deleted_in_source=True, pending_garbage_collection=True).count(), 1
+        )
@@ -0,0 +1,146 @@
+import threading
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from departments.models import Department, UserDepartmentRole
+from settings_manager.models import LDAPConfig, LDAPDepartmentRoleMapping
+from users import ldap_runtime
+from users.ldap_runtime import LDAPConnectionPool, LDAPPoolTimeout, get_ldap_runtime
+
+User = get_user_model()
+
+
+class LDAPConnectionPoolTests(SimpleTestCase):
+    def test_connections_are_reused(self):
+        factory = mock.Mock(side_effect=lambda: mock.Mock())
+        pool = LDAPConnectionPool(factory, max_size=2)
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(factory.call_count, 1)
+
+    def test_pool_is_bounded(self):
+        pool = LDAPConnectionPool(mock.Mock, max_size=1, acquire_timeout=0.05)
+        pool.acquire()
+
+        with self.assertRaises(LDAPPoolTimeout):
+            pool.acquire()
+
+    def test_waiting_caller_gets_released_connection(self):
+        pool = LDAPConnectionPool(mock.Mock, max_size=1, acquire_timeout=5)
+        connection = pool.acquire()
+        received = []
+
+        waiter = threading.Thread(target=lambda: received.append(pool.acquire()))
+        waiter.start()
+        pool.release(connection)
+        waiter.join(5)
+
+        self.assertEqual(received, [connection])
+
+    def test_discarded_and_idle_connections_are_closed(self):
+        pool = LDAPConnectionPool(mock.Mock, max_size=2, max_idle=0)
+        broken = pool.acquire()
+        pool.release(broken, discard=True)
+        broken.unbind_s.assert_called_once()
+
+        stale = pool.acquire()
+        pool.release(stale)
+        self.assertIsNot(pool.acquire(), stale)
+        stale.unbind_s.assert_called_once()
+        self.assertEqual(pool.size, 1)
+
+    def test_failing_factory_frees_slot(self):
+        pool = LDAPConnectionPool(mock.Mock(side_effect=OSError("down")), max_size=1, acquire_timeout=0.05)
+
+        for _ in range(2):
+            with self.assertRaises(OSError):
+                pool.acquire()
+        self.assertEqual(pool.size, 0)
+
+
+class LDAPRuntimeCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        ldap_runtime._runtime = None
+        self.config = LDAPConfig.get_or_create_default()
+
+    def test_disabled_config_is_compiled_once(self):
+        self.assertIsNone(get_ldap_runtime())
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_ldap_runtime())
+
+    def test_saving_config_recompiles_runtime(self):
+        get_ldap_runtime()
+
+        self.config.server_uri = "ldap://ldap.example.org"
+        self.config.save()
+
+        with mock.patch.object(ldap_runtime, "_compile_runtime", return_value=None) as compile_runtime:
+            get_ldap_runtime()
+            get_ldap_runtime()
+        compile_runtime.assert_called_once()
+
+
+class LDAPDepartmentRoleSyncTests(TestCase):
+    def setUp(self):
+        from users.ldap_backend import ConfigurableLDAPBackend
+
+        self.config = LDAPConfig.get_or_create_default()
+        self.user = User.objects.create_user(username="ldap-sync", password="pw12345!")
+        self.department_a = Department.objects.create(name="Wache A", code="A")
+        self.department_b = Department.objects.create(name="Wache B", code="B")
+        self.readers = Group.objects.create(name="Leser")
+        self.editors = Group.objects.create(name="Bearbeiter")
+
+        self.backend = ConfigurableLDAPBackend()
+        self.backend._runtime = mock.Mock(config_id=self.config.pk)
+
+    def _mapping(self, group_dn, department, groups, revoke=False):
+        mapping = LDAPDepartmentRoleMapping.objects.create(
+            ldap_config=self.config, ldap_group_dn=group_dn, department=department, revoke_on_mismatch=revoke
+        )
+        mapping.auth_groups.set(groups)
+        return mapping
+
+    def _sync(self, group_dns):
+        self.user.ldap_user = mock.Mock(group_dns=group_dns)
+        self.backend._sync_department_roles(self.user)
+
+    def test_merges_groups_and_revokes_unmatched_departments(self):
+        self._mapping("cn=a-read", self.department_a, [self.readers])
+        self._mapping("cn=a-edit", self.department_a, [self.editors])
+        self._mapping("cn=b", self.department_b, [self.readers], revoke=True)
+        UserDepartmentRole.objects.create(user=self.user, department=self.department_b)
+
+        self._sync(["cn=a-read", "cn=a-edit"])
+
+        role = UserDepartmentRole.objects.get(user=self.user, department=self.department_a)
+        self.assertEqual(set(role.groups.all()), {self.readers, self.editors})
+        self.assertFalse(UserDepartmentRole.objects.filter(user=self.user, department=self.department_b).exists())
+
+    def test_revoke_does_not_remove_department_granted_by_other_mapping(self):
+        self._mapping("cn=a-read", self.department_a, [self.readers])
+        self._mapping("cn=a-legacy", self.department_a, [self.editors], revoke=True)
+
+        self._sync(["cn=a-read"])
+
+        role = UserDepartmentRole.objects.get(user=self.user, department=self.department_a)
+        self.assertEqual(list(role.groups.all()), [self.readers])
+
+    def test_unchanged_roles_are_not_rewritten(self):
+        self._mapping("cn=a-read", self.department_a, [self.readers])
+        self._sync(["cn=a-read"])
+
+        # mappings + auth groups, roles + role groups
+        with self.assertNumQueries(4):
+            self._sync(["cn=a-read"])
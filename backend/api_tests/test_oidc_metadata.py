@@ -0,0 +1,136 @@
+import json
+import pickle
+import time
+from unittest import mock
+
+import jwt as pyjwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from settings_manager.models import OIDCConfig
+from users.oidc_metadata import get_discovery_document, get_oidc_client_secret, get_oidc_config
+from users.oidc_views import _verify_id_token
+
+User = get_user_model()
+
+ISSUER = "https://idp.example.com"
+JWKS_URI = "https://idp.example.com/jwks"
+
+
+def _jwk(private_key, kid):
+    data = json.loads(pyjwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    data["kid"] = kid
+    return data
+
+
+def _response(payload):
+    response = mock.Mock()
+    response.json.return_value = payload
+    response.raise_for_status.return_value = None
+    return response
+
+
+class OIDCConfigCacheTests(TestCase):
+    def setUp(self):
+        OIDCConfig.get_or_create_default()
+        cache.clear()
+
+    def test_config_is_cached_and_invalidated_on_save(self):
+        get_oidc_config()
+        with self.assertNumQueries(0):
+            get_oidc_config()
+
+        config = OIDCConfig.get_or_create_default()
+        config.provider_name = "Keycloak"
+        config.save()
+
+        self.assertEqual(get_oidc_config().provider_name, "Keycloak")
+
+    def test_client_secret_is_not_cached(self):
+        config = OIDCConfig.get_or_create_default()
+        config.client_secret = "s3cr3t-client-secret"
+        config.save()
+
+        snapshot = get_oidc_config()
+
+        self.assertFalse(hasattr(snapshot, "client_secret"))
+        self.assertNotIn(b"s3cr3t-client-secret", pickle.dumps(snapshot))
+        self.assertEqual(get_oidc_client_secret(), "s3cr3t-client-secret")
+
+    def test_config_is_memoized_on_request(self):
+        request = mock.Mock(spec=[])
+        first = get_oidc_config(request)
+        self.assertIs(get_oidc_config(request), first)
+
+    def test_permission_checks_do_not_query_oidc_config(self):
+        user = User.objects.create_user(username="oidc_perm", password="pw12345!")
+        get_oidc_config()
+
+        with CaptureQueriesContext(connection) as ctx:
+            user.has_perm("members.view_member")
+
+        tables = " ".join(q["sql"] for q in ctx.captured_queries)
+        self.assertNotIn("settings_manager_oidcconfig", tables)
+
+
+class OIDCDiscoveryAndJWKSCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.config = OIDCConfig.get_or_create_default()
+        self.config.issuer_url = ISSUER
+        self.config.client_id = "jf-manager"
+        self.config.save()
+        self.old_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.new_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.discovery = {"jwks_uri": JWKS_URI}
+
+    def _id_token(self, private_key, kid):
+        claims = {"iss": ISSUER, "aud": "jf-manager", "sub": "abc", "nonce": "n1", "exp": int(time.time()) + 60}
+        return pyjwt.encode(claims, private_key, algorithm="RS256", headers={"kid": kid})
+
+    @mock.patch("users.oidc_metadata.requests.get")
+    def test_discovery_document_is_fetched_once(self, mock_get):
+        mock_get.return_value = _response({"issuer": ISSUER})
+
+        get_discovery_document(ISSUER)
+        get_discovery_document(ISSUER)
+
+        self.assertEqual(mock_get.call_count, 1)
+
+    @mock.patch("users.oidc_metadata.requests.get")
+    def test_cached_jwks_is_reused_across_logins(self, mock_get):
+        mock_get.return_value = _response({"keys": [_jwk(self.old_key, "old")]})
+
+        for _ in range(3):
+            claims = _verify_id_token(self._id_token(self.old_key, "old"), self.discovery, self.config, "n1")
+            self.assertEqual(claims["sub"], "abc")
+
+        self.assertEqual(mock_get.call_count, 1)
+
+    @mock.patch("users.oidc_metadata.OIDC_JWKS_MIN_REFRESH_INTERVAL", 0)
+    @mock.patch("users.oidc_metadata.requests.get")
+    def test_unknown_kid_refreshes_jwks(self, mock_get):
+        mock_get.side_effect = [
+            _response({"keys": [_jwk(self.old_key, "old")]}),
+            _response({"keys": [_jwk(self.old_key, "old"), _jwk(self.new_key, "new")]}),
+        ]
+        _verify_id_token(self._id_token(self.old_key, "old"), self.discovery, self.config, "n1")
+
+        claims = _verify_id_token(self._id_token(self.new_key, "new"), self.discovery, self.config, "n1")
+
+        self.assertEqual(claims["sub"], "abc")
+        self.assertEqual(mock_get.call_count, 2)
+
+    @mock.patch("users.oidc_metadata.requests.get")
+    def test_unknown_kid_refresh_is_rate_limited(self, mock_get):
+        mock_get.return_value = _response({"keys": [_jwk(self.old_key, "old")]})
+        _verify_id_token(self._id_token(self.old_key, "old"), self.discovery, self.config, "n1")
+
+        with self.assertRaises(ValueError):
+            _verify_id_token(self._id_token(self.new_key, "forged"), self.discovery, self.config, "n1")
+
+        self.assertEqual(mock_get.call_count, 1)
@@ -0,0 +1,128 @@
+import json
+import os
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from inventory.models import Item
+from members.models import Member
+from servicebook.models import Service
+
+from .query_budgets import BUDGETS, CEILING_SLACK, EXEMPT, SIZES, build_path, iter_routes, populate
+
+# route -> {"small": queries, "large": queries}
+MEASUREMENTS = {}
+
+
+class QueryBudgetTest(TestCase):
+    """Measures every route at both sizes; each size is populated in a savepoint that is rolled back."""
+
+    def measure_size(self, size_name):
+        populate(SIZES[size_name])
+        user = get_user_model().objects.create_superuser(
+            username="budget_admin", email="budget_admin@example.com", password="pw12345"
+        )
+        context = {
+            "member": Member.objects.order_by("pk").values_list("pk", flat=True).first(),
+            "year": Service.objects.order_by("-start").values_list("start__year", flat=True).first(),
+            "code": Item.objects.order_by("pk").values_list("identifier1", flat=True).first(),
+        }
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        for name, basename, viewset, kwarg_names in iter_routes():
+            if name in EXEMPT:
+                continue
+            with self.subTest(route=name, size=size_name):
+                path = build_path(name, basename, viewset, kwarg_names, context)
+                self.assertIsNotNone(path, f"{name}: URL kann nicht gebaut werden (Testdaten fehlen?)")
+                # Start every route from an empty cache, so the warm-up request fills it without the
+                # LocMem cache culling entries (MAX_ENTRIES) that the measured request would need.
+                cache.clear()
+                client.get(path)  # warm up caches (content types, preferences, cached config)
+                with CaptureQueriesContext(connection) as queries:
+                    response = client.get(path)
+                count = len(queries)
+                MEASUREMENTS.setdefault(name, {})[size_name] = count
+                self.assertEqual(response.status_code, 200, f"GET {path}")
+                budget = BUDGETS.get(name)
+                self.assertIsNotNone(
+                    budget, f"{name}: kein Query-Budget in api_tests/query_budgets.py ({count} Queries)"
+                )
+                limit = getattr(budget, size_name) + CEILING_SLACK
+                self.assertLessEqual(count, limit, f"GET {path}: {count} Queries, Budget {limit}")
+
+    def test_every_get_route_stays_within_its_budget(self):
+        for size_name in SIZES:
+            with transaction.atomic():
+                self.measure_size(size_name)
+                transaction.set_rollback(True)
+
+        for name, counts in MEASUREMENTS.items():
+            budget = BUDGETS.get(name)
+            if budget is None or counts.keys() != SIZES.keys():
+                continue
+            with self.subTest(route=name):
+                growth = counts["large"] - counts["small"]
+                self.assertLessEqual(
+                    growth,
+                    budget.growth,
+                    f"{name}: {counts['small']} → {counts['large']} Queries, erlaubter Zuwachs {budget.growth} (N+1?)",
+                )
+
+
+class BudgetTableTest(SimpleTestCase):
+    def test_growing_routes_are_marked_as_known_n_plus_one(self):
+        for name, budget in BUDGETS.items():
+            with self.subTest(route=name):
+                self.assertGreaterEqual(budget.growth, 0)
+                if budget.growth:
+                    self.assertTrue(budget.known_n_plus_one, f"{name}: Zuwachs {budget.growth} ohne Begründung")
+
+
+def split_report(measurements):
+    """``(known N+1 routes, other routes)``, each sorted by growth (small → large), then by queries."""
+    known, others = [], []
+    for name, counts in measurements.items():
+        budget = BUDGETS.get(name)
+        row = {
+            "route": name,
+            "small": counts.get("small"),
+            "large": counts.get("large"),
+            "growth": counts["large"] - counts["small"] if counts.keys() == SIZES.keys() else None,
+        }
+        if budget is not None and budget.known_n_plus_one:
+            known.append({**row, "reason": budget.known_n_plus_one})
+        else:
+            others.append(row)
+    for rows in (known, others):
+        rows.sort(key=lambda row: (row["growth"] or 0, row["large"] or 0), reverse=True)
+    return known, others
+
+
+def format_row(row):
+    growth = "" if row["growth"] is None else f"({row['growth']:+d})"
+    return f"  {row['route']:<45} {row['small']!s:>4} → {row['large']!s:>4}  {growth}"
+
+
+def tearDownModule():
+    target = os.environ.get("QUERY_BUDGET_REPORT")
+    if not target or not MEASUREMENTS:
+        return
+    known, others = split_report(MEASUREMENTS)
+    report = {"known_n_plus_one": known, "most_queries": others[:15], "routes": MEASUREMENTS}
+    if target == "-":
+        sys.stdout.write("\nQuery-Budgets – bekannte N+1-Routen (small → large):\n")
+        for row in known:
+            sys.stdout.write(f"{format_row(row)}  {row['reason']}\n")
+        sys.stdout.write("\nQuery-Budgets – übrige Routen mit den meisten Queries:\n")
+        for row in others[:15]:
+            sys.stdout.write(f"{format_row(row)}\n")
+    else:
+        with open(target, "w") as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
@@ -0,0 +1,115 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from inventory.models import Item, ItemVariant, StorageLocation, Transaction
+from jf_manager_backend.serializers import parse_field_selection
+from members.models import Member, Parent
+from orders.models import Order, OrderableItem, OrderItem, OrderStatus
+
+
+class ParseFieldSelectionTest(SimpleTestCase):
+    def test_nested_paths(self):
+        self.assertEqual(
+            parse_field_selection("id, name,variants.id,variants.sku,,"),
+            {"id": {}, "name": {}, "variants": {"id": {}, "sku": {}}},
+        )
+
+    def test_whole_field_wins(self):
+        self.assertEqual(parse_field_selection("variants.sku,variants"), {"variants": {}})
+        self.assertEqual(parse_field_selection(""), {})
+
+
+class SparseFieldsetApiTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_superuser(
+            username="sparse_admin", email="sparse_admin@example.com", password="pw12345"
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def create_items(self, count):
+        depot = StorageLocation.objects.get_or_create(name="Kleiderkammer")[0]
+        for index in range(count):
+            item = Item.objects.create(name=f"Jacke {index}", is_variant_parent=True)
+            for size in ("152", "164"):
+                variant = ItemVariant.objects.create(parent_item=item, variant_attributes={"größe": size})
+                Transaction.objects.create(transaction_type="IN", item_variant=variant, target=depot, quantity=2)
+
+    def list_queries(self, url):
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response, len(queries)
+
+    def test_item_typeahead_renders_and_computes_only_id_and_name(self):
+        self.create_items(3)
+        response, few = self.list_queries("/api/v1/inventory/items/?fields=id,name")
+        self.create_items(3)
+        _, more = self.list_queries("/api/v1/inventory/items/?fields=id,name")
+
+        self.assertEqual(set(response.data["results"][0]), {"id", "name"})
+        # No variant prefetch and no total_stock aggregate per item.
+        self.assertEqual(few, more)
+
+    def test_nested_variant_fields(self):
+        self.create_items(1)
+
+        response = self.client.get("/api/v1/inventory/items/?fields=id,variants.sku")
+
+        row = response.data["results"][0]
+        self.assertEqual(set(row), {"id", "variants"})
+        self.assertEqual([set(variant) for variant in row["variants"]], [{"sku"}, {"sku"}])
+
+    def test_expand_adds_complete_nested_fields(self):
+        self.create_items(1)
+
+        response = self.client.get("/api/v1/inventory/items/?fields=id&expand=variants")
+
+        row = response.data["results"][0]
+        self.assertEqual(set(row), {"id", "variants"})
+        self.assertIn("total_stock", row["variants"][0])
+
+    def test_full_representation_without_fields(self):
+        self.create_items(1)
+
+        row = self.client.get("/api/v1/inventory/items/").data["results"][0]
+
+        self.assertIn("total_stock", row)
+        self.assertEqual(len(row["variants"]), 2)
+
+    def test_writes_ignore_fields(self):
+        response = self.client.post("/api/v1/inventory/items/?fields=id", {"name": "Helm"}, format="json")
+
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertIn("name", response.data)
+
+    def test_member_list_skips_alerts_and_parents(self):
+        for index in range(3):
+            member = Member.objects.create(name=f"Kind {index}", lastname="Muster")
+            Parent.objects.create(name="Elternteil", lastname="Muster").children.add(member)
+        response, few = self.list_queries("/api/v1/members/?fields=id,full_name")
+        for index in range(3):
+            Member.objects.create(name=f"Kind {index + 3}", lastname="Muster")
+        _, more = self.list_queries("/api/v1/members/?fields=id,full_name")
+
+        self.assertEqual(set(response.data["results"][0]), {"id", "full_name"})
+        self.assertEqual(few, more)
+
+    def test_order_list_skips_item_summaries(self):
+        status = OrderStatus.objects.create(name="Bestellt", code="sparse_ordered")
+        orderable = OrderableItem.objects.create(name="T-Shirt", category="Bekleidung")
+        member = Member.objects.create(name="Max", lastname="Mustermann")
+        for _ in range(3):
+            order = Order.objects.create(member=member, ordered_by=self.user)
+            OrderItem.objects.create(order=order, item=orderable, status=status, size="M")
+
+        response = self.client.get("/api/v1/orders/?fields=id,member_name,order_date")
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/api/v1/orders/?fields=id,member_name,order_date")
+
+        self.assertEqual(set(response.data["results"][0]), {"id", "member_name", "order_date"})
+        self.assertFalse(any("orders_orderitem" in query["sql"] for query in queries.captured_queries))
@@ -0,0 +1,143 @@
+import copy
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from io import StringIO
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection, connections, transaction
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+
+from jf_manager_backend.db.sqlite3.base import DatabaseWrapper
+
+ALIAS = "sqlite_profile"
+
+
+class SQLiteProfileTest(SimpleTestCase):
+    """The profile needs a database file (WAL does not apply in memory), so every test opens its own."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "profile.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @contextmanager
+    def profile_connection(self, **options):
+        """Registers a connection with the production OPTIONS under ALIAS for the current thread."""
+        settings_dict = copy.deepcopy(connection.settings_dict)
+        settings_dict.update(
+            ENGINE="jf_manager_backend.db.sqlite3",
+            NAME=self.path,
+            OPTIONS={**settings.SQLITE_OPTIONS, **options},
+        )
+        wrapper = DatabaseWrapper(settings_dict, ALIAS)
+        connections[ALIAS] = wrapper
+        try:
+            yield wrapper
+        finally:
+            wrapper.close()
+            del connections[ALIAS]
+
+    def pragma(self, wrapper, name):
+        with wrapper.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def test_new_connections_apply_the_pragmas(self):
+        with self.profile_connection() as wrapper:
+            self.assertEqual(self.pragma(wrapper, "journal_mode"), "wal")
+            self.assertEqual(self.pragma(wrapper, "synchronous"), 1)  # NORMAL
+            self.assertEqual(self.pragma(wrapper, "busy_timeout"), settings.SQLITE_BUSY_TIMEOUT)
+            self.assertEqual(self.pragma(wrapper, "cache_size"), -settings.SQLITE_CACHE_SIZE)
+            self.assertEqual(self.pragma(wrapper, "foreign_keys"), 1)
+
+    def test_atomic_blocks_begin_immediate(self):
+        with (
+            self.profile_connection() as wrapper,
+            CaptureQueriesContext(wrapper) as queries,
+            transaction.atomic(using=ALIAS),
+        ):
+            self.pragma(wrapper, "user_version")
+
+        self.assertEqual(queries.captured_queries[0]["sql"], "BEGIN IMMEDIATE")
+
+    def test_invalid_transaction_mode_is_rejected(self):
+        with self.profile_connection(transaction_mode="LAZY") as wrapper, self.assertRaises(ImproperlyConfigured):
+            wrapper.ensure_connection()
+
+    def test_parallel_readers_and_writers_do_not_lock(self):
+        writers, readers, increments = 4, 4, 25
+        with self.profile_connection() as wrapper, wrapper.cursor() as cursor:
+            cursor.execute("CREATE TABLE counter (id INTEGER PRIMARY KEY, value INTEGER NOT NULL)")
+            cursor.execute("INSERT INTO counter (id, value) VALUES (1, 0)")
+
+        errors = []
+        done = threading.Event()
+        start = threading.Barrier(writers + readers)
+        reads = []
+
+        def write():
+            with self.profile_connection() as wrapper:
+                start.wait()
+                for _ in range(increments):
+                    # Read, then write: with a deferred BEGIN two such transactions deadlock on the upgrade
+                    # to a write lock and one fails with "database is locked" regardless of the busy timeout.
+                    with transaction.atomic(using=ALIAS), wrapper.cursor() as cursor:
+                        cursor.execute("SELECT value FROM counter WHERE id = 1")
+                        value = cursor.fetchone()[0]
+                        time.sleep(0.001)  # let the other writers run between read and write
+                        cursor.execute("UPDATE counter SET value = %s WHERE id = 1", [value + 1])
+
+        def read():
+            with self.profile_connection() as wrapper:
+                start.wait()
+                while not done.is_set():
+                    with wrapper.cursor() as cursor:
+                        cursor.execute("SELECT value FROM counter WHERE id = 1")
+                        reads.append(cursor.fetchone()[0])
+
+        def guarded(target):
+            def run():
+                try:
+                    target()
+                except Exception as exc:  # collected and asserted below
+                    errors.append(exc)
+                    if start.n_waiting:
+                        start.abort()
+
+            return threading.Thread(target=run)
+
+        writer_threads = [guarded(write) for _ in range(writers)]
+        reader_threads = [guarded(read) for _ in range(readers)]
+        for thread in writer_threads + reader_threads:
+            thread.start()
+        for thread in writer_threads:
+            thread.join(timeout=60)
+        done.set()
+        for thread in reader_threads:
+            thread.join(timeout=60)
+
+        self.assertEqual(errors, [])
+        with self.profile_connection() as wrapper, wrapper.cursor() as cursor:
+            cursor.execute("SELECT value FROM counter WHERE id = 1")
+            self.assertEqual(cursor.fetchone()[0], writers * increments)
+        self.assertTrue(reads)
+        self.assertLessEqual(max(reads), writers * increments)
+
+    def test_optimize_command_checkpoints_the_wal(self):
+        with self.profile_connection() as wrapper, wrapper.cursor() as cursor:
+            cursor.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+            cursor.executemany("INSERT INTO t (id) VALUES (%s)", [(i,) for i in range(100)])
+            self.assertGreater(os.path.getsize(self.path + "-wal"), 0)
+
+            call_command("optimize_sqlite", database=ALIAS, stdout=StringIO())
+
+            self.assertEqual(os.path.getsize(self.path + "-wal"), 0)
@@ -0,0 +1,54 @@
+import csv
+import io
+from unittest import mock
+
+import openpyxl
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from members.models import Member, Parent
+from orders.models import Order, OrderableItem, OrderItem, OrderStatus
+
+
+class StreamingExportTest(TestCase):
+    """Exports read their rows with iterator(chunk_size=...); prefetches must still apply to every chunk."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_superuser(
+            username="export_admin", email="export_admin@example.com", password="pw12345"
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_order_csv_contains_every_item_across_chunks(self):
+        status = OrderStatus.objects.create(name="Bestellt", code="export_ordered")
+        orderable = OrderableItem.objects.create(name="T-Shirt", category="Bekleidung")
+        for index in range(5):
+            member = Member.objects.create(name=f"Max{index}", lastname="Mustermann")
+            order = Order.objects.create(member=member, ordered_by=self.user)
+            for size in ("M", "L"):
+                OrderItem.objects.create(order=order, item=orderable, status=status, size=size)
+
+        # permissions + orders, then items, items__item and items__status once per chunk of 2 orders
+        with mock.patch("orders.api.viewsets.order.EXPORT_CHUNK_SIZE", 2), self.assertNumQueries(2 + 3 * 3):
+            response = self.client.get("/api/v1/orders/export/")
+
+        rows = list(csv.reader(io.StringIO(response.content.decode())))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(rows), 1 + 10)
+        self.assertEqual({row[7] for row in rows[1:]}, {"M", "L"})
+
+    def test_member_excel_contains_every_member_across_chunks(self):
+        for index in range(5):
+            member = Member.objects.create(name=f"Erika{index}", lastname="Musterfrau")
+            Parent.objects.create(name="Eva", lastname="Musterfrau").children.add(member)
+
+        with mock.patch("members.api.viewsets.member_viewsets.EXPORT_CHUNK_SIZE", 2):
+            response = self.client.get("/api/v1/members/export-excel/?columns=name,parent1_name")
+
+        self.assertEqual(response.status_code, 200)
+        sheet = openpyxl.load_workbook(io.BytesIO(response.content)).active
+        self.assertEqual(sheet.max_row, 1 + 5)
+        self.assertEqual({row[0].value for row in sheet.iter_rows(min_row=2)}, {f"Erika{i}" for i in range(5)})
+        self.assertEqual({row[1].value for row in sheet.iter_rows(min_row=2)}, {"Eva"})
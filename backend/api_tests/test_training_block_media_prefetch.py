@@ -0,0 +1,98 @@
+from datetime import date, time
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from departments.models import Department
+from members.models import Attachment
+from training.models import LibraryBlock, TrainingBlock, TrainingMedia, TrainingSession
+
+
+class TrainingBlockMediaPrefetchTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_superuser(
+            username="training_prefetch_admin", email="training_prefetch_admin@example.com", password="pw12345"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.session = TrainingSession.objects.create(
+            title="Funkübung",
+            date=date(2030, 4, 10),
+            start_time=time(18, 0),
+            end_time=time(20, 0),
+            department=Department.objects.create(name="Abteilung West", code="west"),
+            created_by=self.user,
+        )
+
+    def add_block(self, title, media=1, attachments=1):
+        block = TrainingBlock.objects.create(title=title, session=self.session, duration_minutes=15)
+        content_type = ContentType.objects.get_for_model(block)
+        for index in range(media):
+            TrainingMedia.objects.create(
+                content_type=content_type,
+                object_id=block.pk,
+                file=f"training/images/{title}-{index}.jpg",
+                original_filename=f"{title}-{index}.jpg",
+                status=TrainingMedia.Status.READY,
+            )
+        for index in range(attachments):
+            Attachment.objects.create(
+                content_type=content_type,
+                object_id=block.pk,
+                name=f"{title}-{index}",
+                file=SimpleUploadedFile(f"{title}-{index}.txt", b"x"),
+            )
+        return block
+
+    def handout_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"/api/v1/training/sessions/{self.session.pk}/handout/")
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_handout_query_count_does_not_grow_with_blocks(self):
+        self.add_block("Lagekarte")
+        self.handout_queries()  # warm up the ContentType cache
+        _, baseline = self.handout_queries()
+
+        for index in range(5):
+            self.add_block(f"Block{index}", media=2, attachments=2)
+        response, queries = self.handout_queries()
+
+        self.assertEqual(queries, baseline)
+        self.assertEqual(len(response.data["blocks"]), 6)
+        self.assertEqual(sum(len(block["media"]) for block in response.data["blocks"]), 11)
+        self.assertEqual(sum(len(block["attachments"]) for block in response.data["blocks"]), 11)
+
+    def test_media_is_grouped_per_block(self):
+        first = self.add_block("Erste", media=2, attachments=0)
+        second = self.add_block("Zweite", media=0, attachments=1)
+
+        response = self.client.get("/api/v1/training/blocks/", {"session": self.session.pk})
+
+        rows = response.data["results"] if isinstance(response.data, dict) else response.data
+        by_id = {row["id"]: row for row in rows}
+        self.assertEqual(len(by_id[first.pk]["media"]), 2)
+        self.assertEqual(by_id[first.pk]["attachments"], [])
+        self.assertEqual(by_id[second.pk]["media"], [])
+        self.assertEqual(len(by_id[second.pk]["attachments"]), 1)
+
+    def test_library_export_includes_media(self):
+        block = LibraryBlock.objects.create(title="Knoten", created_by=self.user)
+        TrainingMedia.objects.create(
+            content_type=ContentType.objects.get_for_model(block),
+            object_id=block.pk,
+            file="training/images/knoten.jpg",
+            original_filename="knoten.jpg",
+        )
+
+        response = self.client.post("/api/v1/training/library/export_blocks/", {"ids": [block.pk]}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        [exported] = response.data["blocks"]
+        self.assertEqual([media["original_filename"] for media in exported["media"]], ["knoten.jpg"])
@@ -0,0 +1,127 @@
+import io
+import shutil
+import tempfile
+from datetime import date, time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from departments.models import Department
+from training.media import process_media_id
+from training.models import TrainingBlock, TrainingMedia, TrainingSession
+
+
+def make_image(size, image_format="JPEG", mode="RGB"):
+    buffer = io.BytesIO()
+    Image.new(mode, size, (200, 30, 30, 128) if mode == "RGBA" else (200, 30, 30)).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+class TrainingMediaPipelineTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root, RQ_QUEUES={})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_superuser(
+            username="training_media_admin", email="training_media_admin@example.com", password="pw12345"
+        )
+        self.client.force_authenticate(user=self.user)
+        session = TrainingSession.objects.create(
+            title="Funkübung",
+            date=date(2030, 4, 10),
+            start_time=time(18, 0),
+            end_time=time(20, 0),
+            department=Department.objects.create(name="Abteilung West", code="west"),
+            created_by=self.user,
+        )
+        self.block = TrainingBlock.objects.create(title="Lagekarte", session=session, duration_minutes=30)
+
+    def upload(self, content, name="foto.jpg", content_type="image/jpeg"):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                f"/api/v1/training/blocks/{self.block.id}/upload_image/",
+                {"image": SimpleUploadedFile(name, content, content_type=content_type)},
+                format="multipart",
+            )
+
+    def test_upload_stores_original_and_renders_after_commit(self):
+        response = self.upload(make_image((3000, 2000)))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data["width"], response.data["height"]), (3000, 2000))
+        media = TrainingMedia.objects.get(pk=response.data["id"])
+        self.assertEqual(media.status, TrainingMedia.Status.READY)
+        with media.file.open("rb") as original, Image.open(original) as img:
+            self.assertEqual(img.size, (3000, 2000))
+        self.assertEqual(
+            {name: (rendition["width"], rendition["height"]) for name, rendition in media.renditions.items()},
+            {"large": (1200, 800), "medium": (600, 400), "thumb": (320, 213)},
+        )
+        with default_storage.open(media.renditions["thumb"]["webp"]) as webp, Image.open(webp) as img:
+            self.assertEqual(img.format, "WEBP")
+
+        listed = self.client.get(f"/api/v1/training/blocks/{self.block.id}/media/").data[0]
+        self.assertTrue(listed["url"].endswith("_large.jpg"))
+        self.assertEqual(listed["renditions"]["medium"]["width"], 600)
+
+    def test_upload_is_processed_inline_when_the_queue_is_down(self):
+        queues = {"default": {"HOST": "localhost", "PORT": 6379, "DB": 0}}
+        with (
+            override_settings(RQ_QUEUES=queues),
+            mock.patch("training.tasks.process_training_media.delay", side_effect=ConnectionError("Redis down")),
+            self.assertLogs("training.media", level="ERROR"),
+        ):
+            response = self.upload(make_image((800, 600)))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(TrainingMedia.objects.get(pk=response.data["id"]).status, TrainingMedia.Status.READY)
+
+    def test_embedded_original_url_is_replaced_by_rendition(self):
+        response = self.client.post(
+            f"/api/v1/training/blocks/{self.block.id}/upload_image/",
+            {"image": SimpleUploadedFile("foto.jpg", make_image((1600, 900)), content_type="image/jpeg")},
+            format="multipart",
+        )
+        media = TrainingMedia.objects.get(pk=response.data["id"])
+        self.assertEqual(media.status, TrainingMedia.Status.PENDING)
+        TrainingBlock.objects.filter(pk=self.block.pk).update(content=f'<p><img src="{response.data["url"]}"></p>')
+
+        self.assertEqual(process_media_id(media.pk), TrainingMedia.Status.READY)
+        self.block.refresh_from_db()
+        media.refresh_from_db()
+        self.assertIn(default_storage.url(media.renditions["large"]["file"]), self.block.content)
+        self.assertNotIn(response.data["url"], self.block.content)
+
+    def test_small_transparent_images_are_not_upscaled(self):
+        response = self.upload(make_image((400, 300), "PNG", "RGBA"), name="logo.png", content_type="image/png")
+
+        media = TrainingMedia.objects.get(pk=response.data["id"])
+        self.assertEqual(media.renditions["large"]["width"], 400)
+        self.assertTrue(media.renditions["large"]["file"].endswith(".png"))
+
+    def test_unreadable_image_is_rejected(self):
+        response = self.upload(b"not an image")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(TrainingMedia.objects.exists())
+
+    def test_delete_removes_original_and_renditions(self):
+        response = self.upload(make_image((800, 600)))
+        media = TrainingMedia.objects.get(pk=response.data["id"])
+        names = [media.file.name, *media.rendition_names()]
+
+        response = self.client.delete(
+            f"/api/v1/training/blocks/{self.block.id}/media/", QUERY_STRING=f"media_id={media.pk}"
+        )
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(any(default_storage.exists(name) for name in names))
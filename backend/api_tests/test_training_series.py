@@ -0,0 +1,149 @@
+from datetime import date, time
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from departments.models import Department
+from members.models import Group, Member
+from servicebook.models import Attendance, Service
+from training.models import TrainingSession
+from training.recurrence import MAX_OCCURRENCES, compute_occurrences
+
+
+class ComputeOccurrencesTest(SimpleTestCase):
+    def test_weekly_and_biweekly(self):
+        self.assertEqual(
+            compute_occurrences(date(2026, 5, 1), "WEEKLY", date(2026, 5, 22)),
+            [date(2026, 5, 8), date(2026, 5, 15), date(2026, 5, 22)],
+        )
+        self.assertEqual(
+            compute_occurrences(date(2026, 5, 1), "BIWEEKLY", date(2026, 5, 28)),
+            [date(2026, 5, 15)],
+        )
+
+    def test_monthly_keeps_the_day_of_month(self):
+        self.assertEqual(
+            compute_occurrences(date(2026, 1, 31), "MONTHLY", date(2026, 4, 30)),
+            [date(2026, 2, 28), date(2026, 3, 31), date(2026, 4, 30)],
+        )
+
+    def test_invalid_series(self):
+        with self.assertRaises(ValueError):
+            compute_occurrences(date(2026, 1, 1), "DAILY", date(2026, 2, 1))
+        with self.assertRaises(ValueError):
+            compute_occurrences(date(2026, 1, 1), "WEEKLY", date(2026 + MAX_OCCURRENCES // 50, 1, 1))
+
+
+class GenerateSeriesTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_superuser(
+            username="training_series_admin", email="training_series_admin@example.com", password="pw12345"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.parent = TrainingSession.objects.create(
+            title="Gerätekunde",
+            date=date(2026, 1, 2),
+            start_time=time(18, 0),
+            end_time=time(20, 0),
+            department=Department.objects.create(name="Abteilung Nord", code="nord"),
+            recurrence_rule={"frequency": "WEEKLY", "end_date": "2026-12-31"},
+            created_by=self.user,
+        )
+        self.groups = [Group.objects.create(name="Gruppe 1"), Group.objects.create(name="Gruppe 2")]
+        self.parent.groups.set(self.groups)
+        self.url = f"/api/v1/training/sessions/{self.parent.pk}/generate_series/"
+
+    def generate(self, **rule):
+        if rule:
+            TrainingSession.objects.filter(pk=self.parent.pk).update(
+                recurrence_rule={**self.parent.recurrence_rule, **rule}
+            )
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 201, response.data)
+        return response.data
+
+    def test_year_long_series_is_written_in_bulk(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.generate()
+
+        self.assertEqual(data["created"], 51)
+        self.assertLess(len(queries), 25)
+        children = TrainingSession.objects.filter(series_parent=self.parent)
+        self.assertEqual(TrainingSession.groups.through.objects.filter(trainingsession__in=children).count(), 102)
+        self.assertEqual(Service.objects.filter(training_session__in=children).count(), 51)
+        service = Service.objects.get(training_session__date=date(2026, 1, 9))
+        self.assertEqual((service.topic, service.department_id), ("Gerätekunde", self.parent.department_id))
+
+    def test_regenerating_keeps_existing_children_and_their_attendance(self):
+        self.generate()
+        child = TrainingSession.objects.get(series_parent=self.parent, date=date(2026, 1, 9))
+        Attendance.objects.create(
+            person=Member.objects.create(name="Max", lastname="Mustermann"),
+            service=child.servicebook_entry,
+            state="A",
+        )
+
+        data = self.generate()
+
+        self.assertEqual((data["created"], data["kept"], data["removed"]), (0, 51, 0))
+        self.assertTrue(Attendance.objects.filter(service__training_session=child).exists())
+
+    def test_regenerating_applies_parent_changes_to_kept_children(self):
+        self.generate()
+        child = TrainingSession.objects.get(series_parent=self.parent, date=date(2026, 1, 9))
+        Attendance.objects.create(
+            person=Member.objects.create(name="Max", lastname="Mustermann"),
+            service=child.servicebook_entry,
+            state="A",
+        )
+        self.parent.title = "Knotenkunde"
+        self.parent.start_time = time(17, 30)
+        self.parent.location = "Gerätehaus"
+        self.parent.save()
+        self.parent.groups.set(self.groups[:1])
+
+        data = self.generate()
+
+        self.assertEqual((data["created"], data["kept"], data["removed"]), (0, 51, 0))
+        child.refresh_from_db()
+        self.assertEqual((child.title, child.start_time, child.location), ("Knotenkunde", time(17, 30), "Gerätehaus"))
+        self.assertEqual(list(child.groups.all()), self.groups[:1])
+        service = child.servicebook_entry
+        self.assertEqual((service.topic, service.place), ("Knotenkunde", "Gerätehaus"))
+        self.assertEqual(timezone.localtime(service.start).time(), time(17, 30))
+        self.assertTrue(service.attendance_set.exists())
+        children = TrainingSession.objects.filter(series_parent=self.parent)
+        self.assertEqual(children.exclude(start_time=time(17, 30)).count(), 0)
+        self.assertEqual(Service.objects.filter(training_session__in=children, topic="Knotenkunde").count(), 51)
+
+    def test_shortened_series_removes_dropped_dates(self):
+        self.generate()
+        attended = TrainingSession.objects.get(series_parent=self.parent, date=date(2026, 12, 25))
+        Attendance.objects.create(
+            person=Member.objects.create(name="Erika", lastname="Musterfrau"),
+            service=attended.servicebook_entry,
+            state="E",
+        )
+        attended_service_id = attended.servicebook_entry.pk
+
+        data = self.generate(end_date="2026-06-30")
+
+        self.assertEqual((data["created"], data["kept"], data["removed"]), (0, 25, 26))
+        self.assertEqual(len(data["session_ids"]), 25)
+        # Services with recorded attendance survive, unlinked; the others are gone.
+        self.assertEqual(Service.objects.filter(training_session__isnull=True).count(), 1)
+        self.assertIsNone(Service.objects.get(pk=attended_service_id).training_session_id)
+
+    def test_unknown_frequency_is_rejected(self):
+        TrainingSession.objects.filter(pk=self.parent.pk).update(
+            recurrence_rule={"frequency": "DAILY", "end_date": "2026-02-01"}
+        )
+
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, 400)
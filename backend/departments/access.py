@@ -0,0 +1,103 @@
+"""
+Per-request department access context.
+
+Department ids and department-role permission codenames of a user are needed
+several times per API request (permission check, queryset scoping, create
+defaults).  ``get_department_access()`` resolves them once per request and backs
+the lookup with a versioned cache entry, so repeated requests of the same user
+do not touch ``UserDepartmentRole`` / group permissions at all.
+
+The cache version is bumped by ``departments.signals`` whenever department
+roles, their groups or the groups' permissions change.
+"""
+
+from dataclasses import dataclass, field
+
+from django.core.cache import cache
+
+from jf_manager_backend.cache_versions import bump_cache_version, get_cache_version
+
+ACCESS_CACHE_VERSION_KEY = "department_access:version"
+ACCESS_CACHE_TIMEOUT = 300
+
+_REQUEST_ATTR = "_department_access_context"
+
+
+@dataclass(frozen=True)
+class DepartmentAccessContext:
+    """Department ids and role codenames of one user, resolved once per request."""
+
+    is_org_wide: bool = False
+    # department id -> permission codenames granted through that department role
+    role_codenames: dict = field(default_factory=dict)
+
+    @property
+    def department_ids(self) -> list:
+        """Department PKs the user is explicitly assigned to."""
+        return list(self.role_codenames)
+
+    def codenames_for(self, department_id=None) -> set:
+        """Role codenames of one department, or of all departments if none is given."""
+        if department_id is not None:
+            return set(self.role_codenames.get(department_id, ()))
+        codenames = set()
+        for department_codenames in self.role_codenames.values():
+            codenames.update(department_codenames)
+        return codenames
+
+
+def get_access_cache_version() -> int:
+    return get_cache_version(ACCESS_CACHE_VERSION_KEY)
+
+
+def bump_access_cache_version():
+    """Invalidate all cached access contexts."""
+    bump_cache_version(ACCESS_CACHE_VERSION_KEY)
+
+
+def _load_role_codenames(user) -> dict:
+    from .models import UserDepartmentRole
+
+    role_codenames = {}
+    rows = UserDepartmentRole.objects.filter(user=user).values_list("department_id", "groups__permissions__codename")
+    for department_id, codename in rows:
+        codenames = role_codenames.setdefault(department_id, set())
+        if codename:
+            codenames.add(codename)
+    return {department_id: sorted(codenames) for department_id, codenames in role_codenames.items()}
+
+
+def _cached_role_codenames(user) -> dict:
+    key = f"department_access:v{get_access_cache_version()}:user:{user.pk}"
+    role_codenames = cache.get(key)
+    if role_codenames is None:
+        role_codenames = _load_role_codenames(user)
+        cache.set(key, role_codenames, ACCESS_CACHE_TIMEOUT)
+    return role_codenames
+
+
+def get_department_access(user, request=None) -> DepartmentAccessContext:
+    """
+    Return the access context of ``user``.
+
+    When ``request`` is given the context is memoized on it, so permission
+    classes and viewset mixins share a single lookup per request.
+    """
+    if request is not None:
+        context = getattr(request, _REQUEST_ATTR, None)
+        if context is not None:
+            return context
+
+    if not user or not user.is_authenticated:
+        context = DepartmentAccessContext()
+    else:
+        context = DepartmentAccessContext(
+            is_org_wide=(user.is_staff or user.is_superuser or user.has_perm("departments.can_access_all_departments")),
+            role_codenames={
+                department_id: frozenset(codenames) for department_id, codenames in _cached_role_codenames(user).items()
+            },
+        )
+
+    if request is not None:
+        setattr(request, _REQUEST_ATTR, context)
+    return context
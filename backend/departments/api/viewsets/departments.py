@@ -4,9 +4,10 @@ from rest_framework import filters, permissions, viewsets
 from departments.api.filters import DepartmentFilter
 from departments.api.serializers.department import DepartmentSerializer
 from departments.models import Department
+from jf_manager_backend.mixins import CollectionETagViewSetMixin
 
 
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(CollectionETagViewSetMixin, viewsets.ModelViewSet):
     """
     Manage departments.
 
@@ -21,6 +22,7 @@ class DepartmentViewSet(viewsets.ModelViewSet):
     search_fields = ["name", "code"]
     ordering_fields = ["name", "created_at"]
     ordering = ["name"]
+    etag_models = [Department]
 
     def get_queryset(self):
         user = self.request.user
@@ -25,6 +25,16 @@ they actually belong to.
 
 from rest_framework.exceptions import PermissionDenied, ValidationError
 
+from departments.access import get_department_access
+
+
+def _department_access(view, user):
+    """Return the access context of the user, shared across the view's request."""
+    request = getattr(view, "request", None)
+    if request is not None and request.user is user:
+        return get_department_access(user, request)
+    return get_department_access(user)
+
 
 class DepartmentScopeViewSetMixin:
     """Mixin for department-aware filtering in DRF ViewSets."""
@@ -46,11 +56,11 @@ class DepartmentScopeViewSetMixin:
 
     def _user_is_org_wide(self, user) -> bool:
         """Return True if the user has unrestricted cross-department access."""
-        return user.is_staff or user.is_superuser or user.has_perm("departments.can_access_all_departments")
+        return _department_access(self, user).is_org_wide
 
     def _user_department_ids(self, user) -> list:
         """Return list of department PKs the user is explicitly assigned to."""
-        return list(user.department_roles.values_list("department_id", flat=True))
+        return _department_access(self, user).department_ids
 
     def _resolve_requested_department(self, user):
         """
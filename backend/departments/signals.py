@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from jf_manager_backend.etags import track_collection_versions
+
+from .access import bump_access_cache_version
+from .models import Department, UserDepartmentRole
+
+track_collection_versions(Department)
+
+
+@receiver(post_save, sender=UserDepartmentRole)
+@receiver(post_delete, sender=UserDepartmentRole)
+def department_role_changed(sender, instance, **kwargs):
+    """Invalidate cached access contexts when a department assignment changes"""
+    bump_access_cache_version()
+
+
+@receiver(m2m_changed, sender=UserDepartmentRole.groups.through)
+@receiver(m2m_changed, sender=Group.permissions.through)
+def department_role_permissions_changed(sender, action, **kwargs):
+    """Invalidate cached access contexts when role groups or group permissions change"""
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_access_cache_version()
+
+
+@receiver(post_delete, sender=Group)
+def group_deleted(sender, instance, **kwargs):
+    """Invalidate cached access contexts when a group (and its role links) is removed"""
+    bump_access_cache_version()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def user_created(sender, instance, created, **kwargs):
+    """Invalidate cached access contexts for new users, so entries of reused primary keys never apply"""
+    if created:
+        bump_access_cache_version()
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def user_deleted(sender, instance, **kwargs):
+    """Invalidate cached access contexts when a user is removed"""
+    bump_access_cache_version()
@@ -0,0 +1,73 @@
+"""
+Tests for the per-request department access context.
+
+Covers:
+  - department ids and role codenames are resolved from roles/groups
+  - the context is memoized per request and cached across requests
+  - role, group and group-permission changes invalidate the cache
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from departments.access import get_department_access
+from departments.models import Department, UserDepartmentRole
+
+User = get_user_model()
+
+
+class DepartmentAccessContextTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.dept_a = Department.objects.create(name="Abteilung A", code="dept-a")
+        cls.dept_b = Department.objects.create(name="Abteilung B", code="dept-b")
+        cls.group = Group.objects.create(name="Jugendwart")
+        cls.group.permissions.add(Permission.objects.get(codename="view_member"))
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="scoped", password="pw")
+        self.role_a = UserDepartmentRole.objects.create(user=self.user, department=self.dept_a)
+        self.role_a.groups.add(self.group)
+        UserDepartmentRole.objects.create(user=self.user, department=self.dept_b)
+
+    def test_resolves_department_ids_and_codenames(self):
+        access = get_department_access(self.user)
+
+        self.assertFalse(access.is_org_wide)
+        self.assertCountEqual(access.department_ids, [self.dept_a.id, self.dept_b.id])
+        self.assertEqual(access.codenames_for(self.dept_a.id), {"view_member"})
+        self.assertEqual(access.codenames_for(self.dept_b.id), set())
+        self.assertEqual(access.codenames_for(), {"view_member"})
+
+    def test_memoized_per_request_and_cached_across_requests(self):
+        request = APIRequestFactory().get("/")
+        first = get_department_access(self.user, request)
+        with self.assertNumQueries(0):
+            self.assertIs(get_department_access(self.user, request), first)
+
+        # A fresh request of the same user is served from the cache
+        fresh_user = User.objects.get(pk=self.user.pk)
+        with CaptureQueriesContext(connection) as ctx:
+            second = get_department_access(fresh_user, APIRequestFactory().get("/"))
+        self.assertFalse(any("departments_userdepartmentrole" in q["sql"] for q in ctx.captured_queries))
+        self.assertEqual(second.role_codenames, first.role_codenames)
+
+    def test_role_changes_invalidate_cache(self):
+        get_department_access(self.user)
+        UserDepartmentRole.objects.filter(user=self.user, department=self.dept_b).delete()
+        self.assertEqual(get_department_access(self.user).department_ids, [self.dept_a.id])
+
+    def test_group_permission_changes_invalidate_cache(self):
+        get_department_access(self.user)
+        self.group.permissions.add(Permission.objects.get(codename="change_member"))
+        self.assertEqual(
+            get_department_access(self.user).codenames_for(self.dept_a.id), {"view_member", "change_member"}
+        )
+
+        get_department_access(self.user)
+        self.role_a.groups.clear()
+        self.assertEqual(get_department_access(self.user).codenames_for(), set())
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from departments.access import get_department_access
 from external_sync.models import SyncBinding, SyncJob, SyncRun
 
 
@@ -125,7 +126,7 @@ class SyncJobDetailSerializer(SyncJobListSerializer):
             return attrs
 
         is_org_wide = user.is_staff or user.is_superuser or user.has_perm("departments.can_access_all_departments")
-        allowed_department_ids = set(user.department_roles.values_list("department_id", flat=True))
+        allowed_department_ids = set(get_department_access(user).department_ids)
 
         if scope == SyncJob.Scope.ORGANIZATION and not is_org_wide:
             raise serializers.ValidationError(
@@ -8,6 +8,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from departments.access import get_department_access
 from external_sync.api.serializers import (
     SpondGroupsLookupSerializer,
     SpondTopLevelGroupSerializer,
@@ -19,15 +20,16 @@ from external_sync.api.serializers import (
 )
 from external_sync.models import SyncJob, SyncRun
 from external_sync.services import ProviderNotImplementedError, ProviderRuntimeError, get_provider
+from jf_manager_backend.pagination import OptionalCursorPagination
 from jf_manager_backend.permissions import DepartmentRoleModelPermissions
 
 
 class ExternalSyncScopeMixin:
     def _user_is_org_wide(self, user):
-        return user.is_staff or user.is_superuser or user.has_perm("departments.can_access_all_departments")
+        return get_department_access(user, self.request).is_org_wide
 
     def _user_department_ids(self, user):
-        return list(user.department_roles.values_list("department_id", flat=True))
+        return get_department_access(user, self.request).department_ids
 
 
 class SyncJobViewSet(ExternalSyncScopeMixin, viewsets.ModelViewSet):
@@ -195,6 +197,7 @@ class SyncRunViewSet(ExternalSyncScopeMixin, viewsets.ReadOnlyModelViewSet):
     filterset_fields = ["job", "status", "trigger", "job__provider", "job__department"]
     ordering_fields = ["created_at", "started_at", "finished_at"]
     ordering = ["-created_at"]
+    pagination_class = OptionalCursorPagination
 
     def get_queryset(self):
         user = self.request.user
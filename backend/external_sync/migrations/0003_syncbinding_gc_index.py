@@ -0,0 +1,21 @@
+# Generated by Django 5.0.14 on 2026-10-19 18:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("external_sync", "0002_syncbinding_department_object_type"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="syncbinding",
+            index=models.Index(
+                condition=models.Q(("is_deleted_in_source", True), ("pending_garbage_collection", True)),
+                fields=["job", "object_type", "external_name", "external_id"],
+                name="sync_binding_gc_idx",
+            ),
+        ),
+    ]
@@ -181,6 +181,14 @@ class SyncBinding(models.Model):
                 name="uniq_sync_binding_object",
             ),
         ]
+        indexes = [
+            # Garbage-collection preview of a job; flagged bindings are a small fraction of all
+            models.Index(
+                fields=["job", "object_type", "external_name", "external_id"],
+                name="sync_binding_gc_idx",
+                condition=models.Q(is_deleted_in_source=True, pending_garbage_collection=True),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.get_object_type_display()}: {self.external_name or self.external_id}"
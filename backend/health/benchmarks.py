@@ -0,0 +1,327 @@
+"""
+Benchmark suite for the hot selectors, services and API endpoints.
+
+Every case is measured ``repeat`` times after a warm-up run; the result
+records wall time (min/median/mean/max), the number of SQL queries and the
+time spent in the database of the last run.  ``run_benchmarks()`` returns a
+JSON-serialisable report with the commit, database vendor and dataset size,
+so reports written by ``manage.py run_benchmarks --output`` can be compared
+between commits (``--compare``).
+
+Meant to run against a database filled by ``manage.py generate_dataset``;
+on an empty database the numbers say little.
+"""
+
+import fnmatch
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Max
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .middleware import QueryStats
+
+BENCHMARK_USERNAME = "benchmark"
+
+
+@dataclass
+class Benchmark:
+    name: str
+    group: str
+    func: object
+    setup: object = None
+
+
+BENCHMARKS = []
+
+
+def benchmark(name, group, setup=None):
+    """Register ``func(context)`` as a benchmark case; ``setup(context)`` runs untimed before every run."""
+
+    def register(func):
+        BENCHMARKS.append(Benchmark(name, group, func, setup))
+        return func
+
+    return register
+
+
+class BenchmarkContext:
+    """Shared inputs of the cases: a superuser API client, a busy member, the latest service year."""
+
+    def __init__(self):
+        from members.models import Member
+        from servicebook.models import Attendance, Service
+
+        user, created = get_user_model().objects.get_or_create(
+            username=BENCHMARK_USERNAME, defaults={"is_staff": True, "is_superuser": True}
+        )
+        if created:
+            user.set_unusable_password()
+            user.save(update_fields=["password"])
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+        latest = Service.objects.aggregate(latest=Max("start"))["latest"] or timezone.now()
+        self.year = timezone.localtime(latest).year
+        self.midpoint = latest - timezone.timedelta(days=365)
+        person_id = Attendance.objects.order_by("-person_id").values_list("person_id", flat=True).first()
+        self.member = Member.objects.filter(pk=person_id).first() or Member.objects.first()
+
+    def get(self, path):
+        response = self.client.get(path)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {path} antwortete mit {response.status_code}")
+        return response
+
+
+# ---------------------------------------------------------------------- #
+# Selectors and services                                                  #
+# ---------------------------------------------------------------------- #
+
+
+@benchmark("servicebook.top_lists", "selector")
+def _top_lists(context):
+    from servicebook.selectors import get_top_lists_by_state
+
+    for state in ("A", "E", "F"):
+        list(get_top_lists_by_state(state, year=context.year))
+
+
+@benchmark("servicebook.year_report", "selector")
+def _year_report(context):
+    from servicebook.selectors import get_attendance_year_report
+
+    list(get_attendance_year_report(context.year))
+
+
+def _clear_service_caches(context):
+    from servicebook.selectors import invalidate_service_caches
+
+    invalidate_service_caches()
+
+
+@benchmark("servicebook.attendance_over_time", "selector", setup=_clear_service_caches)
+def _attendance_over_time(context):
+    from servicebook.selectors import get_attendance_over_time_data
+
+    get_attendance_over_time_data()
+
+
+@benchmark("servicebook.member_alert", "selector")
+def _member_alert(context):
+    from servicebook.selectors import get_attandance_alert_by_member
+
+    if context.member is not None:
+        get_attandance_alert_by_member(context.member)
+
+
+@benchmark("servicebook.rebuild_summaries_year", "service")
+def _rebuild_summaries(context):
+    from servicebook.services import rebuild_attendance_summaries
+
+    rebuild_attendance_summaries(year=context.year)
+
+
+@benchmark("inventory.stock_rollup", "selector")
+def _stock_rollup(context):
+    from inventory.models import Stock
+    from inventory.selectors import get_stock_rollup
+
+    get_stock_rollup(Stock.objects.all(), group_by=("location__department",))
+
+
+@benchmark("inventory.stock_as_of", "selector")
+def _stock_as_of(context):
+    from inventory.snapshots import compute_stock_as_of
+
+    compute_stock_as_of(context.midpoint)
+
+
+@benchmark("inventory.ledger_check", "service")
+def _ledger_check(context):
+    from inventory.ledger import check_stock_ledger
+
+    check_stock_ledger()
+
+
+@benchmark("inventory.search", "selector")
+def _search(context):
+    from inventory.search import search_documents
+
+    list(search_documents("jacke 164")[:50])
+
+
+@benchmark("orders.pending", "selector")
+def _pending_orders(context):
+    from orders.selectors import get_pending_orders
+
+    list(get_pending_orders()[:200])
+
+
+# ---------------------------------------------------------------------- #
+# API endpoints                                                           #
+# ---------------------------------------------------------------------- #
+
+VIEWSET_CASES = [
+    ("members.list", "/api/v1/members/"),
+    ("members.list_sparse", "/api/v1/members/?fields=id,name,lastname"),
+    ("servicebook.services", "/api/v1/servicebook/services/"),
+    ("servicebook.statistics", "/api/v1/servicebook/services/statistics/"),
+    ("servicebook.year_report", "/api/v1/servicebook/services/year_report/?year={year}"),
+    ("servicebook.attendances_cursor", "/api/v1/servicebook/attendances/?pagination=cursor"),
+    ("inventory.items", "/api/v1/inventory/items/"),
+    ("inventory.stocks", "/api/v1/inventory/stocks/"),
+    ("inventory.transactions", "/api/v1/inventory/transactions/"),
+    ("inventory.transactions_cursor", "/api/v1/inventory/transactions/?pagination=cursor"),
+    ("orders.list", "/api/v1/orders/"),
+    ("orders.list_cursor", "/api/v1/orders/?pagination=cursor"),
+    ("orders.export", "/api/v1/orders/export/"),
+    ("members.export_excel", "/api/v1/members/export-excel/"),
+]
+
+for _name, _path in VIEWSET_CASES:
+    benchmark(f"api.{_name}", "viewset")(lambda context, path=_path: context.get(path.format(year=context.year)))
+
+
+# ---------------------------------------------------------------------- #
+# Connections                                                             #
+# ---------------------------------------------------------------------- #
+# The same small request once on the open connection (CONN_MAX_AGE > 0) and once
+# after closing it (CONN_MAX_AGE = 0): the difference of the medians is the
+# latency a persistent connection saves per request.
+
+CONNECTION_PATH = "/api/v1/orders/?fields=id"
+
+
+def _close_connection(context):
+    connection.close()
+
+
+@benchmark("db.request_persistent", "connection")
+def _request_persistent(context):
+    context.get(CONNECTION_PATH)
+
+
+@benchmark("db.request_reconnect", "connection", setup=_close_connection)
+def _request_reconnect(context):
+    context.get(CONNECTION_PATH)
+
+
+# ---------------------------------------------------------------------- #
+# Runner                                                                  #
+# ---------------------------------------------------------------------- #
+
+
+def select_benchmarks(patterns=()):
+    """Cases whose name matches one of the glob ``patterns`` (all cases without patterns)."""
+    if not patterns:
+        return list(BENCHMARKS)
+    return [case for case in BENCHMARKS if any(fnmatch.fnmatch(case.name, pattern) for pattern in patterns)]
+
+
+def measure(case, context, repeat=5, warmup=1):
+    for _ in range(warmup):
+        if case.setup:
+            case.setup(context)
+        case.func(context)
+
+    timings = []
+    for _ in range(repeat):
+        if case.setup:
+            case.setup(context)
+        queries = QueryStats()
+        start = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            case.func(context)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "name": case.name,
+        "group": case.group,
+        "runs": repeat,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "queries": queries.count,
+        "db_ms": round(queries.duration * 1000, 3),
+    }
+
+
+def _git_commit():
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(settings.BASE_DIR),
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def dataset_counts():
+    from departments.models import Department
+    from inventory.models import Transaction
+    from members.models import Member
+    from orders.models import Order
+    from servicebook.models import Attendance
+
+    return {
+        "departments": Department.objects.count(),
+        "members": Member.objects.count(),
+        "attendances": Attendance.objects.count(),
+        "transactions": Transaction.objects.count(),
+        "orders": Order.objects.count(),
+    }
+
+
+def run_benchmarks(cases, repeat=5, warmup=1, on_result=None):
+    """Measure ``cases`` and return the report (see module docstring)."""
+    results = []
+    with override_settings(ALLOWED_HOSTS=["*"]):
+        context = BenchmarkContext()
+        for case in cases:
+            result = measure(case, context, repeat=repeat, warmup=warmup)
+            results.append(result)
+            if on_result:
+                on_result(result)
+    return {
+        "meta": {
+            "created_at": timezone.now().isoformat(),
+            "commit": _git_commit(),
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "repeat": repeat,
+            "warmup": warmup,
+        },
+        "dataset": dataset_counts(),
+        "results": results,
+    }
+
+
+def compare_reports(baseline, current):
+    """Rows ``(name, baseline median, current median, change in %, baseline queries, current queries)``."""
+    previous = {result["name"]: result for result in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        old = previous.get(result["name"])
+        if old is None:
+            rows.append((result["name"], None, result["median_ms"], None, None, result["queries"]))
+            continue
+        change = (result["median_ms"] - old["median_ms"]) / old["median_ms"] * 100 if old["median_ms"] else None
+        rows.append((result["name"], old["median_ms"], result["median_ms"], change, old["queries"], result["queries"]))
+    return rows
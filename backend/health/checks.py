@@ -0,0 +1,172 @@
+"""
+Readiness probes for ``/health/ready/``.
+
+``run_readiness_checks()`` runs every probe in its own thread with a
+per-probe timeout (``READINESS_PROBE_TIMEOUT``) and keeps the report for
+``READINESS_CACHE_SECONDS`` in process memory, so load balancers and
+``healthcheck.sh`` can poll frequently without each poll hitting the
+database, Redis and the SMTP relay.
+
+Each probe returns a dict with ``status``:
+
+- ``ok``
+- ``warning``: degraded but serving (failed jobs, SMTP relay unreachable,
+  overdue sync job)
+- ``error``: not ready (database or cache down, worker queue backed up for
+  longer than ``READINESS_QUEUE_MAX_AGE`` seconds); the endpoint answers 503
+- ``skipped``: not configured (no Redis, no SMTP host)
+"""
+
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+_cached_report = None
+_cached_until = 0.0
+_lock = threading.Lock()
+
+
+def _elapsed_ms(start):
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def _age_seconds(moment):
+    if moment is None:
+        return None
+    if timezone.is_naive(moment):  # rq stores naive UTC timestamps
+        moment = timezone.make_aware(moment, dt_timezone.utc)
+    return round((timezone.now() - moment).total_seconds(), 1)
+
+
+def check_database():
+    start = time.perf_counter()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+    return {"status": "ok", "latency_ms": _elapsed_ms(start)}
+
+
+def check_cache():
+    start = time.perf_counter()
+    key = "health:ready:cache"
+    cache.set(key, 1, 10)
+    if cache.get(key) != 1:
+        return {"status": "error", "detail": "Cache liefert geschriebenen Wert nicht zurück."}
+    return {"status": "ok", "latency_ms": _elapsed_ms(start)}
+
+
+def check_queue():
+    if not settings.RQ_QUEUES:
+        return {"status": "skipped"}
+    import django_rq
+
+    report = {"status": "ok", "queues": {}}
+    for name in settings.RQ_QUEUES:
+        queue = django_rq.get_queue(name)
+        oldest_age = None
+        oldest_ids = queue.get_job_ids(0, 0)
+        if oldest_ids:
+            job = queue.fetch_job(oldest_ids[0])
+            oldest_age = _age_seconds(job.enqueued_at if job else None)
+        failed = queue.failed_job_registry.count
+        report["queues"][name] = {"depth": queue.count, "oldest_job_age_seconds": oldest_age, "failed_jobs": failed}
+        if oldest_age is not None and oldest_age > settings.READINESS_QUEUE_MAX_AGE:
+            report["status"] = "error"
+        elif failed and report["status"] == "ok":
+            report["status"] = "warning"
+    return report
+
+
+def check_smtp():
+    from jf_manager_backend.email_backend import get_email_settings
+
+    email_settings = get_email_settings()
+    if not email_settings["host"]:
+        return {"status": "skipped"}
+    start = time.perf_counter()
+    smtp_class = smtplib.SMTP_SSL if email_settings["use_ssl"] else smtplib.SMTP
+    # Connecting reads the 220 greeting; nothing is sent and no login happens.
+    server = smtp_class(email_settings["host"], int(email_settings["port"]), timeout=settings.READINESS_PROBE_TIMEOUT)
+    server.quit()
+    return {"status": "ok", "latency_ms": _elapsed_ms(start)}
+
+
+def check_sync():
+    from external_sync.models import SyncJob, SyncRun
+
+    succeeded = SyncRun.objects.filter(status=SyncRun.Status.SUCCEEDED, finished_at__isnull=False)
+    last_success = succeeded.order_by("-finished_at").values_list("finished_at", flat=True).first()
+    report = {"status": "ok", "last_success_age_seconds": _age_seconds(last_success), "overdue_jobs": []}
+
+    jobs = SyncJob.objects.filter(enabled=True, run_mode=SyncJob.RunMode.INTERVAL, interval_minutes__isnull=False)
+    for job in jobs.only("name", "interval_minutes", "last_success_at"):
+        age = _age_seconds(job.last_success_at)
+        # Two missed intervals in a row are worth a look.
+        if age is None or age > 2 * job.interval_minutes * 60:
+            report["overdue_jobs"].append({"id": job.pk, "name": job.name, "last_success_age_seconds": age})
+    if report["overdue_jobs"]:
+        report["status"] = "warning"
+    return report
+
+
+PROBES = {
+    "database": check_database,
+    "cache": check_cache,
+    "queue": check_queue,
+    "smtp": check_smtp,
+    "sync": check_sync,
+}
+
+
+def _run_probe(probe):
+    try:
+        return probe()
+    except Exception as exc:
+        return {"status": "error", "detail": f"{type(exc).__name__}: {exc}"}
+    finally:
+        # Probe threads are short-lived; do not leave their connections open.
+        connection.close()
+
+
+def _collect():
+    timeout = settings.READINESS_PROBE_TIMEOUT
+    executor = ThreadPoolExecutor(max_workers=len(PROBES), thread_name_prefix="health-ready")
+    futures = {name: executor.submit(_run_probe, probe) for name, probe in PROBES.items()}
+    deadline = time.monotonic() + timeout
+    checks = {}
+    for name, future in futures.items():
+        try:
+            checks[name] = future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FutureTimeoutError:
+            checks[name] = {"status": "error", "detail": f"Zeitüberschreitung nach {timeout} s"}
+    # Do not wait for hanging probes; their threads finish on their own.
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    # An unreachable mail relay or an overdue sync degrades, but does not stop the app.
+    for name in ("smtp", "sync"):
+        if checks[name]["status"] == "error":
+            checks[name]["status"] = "warning"
+
+    statuses = {check["status"] for check in checks.values()}
+    status = "error" if "error" in statuses else "warning" if "warning" in statuses else "ok"
+    return {"status": status, "checked_at": timezone.now().isoformat(), "checks": checks}
+
+
+def run_readiness_checks(use_cache=True):
+    """Return the readiness report, reusing a report younger than ``READINESS_CACHE_SECONDS``."""
+    global _cached_report, _cached_until
+    with _lock:
+        if use_cache and _cached_report is not None and time.monotonic() < _cached_until:
+            return {**_cached_report, "cached": True}
+        report = _collect()
+        _cached_report = report
+        _cached_until = time.monotonic() + settings.READINESS_CACHE_SECONDS
+    return {**report, "cached": False}
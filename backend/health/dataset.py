@@ -0,0 +1,443 @@
+"""
+Seeded, bulk-inserted datasets for performance work.
+
+``generate_dataset()`` fills the database with a federation-sized data set
+(departments, members, services with attendances, inventory with a
+transaction history, orders) using ``bulk_create`` in batches.  The same seed
+and size always produce the same rows in the same order, so benchmark
+results (see health.benchmarks) can be compared between commits.
+
+``bulk_create`` bypasses model signals, so everything the signal handlers
+would maintain is rebuilt at the end: the yearly attendance rollup, stock
+rows (replayed from the generated transactions), the inventory search index
+and the collection versions behind the reference-data ETags.
+
+Generated rows are tagged (department codes ``bench-…``, inventory numbers
+``BENCH-…``); run it against a dedicated database, there is no undo.
+"""
+
+import math
+import random
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+
+from django.db import transaction as db_transaction
+from django.utils import timezone
+
+from departments.models import Department
+from inventory.ledger import check_stock_ledger, repair_stock_drift
+from inventory.models import Category, Item, ItemVariant, StorageLocation, Transaction
+from inventory.search import index_items
+from jf_manager_backend.etags import bump_collection_version
+from members.models import Group, Member, Status
+from orders.models import Order, OrderableItem, OrderItem, OrderStatus
+from servicebook.models import Attendance, Service
+from servicebook.selectors import invalidate_service_caches
+from servicebook.services import rebuild_attendance_summaries
+
+DEPARTMENT_CODE_PREFIX = "bench-"
+IDENTIFIER_PREFIX = "BENCH-"
+BATCH_SIZE = 2000
+
+# Ends of the generated history; fixed so a seed always yields the same dates.
+DEFAULT_END_DATE = date(2026, 1, 1)
+HISTORY_YEARS = 3
+
+FIRST_NAMES = [
+    "Anna", "Ben", "Clara", "David", "Emma", "Finn", "Greta", "Hannes", "Ida", "Jonas", "Klara", "Leon", "Mia",
+    "Noah", "Lena", "Paul", "Marie", "Luca", "Sophie", "Elias", "Lina", "Felix", "Nele", "Jakob", "Emilia", "Tim",
+]  # fmt: skip
+LAST_NAMES = [
+    "Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer", "Wagner", "Becker", "Schulz", "Hoffmann",
+    "Koch", "Richter", "Klein", "Wolf", "Schröder", "Neumann", "Schwarz", "Braun", "Zimmermann", "Hartmann",
+]  # fmt: skip
+TOWNS = [
+    "Altdorf", "Bergheim", "Buchholz", "Eichenau", "Felsberg", "Grünwald", "Hochfeld", "Kirchberg", "Lindau",
+    "Mühlbach", "Neustadt", "Oberau", "Rosenthal", "Seefeld", "Steinach", "Talheim", "Waldkirch", "Wiesental",
+]  # fmt: skip
+TOPICS = ["Knotenkunde", "Erste Hilfe", "Gerätekunde", "Löschangriff", "Funk", "Sport", "Wettbewerbsübung"]
+SIZES = ["128", "140", "152", "164", "176", "S", "M", "L"]
+ITEM_KINDS = {
+    "Uniformen": ["Jacke", "Hose", "Mütze", "Poloshirt", "Stiefel"],
+    "Ausrüstung": ["Helm", "Handschuhe", "Taschenlampe", "Rucksack"],
+    "Werkzeug": ["Strahlrohr", "Verteiler", "Schlauch C", "Kupplungsschlüssel"],
+    "Erste Hilfe": ["Verbandkasten", "Rettungsdecke", "Beatmungsmaske"],
+}
+# (type, weight); source/target rules as in Transaction.SOURCE_TYPES/TARGET_TYPES
+TRANSACTION_MIX = [("IN", 35), ("MOVE", 20), ("LOAN", 15), ("RETURN", 10), ("OUT", 10), ("DISCARD", 10)]
+ATTENDANCE_STATES = [("A", 70), ("E", 20), ("F", 10)]
+
+
+@dataclass(frozen=True)
+class DatasetSize:
+    departments: int
+    members: int
+    attendances: int
+    transactions: int
+    orders: int
+    items: int
+
+
+PROFILES = {
+    "small": DatasetSize(departments=3, members=300, attendances=5_000, transactions=2_000, orders=300, items=60),
+    "medium": DatasetSize(
+        departments=10, members=2_000, attendances=50_000, transactions=20_000, orders=3_000, items=200
+    ),
+    "federation": DatasetSize(
+        departments=50, members=20_000, attendances=500_000, transactions=200_000, orders=30_000, items=1_000
+    ),
+}
+
+
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _insert(model, objects, batch_size=BATCH_SIZE, dates=None, collect=True):
+    """
+    ``bulk_create`` ``objects`` in batches and return the created instances
+    (only their number with ``collect=False``, for the large tables).
+
+    ``dates`` names a field whose ``auto_now_add`` value is replaced with the
+    generated one (kept under ``_generated_<field>``) by a ``bulk_update``.
+    """
+    created = []
+    count = 0
+    for batch in _batched(objects, batch_size):
+        values = [getattr(obj, f"_generated_{dates}") for obj in batch] if dates else None
+        model.objects.bulk_create(batch, batch_size=batch_size)
+        if dates:
+            for obj, value in zip(batch, values, strict=True):
+                setattr(obj, dates, value)
+            model.objects.bulk_update(batch, [dates], batch_size=batch_size)
+        count += len(batch)
+        if collect:
+            created.extend(batch)
+    return created if collect else count
+
+
+class DatasetGenerator:
+    def __init__(self, size, seed=0, end_date=DEFAULT_END_DATE, batch_size=BATCH_SIZE, log=None):
+        self.size = size
+        self.rng = random.Random(seed)
+        self.end = timezone.make_aware(datetime.combine(end_date, time(18, 0)))
+        self.start = self.end - timedelta(days=365 * HISTORY_YEARS)
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+
+    def _moment(self, fraction):
+        """Point in the generated history; ``fraction`` 0 is the start, 1 the end."""
+        return self.start + (self.end - self.start) * fraction
+
+    def _weighted(self, choices):
+        values, weights = zip(*choices, strict=True)
+        return self.rng.choices(values, weights)[0]
+
+    # ------------------------------------------------------------------ #
+    # Organisation and members                                            #
+    # ------------------------------------------------------------------ #
+
+    def create_departments(self):
+        departments = []
+        for index in range(self.size.departments):
+            town = TOWNS[index % len(TOWNS)]
+            suffix = f" {index // len(TOWNS) + 1}" if index >= len(TOWNS) else ""
+            departments.append(Department(name=f"JF {town}{suffix}", code=f"{DEPARTMENT_CODE_PREFIX}{index + 1:03d}"))
+        self.departments = _insert(Department, departments, self.batch_size)
+        self.groups = _insert(
+            Group,
+            (Group(name=f"Gruppe {number}", department=dep) for dep in self.departments for number in (1, 2)),
+            self.batch_size,
+        )
+        self.statuses = list(Status.objects.order_by("pk")) or _insert(
+            Status, [Status(name="Aktiv"), Status(name="Passiv")], self.batch_size
+        )
+
+    def create_members(self):
+        rng = self.rng
+        groups_by_department = {}
+        for group in self.groups:
+            groups_by_department.setdefault(group.department_id, []).append(group)
+
+        def members():
+            for index in range(self.size.members):
+                department = self.departments[index % len(self.departments)]
+                member = Member(
+                    name=rng.choice(FIRST_NAMES),
+                    lastname=rng.choice(LAST_NAMES),
+                    gender=rng.choice([Member.Gender.MALE, Member.Gender.FEMALE]),
+                    birthday=self.end.date() - timedelta(days=rng.randint(10 * 365, 18 * 365)),
+                    joined=self._moment(rng.random()).date(),
+                    identityCardNumber=f"{IDENTIFIER_PREFIX}{index + 1:06d}",
+                    canSwimm=rng.random() < 0.8,
+                    group=rng.choice(groups_by_department[department.pk]),
+                    status=self.statuses[0] if rng.random() < 0.9 else self.statuses[-1],
+                )
+                member._department = department
+                yield member
+
+        created = _insert(Member, members(), self.batch_size)
+        self.members_by_department = {}
+        memberships = []
+        for member in created:
+            self.members_by_department.setdefault(member._department.pk, []).append(member.pk)
+            memberships.append(Member.departments.through(member_id=member.pk, department_id=member._department.pk))
+        _insert(Member.departments.through, memberships, self.batch_size)
+        self.member_ids = [member.pk for member in created]
+
+    # ------------------------------------------------------------------ #
+    # Servicebook                                                         #
+    # ------------------------------------------------------------------ #
+
+    def create_services(self):
+        """Enough services for the attendance target, ~60 % of the department attending each."""
+        rng = self.rng
+        per_department = max(1, self.size.members // len(self.departments))
+        attendees = max(1, round(per_department * 0.6))
+        count = max(1, math.ceil(self.size.attendances / attendees))
+
+        def services():
+            for index in range(count):
+                department = self.departments[index % len(self.departments)]
+                start = self._moment((index + rng.random()) / count).replace(hour=18, minute=0, second=0)
+                yield Service(
+                    start=start,
+                    end=start + timedelta(hours=2),
+                    place=f"Gerätehaus {department.name}",
+                    topic=rng.choice(TOPICS),
+                    department=department,
+                )
+
+        self.services = _insert(Service, services(), self.batch_size)
+
+        def attendances():
+            remaining = self.size.attendances
+            for service in self.services:
+                candidates = self.members_by_department.get(service.department_id, [])
+                take = min(attendees, len(candidates), remaining)
+                for person_id in rng.sample(candidates, take):
+                    yield Attendance(person_id=person_id, service=service, state=self._weighted(ATTENDANCE_STATES))
+                remaining -= take
+                if not remaining:
+                    return
+
+        self.attendance_count = _insert(Attendance, attendances(), self.batch_size, collect=False)
+
+    # ------------------------------------------------------------------ #
+    # Inventory                                                           #
+    # ------------------------------------------------------------------ #
+
+    def create_inventory(self):
+        rng = self.rng
+        self.categories = _insert(
+            Category, [Category(name=f"Benchmark {name}", schema={}) for name in ITEM_KINDS], self.batch_size
+        )
+
+        def items():
+            for index in range(self.size.items):
+                category = self.categories[index % len(self.categories)]
+                kind = rng.choice(ITEM_KINDS[category.name.removeprefix("Benchmark ")])
+                shared = rng.random() < 0.3
+                yield Item(
+                    name=f"{kind} {index + 1}",
+                    category=category,
+                    is_variant_parent=category.name == "Benchmark Uniformen",
+                    identifier1=f"{IDENTIFIER_PREFIX}{index + 1:06d}",
+                    identifier2=f"40{index + 1:011d}",
+                    department=None if shared else rng.choice(self.departments),
+                )
+
+        self.items = _insert(Item, items(), self.batch_size)
+        variants = [
+            ItemVariant(parent_item=item, variant_attributes={"größe": size}, sku=f"{item.identifier1}-{size}")
+            for item in self.items
+            if item.is_variant_parent
+            for size in rng.sample(SIZES, 4)
+        ]
+        self.variants = _insert(ItemVariant, variants, self.batch_size)
+
+        # MPTT maintains the tree columns on save(), so locations are created one by one (two per department).
+        self.locations_by_department = {
+            department.pk: [
+                StorageLocation.objects.create(name=f"{name} {department.name}", department=department)
+                for name in ("Gerätehaus", "Kleiderkammer")
+            ]
+            for department in self.departments
+        }
+
+    def create_transactions(self):
+        """A plausible history: stock only leaves a location it was booked into before."""
+        rng = self.rng
+        stock_keys = [(item.pk, None) for item in self.items if not item.is_variant_parent]
+        stock_keys += [(None, variant.pk) for variant in self.variants]
+        locations = list(self.locations_by_department.values())
+        # Moves, loans and returns stay within a department: the other location of the pair.
+        partner = {first: second for first, second in locations} | {second: first for first, second in locations}
+        balances = {}
+        stocked = []
+
+        def transactions():
+            count = self.size.transactions
+            for index in range(count):
+                transaction_type = self._weighted(TRANSACTION_MIX)
+                quantity = rng.randint(1, 5)
+                if transaction_type != "IN" and stocked:
+                    source, key = rng.choice(stocked)
+                    if balances[(source, key)] < quantity:
+                        transaction_type = "IN"
+                else:
+                    transaction_type = "IN"
+                if transaction_type == "IN":
+                    source, key = None, rng.choice(stock_keys)
+                    target = rng.choice(rng.choice(locations))
+                    quantity = rng.randint(5, 50)
+                elif transaction_type in Transaction.TARGET_TYPES:
+                    target = partner[source]
+                else:
+                    target = None
+
+                if source is not None:
+                    balances[(source, key)] -= quantity
+                if target is not None:
+                    if (target, key) not in balances:
+                        balances[(target, key)] = 0
+                        stocked.append((target, key))
+                    balances[(target, key)] += quantity
+
+                discard_reason = rng.choice(["DAMAGED", "WORN_OUT", "LOST"]) if transaction_type == "DISCARD" else None
+                txn = Transaction(
+                    transaction_type=transaction_type,
+                    discard_reason=discard_reason,
+                    item_id=key[0],
+                    item_variant_id=key[1],
+                    source=source,
+                    target=target,
+                    quantity=quantity,
+                )
+                txn._generated_date = self._moment((index + 1) / (count + 1))
+                yield txn
+
+        self.transaction_count = _insert(Transaction, transactions(), self.batch_size, dates="date", collect=False)
+
+    # ------------------------------------------------------------------ #
+    # Orders                                                              #
+    # ------------------------------------------------------------------ #
+
+    def create_orders(self):
+        rng = self.rng
+        statuses = list(OrderStatus.objects.filter(is_active=True).order_by("sort_order", "pk"))
+        if not statuses:
+            statuses = _insert(
+                OrderStatus,
+                [
+                    OrderStatus(name=name, code=f"bench_{code}", sort_order=order)
+                    for order, (code, name) in enumerate(
+                        [("new", "Neu"), ("ordered", "Bestellt"), ("received", "Eingegangen"), ("done", "Ausgegeben")]
+                    )
+                ],
+                self.batch_size,
+            )
+        orderable = _insert(
+            OrderableItem,
+            [
+                OrderableItem(
+                    name=f"Benchmark {kind}",
+                    category=category,
+                    has_sizes=category == "Uniformen",
+                    available_sizes=",".join(SIZES) if category == "Uniformen" else "",
+                )
+                for category, kinds in ITEM_KINDS.items()
+                for kind in kinds
+            ],
+            self.batch_size,
+        )
+        department_of_member = {
+            member_id: department_id
+            for department_id, member_ids in self.members_by_department.items()
+            for member_id in member_ids
+        }
+
+        def orders():
+            count = self.size.orders
+            for index in range(count):
+                member_id = rng.choice(self.member_ids)
+                order = Order(member_id=member_id, department_id=department_of_member[member_id])
+                order._generated_order_date = self._moment((index + 1) / (count + 1))
+                yield order
+
+        created = _insert(Order, orders(), self.batch_size, dates="order_date")
+        items = (
+            OrderItem(
+                order=order,
+                item=product,
+                size=rng.choice(SIZES) if product.has_sizes else "",
+                quantity=rng.randint(1, 3),
+                status=rng.choice(statuses),
+            )
+            for order in created
+            for product in rng.sample(orderable, rng.randint(1, 3))
+        )
+        self.order_item_count = _insert(OrderItem, items, self.batch_size, collect=False)
+        self.order_count = len(created)
+
+    # ------------------------------------------------------------------ #
+    # Derived data                                                        #
+    # ------------------------------------------------------------------ #
+
+    def rebuild_derived_data(self):
+        rebuild_attendance_summaries(batch_size=self.batch_size)
+        invalidate_service_caches()
+        repair_stock_drift(check_stock_ledger().drift, batch_size=self.batch_size)
+        index_items(item.pk for item in self.items)
+        for label in (
+            "departments.Department",
+            "members.Group",
+            "members.Status",
+            "inventory.Category",
+            "inventory.Item",
+            "orders.OrderableItem",
+            "orders.OrderStatus",
+        ):
+            bump_collection_version(label)
+
+    def run(self):
+        steps = [
+            ("Abteilungen", self.create_departments),
+            ("Mitglieder", self.create_members),
+            ("Dienste und Anwesenheiten", self.create_services),
+            ("Inventar", self.create_inventory),
+            ("Transaktionen", self.create_transactions),
+            ("Bestellungen", self.create_orders),
+            ("abgeleitete Daten (Jahresübersichten, Bestände, Suchindex)", self.rebuild_derived_data),
+        ]
+        with db_transaction.atomic():
+            for label, step in steps:
+                self.log(f"Erstelle {label}...")
+                step()
+        return {
+            "departments": len(self.departments),
+            "members": len(self.member_ids),
+            "services": len(self.services),
+            "attendances": self.attendance_count,
+            "items": len(self.items),
+            "item_variants": len(self.variants),
+            "transactions": self.transaction_count,
+            "orders": self.order_count,
+            "order_items": self.order_item_count,
+        }
+
+
+def dataset_exists():
+    return Department.objects.filter(code__startswith=DEPARTMENT_CODE_PREFIX).exists()
+
+
+def generate_dataset(size, seed=0, **kwargs):
+    """Generate the data set described by ``size`` (a ``DatasetSize``); returns the row counts."""
+    return DatasetGenerator(size, seed=seed, **kwargs).run()
+
+
+def describe_size(size):
+    return ", ".join(f"{name}={value}" for name, value in asdict(size).items())
@@ -0,0 +1,46 @@
+import time
+from dataclasses import replace
+
+from django.core.management.base import BaseCommand, CommandError
+
+from health.dataset import PROFILES, dataset_exists, describe_size, generate_dataset
+
+
+class Command(BaseCommand):
+    help = "Erzeugt einen reproduzierbaren Massendatenbestand (bulk_create) für Performance-Messungen"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profile",
+            choices=sorted(PROFILES),
+            default="small",
+            help="Vorgegebene Größe (federation: 50 Abteilungen, 20k Mitglieder, 500k Anwesenheiten, …)",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Startwert des Zufallsgenerators (Standard: 0)")
+        for field in ("departments", "members", "attendances", "transactions", "orders", "items"):
+            parser.add_argument(f"--{field}", type=int, help=f"Überschreibt die Anzahl '{field}' des Profils")
+        parser.add_argument("--batch-size", type=int, default=2000, help="Zeilen pro INSERT (Standard: 2000)")
+
+    def handle(self, *args, **options):
+        if dataset_exists():
+            raise CommandError(
+                "Es existieren bereits generierte Daten (Abteilungen 'bench-…'). "
+                "Bitte eine leere Datenbank verwenden (z. B. nach 'manage.py flush')."
+            )
+        overrides = {
+            field: options[field]
+            for field in ("departments", "members", "attendances", "transactions", "orders", "items")
+            if options[field] is not None
+        }
+        size = replace(PROFILES[options["profile"]], **overrides)
+        if min(size.departments, size.members, size.items) < 1:
+            raise CommandError("Es werden mindestens eine Abteilung, ein Mitglied und ein Artikel benötigt.")
+
+        self.stdout.write(f"Profil {options['profile']} (Seed {options['seed']}): {describe_size(size)}")
+        start = time.perf_counter()
+        counts = generate_dataset(
+            size, seed=options["seed"], batch_size=options["batch_size"], log=lambda message: self.stdout.write(message)
+        )
+        for name, count in counts.items():
+            self.stdout.write(f"  {name:<14} {count:>9}")
+        self.stdout.write(self.style.SUCCESS(f"Datenbestand in {time.perf_counter() - start:.1f} s erzeugt."))
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+
+class Command(BaseCommand):
+    help = (
+        "SQLite-Wartung für den Cronjob: aktualisiert die Planer-Statistiken (PRAGMA optimize) "
+        "und überträgt das Write-Ahead-Log in die Datenbankdatei (wal_checkpoint)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS, help="Datenbank-Alias (Standard: default)")
+        parser.add_argument(
+            "--checkpoint",
+            choices=CHECKPOINT_MODES,
+            default="TRUNCATE",
+            help="Checkpoint-Modus; TRUNCATE setzt die -wal-Datei danach auf 0 Byte zurück (Standard)",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        if connection.vendor != "sqlite":
+            self.stdout.write(f"Datenbank '{options['database']}' ist keine SQLite-Datenbank – nichts zu tun.")
+            return
+
+        with connection.cursor() as cursor:
+            # Bounded ANALYZE: only tables whose statistics are missing or stale are scanned.
+            cursor.execute("PRAGMA analysis_limit=400")
+            cursor.execute("PRAGMA optimize")
+            cursor.execute("PRAGMA journal_mode")
+            journal_mode = cursor.fetchone()[0]
+            if journal_mode.lower() != "wal":
+                self.stdout.write(f"Journal-Modus {journal_mode}: kein Checkpoint nötig.")
+                self.stdout.write(self.style.SUCCESS("Statistiken aktualisiert."))
+                return
+            cursor.execute(f"PRAGMA wal_checkpoint({options['checkpoint']})")
+            busy, log_frames, checkpointed = cursor.fetchone()
+
+        if busy:
+            raise CommandError(
+                f"Checkpoint ({options['checkpoint']}) durch laufende Verbindungen blockiert: "
+                f"{checkpointed} von {log_frames} Seiten übertragen."
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Statistiken aktualisiert, Checkpoint ({options['checkpoint']}): "
+                f"{checkpointed} von {log_frames} WAL-Seiten übertragen."
+            )
+        )
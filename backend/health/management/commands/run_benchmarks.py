@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from health.benchmarks import compare_reports, run_benchmarks, select_benchmarks
+
+
+class Command(BaseCommand):
+    help = "Misst Laufzeit und SQL-Abfragen der wichtigsten Selektoren, Services und API-Endpunkte"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "patterns",
+            nargs="*",
+            help="Nur Benchmarks, deren Name auf eines der Muster passt (z. B. 'api.*' oder 'servicebook.*')",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Gemessene Durchläufe je Benchmark (Standard: 5)")
+        parser.add_argument("--warmup", type=int, default=1, help="Ungemessene Durchläufe vorab (Standard: 1)")
+        parser.add_argument("--output", help="Ergebnis als JSON in diese Datei schreiben")
+        parser.add_argument("--compare", help="Mit einem früher geschriebenen JSON-Ergebnis vergleichen")
+        parser.add_argument("--list", action="store_true", help="Nur die verfügbaren Benchmarks auflisten")
+
+    def handle(self, *args, **options):
+        cases = select_benchmarks(options["patterns"])
+        if not cases:
+            raise CommandError("Kein Benchmark passt auf die angegebenen Muster.")
+        if options["list"]:
+            for case in cases:
+                self.stdout.write(f"{case.name:<40} {case.group}")
+            return
+
+        baseline = None
+        if options["compare"]:
+            try:
+                baseline = json.loads(Path(options["compare"]).read_text())
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"Vergleichsdatei kann nicht gelesen werden: {exc}") from exc
+        if options["repeat"] < 1:
+            raise CommandError("--repeat muss mindestens 1 sein.")
+
+        self.stdout.write(f"{'Benchmark':<40} {'Median':>10} {'Min':>10} {'Max':>10} {'Queries':>8}")
+        report = run_benchmarks(cases, repeat=options["repeat"], warmup=options["warmup"], on_result=self._write_result)
+
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps(report, indent=2) + "\n")
+            self.stdout.write(self.style.SUCCESS(f"Ergebnis nach {options['output']} geschrieben."))
+        if baseline is not None:
+            self._write_comparison(baseline, report)
+
+    def _write_result(self, result):
+        self.stdout.write(
+            f"{result['name']:<40} {result['median_ms']:>8.1f}ms {result['min_ms']:>8.1f}ms "
+            f"{result['max_ms']:>8.1f}ms {result['queries']:>8}"
+        )
+
+    def _write_comparison(self, baseline, report):
+        commit = baseline.get("meta", {}).get("commit") or "?"
+        self.stdout.write("")
+        self.stdout.write(f"Vergleich mit {commit}:")
+        for name, old, new, change, old_queries, new_queries in compare_reports(baseline, report):
+            if old is None:
+                self.stdout.write(f"{name:<40} {'neu':>10} {new:>8.1f}ms")
+                continue
+            change_text = f"{change:+.1f} %" if change is not None else "–"
+            queries_text = f"{old_queries} → {new_queries}" if old_queries != new_queries else str(new_queries)
+            line = f"{name:<40} {old:>8.1f}ms → {new:>8.1f}ms {change_text:>10}   Queries {queries_text}"
+            if (change is not None and change > 10) or (old_queries is not None and new_queries > old_queries):
+                line = self.style.WARNING(line)
+            self.stdout.write(line)
@@ -0,0 +1,179 @@
+"""
+Request metrics in the Prometheus text format.
+
+``health.middleware.RequestMetricsMiddleware`` records for every request,
+labelled with the resolved view name (``item-list``, ``health_check``, …):
+
+- ``jf_http_requests_total``: requests per method, view and status code,
+- ``jf_http_request_duration_seconds``: latency histogram,
+- ``jf_http_db_queries``: histogram of SQL queries per request, plus
+  ``jf_http_db_duration_seconds`` (time spent in the database),
+- ``jf_http_response_size_bytes``: response size histogram,
+- ``jf_cache_gets_total``: hits and misses of the default cache.
+
+Samples are aggregated in-process (one dict guarded by a lock), so recording
+costs a few dictionary updates per request.  With several worker processes
+set ``METRICS_REDIS_AGGREGATION=true``: each process then adds its deltas to
+a Redis hash every ``METRICS_FLUSH_INTERVAL`` seconds and ``/health/metrics/``
+renders the totals of all workers.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+REDIS_METRICS_KEY = "jf_metrics"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# name -> (type, help)
+METRICS = {
+    "jf_http_requests_total": ("counter", "HTTP requests by method, view and status code."),
+    "jf_http_request_duration_seconds": ("histogram", "Time from the first to the last middleware."),
+    "jf_http_db_queries": ("histogram", "SQL queries issued per request."),
+    "jf_http_db_duration_seconds": ("histogram", "Time spent executing SQL per request."),
+    "jf_http_response_size_bytes": ("histogram", "Size of the response body."),
+    "jf_cache_gets_total": ("counter", "Reads from the default cache by result (hit/miss)."),
+}
+
+HISTOGRAM_SUFFIXES = ("_bucket", "_sum", "_count")
+
+
+def _format_number(value):
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """Flat store of ``(series name, labels) -> value``; histograms are expanded on observe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = defaultdict(float)
+        self._pending = defaultdict(float)
+        self._last_flush = time.monotonic()
+
+    def _add(self, name, labels, amount):
+        key = (name, labels)
+        self._values[key] += amount
+        self._pending[key] += amount
+
+    def inc(self, name, labels=(), amount=1):
+        with self._lock:
+            self._add(name, tuple(labels), amount)
+
+    def observe(self, name, labels, value, buckets):
+        labels = tuple(labels)
+        with self._lock:
+            for bound in buckets:
+                self._add(f"{name}_bucket", (*labels, ("le", _format_number(bound))), 1 if value <= bound else 0)
+            self._add(f"{name}_bucket", (*labels, ("le", "+Inf")), 1)
+            self._add(f"{name}_sum", labels, value)
+            self._add(f"{name}_count", labels, 1)
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+            self._pending.clear()
+
+    # ------------------------------------------------------------------ #
+    # Redis aggregation                                                    #
+    # ------------------------------------------------------------------ #
+
+    def flush(self, force=False):
+        """Add the deltas since the last flush to the shared Redis hash (if enabled and due)."""
+        if not redis_aggregation_enabled():
+            return
+        now = time.monotonic()
+        with self._lock:
+            if not self._pending or (not force and now - self._last_flush < settings.METRICS_FLUSH_INTERVAL):
+                return
+            pending, self._pending = self._pending, defaultdict(float)
+            self._last_flush = now
+        try:
+            pipe = _redis().pipeline(transaction=False)
+            for (name, labels), amount in pending.items():
+                pipe.hincrbyfloat(REDIS_METRICS_KEY, json.dumps([name, labels]), amount)
+            pipe.execute()
+        except Exception:  # metrics must never break a request
+            logger.warning("Metriken konnten nicht nach Redis geschrieben werden", exc_info=True)
+
+    def aggregated(self):
+        """Totals of all workers (Redis) or of this process."""
+        if not redis_aggregation_enabled():
+            return self.snapshot()
+        self.flush(force=True)
+        try:
+            rows = _redis().hgetall(REDIS_METRICS_KEY)
+        except Exception:
+            logger.warning("Metriken konnten nicht aus Redis gelesen werden", exc_info=True)
+            return self.snapshot()
+        values = {}
+        for field, value in rows.items():
+            name, labels = json.loads(field)
+            values[(name, tuple(tuple(label) for label in labels))] = float(value)
+        return values
+
+
+def redis_aggregation_enabled():
+    return settings.METRICS_REDIS_AGGREGATION and settings.REDIS_URL != "none"
+
+
+def _redis():
+    from django_redis import get_redis_connection
+
+    return get_redis_connection("default")
+
+
+def _family(name):
+    if name in METRICS:
+        return name
+    for suffix in HISTOGRAM_SUFFIXES:
+        if name.endswith(suffix) and name.removesuffix(suffix) in METRICS:
+            return name.removesuffix(suffix)
+    return name
+
+
+def _sort_key(item):
+    (name, labels), _ = item
+    le = dict(labels).get("le")
+    plain = tuple(label for label in labels if label[0] != "le")
+    bound = float("inf") if le in (None, "+Inf") else float(le)
+    return _family(name), plain, name.endswith("_bucket") is False, bound, name
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_prometheus(values):
+    """Render ``{(name, labels): value}`` in the Prometheus text exposition format."""
+    lines = []
+    current = None
+    for (name, labels), value in sorted(values.items(), key=_sort_key):
+        family = _family(name)
+        if family != current:
+            current = family
+            kind, help_text = METRICS.get(family, ("untyped", ""))
+            lines.append(f"# HELP {family} {help_text}")
+            lines.append(f"# TYPE {family} {kind}")
+        label_text = ",".join(f'{key}="{_escape(label)}"' for key, label in labels)
+        series = f"{name}{{{label_text}}}" if label_text else name
+        lines.append(f"{series} {_format_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
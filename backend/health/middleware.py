@@ -0,0 +1,74 @@
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+from .metrics import LATENCY_BUCKETS, QUERY_COUNT_BUCKETS, SIZE_BUCKETS, registry
+
+
+class QueryStats:
+    """``connection.execute_wrapper`` that counts and times the queries of one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+
+_MISSING = object()
+
+
+def _instrument_cache(backend):
+    """Count hits and misses of ``backend.get`` (also used by ``get_or_set``)."""
+    if getattr(backend, "_metrics_instrumented", False):
+        return
+    original_get = backend.get
+
+    @wraps(original_get)
+    def get(key, default=None, version=None):
+        value = original_get(key, _MISSING, version=version)
+        registry.inc("jf_cache_gets_total", (("result", "miss" if value is _MISSING else "hit"),))
+        return default if value is _MISSING else value
+
+    backend.get = get
+    backend._metrics_instrumented = True
+
+
+class RequestMetricsMiddleware:
+    """Records latency, SQL queries, response size and cache reads per view (see health.metrics)."""
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        # Cache backends are per thread; instrumenting is a no-op after the first request.
+        _instrument_cache(caches["default"])
+        queries = QueryStats()
+        start = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        match = getattr(request, "resolver_match", None)
+        view = match.view_name if match is not None and match.view_name else "unmatched"
+        labels = (("method", request.method), ("view", view))
+        registry.inc("jf_http_requests_total", (*labels, ("status", str(response.status_code))))
+        registry.observe("jf_http_request_duration_seconds", labels, duration, LATENCY_BUCKETS)
+        registry.observe("jf_http_db_queries", labels, queries.count, QUERY_COUNT_BUCKETS)
+        registry.observe("jf_http_db_duration_seconds", labels, queries.duration, LATENCY_BUCKETS)
+        if not response.streaming:
+            registry.observe("jf_http_response_size_bytes", labels, len(response.content), SIZE_BUCKETS)
+        registry.flush()
+        return response
@@ -1,7 +1,9 @@
 from django.urls import path
 
-from .views import HealthCheckView
+from .views import HealthCheckView, MetricsView, ReadinessView
 
 urlpatterns = [
     path("", HealthCheckView.as_view(), name="health_check"),
+    path("ready/", ReadinessView.as_view(), name="health_ready"),
+    path("metrics/", MetricsView.as_view(), name="health_metrics"),
 ]
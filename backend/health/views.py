@@ -1,7 +1,40 @@
-from django.http import JsonResponse
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
 from django.views import View
 
+from .checks import run_readiness_checks
+from .metrics import registry, render_prometheus
+
 
 class HealthCheckView(View):
     def get(self, request, *args, **kwargs):
         return JsonResponse({"status": "ok"}, status=200)
+
+
+class ReadinessView(View):
+    """Dependency probes (see health.checks); 503 while a required dependency is down."""
+
+    def get(self, request, *args, **kwargs):
+        report = run_readiness_checks()
+        return JsonResponse(report, status=503 if report["status"] == "error" else 200)
+
+
+class MetricsView(View):
+    """
+    Prometheus scrape target; requires ``Authorization: Bearer <METRICS_TOKEN>``.
+    Without a token only logged-in staff users get the metrics, unless
+    ``METRICS_PUBLIC`` opens them to everyone.
+    """
+
+    def get(self, request, *args, **kwargs):
+        token = settings.METRICS_TOKEN
+        if token:
+            if not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+                return JsonResponse({"detail": "Ungültiges Metrik-Token."}, status=403)
+        elif not (settings.METRICS_PUBLIC or request.user.is_staff):
+            return JsonResponse({"detail": "Kein Zugriff auf die Metriken."}, status=403)
+        return HttpResponse(
+            render_prometheus(registry.aggregated()), content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Category, Item, ItemVariant, Stock, StorageLocation, Transaction
+from .models import Category, Item, ItemVariant, Stock, StockSnapshot, StorageLocation, Transaction
 
 
 @admin.register(Category)
@@ -86,3 +86,12 @@ class TransactionAdmin(admin.ModelAdmin):
         if not obj.user:
             obj.user = request.user
         super().save_model(request, obj, form, change)
+
+
+@admin.register(StockSnapshot)
+class StockSnapshotAdmin(admin.ModelAdmin):
+    list_display = ("taken_at", "created_at")
+    readonly_fields = ("taken_at", "created_at")
+
+    def has_add_permission(self, request):
+        return False  # Snapshots werden mit "manage.py take_stock_snapshot" erstellt
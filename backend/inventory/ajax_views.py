@@ -3,7 +3,9 @@ from django.db.models import Q
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 
-from inventory.models import Item, ItemVariant, Stock, StorageLocation
+from inventory.models import Stock, StorageLocation
+from inventory.search import MIN_QUERY_LENGTH, search_documents
+from inventory.selectors import attach_full_paths
 
 
 @login_required
@@ -93,27 +95,20 @@ def _sort_locations_hierarchically(locations):
     """Sort locations in hierarchical order"""
     # Convert to list to avoid multiple DB queries
     location_list = list(locations.select_related("parent"))
-    {loc.id: loc for loc in location_list}
+    attach_full_paths(location_list)
 
-    # Find root locations
-    roots = [loc for loc in location_list if loc.parent_id is None]
-    sorted_list = []
+    # Group children by parent once instead of rescanning the list per node
+    children_by_parent = {}
+    for loc in sorted(location_list, key=lambda x: x.name):
+        children_by_parent.setdefault(loc.parent_id, []).append(loc)
 
-    def add_location_with_children(location, level=0):
+    sorted_list = []
+    stack = [(root, 0) for root in reversed(children_by_parent.get(None, []))]
+    while stack:
+        location, level = stack.pop()
         location._display_level = level
         sorted_list.append(location)
-
-        # Find children
-        children = [loc for loc in location_list if loc.parent_id == location.id]
-        children.sort(key=lambda x: x.name)
-
-        for child in children:
-            add_location_with_children(child, level + 1)
-
-    # Sort roots by name and add them with their children
-    roots.sort(key=lambda x: x.name)
-    for root in roots:
-        add_location_with_children(root)
+        stack.extend((child, level + 1) for child in reversed(children_by_parent.get(location.id, [])))
 
     return sorted_list
 
@@ -125,33 +120,32 @@ def search_items(request):
     """Search for items and variants"""
     query = request.GET.get("q", "").strip()
 
-    if len(query) < 2:
+    if len(query) < MIN_QUERY_LENGTH:
         return JsonResponse({"items": [], "variants": []})
 
-    # Search items
-    items = Item.objects.filter(
-        Q(name__icontains=query) | Q(description__icontains=query), is_variant_parent=False
-    ).select_related("category")[:10]
-
-    # Search variants
-    variants = ItemVariant.objects.filter(
-        Q(name__icontains=query) | Q(parent_item__name__icontains=query)
-    ).select_related("parent_item", "parent_item__category")[:10]
+    documents = search_documents(query).select_related("category", "parent_item").order_by("display_name", "pk")
+    items = documents.filter(item__isnull=False, is_variant_parent=False)[:10]
+    variants = documents.filter(item_variant__isnull=False)[:10]
 
     items_data = []
-    for item in items:
+    for document in items:
         items_data.append(
-            {"id": item.id, "name": item.name, "category": item.category.name if item.category else "", "type": "item"}
+            {
+                "id": document.item_id,
+                "name": document.display_name,
+                "category": document.category.name if document.category else "",
+                "type": "item",
+            }
         )
 
     variants_data = []
-    for variant in variants:
+    for document in variants:
         variants_data.append(
             {
-                "id": variant.id,
-                "name": variant.name,
-                "parent_name": variant.parent_item.name,
-                "category": variant.parent_item.category.name if variant.parent_item.category else "",
+                "id": document.item_variant_id,
+                "name": document.display_name,
+                "parent_name": document.parent_item.name,
+                "category": document.category.name if document.category else "",
                 "type": "variant",
             }
         )
@@ -178,7 +172,7 @@ def search_locations(request):
     elif location_type == "stock":
         locations = locations.filter(stocks__quantity__gt=0)
 
-    locations = locations.distinct().select_related("parent")[:15]
+    locations = attach_full_paths(locations.distinct().select_related("parent")[:15])
 
     locations_data = []
     for location in locations:
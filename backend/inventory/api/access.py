@@ -1,5 +1,7 @@
 from django.db.models import Q
 
+from departments.access import get_department_access
+
 
 def is_org_wide_user(user) -> bool:
     """Return whether the user may act across all departments without scoping."""
@@ -12,7 +14,7 @@ def get_user_department_ids(user) -> set[int]:
     """Return all department ids granted through scoped department-role assignments."""
     if not user or not user.is_authenticated:
         return set()
-    return set(user.department_roles.values_list("department_id", flat=True))
+    return set(get_department_access(user).department_ids)
 
 
 def can_manage_department(user, department_id: int | None) -> bool:
@@ -41,6 +43,21 @@ def is_location_allowed_for_item_department(location, item_department_id: int |
     return location_department_id is None and getattr(location, "is_member", False)
 
 
+def get_transaction_access_error(user, item_department_id: int | None, source, target) -> dict | None:
+    """
+    Return ``{field: message}`` when a non-org-wide user may not book the
+    transaction, otherwise None.
+    """
+    if not user or is_org_wide_user(user):
+        return None
+    if not can_manage_department(user, item_department_id):
+        return {"item": "Transaktionen sind nur für Artikel der eigenen Abteilung erlaubt."}
+    for field_name, location in (("source", source), ("target", target)):
+        if location is not None and not is_location_allowed_for_item_department(location, item_department_id):
+            return {field_name: "Quelle/Ziel muss zur Artikel-Abteilung gehören."}
+    return None
+
+
 def filter_item_department_queryset_for_user(qs, user):
     """
     Filter stock/transaction-like querysets by owning item department.
@@ -2,30 +2,35 @@
 ViewSets for Category, Item, and ItemVariant.
 """
 
-from django.db.models import Q, Sum
-from rest_framework import viewsets
+from django.db.models import Sum
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from departments.mixins import DepartmentScopeViewSetMixin
 from inventory.models import Category, Item, ItemVariant, Stock
-from jf_manager_backend.mixins import BasePermissionedViewSet
-from jf_manager_backend.permissions import OrgWideWritePermission
+from inventory.scan import resolve_scan_codes
+from inventory.search import MIN_QUERY_LENGTH, search_documents
+from jf_manager_backend.mixins import BasePermissionedViewSet, CollectionETagViewSetMixin, SparseFieldsViewSetMixin
+from jf_manager_backend.permissions import DepartmentRoleReadPermissions, OrgWideWritePermission
 
 from .serializers import (
     CategorySerializer,
     ItemSerializer,
     ItemVariantSerializer,
+    ScanCodesSerializer,
     StockSerializer,
 )
 
 
-class CategoryViewSet(BasePermissionedViewSet, viewsets.ModelViewSet):
+class CategoryViewSet(CollectionETagViewSetMixin, BasePermissionedViewSet, viewsets.ModelViewSet):
     queryset = Category.objects.all()  # overridden by get_queryset; required for DRF router basename
     serializer_class = CategorySerializer
     permission_classes = [*BasePermissionedViewSet.permission_classes, OrgWideWritePermission]
     search_fields = ["name"]
     filterset_fields = ["name"]
+    etag_models = [Category, Item]  # item_count
 
     def get_queryset(self):
         from django.db.models import Count
@@ -43,13 +48,27 @@ class CategoryViewSet(BasePermissionedViewSet, viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class ItemViewSet(DepartmentScopeViewSetMixin, BasePermissionedViewSet, viewsets.ModelViewSet):
+class ItemViewSet(
+    SparseFieldsViewSetMixin, DepartmentScopeViewSetMixin, BasePermissionedViewSet, viewsets.ModelViewSet
+):
     queryset = Item.objects.select_related("category", "department").prefetch_related("variants")
     serializer_class = ItemSerializer
     include_central_records = True
     search_fields = ["name", "category__name", "identifier1", "identifier2"]
     filterset_fields = ["category", "is_variant_parent"]
 
+    def get_permissions(self):
+        # The batch scan is a POST, but only reads.
+        if self.action == "scan":
+            return [IsAuthenticated(), DepartmentRoleReadPermissions()]
+        return super().get_permissions()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if not self.field_requested("variants"):
+            queryset = queryset.prefetch_related(None)
+        return queryset
+
     @action(detail=True, methods=["get"], url_path="variants")
     def variants(self, request, pk=None):
         item = self.get_object()
@@ -69,14 +88,42 @@ class ItemViewSet(DepartmentScopeViewSetMixin, BasePermissionedViewSet, viewsets
     @action(detail=False, methods=["get"], url_path="search")
     def search(self, request):
         q = request.query_params.get("q", "").strip()
-        if len(q) < 2:
+        if len(q) < MIN_QUERY_LENGTH:
             return Response({"results": []})
-        items = self.get_queryset().filter(Q(name__icontains=q) | Q(category__name__icontains=q))[:25]
+        # Variant matches (SKU, variant attributes) return their parent item.
+        matches = search_documents(q).values("parent_item_id")
+        items = self.get_queryset().filter(pk__in=matches).order_by("name", "pk")[:25]
         serializer = self.get_serializer(items, many=True)
         return Response({"results": serializer.data})
 
-
-class ItemVariantViewSet(BasePermissionedViewSet, viewsets.ModelViewSet):
+    @action(detail=False, methods=["get", "post"], url_path="scan")
+    def scan(self, request):
+        """
+        Resolve scanned codes (inventory number, barcode, SKU) to items/variants
+        with their stock locations and borrowers.
+
+        GET ``?code=...`` resolves one code, POST ``{"codes": [...]}`` a whole
+        scanner session; both use the same indexed lookup.
+        """
+        if request.method == "GET":
+            code = request.query_params.get("code", "").strip()
+            if not code:
+                return Response({"code": ["Dieser Parameter ist erforderlich."]}, status=status.HTTP_400_BAD_REQUEST)
+            matches = resolve_scan_codes([code], items=self.get_queryset())[code]
+            return Response({"code": code, "matches": matches})
+
+        serializer = ScanCodesSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        resolved = resolve_scan_codes(serializer.validated_data["codes"], items=self.get_queryset())
+        return Response(
+            {
+                "results": [{"code": code, "matches": matches} for code, matches in resolved.items()],
+                "not_found": [code for code, matches in resolved.items() if not matches],
+            }
+        )
+
+
+class ItemVariantViewSet(SparseFieldsViewSetMixin, BasePermissionedViewSet, viewsets.ModelViewSet):
     queryset = ItemVariant.objects.select_related("parent_item__category")
     serializer_class = ItemVariantSerializer
     search_fields = ["parent_item__name", "sku"]
@@ -89,3 +136,13 @@ class ItemVariantViewSet(BasePermissionedViewSet, viewsets.ModelViewSet):
         serializer = StockSerializer(qs, many=True)
         total = qs.aggregate(total=Sum("quantity"))["total"] or 0
         return Response({"total": total, "rows": serializer.data})
+
+    @action(detail=False, methods=["get"], url_path="search")
+    def search(self, request):
+        q = request.query_params.get("q", "").strip()
+        if len(q) < MIN_QUERY_LENGTH:
+            return Response({"results": []})
+        matches = search_documents(q).filter(item_variant__isnull=False).values("item_variant_id")
+        variants = self.get_queryset().filter(pk__in=matches).order_by("parent_item__name", "pk")[:25]
+        serializer = self.get_serializer(variants, many=True)
+        return Response({"results": serializer.data})
@@ -5,14 +5,15 @@ ViewSets for StorageLocation — including member equipment lookups.
 from django.db.models import Q, Sum
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.response import Response
 
 from departments.mixins import DepartmentScopeViewSetMixin
 from inventory.models import Stock, StorageLocation, Transaction
+from inventory.selectors import filter_stock_in_subtree, get_stock_rollup
 from jf_manager_backend.mixins import BasePermissionedViewSet
 
-from .access import get_user_department_ids, is_org_wide_user
+from .access import filter_item_department_queryset_for_user, get_user_department_ids, is_org_wide_user
 from .serializers import StockSerializer, StorageLocationSerializer, TransactionSerializer
 
 
@@ -46,6 +47,57 @@ class StorageLocationViewSet(DepartmentScopeViewSetMixin, BasePermissionedViewSe
         total = qs.aggregate(total=Sum("quantity"))["total"] or 0
         return Response({"total": total, "rows": serializer.data})
 
+    def _rollup_stock_queryset(self, locations):
+        """Stock visible to the user at the given locations, optionally narrowed by ?item=/?item_variant=."""
+        qs = filter_item_department_queryset_for_user(Stock.objects.filter(location__in=locations), self.request.user)
+        for param in ("item", "item_variant"):
+            value = self.request.query_params.get(param)
+            if value:
+                try:
+                    qs = qs.filter(**{f"{param}_id": int(value)})
+                except ValueError as exc:
+                    raise ValidationError({param: "Ungültiger Wert – muss eine Zahl sein."}) from exc
+        return qs
+
+    @action(detail=True, methods=["get"], url_path="rollup")
+    def rollup(self, request, pk=None):
+        """
+        Stock per item/variant summed over this location and all locations
+        below it, computed with one query over the tree index.
+        """
+        location = self.get_object()
+        qs = filter_stock_in_subtree(self._rollup_stock_queryset(self.get_queryset()), location)
+        rows = get_stock_rollup(qs)
+        return Response(
+            {
+                "location": location.pk,
+                "location_path": location.get_full_path(),
+                "total": sum(row["quantity"] for row in rows),
+                "rows": rows,
+            }
+        )
+
+    @action(detail=False, methods=["get"], url_path="department-rollup")
+    def department_rollup(self, request):
+        """Stock per item/variant summed over all visible locations of each department."""
+        locations = self.filter_queryset(self.get_queryset())
+        rows = get_stock_rollup(
+            self._rollup_stock_queryset(locations),
+            group_by=("location__department_id", "location__department__name"),
+        )
+
+        departments: dict = {}
+        for row in rows:
+            department_id = row.pop("location__department_id")
+            department_name = row.pop("location__department__name")
+            entry = departments.setdefault(
+                department_id,
+                {"department": department_id, "department_name": department_name, "total": 0, "rows": []},
+            )
+            entry["total"] += row["quantity"]
+            entry["rows"].append(row)
+        return Response({"departments": list(departments.values())})
+
     @action(detail=False, methods=["get", "post"], url_path="for-member/(?P<member_id>[^/.]+)")
     def for_member(self, request, member_id=None):
         """
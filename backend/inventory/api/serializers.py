@@ -8,12 +8,13 @@ from inventory.models import (
     StorageLocation,
     Transaction,
 )
+from inventory.selectors import attach_full_paths
+from jf_manager_backend.serializers import SparseFieldsMixin
 
-from .access import (
-    can_manage_department,
-    is_location_allowed_for_item_department,
-    is_org_wide_user,
-)
+from .access import can_manage_department, get_transaction_access_error
+
+MAX_BULK_TRANSACTIONS = 1000
+MAX_SCAN_CODES = 1000
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -24,7 +25,7 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = ["id", "name", "schema", "item_count"]
 
 
-class ItemVariantSerializer(serializers.ModelSerializer):
+class ItemVariantSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     parent_item_name = serializers.CharField(source="parent_item.name", read_only=True)
     category_id = serializers.IntegerField(source="parent_item.category_id", read_only=True)
     category_name = serializers.CharField(source="parent_item.category.name", read_only=True)
@@ -44,7 +45,7 @@ class ItemVariantSerializer(serializers.ModelSerializer):
         ]
 
 
-class ItemSerializer(serializers.ModelSerializer):
+class ItemSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     category_name = serializers.CharField(source="category.name", read_only=True)
     total_stock = serializers.IntegerField(read_only=True)
     variants = ItemVariantSerializer(many=True, read_only=True)
@@ -88,6 +89,12 @@ class ItemSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class StorageLocationListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        locations = attach_full_paths(data.all() if hasattr(data, "all") else data)
+        return super().to_representation(locations)
+
+
 class StorageLocationSerializer(serializers.ModelSerializer):
     parent_name = serializers.CharField(source="parent.name", read_only=True)
     full_path = serializers.SerializerMethodField()
@@ -104,6 +111,7 @@ class StorageLocationSerializer(serializers.ModelSerializer):
             "department",
             "full_path",
         ]
+        list_serializer_class = StorageLocationListSerializer
 
     def get_full_path(self, obj):  # pragma: no cover - simple helper
         return obj.get_full_path()
@@ -243,17 +251,9 @@ class TransactionSerializer(serializers.ModelSerializer):
         elif item_variant is not None:
             item_department_id = item_variant.parent_item.department_id
 
-        if user and not is_org_wide_user(user):
-            if not can_manage_department(user, item_department_id):
-                raise serializers.ValidationError(
-                    {"item": "Transaktionen sind nur für Artikel der eigenen Abteilung erlaubt."}
-                )
-
-            for field_name, location in (("source", source), ("target", target)):
-                if location is None:
-                    continue
-                if not is_location_allowed_for_item_department(location, item_department_id):
-                    raise serializers.ValidationError({field_name: "Quelle/Ziel muss zur Artikel-Abteilung gehören."})
+        access_error = get_transaction_access_error(user, item_department_id, source, target)
+        if access_error:
+            raise serializers.ValidationError(access_error)
 
         return attrs
 
@@ -262,3 +262,33 @@ class TransactionSerializer(serializers.ModelSerializer):
         if request and request.user.is_authenticated:
             validated_data.setdefault("user", request.user)
         return super().create(validated_data)
+
+
+class TransactionBulkLineSerializer(serializers.Serializer):
+    """
+    One line of a bulk booking.  Related objects are passed as primary keys
+    and resolved in bulk by inventory.services.create_transactions_bulk().
+    """
+
+    transaction_type = serializers.ChoiceField(choices=Transaction.TRANSACTION_TYPES)
+    item = serializers.IntegerField(required=False, allow_null=True)
+    item_variant = serializers.IntegerField(required=False, allow_null=True)
+    source = serializers.IntegerField(required=False, allow_null=True)
+    target = serializers.IntegerField(required=False, allow_null=True)
+    quantity = serializers.IntegerField(min_value=1)
+    note = serializers.CharField(required=False, allow_blank=True, default="")
+    discard_reason = serializers.ChoiceField(
+        choices=Transaction.DISCARD_REASONS, required=False, allow_null=True, allow_blank=True
+    )
+
+
+class TransactionBulkSerializer(serializers.Serializer):
+    transactions = serializers.ListField(
+        child=TransactionBulkLineSerializer(), allow_empty=False, max_length=MAX_BULK_TRANSACTIONS
+    )
+
+
+class ScanCodesSerializer(serializers.Serializer):
+    codes = serializers.ListField(
+        child=serializers.CharField(max_length=255, allow_blank=True), allow_empty=False, max_length=MAX_SCAN_CODES
+    )
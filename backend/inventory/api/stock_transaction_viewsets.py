@@ -1,5 +1,5 @@
 """
-ViewSets for Stock (read-only) and Transaction (full CRUD + discard statistics).
+ViewSets for Stock (read-only) and Transaction (full CRUD + bulk booking + discard statistics).
 """
 
 from datetime import timedelta
@@ -8,13 +8,19 @@ from django.db.models import Count, Sum
 from django.utils import timezone
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.response import Response
 
-from inventory.models import Stock, Transaction
+from inventory.ledger import check_stock_ledger, describe_drift, repair_stock_drift
+from inventory.models import Stock, StorageLocation, Transaction
+from inventory.selectors import describe_stock_keys
+from inventory.services import BulkTransactionError, create_transactions_bulk
+from inventory.snapshots import compute_stock_as_of, parse_as_of
 from jf_manager_backend.mixins import BasePermissionedViewSet
+from jf_manager_backend.pagination import OptionalCursorPagination
 
-from .access import filter_item_department_queryset_for_user
-from .serializers import StockSerializer, TransactionSerializer
+from .access import filter_item_department_queryset_for_user, is_org_wide_user
+from .serializers import StockSerializer, TransactionBulkSerializer, TransactionSerializer
 
 
 class StockViewSet(BasePermissionedViewSet, mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
@@ -32,6 +38,95 @@ class StockViewSet(BasePermissionedViewSet, mixins.ListModelMixin, mixins.Retrie
         queryset = super().get_queryset()
         return filter_item_department_queryset_for_user(queryset, self.request.user)
 
+    def _int_param(self, name):
+        value = self.request.query_params.get(name)
+        if not value:
+            return None
+        try:
+            return int(value)
+        except ValueError as exc:
+            raise ValidationError({name: "Ungültiger Wert – muss eine Zahl sein."}) from exc
+
+    @action(detail=False, methods=["get"], url_path="as-of")
+    def as_of(self, request):
+        """
+        Stock at a point in time, derived from the nearest earlier snapshot
+        plus the transactions booked since.
+
+        ``?date=`` is ``YYYY-MM-DD`` (end of that day) or an ISO datetime;
+        ``?location=`` (including all locations below it), ``?item=`` and
+        ``?item_variant=`` narrow the result.
+        """
+        raw_date = request.query_params.get("date")
+        if not raw_date:
+            raise ValidationError({"date": "Dieser Parameter ist erforderlich."})
+        try:
+            at = parse_as_of(raw_date)
+        except ValueError as exc:
+            raise ValidationError({"date": "Ungültiges Datum – erwartet JJJJ-MM-TT oder ISO-Zeitpunkt."}) from exc
+
+        scope = {
+            "user": request.user,
+            "item_id": self._int_param("item"),
+            "item_variant_id": self._int_param("item_variant"),
+        }
+        location_id = self._int_param("location")
+        if location_id is not None:
+            location = StorageLocation.objects.filter(pk=location_id).first()
+            if location is None:
+                raise ValidationError({"location": f"Lagerort mit ID {location_id} existiert nicht."})
+            scope["locations"] = location.get_descendants(include_self=True)
+
+        balances, snapshot = compute_stock_as_of(at, **scope)
+        names = describe_stock_keys(balances)
+        rows = [
+            {
+                "location": location_id,
+                "item": item_id,
+                "item_variant": item_variant_id,
+                **names[(location_id, item_id, item_variant_id)],
+                "quantity": quantity,
+            }
+            for (location_id, item_id, item_variant_id), quantity in balances.items()
+        ]
+        rows.sort(key=lambda row: (row["location_name"] or "", row["display_name"] or ""))
+        return Response(
+            {
+                "as_of": at,
+                "snapshot_taken_at": snapshot.taken_at if snapshot else None,
+                "total": sum(balances.values()),
+                "rows": rows,
+            }
+        )
+
+    @action(detail=False, methods=["get", "post"], url_path="ledger-check")
+    def ledger_check(self, request):
+        """
+        Replay the transaction ledger and report stock rows that differ from it.
+
+        GET only reports; POST additionally sets the drifted rows to the
+        replayed quantities, re-checked while the stock rows are locked.  ``?limit=`` caps the listed rows (default 200).
+        """
+        if not is_org_wide_user(request.user):
+            raise PermissionDenied("Die Bestandsprüfung ist nur mit abteilungsübergreifendem Zugriff möglich.")
+        try:
+            limit = int(request.query_params.get("limit", 200))
+        except ValueError:
+            return Response({"limit": "Ungültiger Wert – muss eine Zahl sein."}, status=status.HTTP_400_BAD_REQUEST)
+
+        report = check_stock_ledger()
+        repaired = repair_stock_drift(report.drift) if request.method == "POST" else 0
+        return Response(
+            {
+                "transaction_count": report.transaction_count,
+                "stock_count": report.stock_count,
+                "negative_balances": report.negative_balances,
+                "drift_count": len(report.drift),
+                "repaired": repaired,
+                "drift": describe_drift(report.drift[:limit]),
+            }
+        )
+
 
 class TransactionViewSet(BasePermissionedViewSet, viewsets.ModelViewSet):
     queryset = Transaction.objects.select_related(
@@ -43,6 +138,7 @@ class TransactionViewSet(BasePermissionedViewSet, viewsets.ModelViewSet):
         "user",
     )
     serializer_class = TransactionSerializer
+    pagination_class = OptionalCursorPagination
     search_fields = ["item__name", "item_variant__parent_item__name", "source__name", "target__name", "note"]
     filterset_fields = ["transaction_type", "item", "item_variant", "source", "target", "discard_reason"]
 
@@ -53,6 +149,29 @@ class TransactionViewSet(BasePermissionedViewSet, viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save()  # user is injected in serializer.create
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        """
+        Book many transactions at once (e.g. kit handouts) — all or nothing.
+
+        Body: ``{"transactions": [{...}, ...]}`` with the same fields as a
+        single transaction.  Lines are applied in order; on any error nothing
+        is booked and the errors are returned per line index.
+        """
+        serializer = TransactionBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            transactions = create_transactions_bulk(serializer.validated_data["transactions"], user=request.user)
+        except BulkTransactionError as exc:
+            return Response(exc.errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {
+                "created": len(transactions),
+                "transactions": TransactionSerializer(transactions, many=True).data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
     @action(detail=False, methods=["get"], url_path="discard-statistics")
     def discard_statistics(self, request):
         """Breakdown of discarded items by reason, category, and time period."""
@@ -16,6 +16,8 @@ from django.views.decorators.http import require_GET
 from members.models.member import Member
 
 from .models import Category, Item, ItemVariant, Stock, StorageLocation
+from .search import MIN_QUERY_LENGTH, search_documents
+from .selectors import attach_full_paths, get_stock_quantities
 
 
 def _deprecated(response: JsonResponse):  # helper
@@ -34,14 +36,14 @@ def search_items(request):
     category_id = request.GET.get("category_id")
     page = request.GET.get("page", 1)
 
-    if len(query) < 2:
+    if len(query) < MIN_QUERY_LENGTH:
         return JsonResponse({"results": [], "has_more": False})
 
     # Basis-Queryset
     items = Item.objects.select_related("category").all()
 
-    # Nach Text suchen
-    items = items.filter(Q(name__icontains=query) | Q(category__name__icontains=query))
+    # Nach Text suchen (Name, Kategorie, Inventarnummern, Attribute)
+    items = items.filter(pk__in=search_documents(query).filter(item__isnull=False).values("item_id"))
 
     # Nach Kategorie filtern
     if category_id:
@@ -55,20 +57,19 @@ def search_items(request):
     paginator = Paginator(items, 20)
     page_obj = paginator.get_page(page)
 
+    # Bestände der Seite in einer Abfrage statt einer pro Artikel
+    stock_quantities = get_stock_quantities(item_ids=[item.id for item in page_obj], location_id=location_id)
+    location_name = ""
+    if location_id:
+        location_name = StorageLocation.objects.filter(pk=location_id).values_list("name", flat=True).first() or ""
+
     results = []
     for item in page_obj:
-        # Bestandsinformationen hinzufügen
-        stock_info = {}
+        quantity = stock_quantities.get(("item", item.id))
         if location_id:
-            try:
-                stock = Stock.objects.get(item=item, location_id=location_id)
-                stock_info = {"quantity": stock.quantity, "location_name": stock.location.name}
-            except Stock.DoesNotExist:
-                stock_info = {"quantity": 0, "location_name": ""}
+            stock_info = {"quantity": quantity or 0, "location_name": location_name if quantity is not None else ""}
         else:
-            # Gesamtbestand über alle Lagerorte
-            total_stock = Stock.objects.filter(item=item).aggregate(total=Sum("quantity"))["total"] or 0
-            stock_info = {"total_quantity": total_stock}
+            stock_info = {"total_quantity": quantity or 0}
 
         results.append(
             {
@@ -94,7 +95,7 @@ def search_locations(request):
     exclude_member_locations = request.GET.get("exclude_members", "").lower() == "true"
     page = request.GET.get("page", 1)
 
-    if len(query) < 2:
+    if len(query) < MIN_QUERY_LENGTH:
         return JsonResponse({"results": [], "has_more": False})
 
     # Basis-Queryset
@@ -115,7 +116,7 @@ def search_locations(request):
     page_obj = paginator.get_page(page)
 
     results = []
-    for location in page_obj:
+    for location in attach_full_paths(page_obj):
         # Bestandsstatistiken
         stock_count = Stock.objects.filter(location=location).count()
         total_items = Stock.objects.filter(location=location).aggregate(total=Sum("quantity"))["total"] or 0
@@ -144,7 +145,7 @@ def search_members(request):
     query = request.GET.get("q", "").strip()
     page = request.GET.get("page", 1)
 
-    if len(query) < 2:
+    if len(query) < MIN_QUERY_LENGTH:
         return JsonResponse({"results": [], "has_more": False})
 
     # Basis-Queryset
@@ -219,7 +220,8 @@ def get_stock_info(request):
             return JsonResponse({"error": "Location not found"}, status=404)
     else:
         # Bestand über alle Lagerorte
-        stocks = Stock.objects.filter(**stock_filter).select_related("location")
+        stocks = list(Stock.objects.filter(**stock_filter).select_related("location"))
+        attach_full_paths(stock.location for stock in stocks)
         total_quantity = sum(stock.quantity for stock in stocks)
 
         stock_data = {
@@ -287,7 +289,8 @@ def get_items_by_category(request, category_id):
     # Bestandsinformationen hinzufügen
     results = []
     for item in items:
-        stocks = Stock.objects.filter(item=item).select_related("location")
+        stocks = list(Stock.objects.filter(item=item).select_related("location"))
+        attach_full_paths(stock.location for stock in stocks)
         total_quantity = sum(stock.quantity for stock in stocks)
 
         results.append(
@@ -490,92 +493,67 @@ def search_items_and_variants(request):
     category_id = request.GET.get("category_id")
     page = request.GET.get("page", 1)
 
-    if len(query) < 2:
+    if len(query) < MIN_QUERY_LENGTH:
         return JsonResponse({"results": [], "has_more": False})
 
-    results = []
-
-    # Search in Items
-    items = Item.objects.select_related("category").filter(
-        Q(name__icontains=query) | Q(category__name__icontains=query)
-    )
-
+    # Variant parents are not bookable - their variants are listed instead
+    documents = search_documents(query).exclude(is_variant_parent=True)
     if category_id:
-        items = items.filter(category_id=category_id)
-
-    for item in items:
-        # Skip variant parents in search results - show variants instead
-        if item.is_variant_parent:
-            continue
+        documents = documents.filter(category_id=category_id)
+    documents = documents.select_related("category", "item_variant").order_by("display_name", "pk")
 
-        # Stock information
-        stock_info = {}
-        if location_id:
-            try:
-                stock = Stock.objects.get(item=item, location_id=location_id)
-                stock_info = {"quantity": stock.quantity, "location_name": stock.location.name}
-            except Stock.DoesNotExist:
-                stock_info = {"quantity": 0, "location_name": ""}
-        else:
-            total_stock = Stock.objects.filter(item=item).aggregate(total=Sum("quantity"))["total"] or 0
-            stock_info = {"total_quantity": total_stock}
-
-        results.append(
-            {
-                "id": item.id,
-                "name": item.name,
-                "category": item.category.name if item.category else "",
-                "display_name": f"{item.name} ({item.category.name})" if item.category else item.name,
-                "type": "item",
-                "stock": stock_info,
-            }
-        )
+    paginator = Paginator(documents, 20)
+    page_obj = paginator.get_page(page)
 
-    # Search in ItemVariants
-    variants = ItemVariant.objects.select_related("parent_item__category").filter(
-        Q(parent_item__name__icontains=query)
-        | Q(parent_item__category__name__icontains=query)
-        | Q(sku__icontains=query)
+    # Bestände der Seite in einer Abfrage
+    stock_quantities = get_stock_quantities(
+        item_ids=[document.item_id for document in page_obj if document.item_id],
+        variant_ids=[document.item_variant_id for document in page_obj if document.item_variant_id],
+        location_id=location_id,
     )
+    location_name = ""
+    if location_id:
+        location_name = StorageLocation.objects.filter(pk=location_id).values_list("name", flat=True).first() or ""
 
-    for variant in variants:
-        # Stock information
-        stock_info = {}
+    results = []
+    for document in page_obj:
+        key = ("item", document.item_id) if document.item_id else ("variant", document.item_variant_id)
+        quantity = stock_quantities.get(key, 0)
         if location_id:
-            try:
-                stock = Stock.objects.get(item_variant=variant, location_id=location_id)
-                stock_info = {"quantity": stock.quantity, "location_name": stock.location.name}
-            except Stock.DoesNotExist:
-                stock_info = {"quantity": 0, "location_name": ""}
+            stock_info = {"quantity": quantity, "location_name": location_name if key in stock_quantities else ""}
         else:
-            total_stock = Stock.objects.filter(item_variant=variant).aggregate(total=Sum("quantity"))["total"] or 0
-            stock_info = {"total_quantity": total_stock}
-
-        # Create attributes display
-        variant_display = []
-        if variant.variant_attributes:
-            for key, value in variant.variant_attributes.items():
-                variant_display.append(f"{key}: {value}")
+            stock_info = {"total_quantity": quantity}
+        category = document.category.name if document.category else ""
+
+        if document.item_id:
+            results.append(
+                {
+                    "id": document.item_id,
+                    "name": document.display_name,
+                    "category": category,
+                    "display_name": f"{document.display_name} ({category})" if category else document.display_name,
+                    "type": "item",
+                    "stock": stock_info,
+                }
+            )
+            continue
 
+        variant_attributes = document.item_variant.variant_attributes or {}
         results.append(
             {
-                "id": f"variant_{variant.id}",
-                "variant_id": variant.id,
-                "name": str(variant),
-                "category": variant.parent_item.category.name if variant.parent_item.category else "",
-                "display_name": str(variant),
+                "id": f"variant_{document.item_variant_id}",
+                "variant_id": document.item_variant_id,
+                "name": document.display_name,
+                "category": category,
+                "display_name": document.display_name,
                 "type": "variant",
                 "stock": stock_info,
-                "attributes_display": ", ".join(variant_display),
+                "attributes_display": ", ".join(f"{key}: {value}" for key, value in variant_attributes.items()),
             }
         )
 
-    # Simple pagination (can be enhanced)
-    paginator = Paginator(results, 20)
-    page_obj = paginator.get_page(page)
-
     return _deprecated(
-        JsonResponse({"results": list(page_obj), "has_more": page_obj.has_next(), "total_count": len(results)})
+        JsonResponse({"results": results, "has_more": page_obj.has_next(), "total_count": paginator.count})
     )
 
 
@@ -0,0 +1,173 @@
+"""
+Stock ledger replay and consistency check.
+
+``Stock.quantity`` is maintained incrementally by ``Transaction.update_stock()``
+and the bulk booking service, while some maintenance paths (e.g. the member
+deletion strategies) delete or unlink transactions with plain queryset
+updates.  ``check_stock_ledger()`` replays the whole transaction history and
+compares the result with the stored stock:
+
+- transactions are streamed in primary-key order with a chunked server-side
+  iterator, so memory is bounded by the number of distinct
+  (location, item/variant) balances, not by the number of transactions,
+- legs whose location was unlinked (``source``/``target`` set to NULL) are
+  skipped — that stock left the system together with the location,
+- balances that drop below zero while replaying are counted; they point to
+  missing history (e.g. deleted IN transactions) rather than to stock drift.
+
+``repair_stock_drift()`` overwrites the stored quantities with the replayed
+ones.  It locks the affected stock rows and replays their keys again inside
+the same database transaction, so a booking made after the check is neither
+overwritten nor counted twice (bookings lock the same rows; on SQLite the
+``BEGIN IMMEDIATE`` profile serializes all writers).  Used by ``manage.py check_stock_ledger`` and the
+``/inventory/stocks/ledger-check/`` endpoint.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.db import transaction as db_transaction
+from django.db.models import Q
+
+from .models import Stock, Transaction
+from .selectors import describe_stock_keys
+
+LEDGER_CHUNK_SIZE = 2000
+
+
+@dataclass
+class StockDrift:
+    location_id: int
+    item_id: int | None
+    item_variant_id: int | None
+    expected: int
+    actual: int
+    stock_id: int | None = None  # None when no Stock row exists
+
+    @property
+    def difference(self):
+        return self.actual - self.expected
+
+
+@dataclass
+class LedgerReport:
+    transaction_count: int = 0
+    stock_count: int = 0
+    negative_balances: int = 0
+    drift: list[StockDrift] = field(default_factory=list)
+
+
+def _keys_filter(keys, location_fields):
+    """Q matching rows of any of the ``(location_id, item_id, item_variant_id)`` keys (and a few more)."""
+    location_ids = {location_id for location_id, _item_id, _item_variant_id in keys}
+    item_ids = {item_id for _location_id, item_id, _item_variant_id in keys if item_id is not None}
+    variant_ids = {item_variant_id for _location_id, _item_id, item_variant_id in keys if item_variant_id is not None}
+    locations = Q()
+    for location_field in location_fields:
+        locations |= Q(**{f"{location_field}__in": location_ids})
+    return locations & (Q(item_id__in=item_ids) | Q(item_variant_id__in=variant_ids))
+
+
+def replay_ledger(chunk_size=LEDGER_CHUNK_SIZE, keys=None):
+    """
+    Return ``(balances, transaction_count, negative_balances)`` where balances
+    maps ``(location_id, item_id, item_variant_id)`` to the replayed quantity.
+
+    With ``keys`` only the transactions touching those balances are replayed.
+    """
+    balances = defaultdict(int)
+    went_negative = set()
+    count = 0
+    rows = Transaction.objects.order_by("pk")
+    if keys is not None:
+        rows = rows.filter(_keys_filter(keys, ("source_id", "target_id")))
+    rows = rows.values_list("transaction_type", "item_id", "item_variant_id", "source_id", "target_id", "quantity")
+    for transaction_type, item_id, item_variant_id, source_id, target_id, quantity in rows.iterator(
+        chunk_size=chunk_size
+    ):
+        count += 1
+        if transaction_type in Transaction.SOURCE_TYPES and source_id is not None:
+            key = (source_id, item_id, item_variant_id)
+            balances[key] -= quantity
+            if balances[key] < 0:
+                went_negative.add(key)
+        if transaction_type in Transaction.TARGET_TYPES and target_id is not None:
+            balances[(target_id, item_id, item_variant_id)] += quantity
+    if keys is not None:
+        balances = defaultdict(int, {key: balance for key, balance in balances.items() if key in keys})
+        went_negative &= keys
+    return balances, count, len(went_negative)
+
+
+def check_stock_ledger(chunk_size=LEDGER_CHUNK_SIZE):
+    """Replay all transactions and report every stock row that differs from the ledger."""
+    balances, transaction_count, negative_balances = replay_ledger(chunk_size)
+    report = LedgerReport(transaction_count=transaction_count, negative_balances=negative_balances)
+
+    rows = Stock.objects.order_by("pk").values_list("pk", "location_id", "item_id", "item_variant_id", "quantity")
+    for stock_id, location_id, item_id, item_variant_id, quantity in rows.iterator(chunk_size=chunk_size):
+        report.stock_count += 1
+        # pop(): a duplicate row for the same key is expected to be empty
+        expected = balances.pop((location_id, item_id, item_variant_id), 0)
+        if expected != quantity:
+            report.drift.append(StockDrift(location_id, item_id, item_variant_id, expected, quantity, stock_id))
+
+    for (location_id, item_id, item_variant_id), expected in balances.items():
+        if expected != 0:
+            report.drift.append(StockDrift(location_id, item_id, item_variant_id, expected, 0))
+    return report
+
+
+def repair_stock_drift(drift, batch_size=LEDGER_CHUNK_SIZE):
+    """
+    Set the stored stock of the drifted keys to the replayed quantities.
+
+    ``drift`` only selects the keys; their balances are replayed again while
+    the stock rows are locked, so the written quantities include bookings made
+    since ``check_stock_ledger()``.  Negative balances are clamped to zero.
+    Returns the number of stock rows written.
+    """
+    keys = {(row.location_id, row.item_id, row.item_variant_id) for row in drift}
+    if not keys:
+        return 0
+
+    with db_transaction.atomic():
+        stocks = list(Stock.objects.select_for_update().filter(_keys_filter(keys, ("location_id",))).order_by("pk"))
+        balances, _count, _negative_balances = replay_ledger(keys=keys)
+
+        updates = []
+        for stock in stocks:
+            key = (stock.location_id, stock.item_id, stock.item_variant_id)
+            if key not in keys:
+                continue
+            # pop(): a duplicate row for the same key is expected to be empty
+            expected = max(balances.pop(key, 0), 0)
+            if stock.quantity != expected:
+                stock.quantity = expected
+                updates.append(stock)
+        creates = [
+            Stock(location_id=location_id, item_id=item_id, item_variant_id=item_variant_id, quantity=expected)
+            for (location_id, item_id, item_variant_id), expected in balances.items()
+            if expected > 0
+        ]
+        Stock.objects.bulk_update(updates, ["quantity"], batch_size=batch_size)
+        Stock.objects.bulk_create(creates, batch_size=batch_size)
+    return len(updates) + len(creates)
+
+
+def describe_drift(drift):
+    """Serialize drift rows with location and item names (three queries)."""
+    names = describe_stock_keys((row.location_id, row.item_id, row.item_variant_id) for row in drift)
+    return [
+        {
+            "stock": row.stock_id,
+            "location": row.location_id,
+            "item": row.item_id,
+            "item_variant": row.item_variant_id,
+            **names[(row.location_id, row.item_id, row.item_variant_id)],
+            "expected": row.expected,
+            "actual": row.actual,
+            "difference": row.difference,
+        }
+        for row in drift
+    ]
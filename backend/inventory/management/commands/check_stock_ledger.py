@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from inventory.ledger import LEDGER_CHUNK_SIZE, check_stock_ledger, describe_drift, repair_stock_drift
+
+
+class Command(BaseCommand):
+    help = "Spielt alle Transaktionen nach und vergleicht das Ergebnis mit den gespeicherten Beständen"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="Setzt abweichende Bestände auf den aus den Transaktionen berechneten Wert",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=LEDGER_CHUNK_SIZE,
+            help=f"Anzahl Zeilen pro Datenbank-Abruf (Standard: {LEDGER_CHUNK_SIZE})",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=50,
+            help="Maximale Anzahl ausgegebener Abweichungen (Standard: 50, 0 = alle)",
+        )
+        parser.add_argument(
+            "--fail-on-drift",
+            action="store_true",
+            help="Beendet mit Fehlercode, wenn (nicht reparierte) Abweichungen gefunden wurden",
+        )
+
+    def handle(self, *args, **options):
+        report = check_stock_ledger(chunk_size=options["chunk_size"])
+
+        self.stdout.write(
+            f"{report.transaction_count} Transaktionen nachgespielt, {report.stock_count} Bestände geprüft"
+        )
+        if report.negative_balances:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{report.negative_balances} Bestände waren zwischenzeitlich negativ (unvollständige Historie?)"
+                )
+            )
+
+        if not report.drift:
+            self.stdout.write(self.style.SUCCESS("Alle Bestände stimmen mit den Transaktionen überein."))
+            return
+
+        self.stdout.write(self.style.WARNING(f"{len(report.drift)} abweichende Bestände:"))
+        shown = report.drift[: options["limit"]] if options["limit"] else report.drift
+        for row in describe_drift(shown):
+            self.stdout.write(
+                f"  {row['display_name']} @ {row['location_name']}: "
+                f"gespeichert {row['actual']}, erwartet {row['expected']} ({row['difference']:+d})"
+            )
+        if len(shown) < len(report.drift):
+            self.stdout.write(f"  … {len(report.drift) - len(shown)} weitere")
+
+        if options["repair"]:
+            repaired = repair_stock_drift(report.drift)
+            self.stdout.write(self.style.SUCCESS(f"{repaired} Bestände korrigiert."))
+        elif options["fail_on_drift"]:
+            raise CommandError(f"{len(report.drift)} abweichende Bestände gefunden.")
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from inventory.models import ItemSearchDocument
+from inventory.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Baut den Suchindex für Artikel und Varianten neu auf (z. B. nach Importen per SQL)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Löscht vorher alle Suchdokumente",
+        )
+
+    def handle(self, *args, **options):
+        if options["clear"]:
+            ItemSearchDocument.objects.all().delete()
+        count = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f"Suchindex für {count} Artikel neu aufgebaut."))
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from inventory.models import StockSnapshot, Transaction
+from inventory.snapshots import month_starts, parse_as_of, take_stock_snapshot
+
+
+class Command(BaseCommand):
+    help = "Speichert den vollständigen Bestand zu einem Stichtag (für Abfragen „Bestand am …“)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--at",
+            help="Stichtag als JJJJ-MM-TT (Tagesende) oder ISO-Zeitpunkt (Standard: jetzt)",
+        )
+        parser.add_argument(
+            "--backfill-monthly",
+            action="store_true",
+            help="Erstellt fehlende Snapshots zu jedem Monatsanfang seit der ersten Transaktion",
+        )
+
+    def handle(self, *args, **options):
+        if options["at"]:
+            try:
+                at = parse_as_of(options["at"])
+            except ValueError as exc:
+                raise CommandError(f"Ungültiger Stichtag: {options['at']}") from exc
+        else:
+            at = timezone.now()
+
+        if options["backfill_monthly"]:
+            first = Transaction.objects.order_by("date").values_list("date", flat=True).first()
+            if first is None:
+                self.stdout.write("Keine Transaktionen vorhanden.")
+                return
+            existing = set(StockSnapshot.objects.values_list("taken_at", flat=True))
+            # Oldest first: every snapshot starts from the previous one.
+            for moment in month_starts(first, at):
+                if moment not in existing:
+                    snapshot = take_stock_snapshot(moment)
+                    self.stdout.write(f"{snapshot}: {snapshot.lines.count()} Positionen")
+            return
+
+        snapshot = take_stock_snapshot(at)
+        self.stdout.write(self.style.SUCCESS(f"{snapshot}: {snapshot.lines.count()} Positionen"))
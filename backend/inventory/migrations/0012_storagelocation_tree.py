@@ -0,0 +1,80 @@
+from django.db import migrations, models
+
+import mptt.fields
+
+
+def build_tree(apps, schema_editor):
+    """Compute nested-set values for existing locations (roots and children ordered by name)."""
+    StorageLocation = apps.get_model("inventory", "StorageLocation")
+
+    locations = list(StorageLocation.objects.order_by("name", "pk"))
+    children = {}
+    for location in locations:
+        children.setdefault(location.parent_id, []).append(location)
+
+    for tree_id, root in enumerate(children.get(None, []), start=1):
+        counter = 1
+        # Iterative depth-first walk: (node, level, visited)
+        stack = [(root, 0, False)]
+        while stack:
+            node, level, visited = stack.pop()
+            if visited:
+                node.rght = counter
+                counter += 1
+                continue
+            node.tree_id = tree_id
+            node.level = level
+            node.lft = counter
+            counter += 1
+            stack.append((node, level, True))
+            for child in reversed(children.get(node.pk, [])):
+                stack.append((child, level + 1, False))
+
+    StorageLocation.objects.bulk_update(locations, ["lft", "rght", "tree_id", "level"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory", "0011_add_former_member_name_to_transaction"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="storagelocation",
+            name="level",
+            field=models.PositiveIntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="storagelocation",
+            name="lft",
+            field=models.PositiveIntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="storagelocation",
+            name="rght",
+            field=models.PositiveIntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="storagelocation",
+            name="tree_id",
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name="storagelocation",
+            name="parent",
+            field=mptt.fields.TreeForeignKey(
+                blank=True,
+                help_text="Übergeordneter Lagerort für hierarchische Struktur",
+                null=True,
+                on_delete=models.deletion.CASCADE,
+                related_name="children",
+                to="inventory.storagelocation",
+                verbose_name="Übergeordneter Lagerort",
+            ),
+        ),
+        migrations.RunPython(build_tree, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.0.14 on 2026-10-19 17:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory", "0012_storagelocation_tree"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StockSnapshot",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("taken_at", models.DateTimeField(unique=True, verbose_name="Stichtag")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="Erstellt am")),
+            ],
+            options={
+                "verbose_name": "Bestands-Snapshot",
+                "verbose_name_plural": "Bestands-Snapshots",
+                "ordering": ["-taken_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="StockSnapshotLine",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("quantity", models.IntegerField(verbose_name="Menge")),
+            ],
+            options={
+                "verbose_name": "Snapshot-Position",
+                "verbose_name_plural": "Snapshot-Positionen",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(fields=["date"], name="inventory_txn_date_idx"),
+        ),
+        migrations.AddField(
+            model_name="stocksnapshotline",
+            name="item",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="inventory.item",
+                verbose_name="Artikel",
+            ),
+        ),
+        migrations.AddField(
+            model_name="stocksnapshotline",
+            name="item_variant",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="inventory.itemvariant",
+                verbose_name="Artikel-Variante",
+            ),
+        ),
+        migrations.AddField(
+            model_name="stocksnapshotline",
+            name="location",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE, to="inventory.storagelocation", verbose_name="Lagerort"
+            ),
+        ),
+        migrations.AddField(
+            model_name="stocksnapshotline",
+            name="snapshot",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="lines",
+                to="inventory.stocksnapshot",
+                verbose_name="Snapshot",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="stocksnapshotline",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    models.Q(("item__isnull", False), ("item_variant__isnull", True)),
+                    models.Q(("item__isnull", True), ("item_variant__isnull", False)),
+                    _connector="OR",
+                ),
+                name="stocksnapshotline_either_item_or_variant",
+            ),
+        ),
+    ]
@@ -0,0 +1,229 @@
+# Generated by Django 5.0.14 on 2026-10-19 17:11
+
+import sqlite3
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+FTS_TABLE = "inventory_search_fts"
+DOCUMENT_TABLE = "inventory_itemsearchdocument"
+TRIGRAM_MIN_VERSION = (3, 34, 0)
+
+SQLITE_FORWARD = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        search_text, content='{DOCUMENT_TABLE}', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {DOCUMENT_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {DOCUMENT_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON {DOCUMENT_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+        INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text);
+    END
+    """,
+]
+SQLITE_BACKWARD = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX inventory_search_text_trgm ON {DOCUMENT_TABLE} USING gin (search_text gin_trgm_ops)",
+]
+POSTGRES_BACKWARD = ["DROP INDEX IF EXISTS inventory_search_text_trgm"]
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("PRAGMA compile_options")
+            if "ENABLE_FTS5" not in {row[0] for row in cursor.fetchall()}:
+                return  # inventory.search falls back to LIKE
+        if sqlite3.sqlite_version_info < TRIGRAM_MIN_VERSION:
+            return  # no trigram tokenizer: LIKE fallback as well
+        statements = SQLITE_FORWARD
+    elif vendor == "postgresql":
+        statements = POSTGRES_FORWARD
+    else:
+        return
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"sqlite": SQLITE_BACKWARD, "postgresql": POSTGRES_BACKWARD}.get(vendor, [])
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def _flatten(attributes):
+    if not isinstance(attributes, dict):
+        return []
+    parts = []
+    for key, value in attributes.items():
+        parts.append(str(key))
+        if isinstance(value, dict):
+            parts.extend(_flatten(value))
+        elif isinstance(value, list | tuple):
+            parts.extend(str(entry) for entry in value if entry is not None)
+        elif value is not None and value != "":
+            parts.append(str(value))
+    return parts
+
+
+def _text(*parts):
+    return " ".join(" ".join(str(part) for part in parts if part).casefold().split())
+
+
+def _variant_name(variant):
+    parts = [f"{key}: {value}" for key, value in (variant.variant_attributes or {}).items()]
+    if parts:
+        return f"{variant.parent_item.name} ({', '.join(parts)})"
+    return f"{variant.parent_item.name} (Variante #{variant.pk})"
+
+
+def populate_search_documents(apps, schema_editor):
+    Item = apps.get_model("inventory", "Item")
+    ItemVariant = apps.get_model("inventory", "ItemVariant")
+    ItemSearchDocument = apps.get_model("inventory", "ItemSearchDocument")
+
+    documents = []
+    for item in Item.objects.select_related("category").iterator(chunk_size=500):
+        category_name = item.category.name if item.category else ""
+        if item.name:
+            display_name = item.name
+        elif item.category and item.size:
+            display_name = f"{category_name} gr. {item.size}"
+        else:
+            display_name = f"Item #{item.pk}"
+        documents.append(
+            ItemSearchDocument(
+                item_id=item.pk,
+                parent_item_id=item.pk,
+                category_id=item.category_id,
+                department_id=item.department_id,
+                is_variant_parent=item.is_variant_parent,
+                display_name=display_name[:500],
+                search_text=_text(
+                    item.name, category_name, item.size, item.identifier1, item.identifier2, *_flatten(item.attributes)
+                ),
+            )
+        )
+    for variant in ItemVariant.objects.select_related("parent_item__category").iterator(chunk_size=500):
+        parent = variant.parent_item
+        documents.append(
+            ItemSearchDocument(
+                item_variant_id=variant.pk,
+                parent_item_id=parent.pk,
+                category_id=parent.category_id,
+                department_id=parent.department_id,
+                display_name=_variant_name(variant)[:500],
+                search_text=_text(
+                    parent.name,
+                    parent.category.name if parent.category else "",
+                    variant.sku,
+                    parent.identifier1,
+                    parent.identifier2,
+                    *_flatten(parent.attributes),
+                    *_flatten(variant.variant_attributes),
+                ),
+            )
+        )
+    ItemSearchDocument.objects.bulk_create(documents, batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("departments", "0003_department_color"),
+        ("inventory", "0013_stock_snapshots"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ItemSearchDocument",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("is_variant_parent", models.BooleanField(default=False)),
+                ("display_name", models.CharField(max_length=500)),
+                ("search_text", models.TextField()),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="inventory.category",
+                    ),
+                ),
+                (
+                    "department",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="departments.department",
+                    ),
+                ),
+                (
+                    "item",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_document",
+                        to="inventory.item",
+                    ),
+                ),
+                (
+                    "item_variant",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_document",
+                        to="inventory.itemvariant",
+                    ),
+                ),
+                (
+                    "parent_item",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="inventory.item"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Suchdokument",
+                "verbose_name_plural": "Suchdokumente",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="itemsearchdocument",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    models.Q(("item__isnull", False), ("item_variant__isnull", True)),
+                    models.Q(("item__isnull", True), ("item_variant__isnull", False)),
+                    _connector="OR",
+                ),
+                name="itemsearchdocument_either_item_or_variant",
+            ),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+    ]
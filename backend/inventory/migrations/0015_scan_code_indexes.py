@@ -0,0 +1,24 @@
+# Generated by Django 5.0.14 on 2026-10-19 17:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventory", "0014_item_search_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(fields=["identifier1"], name="inventory_item_ident1_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(fields=["identifier2"], name="inventory_item_ident2_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="itemvariant",
+            index=models.Index(fields=["sku"], name="inventory_variant_sku_idx"),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from .category import Category
 from .item import Item
 from .location import StorageLocation
+from .search import ItemSearchDocument
+from .snapshot import StockSnapshot, StockSnapshotLine
 from .stock import Stock, Transaction
 from .variant import ItemVariant
@@ -49,6 +49,11 @@ class Item(models.Model):
         verbose_name = "Artikel"
         verbose_name_plural = "Artikel"
         ordering = ["name"]
+        indexes = [
+            # Scan lookups (inventory.scan) match these exactly
+            models.Index(fields=["identifier1"], name="inventory_item_ident1_idx"),
+            models.Index(fields=["identifier2"], name="inventory_item_ident2_idx"),
+        ]
         permissions = [
             ("can_rent", "can rent items to members"),
         ]
@@ -1,14 +1,20 @@
 from django.core.exceptions import ValidationError
 from django.db import models
+from mptt.models import MPTTModel, TreeForeignKey
 
 from members.models.member import Member
 
 
-class StorageLocation(models.Model):
-    """Lagerort mit hierarchischer Struktur"""
+class StorageLocation(MPTTModel):
+    """
+    Lagerort mit hierarchischer Struktur.
+
+    The tree is indexed as nested sets (django-mptt: tree_id/lft/rght/level),
+    so ancestors, descendants and subtree aggregates are single range queries.
+    """
 
     name = models.CharField(max_length=200, verbose_name="Name")
-    parent = models.ForeignKey(
+    parent = TreeForeignKey(
         "self",
         on_delete=models.CASCADE,
         null=True,
@@ -43,35 +49,29 @@ class StorageLocation(models.Model):
         verbose_name_plural = "Lagerorte"
         ordering = ["name"]
 
+    class MPTTMeta:
+        order_insertion_by = ["name"]
+
     def __str__(self):
         if self.is_member and self.member:
             return f"{self.name} ({self.member.name} {self.member.lastname})"
         return self.name
 
     def get_full_path(self):
-        if self.parent:
-            return f"{self.parent.get_full_path()} > {self.name}"
-        return self.name
-
-    def get_level(self):
-        if self.parent:
-            return self.parent.get_level() + 1
-        return 0
+        # Set in bulk by inventory.selectors.attach_full_paths()
+        if getattr(self, "_full_path", None) is not None:
+            return self._full_path
+        if self.parent_id is None:
+            return self.name
+        return " > ".join(location.name for location in self.get_ancestors(include_self=True))
 
     def get_children_recursive(self):
-        children = list(self.children.all())
-        for child in list(children):
-            children.extend(child.get_children_recursive())
-        return children
+        return list(self.get_descendants())
 
     def clean(self):
         if self.is_member and not self.member:
             raise ValidationError('Wenn "Ist Mitglied" aktiviert ist, muss ein Mitglied ausgewählt werden.')
         if not self.is_member and self.member:
             raise ValidationError('Wenn ein Mitglied ausgewählt ist, muss "Ist Mitglied" aktiviert werden.')
-        if self.parent:
-            current = self.parent
-            while current:
-                if current == self:
-                    raise ValidationError("Ein Lagerort kann nicht sein eigener Übergeordneter sein.")
-                current = current.parent
+        if self.parent and self.pk and self.parent.is_descendant_of(self, include_self=True):
+            raise ValidationError("Ein Lagerort kann nicht sein eigener Übergeordneter sein.")
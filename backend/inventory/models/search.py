@@ -0,0 +1,44 @@
+from django.db import models
+
+from .category import Category
+from .item import Item
+from .variant import ItemVariant
+
+
+class ItemSearchDocument(models.Model):
+    """
+    Denormalisiertes Suchdokument pro Artikel bzw. Variante.
+
+    ``search_text`` holds name, category, SKU, inventory numbers and the
+    flattened JSON attributes, case-folded.  It is indexed per database
+    backend (SQLite FTS5 / PostgreSQL trigram, see migration 0014) and kept
+    in sync by inventory.signals; see inventory.search.
+    """
+
+    item = models.OneToOneField(Item, on_delete=models.CASCADE, null=True, blank=True, related_name="search_document")
+    item_variant = models.OneToOneField(
+        ItemVariant, on_delete=models.CASCADE, null=True, blank=True, related_name="search_document"
+    )
+    # Denormalized for filtering without joins
+    parent_item = models.ForeignKey(Item, on_delete=models.CASCADE, related_name="+")
+    category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    department = models.ForeignKey(
+        "departments.Department", on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    is_variant_parent = models.BooleanField(default=False)
+    display_name = models.CharField(max_length=500)
+    search_text = models.TextField()
+
+    class Meta:
+        verbose_name = "Suchdokument"
+        verbose_name_plural = "Suchdokumente"
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(item__isnull=False, item_variant__isnull=True)
+                | models.Q(item__isnull=True, item_variant__isnull=False),
+                name="itemsearchdocument_either_item_or_variant",
+            )
+        ]
+
+    def __str__(self):
+        return self.display_name
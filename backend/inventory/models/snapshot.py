@@ -0,0 +1,44 @@
+from django.db import models
+
+from .item import Item
+from .location import StorageLocation
+from .variant import ItemVariant
+
+
+class StockSnapshot(models.Model):
+    """Bestandsstichtag: vollständiger Bestand zu einem Zeitpunkt (siehe inventory.snapshots)"""
+
+    taken_at = models.DateTimeField(unique=True, verbose_name="Stichtag")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Erstellt am")
+
+    class Meta:
+        verbose_name = "Bestands-Snapshot"
+        verbose_name_plural = "Bestands-Snapshots"
+        ordering = ["-taken_at"]
+
+    def __str__(self):
+        return f"Bestand zum {self.taken_at:%d.%m.%Y %H:%M}"
+
+
+class StockSnapshotLine(models.Model):
+    """Menge eines Artikels/Variante an einem Lagerort zum Stichtag"""
+
+    snapshot = models.ForeignKey(StockSnapshot, on_delete=models.CASCADE, related_name="lines", verbose_name="Snapshot")
+    location = models.ForeignKey(StorageLocation, on_delete=models.CASCADE, verbose_name="Lagerort")
+    item = models.ForeignKey(Item, on_delete=models.CASCADE, null=True, blank=True, verbose_name="Artikel")
+    item_variant = models.ForeignKey(
+        ItemVariant, on_delete=models.CASCADE, null=True, blank=True, verbose_name="Artikel-Variante"
+    )
+    # Signed: a replay over incomplete history may yield negative balances.
+    quantity = models.IntegerField(verbose_name="Menge")
+
+    class Meta:
+        verbose_name = "Snapshot-Position"
+        verbose_name_plural = "Snapshot-Positionen"
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(item__isnull=False, item_variant__isnull=True)
+                | models.Q(item__isnull=True, item_variant__isnull=False),
+                name="stocksnapshotline_either_item_or_variant",
+            )
+        ]
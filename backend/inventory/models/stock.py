@@ -75,6 +75,9 @@ class Transaction(models.Model):
         ("STOLEN", "Gestohlen"),
         ("OTHER", "Sonstiges"),
     ]
+    # Types that take stock from ``source`` / put stock at ``target``
+    SOURCE_TYPES = frozenset({"OUT", "DISCARD", "MOVE", "LOAN", "RETURN"})
+    TARGET_TYPES = frozenset({"IN", "MOVE", "LOAN", "RETURN"})
     transaction_type = models.CharField(max_length=10, choices=TRANSACTION_TYPES, verbose_name="Transaktionstyp")
     discard_reason = models.CharField(
         max_length=20,
@@ -134,6 +137,13 @@ class Transaction(models.Model):
                 name="transaction_either_item_or_variant",
             )
         ]
+        indexes = [
+            # Range scans for as-of queries (inventory.snapshots)
+            models.Index(fields=["date"], name="inventory_txn_date_idx"),
+            # Latest movements of a location (?source= / ?target= filters, member equipment)
+            models.Index(fields=["source", "-date"], name="inventory_txn_source_date_idx"),
+            models.Index(fields=["target", "-date"], name="inventory_txn_target_date_idx"),
+        ]
 
     def clean(self):
         if not self.item and not self.item_variant:
@@ -184,14 +194,14 @@ class Transaction(models.Model):
             stock_params = {"item": None, "item_variant": self.item_variant}
         if self.transaction_type == "IN":
             # IN: Only add to target (stock coming from outside the system)
-            stock, _created = Stock.objects.get_or_create(
+            stock, _created = Stock.objects.select_for_update().get_or_create(
                 location=self.target, defaults={"quantity": 0, **stock_params}, **stock_params
             )
             stock.quantity += self.quantity
             stock.save()
         elif self.transaction_type in ["OUT", "DISCARD"]:
             try:
-                stock = Stock.objects.get(location=self.source, **stock_params)
+                stock = Stock.objects.select_for_update().get(location=self.source, **stock_params)
                 if stock.quantity < self.quantity:
                     raise ValidationError(f"Nicht genügend Bestand. Verfügbar: {stock.quantity}")
                 stock.quantity -= self.quantity
@@ -201,14 +211,14 @@ class Transaction(models.Model):
         elif self.transaction_type in ["MOVE", "LOAN", "RETURN"]:
             # MOVE, LOAN, RETURN: Subtract from source and add to target
             try:
-                source_stock = Stock.objects.get(location=self.source, **stock_params)
+                source_stock = Stock.objects.select_for_update().get(location=self.source, **stock_params)
                 if source_stock.quantity < self.quantity:
                     raise ValidationError(f"Nicht genügend Bestand. Verfügbar: {source_stock.quantity}")
                 source_stock.quantity -= self.quantity
                 source_stock.save()
             except Stock.DoesNotExist as e:
                 raise ValidationError("Kein Bestand am Quellort vorhanden.") from e
-            target_stock, _created = Stock.objects.get_or_create(
+            target_stock, _created = Stock.objects.select_for_update().get_or_create(
                 location=self.target, defaults={"quantity": 0, **stock_params}, **stock_params
             )
             target_stock.quantity += self.quantity
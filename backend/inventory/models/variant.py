@@ -26,15 +26,21 @@ class ItemVariant(models.Model):
         verbose_name_plural = "Artikel-Varianten"
         unique_together = ["parent_item", "variant_attributes"]
         ordering = ["parent_item__name", "sku"]
+        indexes = [models.Index(fields=["sku"], name="inventory_variant_sku_idx")]
 
     def __str__(self):
+        return self.format_name(self.parent_item.name, self.variant_attributes, self.pk)
+
+    @staticmethod
+    def format_name(parent_name, variant_attributes, pk):
+        """Display name from raw column values, e.g. for ``values()`` aggregates."""
         variant_parts = []
-        if self.variant_attributes:
-            for key, value in self.variant_attributes.items():
+        if variant_attributes:
+            for key, value in variant_attributes.items():
                 variant_parts.append(f"{key}: {value}")
         if variant_parts:
-            return f"{self.parent_item.name} ({', '.join(variant_parts)})"
-        return f"{self.parent_item.name} (Variante #{self.pk})"
+            return f"{parent_name} ({', '.join(variant_parts)})"
+        return f"{parent_name} (Variante #{pk})"
 
     @property
     def name(self):
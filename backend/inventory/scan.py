@@ -0,0 +1,101 @@
+"""
+Scan-to-item resolution.
+
+A scanned code is looked up with exact, indexed matches against
+``Item.identifier1`` (hand inventory number), ``Item.identifier2`` (barcode)
+and ``ItemVariant.sku``.  ``resolve_scan_codes()`` answers a whole handheld
+scanner session with a fixed number of queries - items, variants and the
+stock of all matches - regardless of how many codes were scanned.
+"""
+
+from django.db.models import Q
+
+from .models import Item, ItemVariant, Stock
+
+SCAN_FIELDS = ("identifier1", "identifier2")
+
+
+def normalize_codes(codes):
+    """Strip whitespace, drop empty and duplicate codes, keep the scan order."""
+    return list(dict.fromkeys(code.strip() for code in codes if code and code.strip()))
+
+
+def _member_payload(member):
+    return {"member": member.pk, "member_name": str(member)}
+
+
+def resolve_scan_codes(codes, items=None):
+    """
+    Return ``{code: [match, ...]}`` for every code (empty list: unknown code).
+
+    ``items`` is an optional base queryset (e.g. department scope); variants
+    are only resolved when their parent item is part of it.  Codes are not
+    unique, so a code may resolve to several matches.
+    """
+    codes = normalize_codes(codes)
+    results = {code: [] for code in codes}
+    if not codes:
+        return results
+
+    items = Item.objects.all() if items is None else items
+    matched_items = list(
+        items.filter(Q(identifier1__in=codes) | Q(identifier2__in=codes)).select_related("category", "rented_by")
+    )
+    matched_variants = list(
+        ItemVariant.objects.filter(sku__in=codes, parent_item__in=items.values("pk")).select_related(
+            "parent_item__category", "parent_item__rented_by"
+        )
+    )
+
+    stock_rows = (
+        Stock.objects.filter(
+            Q(item__in=[item.pk for item in matched_items]) | Q(item_variant__in=[v.pk for v in matched_variants]),
+            quantity__gt=0,
+        )
+        .select_related("location__member")
+        .order_by("location__name", "pk")
+    )
+    stock_by_key = {}
+    for stock in stock_rows:
+        key = ("item", stock.item_id) if stock.item_id else ("variant", stock.item_variant_id)
+        stock_by_key.setdefault(key, []).append(stock)
+
+    def build(kind, obj, item, field):
+        stocks = stock_by_key.get((kind, obj.pk), [])
+        borrowers = {}
+        if item.rented_by is not None:
+            borrowers[item.rented_by.pk] = _member_payload(item.rented_by)
+        for stock in stocks:
+            if stock.location.is_member and stock.location.member is not None:
+                borrowers.setdefault(stock.location.member_id, _member_payload(stock.location.member))
+        return {
+            "type": kind,
+            "matched_field": field,
+            "item": item.pk,
+            "item_variant": obj.pk if kind == "variant" else None,
+            "display_name": str(obj),
+            "category_name": item.category.name if item.category else "",
+            "department": item.department_id,
+            "total_quantity": sum(stock.quantity for stock in stocks),
+            "stock": [
+                {
+                    "location": stock.location_id,
+                    "location_name": stock.location.name,
+                    "is_member": stock.location.is_member,
+                    "quantity": stock.quantity,
+                }
+                for stock in stocks
+            ],
+            "borrowers": list(borrowers.values()),
+        }
+
+    for item in matched_items:
+        fields_by_code = {}
+        for field in SCAN_FIELDS:
+            fields_by_code.setdefault(getattr(item, field), field)
+        for code, field in fields_by_code.items():
+            if code in results:
+                results[code].append(build("item", item, item, field))
+    for variant in matched_variants:
+        results[variant.sku].append(build("variant", variant, variant.parent_item, "sku"))
+    return results
@@ -0,0 +1,184 @@
+"""
+Catalog search over items and variants.
+
+Every item and every variant has one ``ItemSearchDocument`` whose
+``search_text`` contains name, category, SKU, inventory numbers, legacy size
+and the flattened JSON attributes (keys and values), case-folded.  Documents
+are rebuilt by inventory.signals whenever an item, variant or category is
+saved; ``manage.py rebuild_search_index`` rebuilds all of them after bulk
+imports or raw SQL changes.
+
+``search_documents()`` matches every word of the query as a substring, like
+the former ``icontains`` search, so "jacke" also finds "Einsatzjacke".  On
+SQLite an FTS5 table with the trigram tokenizer (kept in sync by triggers)
+answers words of at least three characters; shorter words, other backends
+and SQLite builds without FTS5 use LIKE (PostgreSQL: trigram GIN index).  The
+typeahead never loads attributes into Python.
+"""
+
+import re
+
+from django.db import connection
+from django.db.models.expressions import RawSQL
+
+from .models import Item, ItemSearchDocument, ItemVariant
+
+FTS_TABLE = "inventory_search_fts"
+MIN_QUERY_LENGTH = 2
+TRIGRAM_LENGTH = 3  # shorter words have no trigram and cannot use the FTS table
+INDEX_BATCH_SIZE = 500
+DOCUMENT_FIELDS = ["parent_item", "category", "department", "is_variant_parent", "display_name", "search_text"]
+
+_WORD_RE = re.compile(r"\w+")
+_fts_available = None
+
+
+def normalize(text) -> str:
+    return " ".join(str(text).casefold().split())
+
+
+def flatten_attributes(attributes) -> list[str]:
+    """Keys and values of a (possibly nested) attribute dict as strings."""
+    if not isinstance(attributes, dict):
+        return []
+    parts = []
+    for key, value in attributes.items():
+        parts.append(str(key))
+        if isinstance(value, dict):
+            parts.extend(flatten_attributes(value))
+        elif isinstance(value, list | tuple):
+            parts.extend(str(entry) for entry in value if entry is not None)
+        elif value is not None and value != "":
+            parts.append(str(value))
+    return parts
+
+
+def build_search_text(*parts, attributes=()) -> str:
+    return normalize(" ".join(str(part) for part in (*parts, *attributes) if part))
+
+
+def _item_document(item):
+    category = item.category
+    return {
+        "parent_item_id": item.pk,
+        "category_id": item.category_id,
+        "department_id": item.department_id,
+        "is_variant_parent": item.is_variant_parent,
+        "display_name": str(item)[:500],
+        "search_text": build_search_text(
+            item.name,
+            category.name if category else "",
+            item.size,
+            item.identifier1,
+            item.identifier2,
+            attributes=flatten_attributes(item.attributes),
+        ),
+    }
+
+
+def _variant_document(variant):
+    parent = variant.parent_item
+    category = parent.category
+    return {
+        "parent_item_id": parent.pk,
+        "category_id": parent.category_id,
+        "department_id": parent.department_id,
+        "is_variant_parent": False,
+        "display_name": str(variant)[:500],
+        "search_text": build_search_text(
+            parent.name,
+            category.name if category else "",
+            variant.sku,
+            parent.identifier1,
+            parent.identifier2,
+            attributes=[*flatten_attributes(parent.attributes), *flatten_attributes(variant.variant_attributes)],
+        ),
+    }
+
+
+def _write_documents(field, documents):
+    """Upsert ``{object_id: values}`` for the documents linked via ``field`` (item / item_variant)."""
+    existing = {
+        getattr(document, f"{field}_id"): document
+        for document in ItemSearchDocument.objects.filter(**{f"{field}_id__in": documents})
+    }
+    updates, creates = [], []
+    for object_id, values in documents.items():
+        document = existing.get(object_id)
+        if document is None:
+            creates.append(ItemSearchDocument(**{f"{field}_id": object_id}, **values))
+            continue
+        if any(getattr(document, name) != value for name, value in values.items()):
+            for name, value in values.items():
+                setattr(document, name, value)
+            updates.append(document)
+    if updates:
+        ItemSearchDocument.objects.bulk_update(updates, DOCUMENT_FIELDS, batch_size=INDEX_BATCH_SIZE)
+    if creates:
+        ItemSearchDocument.objects.bulk_create(creates, batch_size=INDEX_BATCH_SIZE)
+
+
+def index_items(item_ids):
+    """Rebuild the documents of the given items and of all their variants."""
+    item_ids = list(item_ids)
+    if not item_ids:
+        return
+    items = Item.objects.filter(pk__in=item_ids).select_related("category")
+    _write_documents("item", {item.pk: _item_document(item) for item in items})
+    variants = ItemVariant.objects.filter(parent_item_id__in=item_ids).select_related("parent_item__category")
+    _write_documents("item_variant", {variant.pk: _variant_document(variant) for variant in variants})
+
+
+def index_variants(variant_ids):
+    variant_ids = list(variant_ids)
+    if not variant_ids:
+        return
+    variants = ItemVariant.objects.filter(pk__in=variant_ids).select_related("parent_item__category")
+    _write_documents("item_variant", {variant.pk: _variant_document(variant) for variant in variants})
+
+
+def rebuild_search_index():
+    """Rebuild every document in batches; returns the number of items indexed."""
+    count = 0
+    batch = []
+    for item_id in Item.objects.order_by("pk").values_list("pk", flat=True).iterator(chunk_size=INDEX_BATCH_SIZE):
+        batch.append(item_id)
+        if len(batch) == INDEX_BATCH_SIZE:
+            index_items(batch)
+            count += len(batch)
+            batch = []
+    index_items(batch)
+    return count + len(batch)
+
+
+def _use_fts():
+    global _fts_available
+    if connection.vendor != "sqlite":
+        return False
+    if _fts_available is None:
+        _fts_available = FTS_TABLE in connection.introspection.table_names()
+    return _fts_available
+
+
+def search_documents(query, documents=None):
+    """
+    Return the ItemSearchDocument queryset matching every word of ``query``.
+
+    ``documents`` is an optional pre-filtered queryset (e.g. department scope).
+    """
+    documents = ItemSearchDocument.objects.all() if documents is None else documents
+    words = _WORD_RE.findall(normalize(query))
+    if not words:
+        return documents.none()
+    if _use_fts():
+        fts_words = [word for word in words if len(word) >= TRIGRAM_LENGTH]
+        if fts_words:
+            # A quoted string is a substring match with the trigram tokenizer
+            match = " ".join(f'"{word}"' for word in fts_words)
+            documents = documents.filter(
+                pk__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", (match,))
+            )
+        words = [word for word in words if len(word) < TRIGRAM_LENGTH]
+    for word in words:
+        documents = documents.filter(search_text__contains=word)
+    return documents
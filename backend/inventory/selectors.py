@@ -1,4 +1,6 @@
-from .models import Category, Item
+from django.db.models import Count, Q, Sum
+
+from .models import Category, Item, ItemVariant, Stock, StorageLocation
 
 
 def get_item_list():
@@ -9,3 +11,119 @@ def get_item_list():
 def get_category_list():
     category_view_list = Category.objects.all()
     return category_view_list
+
+
+def get_location_paths(tree_ids):
+    """
+    Return {location_id: "Root > ... > Location"} for all locations in the
+    given trees, loaded with a single query.
+    """
+    rows = StorageLocation.objects.filter(tree_id__in=tree_ids).order_by("tree_id", "lft")
+    paths = {}
+    # Tree order guarantees that a parent's path is known before its children.
+    for location_id, name, parent_id in rows.values_list("id", "name", "parent_id"):
+        paths[location_id] = f"{paths[parent_id]} > {name}" if parent_id in paths else name
+    return paths
+
+
+def attach_full_paths(locations):
+    """Precompute get_full_path() for a batch of locations with at most one query."""
+    locations = [location for location in locations if location is not None]
+    tree_ids = {location.tree_id for location in locations if location.parent_id is not None}
+    paths = get_location_paths(tree_ids) if tree_ids else {}
+    for location in locations:
+        location._full_path = paths.get(location.pk, location.name)
+    return locations
+
+
+def filter_stock_in_subtree(stock_qs, location):
+    """Restrict a Stock queryset to the location and all of its descendants."""
+    return stock_qs.filter(
+        location__tree_id=location.tree_id,
+        location__lft__gte=location.lft,
+        location__rght__lte=location.rght,
+    )
+
+
+_ROLLUP_FIELDS = (
+    "item_id",
+    "item__name",
+    "item_variant_id",
+    "item_variant__parent_item__name",
+    "item_variant__variant_attributes",
+)
+
+
+def get_stock_rollup(stock_qs, group_by=()):
+    """
+    Aggregate stock per item/variant with a single GROUP BY query.
+
+    ``group_by`` adds further ``values()`` fields (e.g. the location's
+    department) in front of the item/variant key.  Returns a list of dicts
+    with ``quantity`` and ``location_count`` per group; empty stock rows are
+    ignored.
+    """
+    rows = (
+        stock_qs.filter(quantity__gt=0)
+        .values(*group_by, *_ROLLUP_FIELDS)
+        .annotate(quantity=Sum("quantity"), location_count=Count("location_id", distinct=True))
+        .order_by(*group_by, "item__name", "item_variant__parent_item__name", "item_variant_id")
+    )
+    result = []
+    for row in rows:
+        if row["item_variant_id"] is not None:
+            display_name = ItemVariant.format_name(
+                row["item_variant__parent_item__name"], row["item_variant__variant_attributes"], row["item_variant_id"]
+            )
+        else:
+            display_name = row["item__name"]
+        entry = {field: row[field] for field in group_by}
+        entry.update(
+            {
+                "item": row["item_id"],
+                "item_variant": row["item_variant_id"],
+                "display_name": display_name,
+                "quantity": row["quantity"],
+                "location_count": row["location_count"],
+            }
+        )
+        result.append(entry)
+    return result
+
+
+def describe_stock_keys(keys):
+    """
+    Resolve ``(location_id, item_id, item_variant_id)`` keys to display data
+    with three queries.  Returns ``{key: {"location_name", "display_name"}}``.
+    """
+    keys = list(keys)
+    locations = StorageLocation.objects.in_bulk({location_id for location_id, _, _ in keys})
+    items = Item.objects.in_bulk({item_id for _, item_id, _ in keys if item_id is not None})
+    variants = ItemVariant.objects.select_related("parent_item").in_bulk(
+        {variant_id for _, _, variant_id in keys if variant_id is not None}
+    )
+    result = {}
+    for key in keys:
+        location_id, item_id, variant_id = key
+        location = locations.get(location_id)
+        item = items.get(item_id) if item_id is not None else variants.get(variant_id)
+        result[key] = {
+            "location_name": location.name if location else None,
+            "display_name": str(item) if item else None,
+        }
+    return result
+
+
+def get_stock_quantities(item_ids=(), variant_ids=(), location_id=None):
+    """
+    Stock per item and per variant in one grouped query: summed over all
+    locations, or at ``location_id`` only.  Returns ``{("item" | "variant", id): quantity}``.
+    """
+    stock_qs = Stock.objects.filter(Q(item_id__in=item_ids) | Q(item_variant_id__in=variant_ids))
+    if location_id is not None:
+        stock_qs = stock_qs.filter(location_id=location_id)
+    rows = stock_qs.values_list("item_id", "item_variant_id").annotate(total=Sum("quantity")).order_by()
+    return {
+        ("item", item_id) if item_id is not None else ("variant", variant_id): total
+        for item_id, variant_id, total in rows
+    }
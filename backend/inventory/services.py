@@ -0,0 +1,198 @@
+"""
+Bulk booking of inventory transactions.
+
+``Transaction.save()`` validates, opens its own atomic block and reads/writes
+2-4 stock rows per transaction.  For handout days (a full kit for every new
+member) ``create_transactions_bulk()`` books a whole list instead:
+
+- items, variants and locations of all lines are resolved with one query each,
+- every line is validated against one stock snapshot that is locked for the
+  duration of the booking, applying the lines in order,
+- stock changes are written as one conditional UPDATE per distinct delta plus
+  one ``bulk_create`` for new stock rows, and the transactions themselves are
+  inserted with ``bulk_create``.
+
+Nothing is written unless every line is valid; errors are reported per line.
+"""
+
+from collections import defaultdict
+
+from django.core.exceptions import ValidationError
+from django.db import transaction as db_transaction
+from django.db.models import F, Q
+
+from .models import Item, ItemVariant, Stock, StorageLocation, Transaction
+
+
+class BulkTransactionError(Exception):
+    """
+    Raised when nothing was booked.  ``errors`` has the shape of a DRF error
+    response, e.g. ``{"transactions": {line_index: {field: [messages]}}}``.
+    """
+
+    def __init__(self, errors):
+        super().__init__("Ungültige Transaktionen")
+        self.errors = errors
+
+
+def _stock_key(location_id, line):
+    return (location_id, line.item_id, line.item_variant_id)
+
+
+def _build_transactions(lines, user, errors):
+    """Turn the validated line dicts into unsaved Transaction objects (3 queries)."""
+    from .api.access import get_transaction_access_error
+
+    ids = defaultdict(set)
+    for line in lines:
+        for field in ("item", "item_variant", "source", "target"):
+            if line.get(field) is not None:
+                ids[field].add(line[field])
+
+    objects = {
+        "item": Item.objects.in_bulk(ids["item"]),
+        "item_variant": ItemVariant.objects.select_related("parent_item").in_bulk(ids["item_variant"]),
+    }
+    objects["source"] = objects["target"] = StorageLocation.objects.in_bulk(ids["source"] | ids["target"])
+
+    transactions = []
+    for index, line in enumerate(lines):
+        resolved = {}
+        for field in ("item", "item_variant", "source", "target"):
+            pk = line.get(field)
+            if pk is None:
+                resolved[field] = None
+            elif pk in objects[field]:
+                resolved[field] = objects[field][pk]
+            else:
+                errors.setdefault(index, {})[field] = [f"Objekt mit ID {pk} existiert nicht."]
+        if index in errors:
+            transactions.append(None)
+            continue
+
+        txn = Transaction(
+            transaction_type=line["transaction_type"],
+            discard_reason=line.get("discard_reason") or None,
+            quantity=line["quantity"],
+            note=line.get("note", ""),
+            user=user,
+            **resolved,
+        )
+        try:
+            txn.clean()
+        except ValidationError as exc:
+            errors[index] = {"non_field_errors": exc.messages}
+            transactions.append(None)
+            continue
+
+        if txn.item_id is not None:
+            item_department_id = txn.item.department_id
+        else:
+            item_department_id = txn.item_variant.parent_item.department_id
+        access_error = get_transaction_access_error(user, item_department_id, txn.source, txn.target)
+        if access_error:
+            errors[index] = {field: [message] for field, message in access_error.items()}
+            transactions.append(None)
+            continue
+
+        transactions.append(txn)
+    return transactions
+
+
+def _load_stock_snapshot(transactions):
+    """Lock and return ``{(location_id, item_id, item_variant_id): Stock}`` for all touched rows."""
+    location_ids = set()
+    item_ids = set()
+    variant_ids = set()
+    for txn in transactions:
+        location_ids.update(pk for pk in (txn.source_id, txn.target_id) if pk is not None)
+        if txn.item_id is not None:
+            item_ids.add(txn.item_id)
+        else:
+            variant_ids.add(txn.item_variant_id)
+
+    rows = Stock.objects.select_for_update().filter(
+        Q(item_id__in=item_ids) | Q(item_variant_id__in=variant_ids), location_id__in=location_ids
+    )
+    snapshot = {}
+    for stock in rows.order_by("pk"):
+        snapshot.setdefault((stock.location_id, stock.item_id, stock.item_variant_id), stock)
+    return snapshot
+
+
+def _apply_to_snapshot(transactions, snapshot, errors):
+    """
+    Replay the transactions in order against the snapshot quantities.
+
+    Returns ``{stock_key: delta}``; insufficient stock is reported per line
+    with the same messages as ``Transaction.update_stock()``.
+    """
+    available = {key: stock.quantity for key, stock in snapshot.items()}
+    deltas = defaultdict(int)
+    for index, txn in enumerate(transactions):
+        if txn is None:
+            continue
+        if txn.transaction_type in Transaction.SOURCE_TYPES:
+            key = _stock_key(txn.source_id, txn)
+            if key not in available:
+                errors[index] = {"non_field_errors": ["Kein Bestand am Quellort vorhanden."]}
+                continue
+            if available[key] < txn.quantity:
+                errors[index] = {"non_field_errors": [f"Nicht genügend Bestand. Verfügbar: {available[key]}"]}
+                continue
+            available[key] -= txn.quantity
+            deltas[key] -= txn.quantity
+        if txn.transaction_type in Transaction.TARGET_TYPES:
+            key = _stock_key(txn.target_id, txn)
+            available[key] = available.get(key, 0) + txn.quantity
+            deltas[key] += txn.quantity
+    return deltas
+
+
+def _write_stock(snapshot, deltas):
+    by_delta = defaultdict(list)
+    new_rows = []
+    for key, delta in deltas.items():
+        stock = snapshot.get(key)
+        if stock is None:
+            location_id, item_id, item_variant_id = key
+            new_rows.append(
+                Stock(location_id=location_id, item_id=item_id, item_variant_id=item_variant_id, quantity=delta)
+            )
+        elif delta:
+            by_delta[delta].append(stock.pk)
+
+    for delta, pks in by_delta.items():
+        # The guard only matters if the snapshot lock was not honoured (SQLite);
+        # a mismatch aborts the whole booking instead of going negative.
+        updated = Stock.objects.filter(pk__in=pks, quantity__gte=max(-delta, 0)).update(quantity=F("quantity") + delta)
+        if updated != len(pks):
+            raise BulkTransactionError(
+                {"non_field_errors": ["Der Bestand wurde zwischenzeitlich geändert. Bitte erneut versuchen."]}
+            )
+    if new_rows:
+        Stock.objects.bulk_create(new_rows)
+
+
+def create_transactions_bulk(lines, user=None):
+    """
+    Book a list of transactions all-or-nothing.
+
+    ``lines`` are dicts with ``transaction_type``, ``item``/``item_variant``,
+    ``source``/``target`` (primary keys), ``quantity`` and optionally ``note``
+    and ``discard_reason``; they are applied in list order, so a line may use
+    stock booked in by an earlier line.  Returns the created transactions or
+    raises BulkTransactionError.
+    """
+    errors = {}
+    transactions = _build_transactions(lines, user, errors)
+
+    with db_transaction.atomic():
+        valid = [txn for txn in transactions if txn is not None]
+        snapshot = _load_stock_snapshot(valid) if valid else {}
+        deltas = _apply_to_snapshot(transactions, snapshot, errors)
+        if errors:
+            raise BulkTransactionError({"transactions": dict(sorted(errors.items()))})
+
+        _write_stock(snapshot, deltas)
+        return Transaction.objects.bulk_create(transactions)
@@ -0,0 +1,30 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from jf_manager_backend.etags import track_collection_versions
+
+from .models import Category, Item, ItemVariant
+from .search import index_items, index_variants
+
+# Category lists carry an item_count.
+track_collection_versions(Category, Item)
+
+
+@receiver(post_save, sender=Item)
+def item_saved(sender, instance, raw=False, **kwargs):
+    """Rebuild the search documents of the item and its variants."""
+    if not raw:
+        index_items([instance.pk])
+
+
+@receiver(post_save, sender=ItemVariant)
+def item_variant_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        index_variants([instance.pk])
+
+
+@receiver(post_save, sender=Category)
+def category_saved(sender, instance, created=False, raw=False, **kwargs):
+    """A renamed category changes the search text of all its items."""
+    if not raw and not created:
+        index_items(instance.item_set.values_list("pk", flat=True))
@@ -0,0 +1,153 @@
+"""
+Point-in-time stock: periodic snapshots and as-of queries.
+
+A ``StockSnapshot`` stores the complete stock at ``taken_at`` as compact
+(location, item/variant, quantity) rows.  ``compute_stock_as_of(at)`` starts
+from the latest snapshot at or before ``at`` and applies only the transactions
+booked after it, aggregated in the database (one grouped query for incoming
+and one for outgoing legs), so answering "stock on 31.12." does not scan the
+whole history once snapshots exist.
+
+Snapshots are themselves computed this way (previous snapshot + delta), not
+copied from ``Stock``, so they agree with the ledger replay in
+``inventory.ledger``: legs whose location was unlinked are skipped.
+"""
+
+from collections import defaultdict
+from datetime import datetime, time
+
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.db.models import Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import StockSnapshot, StockSnapshotLine, Transaction
+
+SNAPSHOT_BATCH_SIZE = 2000
+
+
+def parse_as_of(value):
+    """
+    Parse ``YYYY-MM-DD`` (end of that day, local time) or an ISO datetime.
+    Raises ValueError for anything else.
+    """
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(value)
+        moment = datetime.combine(day, time.max)
+    if settings.USE_TZ and timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def month_starts(start, end):
+    """Local midnights of every first of month in ``(start, end]``."""
+    start = timezone.localtime(start) if settings.USE_TZ else start
+    year, month = start.year, start.month
+    while True:
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+        moment = datetime(year, month, 1)
+        if settings.USE_TZ:
+            moment = timezone.make_aware(moment)
+        if moment > end:
+            return
+        yield moment
+
+
+def _scope(qs, location_field, locations=None, item_id=None, item_variant_id=None, user=None):
+    if locations is not None:
+        qs = qs.filter(**{f"{location_field}__in": locations})
+    if item_id is not None:
+        qs = qs.filter(item_id=item_id)
+    if item_variant_id is not None:
+        qs = qs.filter(item_variant_id=item_variant_id)
+    if user is not None:
+        from .api.access import filter_item_department_queryset_for_user
+
+        qs = filter_item_department_queryset_for_user(qs, user)
+    return qs
+
+
+def get_stock_delta(start, end, **scope):
+    """
+    Net stock change per ``(location_id, item_id, item_variant_id)`` of all
+    transactions with ``start < date <= end`` (``start=None``: from the beginning).
+    """
+    qs = Transaction.objects.filter(date__lte=end)
+    if start is not None:
+        qs = qs.filter(date__gt=start)
+
+    delta = defaultdict(int)
+    for location_field, types, sign in (
+        ("target", Transaction.TARGET_TYPES, 1),
+        ("source", Transaction.SOURCE_TYPES, -1),
+    ):
+        legs = (
+            _scope(qs, location_field, **scope)
+            .filter(transaction_type__in=types, **{f"{location_field}__isnull": False})
+            .values_list(f"{location_field}_id", "item_id", "item_variant_id")
+            .annotate(total=Sum("quantity"))
+            .order_by()
+        )
+        for location_id, item_id, item_variant_id, total in legs:
+            delta[(location_id, item_id, item_variant_id)] += sign * total
+    return delta
+
+
+def get_base_snapshot(at):
+    """Return the latest snapshot taken at or before ``at`` (or None)."""
+    return StockSnapshot.objects.filter(taken_at__lte=at).order_by("-taken_at").first()
+
+
+def compute_stock_as_of(at, **scope):
+    """
+    Return ``(balances, snapshot)``: the non-zero stock per
+    ``(location_id, item_id, item_variant_id)`` at ``at`` and the snapshot it
+    was derived from.
+
+    ``scope`` narrows the result: ``locations`` (queryset or ids),
+    ``item_id``, ``item_variant_id`` and ``user`` (item department visibility).
+    """
+    snapshot = get_base_snapshot(at)
+    balances = defaultdict(int)
+    if snapshot is not None:
+        lines = _scope(snapshot.lines.all(), "location", **scope).values_list(
+            "location_id", "item_id", "item_variant_id", "quantity"
+        )
+        for location_id, item_id, item_variant_id, quantity in lines.iterator(chunk_size=SNAPSHOT_BATCH_SIZE):
+            balances[(location_id, item_id, item_variant_id)] += quantity
+
+    for key, change in get_stock_delta(snapshot.taken_at if snapshot else None, at, **scope).items():
+        balances[key] += change
+    return {key: quantity for key, quantity in balances.items() if quantity}, snapshot
+
+
+def take_stock_snapshot(at=None):
+    """Store the complete stock at ``at`` (default: now); idempotent per point in time."""
+    at = at or timezone.now()
+    existing = StockSnapshot.objects.filter(taken_at=at).first()
+    if existing is not None:
+        return existing
+
+    balances, _ = compute_stock_as_of(at)
+    with db_transaction.atomic():
+        snapshot = StockSnapshot.objects.create(taken_at=at)
+        StockSnapshotLine.objects.bulk_create(
+            (
+                StockSnapshotLine(
+                    snapshot=snapshot,
+                    location_id=location_id,
+                    item_id=item_id,
+                    item_variant_id=item_variant_id,
+                    quantity=quantity,
+                )
+                for (location_id, item_id, item_variant_id), quantity in balances.items()
+            ),
+            batch_size=SNAPSHOT_BATCH_SIZE,
+        )
+    return snapshot
@@ -0,0 +1,125 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from departments.models import Department, UserDepartmentRole
+from inventory.models import Category, Item, ItemVariant, Stock, StorageLocation, Transaction
+
+URL = "/api/v1/inventory/transactions/bulk/"
+
+
+class BulkTransactionTest(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser(username="admin", password="pw12345")
+        self.client.force_authenticate(user=self.user)
+
+        category = Category.objects.create(name="Bekleidung")
+        self.helmet = Item.objects.create(name="Helm", category=category)
+        self.jacket = Item.objects.create(name="Jacke", category=category, is_variant_parent=True)
+        self.jacket_164 = ItemVariant.objects.create(parent_item=self.jacket, variant_attributes={"größe": "164"})
+
+        self.depot = StorageLocation.objects.create(name="Kleiderkammer")
+        self.members = [StorageLocation.objects.create(name=f"Mitglied {index}") for index in range(3)]
+
+        Transaction.objects.create(transaction_type="IN", item=self.helmet, target=self.depot, quantity=10)
+        Transaction.objects.create(transaction_type="IN", item_variant=self.jacket_164, target=self.depot, quantity=2)
+
+    def _stock(self, location, **kwargs):
+        stock = Stock.objects.filter(location=location, **kwargs).first()
+        return stock.quantity if stock else None
+
+    def _loan(self, location, **kwargs):
+        return {"transaction_type": "LOAN", "source": self.depot.pk, "target": location.pk, "quantity": 1, **kwargs}
+
+    def test_handout_books_all_lines(self):
+        lines = [self._loan(member, item=self.helmet.pk) for member in self.members]
+        lines.append(self._loan(self.members[0], item_variant=self.jacket_164.pk, quantity=2))
+
+        response = self.client.post(URL, {"transactions": lines}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(response.data["created"], 4)
+        self.assertEqual(self._stock(self.depot, item=self.helmet), 7)
+        self.assertEqual(self._stock(self.depot, item_variant=self.jacket_164), 0)
+        self.assertEqual(self._stock(self.members[0], item=self.helmet), 1)
+        self.assertEqual(self._stock(self.members[0], item_variant=self.jacket_164), 2)
+        self.assertEqual(Transaction.objects.filter(transaction_type="LOAN", user=self.user).count(), 4)
+
+    def test_lines_are_applied_in_order(self):
+        lines = [
+            {"transaction_type": "IN", "item": self.helmet.pk, "target": self.members[0].pk, "quantity": 2},
+            {
+                "transaction_type": "MOVE",
+                "item": self.helmet.pk,
+                "source": self.members[0].pk,
+                "target": self.members[1].pk,
+                "quantity": 2,
+            },
+        ]
+
+        response = self.client.post(URL, {"transactions": lines}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(self._stock(self.members[0], item=self.helmet), 0)
+        self.assertEqual(self._stock(self.members[1], item=self.helmet), 2)
+
+    def test_any_invalid_line_books_nothing(self):
+        lines = [
+            self._loan(self.members[0], item=self.helmet.pk),
+            self._loan(self.members[1], item_variant=self.jacket_164.pk, quantity=5),
+            {"transaction_type": "OUT", "item": self.helmet.pk, "quantity": 1},
+            self._loan(self.members[2], item=999999),
+        ]
+        transaction_count = Transaction.objects.count()
+
+        response = self.client.post(URL, {"transactions": lines}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data["transactions"]
+        self.assertEqual(sorted(errors), [1, 2, 3])
+        self.assertEqual(errors[1]["non_field_errors"], ["Nicht genügend Bestand. Verfügbar: 2"])
+        self.assertIn("item", errors[3])
+        self.assertEqual(Transaction.objects.count(), transaction_count)
+        self.assertEqual(self._stock(self.depot, item=self.helmet), 10)
+        self.assertIsNone(self._stock(self.members[0], item=self.helmet))
+
+    def test_cumulative_lines_cannot_overdraw_stock(self):
+        lines = [self._loan(member, item_variant=self.jacket_164.pk) for member in self.members]
+
+        response = self.client.post(URL, {"transactions": lines}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(response.data["transactions"]), [2])
+
+    def test_query_count_does_not_grow_with_lines(self):
+        def post(count):
+            lines = [self._loan(self.members[index % 3], item=self.helmet.pk) for index in range(count)]
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.post(URL, {"transactions": lines}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+            return len(ctx.captured_queries)
+
+        post(1)  # warm the access context cache
+        self.assertEqual(post(2), post(6))
+
+    def test_department_user_cannot_book_foreign_items(self):
+        dept_a = Department.objects.create(name="Abteilung A", code="dept-a")
+        dept_b = Department.objects.create(name="Abteilung B", code="dept-b")
+        foreign_item = Item.objects.create(name="Item B", category=self.helmet.category, department=dept_b)
+        location_a = StorageLocation.objects.create(name="Lager A", department=dept_a)
+
+        user = get_user_model().objects.create_user(username="dept_user", password="pw12345")
+        group = Group.objects.create(name="inventory-dept-role")
+        group.permissions.set(Permission.objects.filter(codename="add_transaction"))
+        role = UserDepartmentRole.objects.create(user=user, department=dept_a)
+        role.groups.add(group)
+        self.client.force_authenticate(user=user)
+
+        lines = [{"transaction_type": "IN", "item": foreign_item.pk, "target": location_a.pk, "quantity": 1}]
+        response = self.client.post(URL, {"transactions": lines}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("item", response.data["transactions"][0])
@@ -0,0 +1,105 @@
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.ajax_views import _sort_locations_hierarchically
+from inventory.models import StorageLocation
+from inventory.selectors import attach_full_paths
+
+
+def build_depot():
+    depot = StorageLocation.objects.create(name="Gerätehaus")
+    room = StorageLocation.objects.create(name="Kleiderkammer", parent=depot)
+    shelf = StorageLocation.objects.create(name="Regal 1", parent=room)
+    box = StorageLocation.objects.create(name="Fach B", parent=shelf)
+    return depot, room, shelf, box
+
+
+class StorageLocationTreeTest(TestCase):
+    def setUp(self):
+        self.depot, self.room, self.shelf, self.box = build_depot()
+
+    def test_full_path_and_level(self):
+        box = StorageLocation.objects.get(pk=self.box.pk)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(box.get_full_path(), "Gerätehaus > Kleiderkammer > Regal 1 > Fach B")
+        self.assertEqual(box.get_level(), 3)
+
+    def test_children_recursive_in_one_query(self):
+        depot = StorageLocation.objects.get(pk=self.depot.pk)
+
+        with self.assertNumQueries(1):
+            descendants = depot.get_children_recursive()
+
+        self.assertEqual(descendants, [self.room, self.shelf, self.box])
+
+    def test_moving_a_branch_updates_paths(self):
+        garage = StorageLocation.objects.create(name="Garage")
+        shelf = StorageLocation.objects.get(pk=self.shelf.pk)
+        shelf.parent = garage
+        shelf.save()
+
+        box = StorageLocation.objects.get(pk=self.box.pk)
+        self.assertEqual(box.get_full_path(), "Garage > Regal 1 > Fach B")
+
+    def test_location_cannot_be_moved_below_itself(self):
+        room = StorageLocation.objects.get(pk=self.room.pk)
+        room.parent = StorageLocation.objects.get(pk=self.box.pk)
+
+        with self.assertRaises(ValidationError):
+            room.clean()
+
+    def test_attach_full_paths_uses_one_query(self):
+        locations = list(StorageLocation.objects.all())
+
+        with self.assertNumQueries(1):
+            attach_full_paths(locations)
+            paths = {location.pk: location.get_full_path() for location in locations}
+
+        self.assertEqual(paths[self.shelf.pk], "Gerätehaus > Kleiderkammer > Regal 1")
+
+    def test_hierarchical_sort(self):
+        StorageLocation.objects.create(name="Anhänger")
+        StorageLocation.objects.create(name="Atemschutz", parent=self.room)
+
+        ordered = _sort_locations_hierarchically(StorageLocation.objects.all())
+
+        self.assertEqual(
+            [(location.name, location._display_level) for location in ordered],
+            [
+                ("Anhänger", 0),
+                ("Gerätehaus", 0),
+                ("Kleiderkammer", 1),
+                ("Atemschutz", 2),
+                ("Regal 1", 2),
+                ("Fach B", 3),
+            ],
+        )
+
+
+class StorageLocationListQueryTest(APITestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_superuser(username="admin", password="pw12345")
+        self.client.force_authenticate(user=user)
+        build_depot()
+
+    def _list_query_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/v1/inventory/locations/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries), response
+
+    def test_full_paths_do_not_add_queries_per_row(self):
+        self._list_query_count()  # warm the access context cache
+        baseline, _ = self._list_query_count()
+        build_depot()
+        queries, response = self._list_query_count()
+
+        self.assertEqual(queries, baseline)
+        paths = {row["full_path"] for row in response.data["results"]}
+        self.assertIn("Gerätehaus > Kleiderkammer > Regal 1 > Fach B", paths)
@@ -0,0 +1,94 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from departments.models import Department, UserDepartmentRole
+from inventory.models import Category, Item, ItemVariant, StorageLocation, Transaction
+from members.models import Member
+
+
+class ScanLookupTest(APITestCase):
+    URL = "/api/v1/inventory/items/scan/"
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser(username="admin", password="pw12345")
+        self.client.force_authenticate(user=self.user)
+
+        self.dept_a = Department.objects.create(name="Abteilung A", code="dept-a")
+        self.dept_b = Department.objects.create(name="Abteilung B", code="dept-b")
+        category = Category.objects.create(name="Bekleidung")
+        self.member = Member.objects.create(name="Max", lastname="Mustermann")
+
+        self.helmet = Item.objects.create(
+            name="Helm", category=category, identifier1="H-01", identifier2="4006381333931", department=self.dept_a
+        )
+        jacket = Item.objects.create(name="Jacke", category=category, is_variant_parent=True, department=self.dept_a)
+        self.jacket_164 = ItemVariant.objects.create(
+            parent_item=jacket, sku="JK-164", variant_attributes={"größe": "164"}
+        )
+        self.radio = Item.objects.create(name="Funkgerät", identifier2="FG-7", department=self.dept_b)
+
+        self.depot = StorageLocation.objects.create(name="Gerätehaus", department=self.dept_a)
+        self.member_location = StorageLocation.objects.create(name="Max Mustermann", is_member=True, member=self.member)
+        Transaction.objects.create(transaction_type="IN", item=self.helmet, target=self.depot, quantity=3)
+        Transaction.objects.create(
+            transaction_type="LOAN", item=self.helmet, source=self.depot, target=self.member_location, quantity=1
+        )
+        Transaction.objects.create(transaction_type="IN", item_variant=self.jacket_164, target=self.depot, quantity=2)
+
+    def test_barcode_resolves_item_with_stock_and_borrower(self):
+        response = self.client.get(self.URL, {"code": " 4006381333931 "})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        [match] = response.data["matches"]
+        self.assertEqual(match["item"], self.helmet.pk)
+        self.assertEqual(match["matched_field"], "identifier2")
+        self.assertEqual(match["total_quantity"], 3)
+        self.assertEqual(
+            [(row["location_name"], row["quantity"]) for row in match["stock"]],
+            [("Gerätehaus", 2), ("Max Mustermann", 1)],
+        )
+        self.assertEqual(match["borrowers"], [{"member": self.member.pk, "member_name": "Max Mustermann"}])
+
+    def test_sku_resolves_variant(self):
+        response = self.client.get(self.URL, {"code": "JK-164"})
+
+        [match] = response.data["matches"]
+        self.assertEqual((match["type"], match["item_variant"]), ("variant", self.jacket_164.pk))
+        self.assertEqual(match["total_quantity"], 2)
+        self.assertEqual(match["borrowers"], [])
+
+    def test_unknown_code_and_missing_parameter(self):
+        self.assertEqual(self.client.get(self.URL, {"code": "nope"}).data["matches"], [])
+        self.assertEqual(self.client.get(self.URL).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_uses_a_fixed_number_of_queries(self):
+        codes = ["H-01", "JK-164", "FG-7", "nope", "H-01", ""]
+
+        self.client.post(self.URL, {"codes": ["warm-up"]}, format="json")
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.URL, {"codes": codes[:2]}, format="json")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.URL, {"codes": codes}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["code"] for row in response.data["results"]], ["H-01", "JK-164", "FG-7", "nope"])
+        self.assertEqual(response.data["not_found"], ["nope"])
+        self.assertEqual(len(queries), len(small))
+
+    def test_department_users_only_resolve_visible_items(self):
+        user = get_user_model().objects.create_user(username="dept_user", password="pw12345")
+        group = Group.objects.create(name="inventory-dept-role")
+        group.permissions.set(Permission.objects.filter(codename="view_item"))
+        role = UserDepartmentRole.objects.create(user=user, department=self.dept_a)
+        role.groups.add(group)
+        self.client.force_authenticate(user=user)
+
+        # POST only needs the view permission
+        response = self.client.post(self.URL, {"codes": ["H-01", "FG-7"]}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["not_found"], ["FG-7"])
@@ -0,0 +1,146 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from departments.models import Department, UserDepartmentRole
+from inventory.models import Category, Item, ItemSearchDocument, ItemVariant
+from inventory.search import search_documents
+
+
+class SearchFixtureMixin:
+    def build_catalog(self):
+        self.dept_a = Department.objects.create(name="Abteilung A", code="dept-a")
+        self.dept_b = Department.objects.create(name="Abteilung B", code="dept-b")
+        self.clothing = Category.objects.create(name="Bekleidung")
+        self.jacket = Item.objects.create(
+            name="Jacke", category=self.clothing, is_variant_parent=True, department=self.dept_a
+        )
+        self.jacket_164 = ItemVariant.objects.create(
+            parent_item=self.jacket, sku="JK-164", variant_attributes={"größe": "164", "farbe": "Blau"}
+        )
+        self.helmet = Item.objects.create(
+            name="Helm", category=self.clothing, identifier1="INV-0815", attributes={"hersteller": "Rosenbauer"}
+        )
+        self.gloves = Item.objects.create(name="Handschuhe Größe M", department=self.dept_b)
+
+    def matches(self, query):
+        return set(search_documents(query).values_list("item_id", "item_variant_id"))
+
+
+class SearchIndexTest(SearchFixtureMixin, TestCase):
+    def setUp(self):
+        self.build_catalog()
+
+    def test_every_item_and_variant_has_a_document(self):
+        self.assertEqual(ItemSearchDocument.objects.filter(item__isnull=False).count(), 3)
+        self.assertEqual(ItemSearchDocument.objects.filter(item_variant__isnull=False).count(), 1)
+
+    def test_matches_attributes_sku_and_inventory_numbers(self):
+        self.assertEqual(self.matches("rosenbauer"), {(self.helmet.pk, None)})
+        self.assertEqual(self.matches("inv-0815"), {(self.helmet.pk, None)})
+        self.assertEqual(self.matches("JK-164"), {(None, self.jacket_164.pk)})
+        self.assertEqual(self.matches("jacke blau"), {(None, self.jacket_164.pk)})
+
+    def test_words_match_as_prefix_and_case_insensitive(self):
+        self.assertEqual(self.matches("ROSEN"), {(self.helmet.pk, None)})
+        self.assertEqual(self.matches("größe m"), {(self.gloves.pk, None)})
+
+    def test_words_match_inside_compound_words(self):
+        coat = Item.objects.create(name="Einsatzjacke")
+        fire_helmet = Item.objects.create(name="Feuerwehrhelm")
+
+        self.assertEqual(self.matches("jacke"), {(self.jacket.pk, None), (None, self.jacket_164.pk), (coat.pk, None)})
+        self.assertEqual(self.matches("helm"), {(self.helmet.pk, None), (fire_helmet.pk, None)})
+        self.assertEqual(self.matches("satzja"), {(coat.pk, None)})
+        self.assertEqual(self.matches("uh"), {(self.gloves.pk, None)})  # shorter than a trigram
+
+    def test_documents_follow_item_variant_and_category_changes(self):
+        self.helmet.attributes = {"hersteller": "Dräger"}
+        self.helmet.save()
+        self.jacket_164.variant_attributes = {"größe": "176"}
+        self.jacket_164.save()
+        self.clothing.name = "Schutzkleidung"
+        self.clothing.save()
+
+        self.assertEqual(self.matches("rosenbauer"), set())
+        self.assertEqual(self.matches("dräger"), {(self.helmet.pk, None)})
+        self.assertEqual(self.matches("jacke 176"), {(None, self.jacket_164.pk)})
+        self.assertEqual(
+            self.matches("schutzkleidung"),
+            {(self.jacket.pk, None), (None, self.jacket_164.pk), (self.helmet.pk, None)},
+        )
+
+    def test_deleted_items_leave_the_index(self):
+        self.jacket.delete()
+
+        self.assertEqual(self.matches("jacke"), set())
+        self.assertFalse(ItemSearchDocument.objects.filter(parent_item_id=self.jacket.pk).exists())
+
+    def test_rebuild_command_restores_missing_documents(self):
+        ItemSearchDocument.objects.all().delete()
+
+        out = StringIO()
+        call_command("rebuild_search_index", stdout=out)
+
+        self.assertIn("3 Artikel", out.getvalue())
+        self.assertEqual(ItemSearchDocument.objects.count(), 4)
+        self.assertEqual(self.matches("rosenbauer"), {(self.helmet.pk, None)})
+
+
+class SearchApiTest(SearchFixtureMixin, APITestCase):
+    def setUp(self):
+        self.build_catalog()
+        self.user = get_user_model().objects.create_superuser(username="admin", password="pw12345")
+        self.client.force_authenticate(user=self.user)
+
+    def test_item_search_returns_parent_of_matching_variant(self):
+        response = self.client.get("/api/v1/inventory/items/search/", {"q": "blau"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["id"] for row in response.data["results"]], [self.jacket.pk])
+
+    def test_variant_search(self):
+        response = self.client.get("/api/v1/inventory/variants/search/", {"q": "164"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["id"] for row in response.data["results"]], [self.jacket_164.pk])
+
+    def test_item_search_query_count_is_independent_of_catalog_size(self):
+        # Non-matching rows are filtered in the database, never loaded.
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get("/api/v1/inventory/items/search/", {"q": "bekleidung"})
+            return len(queries)
+
+        count_queries()  # warm up one-time lookups (e.g. FTS detection)
+        baseline = count_queries()
+        for index in range(10):
+            Item.objects.create(name=f"Hose {index}", attributes={"größe": str(index)})
+
+        self.assertEqual(count_queries(), baseline)
+
+    def test_item_search_is_scoped_for_department_users(self):
+        user = get_user_model().objects.create_user(username="dept_user", password="pw12345")
+        group = Group.objects.create(name="inventory-dept-role")
+        group.permissions.set(Permission.objects.filter(codename="view_item"))
+        role = UserDepartmentRole.objects.create(user=user, department=self.dept_b)
+        role.groups.add(group)
+        self.client.force_authenticate(user=user)
+
+        response = self.client.get("/api/v1/inventory/items/search/", {"q": "h"})
+        self.assertEqual(response.data["results"], [])
+
+        response = self.client.get("/api/v1/inventory/items/search/", {"q": "größe"})
+        # The jacket variant matches too, but its parent belongs to department A.
+        self.assertEqual([row["id"] for row in response.data["results"]], [self.gloves.pk])
+
+        response = self.client.get("/api/v1/inventory/items/search/", {"q": "rosenbauer"})
+        # Central items stay visible.
+        self.assertEqual([row["id"] for row in response.data["results"]], [self.helmet.pk])
@@ -0,0 +1,142 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.ledger import check_stock_ledger, repair_stock_drift
+from inventory.models import Category, Item, ItemVariant, Stock, StorageLocation, Transaction
+
+
+class LedgerFixtureMixin:
+    def build_ledger(self):
+        category = Category.objects.create(name="Bekleidung")
+        self.helmet = Item.objects.create(name="Helm", category=category)
+        jacket = Item.objects.create(name="Jacke", category=category, is_variant_parent=True)
+        self.jacket_164 = ItemVariant.objects.create(parent_item=jacket, variant_attributes={"größe": "164"})
+        self.depot = StorageLocation.objects.create(name="Kleiderkammer")
+        self.member = StorageLocation.objects.create(name="Mitglied")
+
+        Transaction.objects.create(transaction_type="IN", item=self.helmet, target=self.depot, quantity=5)
+        Transaction.objects.create(transaction_type="IN", item_variant=self.jacket_164, target=self.depot, quantity=3)
+        Transaction.objects.create(
+            transaction_type="LOAN", item=self.helmet, source=self.depot, target=self.member, quantity=2
+        )
+        Transaction.objects.create(
+            transaction_type="DISCARD", item=self.helmet, source=self.depot, quantity=1, discard_reason="DAMAGED"
+        )
+
+    def stock(self, location, **kwargs):
+        return Stock.objects.get(location=location, **kwargs)
+
+
+class StockLedgerTest(LedgerFixtureMixin, TestCase):
+    def setUp(self):
+        self.build_ledger()
+
+    def test_consistent_ledger_has_no_drift(self):
+        report = check_stock_ledger(chunk_size=2)
+
+        self.assertEqual(report.transaction_count, 4)
+        self.assertEqual(report.stock_count, 3)
+        self.assertEqual(report.drift, [])
+
+    def test_manual_stock_change_is_reported_and_repaired(self):
+        Stock.objects.filter(location=self.depot, item=self.helmet).update(quantity=9)
+        Stock.objects.filter(location=self.member).delete()
+
+        report = check_stock_ledger()
+
+        drift = {(row.location_id, row.item_id): row for row in report.drift}
+        self.assertEqual(drift[(self.depot.pk, self.helmet.pk)].expected, 2)
+        self.assertEqual(drift[(self.depot.pk, self.helmet.pk)].difference, 7)
+        self.assertIsNone(drift[(self.member.pk, self.helmet.pk)].stock_id)
+
+        self.assertEqual(repair_stock_drift(report.drift), 2)
+        self.assertEqual(self.stock(self.depot, item=self.helmet).quantity, 2)
+        self.assertEqual(self.stock(self.member, item=self.helmet).quantity, 2)
+        self.assertEqual(check_stock_ledger().drift, [])
+
+    def test_repair_keeps_bookings_made_after_the_check(self):
+        Stock.objects.filter(location=self.depot, item=self.helmet).update(quantity=9)
+        report = check_stock_ledger()
+
+        # Booked between check and repair: the stale report expects 2 helmets in the depot
+        Transaction.objects.create(transaction_type="IN", item=self.helmet, target=self.depot, quantity=4)
+
+        self.assertEqual(repair_stock_drift(report.drift), 1)
+        self.assertEqual(self.stock(self.depot, item=self.helmet).quantity, 2 + 4)
+        self.assertEqual(check_stock_ledger().drift, [])
+
+    def test_repair_skips_drift_resolved_since_the_check(self):
+        Stock.objects.filter(location=self.depot, item=self.helmet).update(quantity=9)
+        report = check_stock_ledger()
+
+        # e.g. a concurrent repair already corrected the row
+        Stock.objects.filter(location=self.depot, item=self.helmet).update(quantity=2)
+
+        self.assertEqual(repair_stock_drift(report.drift), 0)
+        self.assertEqual(self.stock(self.depot, item=self.helmet).quantity, 2)
+
+    def test_deleted_transactions_show_up_as_drift(self):
+        # What the "delete_transactions" member deletion strategy does.
+        Transaction.objects.filter(transaction_type="LOAN").delete()
+
+        report = check_stock_ledger()
+
+        self.assertEqual(len(report.drift), 2)
+        self.assertEqual(report.negative_balances, 0)
+
+    def test_unlinked_legs_are_skipped(self):
+        # What the "unlink"/"anonymize" strategies do before deleting the location.
+        Transaction.objects.filter(target=self.member).update(target=None, former_member_name="Ehemaliges Mitglied")
+        Stock.objects.filter(location=self.member).delete()
+
+        self.assertEqual(check_stock_ledger().drift, [])
+
+    def test_command_reports_and_repairs(self):
+        Stock.objects.filter(location=self.depot, item_variant=self.jacket_164).update(quantity=0)
+
+        with self.assertRaises(CommandError):
+            call_command("check_stock_ledger", "--fail-on-drift", stdout=StringIO())
+
+        out = StringIO()
+        call_command("check_stock_ledger", "--repair", stdout=out)
+        self.assertIn("gespeichert 0, erwartet 3", out.getvalue())
+        self.assertEqual(self.stock(self.depot, item_variant=self.jacket_164).quantity, 3)
+
+
+class StockLedgerApiTest(LedgerFixtureMixin, APITestCase):
+    URL = "/api/v1/inventory/stocks/ledger-check/"
+
+    def setUp(self):
+        self.build_ledger()
+        user = get_user_model().objects.create_superuser(username="admin", password="pw12345")
+        self.client.force_authenticate(user=user)
+        Stock.objects.filter(location=self.depot, item=self.helmet).update(quantity=4)
+
+    def test_get_reports_without_repairing(self):
+        response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["drift_count"], 1)
+        self.assertEqual(response.data["repaired"], 0)
+        self.assertEqual(response.data["drift"][0]["display_name"], "Helm")
+        self.assertEqual(self.stock(self.depot, item=self.helmet).quantity, 4)
+
+    def test_post_repairs(self):
+        response = self.client.post(self.URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["repaired"], 1)
+        self.assertEqual(self.stock(self.depot, item=self.helmet).quantity, 2)
+
+    def test_department_users_are_rejected(self):
+        user = get_user_model().objects.create_user(username="dept_user", password="pw12345")
+        self.client.force_authenticate(user=user)
+
+        response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,107 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from departments.models import Department, UserDepartmentRole
+from inventory.models import Category, Item, ItemVariant, StorageLocation, Transaction
+
+
+class StockRollupTest(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser(username="admin", password="pw12345")
+        self.client.force_authenticate(user=self.user)
+
+        self.dept_a = Department.objects.create(name="Abteilung A", code="dept-a")
+        self.dept_b = Department.objects.create(name="Abteilung B", code="dept-b")
+
+        category = Category.objects.create(name="Bekleidung")
+        self.jacket = Item.objects.create(name="Jacke", category=category, is_variant_parent=True)
+        self.jacket_164 = ItemVariant.objects.create(parent_item=self.jacket, variant_attributes={"größe": "164"})
+        self.jacket_176 = ItemVariant.objects.create(parent_item=self.jacket, variant_attributes={"größe": "176"})
+        self.helmet = Item.objects.create(name="Helm", category=category)
+
+        self.depot = StorageLocation.objects.create(name="Gerätehaus", department=self.dept_a)
+        self.room = StorageLocation.objects.create(name="Kleiderkammer", parent=self.depot, department=self.dept_a)
+        self.shelf = StorageLocation.objects.create(name="Regal 1", parent=self.room, department=self.dept_a)
+        self.other = StorageLocation.objects.create(name="Lager B", department=self.dept_b)
+
+        self._book_in(self.jacket_164, self.shelf, 3, variant=True)
+        self._book_in(self.jacket_164, self.room, 2, variant=True)
+        self._book_in(self.jacket_176, self.shelf, 1, variant=True)
+        self._book_in(self.helmet, self.depot, 4)
+        self._book_in(self.jacket_164, self.other, 7, variant=True)
+
+    def _book_in(self, obj, location, quantity, variant=False):
+        key = "item_variant" if variant else "item"
+        Transaction.objects.create(transaction_type="IN", target=location, quantity=quantity, **{key: obj})
+
+    def _rows_by_name(self, rows):
+        return {row["display_name"]: row for row in rows}
+
+    def test_subtree_rollup_sums_all_descendants(self):
+        response = self.client.get(f"/api/v1/inventory/locations/{self.depot.pk}/rollup/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total"], 10)
+        rows = self._rows_by_name(response.data["rows"])
+        self.assertEqual(rows["Jacke (größe: 164)"]["quantity"], 5)
+        self.assertEqual(rows["Jacke (größe: 164)"]["location_count"], 2)
+        self.assertEqual(rows["Jacke (größe: 176)"]["quantity"], 1)
+        self.assertEqual(rows["Helm"]["quantity"], 4)
+
+    def test_subtree_rollup_of_inner_node_excludes_ancestors(self):
+        response = self.client.get(f"/api/v1/inventory/locations/{self.room.pk}/rollup/")
+
+        self.assertEqual(response.data["location_path"], "Gerätehaus > Kleiderkammer")
+        self.assertNotIn("Helm", self._rows_by_name(response.data["rows"]))
+        self.assertEqual(response.data["total"], 6)
+
+    def test_subtree_rollup_filters_by_variant(self):
+        response = self.client.get(
+            f"/api/v1/inventory/locations/{self.depot.pk}/rollup/?item_variant={self.jacket_164.pk}"
+        )
+
+        self.assertEqual(response.data["total"], 5)
+        self.assertEqual(len(response.data["rows"]), 1)
+
+    def test_subtree_rollup_query_count_does_not_grow_with_tree(self):
+        url = f"/api/v1/inventory/locations/{self.depot.pk}/rollup/"
+        self.client.get(url)  # warm the access context cache
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(url)
+        baseline = len(ctx.captured_queries)
+
+        parent = self.shelf
+        for index in range(5):
+            parent = StorageLocation.objects.create(name=f"Fach {index}", parent=parent, department=self.dept_a)
+            self._book_in(self.helmet, parent, 1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(len(ctx.captured_queries), baseline)
+        self.assertEqual(self._rows_by_name(response.data["rows"])["Helm"]["quantity"], 9)
+
+    def test_department_rollup_groups_by_location_department(self):
+        response = self.client.get("/api/v1/inventory/locations/department-rollup/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        departments = {entry["department"]: entry for entry in response.data["departments"]}
+        self.assertEqual(departments[self.dept_a.pk]["total"], 10)
+        self.assertEqual(departments[self.dept_b.pk]["department_name"], "Abteilung B")
+        self.assertEqual(departments[self.dept_b.pk]["total"], 7)
+
+    def test_department_rollup_is_scoped_for_department_users(self):
+        user = get_user_model().objects.create_user(username="dept_user", password="pw12345")
+        group = Group.objects.create(name="inventory-dept-role")
+        group.permissions.set(Permission.objects.filter(codename="view_storagelocation"))
+        role = UserDepartmentRole.objects.create(user=user, department=self.dept_a)
+        role.groups.add(group)
+        self.client.force_authenticate(user=user)
+
+        response = self.client.get("/api/v1/inventory/locations/department-rollup/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([entry["department"] for entry in response.data["departments"]], [self.dept_a.pk])
@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from inventory.models import Category, Item, StockSnapshot, StorageLocation, Transaction
+from inventory.snapshots import compute_stock_as_of, take_stock_snapshot
+
+
+def local(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+class SnapshotFixtureMixin:
+    def build_history(self):
+        category = Category.objects.create(name="Ausrüstung")
+        self.helmet = Item.objects.create(name="Helm", category=category)
+        self.depot = StorageLocation.objects.create(name="Gerätehaus")
+        self.shelf = StorageLocation.objects.create(name="Regal", parent=self.depot)
+        self.member = StorageLocation.objects.create(name="Mitglied")
+
+        self.book(local(2025, 1, 10), transaction_type="IN", target=self.shelf, quantity=10)
+        self.book(local(2025, 2, 5), transaction_type="LOAN", source=self.shelf, target=self.member, quantity=3)
+        self.book(local(2025, 3, 20), transaction_type="OUT", source=self.shelf, quantity=2)
+
+    def book(self, date, **kwargs):
+        txn = Transaction.objects.create(item=self.helmet, **kwargs)
+        Transaction.objects.filter(pk=txn.pk).update(date=date)
+
+
+class StockSnapshotTest(SnapshotFixtureMixin, TestCase):
+    def setUp(self):
+        self.build_history()
+
+    def key(self, location):
+        return (location.pk, self.helmet.pk, None)
+
+    def test_as_of_without_snapshots_replays_history(self):
+        balances, snapshot = compute_stock_as_of(local(2025, 2, 28))
+
+        self.assertIsNone(snapshot)
+        self.assertEqual(balances, {self.key(self.shelf): 7, self.key(self.member): 3})
+
+    def test_as_of_starts_from_nearest_snapshot(self):
+        take_stock_snapshot(local(2025, 2, 1))
+        take_stock_snapshot(local(2025, 3, 1))
+
+        with self.assertNumQueries(4):  # snapshot, its lines, incoming and outgoing deltas
+            balances, snapshot = compute_stock_as_of(local(2025, 3, 31))
+
+        self.assertEqual(snapshot.taken_at, local(2025, 3, 1))
+        self.assertEqual(balances, {self.key(self.shelf): 5, self.key(self.member): 3})
+
+    def test_snapshot_matches_replay_and_is_idempotent(self):
+        first = take_stock_snapshot(local(2025, 2, 10))
+        again = take_stock_snapshot(local(2025, 2, 10))
+
+        self.assertEqual(first.pk, again.pk)
+        lines = {(line.location_id, line.quantity) for line in first.lines.all()}
+        self.assertEqual(lines, {(self.shelf.pk, 7), (self.member.pk, 3)})
+
+    def test_location_scope(self):
+        balances, _ = compute_stock_as_of(local(2025, 12, 31), locations=self.depot.get_descendants(include_self=True))
+
+        self.assertEqual(balances, {self.key(self.shelf): 5})
+
+    def test_backfill_creates_monthly_snapshots(self):
+        call_command("take_stock_snapshot", "--backfill-monthly", "--at", "2025-04-15", stdout=StringIO())
+
+        self.assertEqual(
+            list(StockSnapshot.objects.order_by("taken_at").values_list("taken_at", flat=True)),
+            [local(2025, 2, 1), local(2025, 3, 1), local(2025, 4, 1)],
+        )
+        april = StockSnapshot.objects.get(taken_at=local(2025, 4, 1))
+        self.assertEqual(sum(april.lines.values_list("quantity", flat=True)), 8)
+
+
+class StockAsOfApiTest(SnapshotFixtureMixin, APITestCase):
+    URL = "/api/v1/inventory/stocks/as-of/"
+
+    def setUp(self):
+        self.build_history()
+        user = get_user_model().objects.create_superuser(username="admin", password="pw12345")
+        self.client.force_authenticate(user=user)
+
+    def test_stock_at_end_of_day(self):
+        take_stock_snapshot(local(2025, 2, 1))
+
+        response = self.client.get(self.URL, {"date": "2025-03-20"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total"], 8)
+        self.assertEqual(response.data["snapshot_taken_at"], local(2025, 2, 1))
+        rows = {row["location_name"]: row["quantity"] for row in response.data["rows"]}
+        self.assertEqual(rows, {"Regal": 5, "Mitglied": 3})
+
+    def test_location_filter_includes_subtree(self):
+        response = self.client.get(self.URL, {"date": "2025-01-31", "location": self.depot.pk})
+
+        self.assertEqual([row["quantity"] for row in response.data["rows"]], [10])
+
+    def test_future_date_matches_current_stock(self):
+        date = (timezone.localdate() + timedelta(days=1)).isoformat()
+
+        response = self.client.get(self.URL, {"date": date})
+
+        self.assertEqual(response.data["total"], 8)
+
+    def test_invalid_date_is_rejected(self):
+        response = self.client.get(self.URL, {"date": "31.12.2025"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("date", response.data)
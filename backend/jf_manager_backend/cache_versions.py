@@ -0,0 +1,40 @@
+"""
+Version counters for invalidating groups of cache entries.
+
+Cached data is stored under a key that contains the current version of its
+group (``f"...:v{get_cache_version(KEY)}:..."``); bumping the version makes
+every old entry unreachable at once.  Versions start at the current time in
+nanoseconds, so a version key that was evicted or cleared never restarts at a
+number that older, still cached entries were stored under.  Bumps made inside
+a transaction are repeated after the commit (``transaction.on_commit``).
+"""
+
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_cache_version(key) -> int:
+    """Current version stored under ``key``, seeded with the current time on a miss."""
+    return cache.get_or_set(key, time.time_ns, None)
+
+
+def _incr_cache_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def bump_cache_version(key):
+    """
+    Invalidate every cache entry derived from the version under ``key``.
+
+    Inside a transaction the version is bumped again once it commits: until
+    then other connections still read the old rows and may cache them under
+    the new version.
+    """
+    _incr_cache_version(key)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _incr_cache_version(key))
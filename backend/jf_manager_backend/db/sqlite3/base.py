@@ -0,0 +1,53 @@
+"""
+SQLite backend for concurrent readers and writers.
+
+Backport of the ``init_command`` and ``transaction_mode`` OPTIONS of the
+Django 5.1 SQLite backend:
+
+* ``init_command``: ``;``-separated statements (PRAGMAs) run on every new
+  connection, e.g. WAL journaling and a busy timeout.
+* ``transaction_mode``: ``"IMMEDIATE"`` lets ``transaction.atomic`` take the
+  write lock when the block starts. With the default deferred ``BEGIN`` a block
+  that reads first and writes later fails with "database is locked" as soon as
+  another connection wrote in between; the busy timeout cannot help there.
+
+After the upgrade to Django 5.1 the ENGINE can go back to
+``django.db.backends.sqlite3`` with unchanged OPTIONS.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+
+TRANSACTION_MODES = ("DEFERRED", "EXCLUSIVE", "IMMEDIATE")
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    transaction_mode = None
+
+    def get_connection_params(self):
+        kwargs = super().get_connection_params()
+        # Not arguments of sqlite3.connect()
+        kwargs.pop("init_command", None)
+        transaction_mode = kwargs.pop("transaction_mode", None)
+        if transaction_mode is not None and transaction_mode.upper() not in TRANSACTION_MODES:
+            raise ImproperlyConfigured(
+                f"settings.DATABASES is improperly configured. Invalid transaction_mode {transaction_mode!r}, "
+                f"use one of {', '.join(TRANSACTION_MODES)}."
+            )
+        self.transaction_mode = transaction_mode.upper() if transaction_mode else None
+        return kwargs
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        init_command = self.settings_dict["OPTIONS"].get("init_command", "")
+        for statement in init_command.split(";"):
+            statement = statement.strip()
+            if statement:
+                conn.execute(statement)
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        if self.transaction_mode is None:
+            super()._start_transaction_under_autocommit()
+        else:
+            self.cursor().execute(f"BEGIN {self.transaction_mode}")
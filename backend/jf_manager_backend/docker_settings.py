@@ -72,4 +72,24 @@ if REDIS_URL != "none":
     }
 
 if DATABASE_URL != "none":
-    DATABASES["default"] = dj_database_url.parse(DATABASE_URL, conn_max_age=600)  # noqa: F405
+    database = dj_database_url.parse(
+        DATABASE_URL,
+        conn_max_age=DB_CONN_MAX_AGE,  # noqa: F405
+        conn_health_checks=DB_CONN_HEALTH_CHECKS,  # noqa: F405
+    )
+    if database["ENGINE"] == "django.db.backends.postgresql":
+        database["DISABLE_SERVER_SIDE_CURSORS"] = DB_DISABLE_SERVER_SIDE_CURSORS  # noqa: F405
+        database["OPTIONS"] = {
+            "application_name": "jf-manager",
+            "connect_timeout": DB_CONNECT_TIMEOUT,  # noqa: F405
+            # Detect dead peers (e.g. a restarted db container) on idle persistent connections
+            "keepalives": 1,
+            "keepalives_idle": 60,
+            "keepalives_interval": 10,
+            "keepalives_count": 3,
+        }
+        if DB_STATEMENT_TIMEOUT:  # noqa: F405
+            database["OPTIONS"]["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT}"  # noqa: F405
+    elif SQLITE_TUNING and database["ENGINE"] == "django.db.backends.sqlite3":  # noqa: F405
+        database.update(ENGINE="jf_manager_backend.db.sqlite3", OPTIONS=SQLITE_OPTIONS)  # noqa: F405
+    DATABASES["default"] = database  # noqa: F405
@@ -1,5 +1,4 @@
 from django import forms
-from django.conf import settings
 from django.contrib import admin, messages
 from django.core.mail import send_mail
 from django.http import HttpResponseRedirect
@@ -8,6 +7,8 @@ from django.urls import path, reverse
 from dynamic_preferences.admin import GlobalPreferenceAdmin
 from dynamic_preferences.models import GlobalPreferenceModel
 
+from .email_backend import get_email_password, get_email_settings
+
 
 class EmailTestForm(forms.Form):
     recipient = forms.EmailField(
@@ -43,8 +44,9 @@ class CustomGlobalPreferenceAdmin(GlobalPreferenceAdmin):
                 message = form.cleaned_data["message"]
 
                 try:
-                    # Get current email settings from Django settings
-                    from_email = settings.DEFAULT_FROM_EMAIL
+                    # Get current email settings from the preference snapshot
+                    email_settings = get_email_settings()
+                    from_email = email_settings["default_from_email"]
 
                     # Send test email
                     send_mail(
@@ -59,9 +61,9 @@ class CustomGlobalPreferenceAdmin(GlobalPreferenceAdmin):
                     messages.success(
                         request,
                         f"Test-E-Mail erfolgreich gesendet an {recipient} von {from_email}. "
-                        f"Aktuelle SMTP-Einstellungen: Host={settings.EMAIL_HOST}, "
-                        f"Port={settings.EMAIL_PORT}, TLS={settings.EMAIL_USE_TLS}, "
-                        f"SSL={settings.EMAIL_USE_SSL}",
+                        f"Aktuelle SMTP-Einstellungen: Host={email_settings['host']}, "
+                        f"Port={email_settings['port']}, TLS={email_settings['use_tls']}, "
+                        f"SSL={email_settings['use_ssl']}",
                     )
 
                     # Redirect back to admin
@@ -77,17 +79,19 @@ class CustomGlobalPreferenceAdmin(GlobalPreferenceAdmin):
             form = EmailTestForm()
 
         # Display email settings
+        email_settings = get_email_settings()
+        password = get_email_password()
         context = {
             "form": form,
             "title": "E-Mail Einstellungen testen",
             "email_settings": {
-                "EMAIL_HOST": settings.EMAIL_HOST,
-                "EMAIL_PORT": settings.EMAIL_PORT,
-                "EMAIL_HOST_USER": settings.EMAIL_HOST_USER,
-                "EMAIL_HOST_PASSWORD": "*" * len(settings.EMAIL_HOST_PASSWORD) if settings.EMAIL_HOST_PASSWORD else "",
-                "EMAIL_USE_TLS": settings.EMAIL_USE_TLS,
-                "EMAIL_USE_SSL": settings.EMAIL_USE_SSL,
-                "DEFAULT_FROM_EMAIL": settings.DEFAULT_FROM_EMAIL,
+                "EMAIL_HOST": email_settings["host"],
+                "EMAIL_PORT": email_settings["port"],
+                "EMAIL_HOST_USER": email_settings["username"],
+                "EMAIL_HOST_PASSWORD": "*" * len(password) if password else "",
+                "EMAIL_USE_TLS": email_settings["use_tls"],
+                "EMAIL_USE_SSL": email_settings["use_ssl"],
+                "DEFAULT_FROM_EMAIL": email_settings["default_from_email"],
             },
         }
 
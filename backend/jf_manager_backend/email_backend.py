@@ -0,0 +1,93 @@
+"""
+SMTP email backend configured from dynamic preferences.
+
+The SMTP settings editable in the admin/settings UI are stored as ``email__*``
+global preferences.  Instead of copying them into ``django.conf.settings`` on
+every request, this backend resolves them lazily when a connection is opened.
+The resolved values are kept as one snapshot in the cache under a version key
+that ``settings_manager.signals`` bumps whenever an email preference changes.
+The SMTP password is not part of the snapshot: it is read from the database
+(bypassing the preference cache) only when a connection is opened.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail.backends.smtp import EmailBackend as SMTPEmailBackend
+
+from jf_manager_backend.cache_versions import bump_cache_version, get_cache_version
+
+EMAIL_SETTINGS_VERSION_KEY = "email_settings:version"
+EMAIL_SETTINGS_TIMEOUT = 3600
+
+
+def get_email_settings_version() -> int:
+    return get_cache_version(EMAIL_SETTINGS_VERSION_KEY)
+
+
+def bump_email_settings_version():
+    """Invalidate the cached email settings snapshot."""
+    bump_cache_version(EMAIL_SETTINGS_VERSION_KEY)
+
+
+def _load_email_settings() -> dict:
+    from dynamic_preferences.registries import global_preferences_registry
+
+    global_preferences = global_preferences_registry.manager()
+
+    # Empty preferences fall back to the (environment based) Django settings
+    return {
+        "host": global_preferences.get("email__email_host") or settings.EMAIL_HOST,
+        "port": global_preferences.get("email__email_port") or settings.EMAIL_PORT,
+        "username": global_preferences.get("email__email_host_user") or settings.EMAIL_HOST_USER,
+        "use_tls": bool(global_preferences.get("email__email_use_tls")),
+        "use_ssl": bool(global_preferences.get("email__email_use_ssl")),
+        "default_from_email": global_preferences.get("email__default_from_email") or settings.DEFAULT_FROM_EMAIL,
+    }
+
+
+def get_email_settings() -> dict:
+    """Return the current SMTP settings snapshot (host, port, username, TLS/SSL, sender)."""
+    key = f"email_settings:v{get_email_settings_version()}"
+    email_settings = cache.get(key)
+    if email_settings is None:
+        email_settings = _load_email_settings()
+        cache.set(key, email_settings, EMAIL_SETTINGS_TIMEOUT)
+    return email_settings
+
+
+def get_email_password() -> str:
+    """Return the SMTP password, read past every cache so the secret is never stored there."""
+    from dynamic_preferences.registries import global_preferences_registry
+
+    global_preferences = global_preferences_registry.manager()
+    return global_preferences.get("email__email_host_password", no_cache=True) or settings.EMAIL_HOST_PASSWORD
+
+
+def get_default_from_email() -> str:
+    """Return the configured sender address."""
+    return get_email_settings()["default_from_email"]
+
+
+class PreferencesEmailBackend(SMTPEmailBackend):
+    """SMTP backend that takes unset connection parameters from the preferences."""
+
+    def __init__(
+        self,
+        host=None,
+        port=None,
+        username=None,
+        password=None,
+        use_tls=None,
+        use_ssl=None,
+        **kwargs,
+    ):
+        email_settings = get_email_settings()
+        super().__init__(
+            host=email_settings["host"] if host is None else host,
+            port=email_settings["port"] if port is None else port,
+            username=email_settings["username"] if username is None else username,
+            password=get_email_password() if password is None else password,
+            use_tls=email_settings["use_tls"] if use_tls is None else use_tls,
+            use_ssl=email_settings["use_ssl"] if use_ssl is None else use_ssl,
+            **kwargs,
+        )
@@ -1,11 +1,12 @@
 from django import forms
-from django.conf import settings
 from django.contrib import admin, messages
 from django.http import HttpResponseRedirect
 from django.shortcuts import render
 from django.urls import path, reverse
 from dynamic_preferences.registries import global_preferences_registry
 
+from .email_backend import get_email_password, get_email_settings
+
 
 class EmailSettingsForm(forms.Form):
     """Form for managing email settings in a single interface"""
@@ -99,15 +100,17 @@ class EmailSettingsAdmin(admin.ModelAdmin):
             }
             form = EmailSettingsForm(initial=initial_data)
 
-        # Current settings from Django's settings (after middleware has applied preferences)
+        # Effective settings as used by the email backend (preferences over Django settings)
+        email_settings = get_email_settings()
+        password = get_email_password()
         current_settings = {
-            "EMAIL_HOST": settings.EMAIL_HOST,
-            "EMAIL_PORT": settings.EMAIL_PORT,
-            "EMAIL_HOST_USER": settings.EMAIL_HOST_USER,
-            "EMAIL_HOST_PASSWORD": "*" * len(settings.EMAIL_HOST_PASSWORD) if settings.EMAIL_HOST_PASSWORD else "",
-            "EMAIL_USE_TLS": settings.EMAIL_USE_TLS,
-            "EMAIL_USE_SSL": settings.EMAIL_USE_SSL,
-            "DEFAULT_FROM_EMAIL": settings.DEFAULT_FROM_EMAIL,
+            "EMAIL_HOST": email_settings["host"],
+            "EMAIL_PORT": email_settings["port"],
+            "EMAIL_HOST_USER": email_settings["username"],
+            "EMAIL_HOST_PASSWORD": "*" * len(password) if password else "",
+            "EMAIL_USE_TLS": email_settings["use_tls"],
+            "EMAIL_USE_SSL": email_settings["use_ssl"],
+            "DEFAULT_FROM_EMAIL": email_settings["default_from_email"],
         }
 
         context = {
@@ -0,0 +1,62 @@
+"""
+Versioned collections for conditional GET on reference data.
+
+Every tracked model has a version counter in the cache that is bumped by
+``post_save``/``post_delete`` (see ``track_collection_versions()``, called
+from the apps' signal modules).  ``CollectionETagViewSetMixin``
+(jf_manager_backend.mixins) derives the ETag of a list/detail response from
+these versions, the caller's department access context and the request URL,
+so a matching ``If-None-Match`` is answered with 304 before the queryset is
+built.
+
+Changes that bypass model signals (``QuerySet.update()``, ``bulk_create()``,
+raw SQL) must call ``bump_collection_version()`` themselves.  The versions
+are ``jf_manager_backend.cache_versions`` counters.
+"""
+
+import hashlib
+
+from django.db.models.signals import post_delete, post_save
+
+from departments.access import get_access_cache_version
+from jf_manager_backend.cache_versions import bump_cache_version, get_cache_version
+
+COLLECTION_VERSION_KEY = "collection_version:{label}"
+
+
+def get_collection_version(label) -> int:
+    return get_cache_version(COLLECTION_VERSION_KEY.format(label=label))
+
+
+def bump_collection_version(label):
+    """Invalidate all ETags derived from the collection ``label`` (``app_label.ModelName``)."""
+    bump_cache_version(COLLECTION_VERSION_KEY.format(label=label))
+
+
+def _collection_changed(sender, **kwargs):
+    bump_collection_version(sender._meta.label)
+
+
+def track_collection_versions(*models):
+    """Bump the version of each model's collection whenever one of its rows is saved or deleted."""
+    for model in models:
+        uid = f"collection_version:{model._meta.label}"
+        post_save.connect(_collection_changed, sender=model, dispatch_uid=uid)
+        post_delete.connect(_collection_changed, sender=model, dispatch_uid=uid)
+
+
+def collection_etag(request, models, *extra) -> str:
+    """Strong ETag for a response built from ``models`` for this user, URL and format."""
+    user = request.user
+    parts = [
+        *(get_collection_version(model._meta.label) for model in models),
+        get_access_cache_version(),
+        user.pk,
+        user.is_staff,
+        user.is_superuser,
+        request.get_full_path(),
+        getattr(request, "accepted_renderer", None) and request.accepted_renderer.format,
+        *extra,
+    ]
+    digest = hashlib.md5(":".join(str(part) for part in parts).encode(), usedforsecurity=False).hexdigest()
+    return f'"{digest}"'
@@ -18,11 +18,17 @@ For stricter model-level permission enforcement (view/add/change/delete)::
         ...
 """
 
+from functools import cached_property
+
+from django.utils.http import parse_etags
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters
-from rest_framework.permissions import IsAuthenticated
+from rest_framework import filters, status
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
+from rest_framework.response import Response
 
+from jf_manager_backend.etags import collection_etag
 from jf_manager_backend.permissions import DepartmentRoleModelPermissions
+from jf_manager_backend.serializers import SparseFieldsMixin, parse_field_selection
 
 
 class BaseFilterMixin:
@@ -48,3 +54,72 @@ class BasePermissionedViewSet:
 
     permission_classes = [IsAuthenticated, DepartmentRoleModelPermissions]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+
+
+class SparseFieldsViewSetMixin:
+    """
+    Passes ``?fields=`` / ``?expand=`` of GET requests to serializers using
+    ``SparseFieldsMixin`` (see jf_manager_backend.serializers).
+
+    ``get_queryset()`` implementations use ``field_requested()`` to skip
+    prefetches and annotations for fields that are not rendered.
+    """
+
+    fields_query_param = "fields"
+    expand_query_param = "expand"
+
+    @cached_property
+    def sparse_fields(self):
+        """The requested field selection, or None for the full representation."""
+        request = getattr(self, "request", None)
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        selection = parse_field_selection(request.query_params.get(self.fields_query_param))
+        if not selection:
+            return None
+        for name, nested in parse_field_selection(request.query_params.get(self.expand_query_param)).items():
+            if selection.get(name) != {}:
+                selection[name] = nested
+        return selection
+
+    def field_requested(self, *names):
+        """True if any of ``names`` is rendered (always True without ``?fields=``)."""
+        return self.sparse_fields is None or any(name in self.sparse_fields for name in names)
+
+    def get_serializer(self, *args, **kwargs):
+        if self.sparse_fields is not None and issubclass(self.get_serializer_class(), SparseFieldsMixin):
+            kwargs.setdefault("sparse_fields", self.sparse_fields)
+        return super().get_serializer(*args, **kwargs)
+
+
+class CollectionETagViewSetMixin:
+    """
+    Conditional GET for reference-data viewsets (see jf_manager_backend.etags).
+
+    ``etag_models`` lists every model the rendered data depends on, including
+    models that only feed annotations (e.g. ``Item`` for a category's
+    ``item_count``).  ``list`` and ``retrieve`` answer a matching
+    ``If-None-Match`` with 304 without building the queryset.
+    """
+
+    etag_models = ()
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional_response(super().retrieve, request, *args, **kwargs)
+
+    def _conditional_response(self, handler, request, *args, **kwargs):
+        etag = collection_etag(request, self.etag_models, self.action)
+        # Weak comparison: nginx turns the ETag into W/"..." when it compresses the response.
+        candidates = {tag.removeprefix("W/") for tag in parse_etags(request.headers.get("If-None-Match", ""))}
+        if etag in candidates or "*" in candidates:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response["ETag"] = etag
+            # Browsers may keep the response but must revalidate it every time.
+            response["Cache-Control"] = "private, no-cache"
+        return response
@@ -0,0 +1,162 @@
+"""
+Pagination classes shared by the API.
+
+``OptionalCursorPagination`` behaves exactly like the global
+``LimitOffsetPagination`` unless the client opts in with
+``?pagination=cursor``.  In cursor mode the list is paged by key instead of
+by offset: the queryset is ordered by the view's default ordering field plus
+``id`` as tie-breaker, and each page continues with
+``WHERE (field, id) < (last_field, last_id)``.  No ``COUNT(*)`` is run and
+the cost of a page does not grow with how deep the client has scrolled.
+Rows whose field is NULL (nullable columns or relations) are listed last, in
+both directions of the ordering, and paged by ``id`` alone.
+
+Responses in cursor mode are ``{"next", "previous", "results"}``; ``next`` and
+``previous`` are complete URLs carrying an opaque ``cursor`` parameter.
+``limit`` sets the page size as usual; ``ordering`` is ignored because the
+cursor is bound to the default ordering.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class OptionalCursorPagination(LimitOffsetPagination):
+    mode_query_param = "pagination"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Ungültiger Cursor."
+
+    cursor_mode = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or self.cursor_query_param in request.query_params
+        )
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.field, self.descending = self.get_cursor_ordering(queryset, view)
+        path = self.get_cursor_path(queryset.model)
+        nullable = any(field.null for field in path)
+        cursor = self.decode_cursor(request, path[-1], nullable)
+        self.reverse = bool(cursor and cursor["r"])
+
+        # Walking backwards flips the order; the page is reversed again below.
+        descending = self.descending != self.reverse
+        prefix = "-" if descending else ""
+        lookup = "lt" if descending else "gt"
+        if not nullable:
+            queryset = queryset.order_by(f"{prefix}{self.field}", f"{prefix}pk")
+            if cursor is not None:
+                queryset = queryset.filter(
+                    Q(**{f"{self.field}__{lookup}": cursor["v"]})
+                    | Q(**{self.field: cursor["v"], f"pk__{lookup}": cursor["id"]})
+                )
+        else:
+            # NULLs come after every value going forward and before them going back.
+            nulls = {"nulls_first": True} if self.reverse else {"nulls_last": True}
+            order = F(self.field).desc(**nulls) if descending else F(self.field).asc(**nulls)
+            queryset = queryset.order_by(order, f"{prefix}pk")
+            if cursor is not None:
+                is_null = Q(**{f"{self.field}__isnull": True})
+                if cursor["v"] is None:
+                    after = is_null & Q(**{f"pk__{lookup}": cursor["id"]})
+                    if self.reverse:
+                        after |= ~is_null
+                else:
+                    after = Q(**{f"{self.field}__{lookup}": cursor["v"]}) | Q(
+                        **{self.field: cursor["v"], f"pk__{lookup}": cursor["id"]}
+                    )
+                    if not self.reverse:
+                        after |= is_null
+                queryset = queryset.filter(after)
+
+        page = list(queryset[: self.limit + 1])
+        has_more = len(page) > self.limit
+        page = page[: self.limit]
+        if self.reverse:
+            page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.page = page
+        return page
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+        return Response(
+            {
+                "next": self.get_cursor_link(self.page[-1], reverse=False) if self.has_next and self.page else None,
+                "previous": self.get_cursor_link(self.page[0], reverse=True)
+                if self.has_previous and self.page
+                else None,
+                "results": data,
+            }
+        )
+
+    def get_cursor_ordering(self, queryset, view):
+        """Return ``(field, descending)`` of the view's default ordering."""
+        ordering = getattr(view, "ordering", None) or queryset.model._meta.ordering
+        if isinstance(ordering, str):
+            ordering = [ordering]
+        if not ordering:
+            return "pk", True
+        first = ordering[0]
+        return first.lstrip("-"), first.startswith("-")
+
+    def get_cursor_path(self, model):
+        """Model fields along ``self.field``, following ``__`` relations."""
+        path = []
+        for name in self.field.split("__"):
+            field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+            path.append(field)
+            model = field.related_model
+        return path
+
+    def get_cursor_value(self, obj):
+        value = obj
+        for name in self.field.split("__"):
+            value = getattr(value, name)
+            if value is None:
+                return None
+        if isinstance(value, datetime | date):
+            return value.isoformat()
+        return value
+
+    def get_cursor_link(self, obj, reverse):
+        position = {"v": self.get_cursor_value(obj), "id": obj.pk, "r": int(reverse)}
+        encoded = base64.urlsafe_b64encode(json.dumps(position, separators=(",", ":")).encode()).decode()
+        url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+        url = replace_query_param(url, self.mode_query_param, "cursor")
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request, field, nullable=False):
+        """
+        Return the position of the ``cursor`` parameter with its value converted
+        by ``field``; a cursor that does not decode or convert, or that is null
+        for a field that cannot be null, is a 404.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            value = field.to_python(position["v"])
+            if value is None and not nullable:
+                raise ValueError("cursor value is null")
+            return {"v": value, "id": int(position["id"]), "r": bool(position.get("r"))}
+        except (TypeError, ValueError, KeyError, binascii.Error, ValidationError):
+            raise NotFound(self.invalid_cursor_message) from None
@@ -1,5 +1,9 @@
+import contextlib
+
 from rest_framework.permissions import SAFE_METHODS, BasePermission, DjangoModelPermissions
 
+from departments.access import get_department_access
+
 
 class CustomDefaultPermissions(DjangoModelPermissions):
     perms_map = {
@@ -58,30 +62,22 @@ class DepartmentRoleModelPermissions(BasePermission):
         return None
 
     def _department_role_codenames(self, request):
-        user = request.user
-        roles = user.department_roles.prefetch_related("groups__permissions")
+        access = get_department_access(request.user, request)
 
+        dept_id = None
         raw_department = request.query_params.get("department")
         if raw_department:
-            try:
+            with contextlib.suppress(TypeError, ValueError):
                 dept_id = int(raw_department)
-                roles = roles.filter(department_id=dept_id)
-            except (TypeError, ValueError):
-                pass
 
-        codenames = set()
-        for role in roles:
-            for group in role.groups.all():
-                for perm in group.permissions.all():
-                    codenames.add(perm.codename)
-        return codenames
+        return access.codenames_for(dept_id)
 
     def has_permission(self, request, view):
         user = request.user
         if not user or not user.is_authenticated:
             return False
 
-        if user.is_staff or user.is_superuser or user.has_perm("departments.can_access_all_departments"):
+        if get_department_access(user, request).is_org_wide:
             return True
 
         model = self._get_model(view)
@@ -106,3 +102,13 @@ class DepartmentRoleModelPermissions(BasePermission):
             return False
 
         return True
+
+
+class DepartmentRoleReadPermissions(DepartmentRoleModelPermissions):
+    """
+    Like ``DepartmentRoleModelPermissions``, but POST only needs the view
+    permission.  For read-only endpoints that take their input as a request
+    body (e.g. batch lookups).
+    """
+
+    perms_map = {**DepartmentRoleModelPermissions.perms_map, "POST": ["%(app_label)s.view_%(model_name)s"]}
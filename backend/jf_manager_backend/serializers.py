@@ -0,0 +1,56 @@
+"""
+Shared serializer helpers.
+
+Sparse fieldsets: a serializer using ``SparseFieldsMixin`` accepts a
+``sparse_fields`` selection and only builds (and therefore only computes) the
+selected fields.  ``SparseFieldsViewSetMixin`` (jf_manager_backend.mixins)
+reads the selection from ``?fields=`` on GET requests::
+
+    ?fields=id,name                       only these fields
+    ?fields=id,name,variants.id,variants.sku
+                                          nested serializers can be narrowed too
+    ?fields=id,name&expand=variants       ``expand`` adds complete nested fields
+
+Without ``?fields=`` the full representation is returned.
+"""
+
+
+def parse_field_selection(value):
+    """
+    Turn ``"id,name,variants.sku"`` into ``{"id": {}, "name": {}, "variants": {"sku": {}}}``.
+
+    An empty dict selects the whole field; naming a field without a sub-path
+    wins over narrower paths into it.  Returns ``{}`` for an empty value.
+    """
+    paths = [[name.strip() for name in path.split(".")] for path in (value or "").split(",")]
+    return _build_selection([path for path in paths if all(path)])
+
+
+def _build_selection(paths):
+    grouped = {}
+    for name, *rest in paths:
+        grouped.setdefault(name, []).append(rest)
+    return {name: {} if [] in rests else _build_selection(rests) for name, rests in grouped.items()}
+
+
+class SparseFieldsMixin:
+    """Drops every field that is not part of the ``sparse_fields`` selection."""
+
+    def __init__(self, *args, sparse_fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sparse_fields = sparse_fields or None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.sparse_fields:
+            return fields
+        for name in list(fields):
+            if name not in self.sparse_fields:
+                del fields[name]
+                continue
+            nested = self.sparse_fields[name]
+            field = fields[name]
+            field = getattr(field, "child", field)
+            if nested and isinstance(field, SparseFieldsMixin):
+                field.sparse_fields = nested
+        return fields
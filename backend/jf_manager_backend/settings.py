@@ -103,6 +103,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Outermost, so latency and query counts cover the whole stack.
+    "health.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -111,7 +113,6 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "jf_manager_backend.email_middleware.EmailConfigMiddleware",
 ]
 
 ROOT_URLCONF = "jf_manager_backend.urls"
@@ -158,10 +159,43 @@ WSGI_APPLICATION = "jf_manager_backend.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/2.0/ref/settings/#databases
 
+# SQLite profile for concurrent readers and writers (see jf_manager_backend/db/sqlite3/base.py):
+# WAL lets readers continue while one connection writes, write transactions take the lock on
+# BEGIN (IMMEDIATE) and wait up to SQLITE_BUSY_TIMEOUT for it instead of failing with "database is locked".
+SQLITE_TUNING = env.bool("SQLITE_TUNING", default=True)
+SQLITE_BUSY_TIMEOUT = env.int("SQLITE_BUSY_TIMEOUT", default=20000)  # milliseconds
+SQLITE_MMAP_SIZE = env.int("SQLITE_MMAP_SIZE", default=256 * 1024 * 1024)  # bytes, 0 disables memory mapping
+SQLITE_CACHE_SIZE = env.int("SQLITE_CACHE_SIZE", default=64 * 1024)  # KiB page cache per connection
+SQLITE_OPTIONS = {
+    "transaction_mode": "IMMEDIATE",
+    "timeout": SQLITE_BUSY_TIMEOUT / 1000,
+    "init_command": ";".join(
+        [
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT}",
+            f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+            f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE}",
+            "PRAGMA temp_store=MEMORY",
+        ]
+    ),
+}
+
+# Persistent connections for DATABASE_URL deployments (applied in docker_settings.py). Django keeps one
+# connection per worker thread and checks it with a cheap query before reusing it after a request.
+DB_CONN_MAX_AGE = env.int("DB_CONN_MAX_AGE", default=600)  # seconds, 0 reconnects on every request
+DB_CONN_HEALTH_CHECKS = env.bool("DB_CONN_HEALTH_CHECKS", default=True)
+DB_CONNECT_TIMEOUT = env.int("DB_CONNECT_TIMEOUT", default=5)  # seconds (PostgreSQL)
+DB_STATEMENT_TIMEOUT = env.int("DB_STATEMENT_TIMEOUT", default=0)  # milliseconds (PostgreSQL), 0 disables
+# Exports and batch jobs stream rows with iterator(chunk_size=...), which uses server-side cursors on
+# PostgreSQL. Disable them behind a transaction-pooling PgBouncer.
+DB_DISABLE_SERVER_SIDE_CURSORS = env.bool("DB_DISABLE_SERVER_SIDE_CURSORS", default=False)
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
+        "ENGINE": "jf_manager_backend.db.sqlite3" if SQLITE_TUNING else "django.db.backends.sqlite3",
         "NAME": os.path.join(BASE_DIR, "db.sqlite3"),
+        "OPTIONS": SQLITE_OPTIONS if SQLITE_TUNING else {},
     }
 }
 
@@ -214,6 +248,11 @@ OIDC_OP_USER_ENDPOINT = ""  # populated at runtime from discovery
 OIDC_RP_CLIENT_ID = ""  # populated at runtime from DB
 OIDC_RP_CLIENT_SECRET = ""  # populated at runtime from DB
 
+# LDAP settings are compiled from LDAPConfig in users.ldap_runtime.
+# Service-account connections used for user/group searches are pooled per process.
+LDAP_POOL_SIZE = env.int("LDAP_POOL_SIZE", default=5)
+LDAP_POOL_MAX_IDLE = env.int("LDAP_POOL_MAX_IDLE", default=60)  # seconds
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework_simplejwt.authentication.JWTAuthentication",
@@ -308,6 +347,21 @@ else:
         }
     }
 
+# Request metrics, scraped from /health/metrics/ (see health/metrics.py)
+METRICS_ENABLED = env.bool("METRICS_ENABLED", default=True)
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+# Without a token the metrics are only shown to staff users; opt out to serve them to anyone
+METRICS_PUBLIC = env.bool("METRICS_PUBLIC", default=False)
+# Sum the metrics of all worker processes in Redis (requires REDIS_URL)
+METRICS_REDIS_AGGREGATION = env.bool("METRICS_REDIS_AGGREGATION", default=False)
+METRICS_FLUSH_INTERVAL = env.int("METRICS_FLUSH_INTERVAL", default=10)  # seconds
+
+# Dependency probes on /health/ready/ (see health/checks.py)
+READINESS_PROBE_TIMEOUT = env.float("READINESS_PROBE_TIMEOUT", default=2.0)  # seconds per probe
+READINESS_CACHE_SECONDS = env.float("READINESS_CACHE_SECONDS", default=5.0)
+# Not ready once the oldest queued job has waited longer than this (seconds)
+READINESS_QUEUE_MAX_AGE = env.int("READINESS_QUEUE_MAX_AGE", default=900)
+
 if REDIS_URL != "none":
     RQ_QUEUES = {
         "default": {
@@ -317,7 +371,9 @@ if REDIS_URL != "none":
     }
 else:
     RQ_QUEUES = {}
-# Default email settings (can be overridden by dynamic preferences)
+# Default email settings (can be overridden by dynamic preferences).
+# The preference-aware backend resolves the SMTP settings lazily when mail is sent.
+EMAIL_BACKEND = "jf_manager_backend.email_backend.PreferencesEmailBackend"
 EMAIL_HOST = ""
 EMAIL_PORT = 587
 EMAIL_HOST_USER = ""
@@ -11,6 +11,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from departments.mixins import DepartmentScopeViewSetMixin
+from jf_manager_backend.pagination import OptionalCursorPagination
 from members.api.permissions import CanSendEmails
 from members.api.serializers.email_serializers import (
     EmailMessageCreateSerializer,
@@ -39,6 +40,7 @@ class EmailMessageViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
     filterset_fields = ["status", "recipient_type", "recipient_group", "sender"]
     ordering_fields = ["created_at", "sent_at", "subject"]
     ordering = ["-created_at"]
+    pagination_class = OptionalCursorPagination
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -9,6 +9,8 @@ from rest_framework import filters, viewsets
 from rest_framework.permissions import IsAuthenticated
 
 from departments.mixins import DepartmentScopeViewSetMixin
+from jf_manager_backend.mixins import CollectionETagViewSetMixin
+from jf_manager_backend.pagination import OptionalCursorPagination
 from jf_manager_backend.permissions import DepartmentRoleModelPermissions
 from members.api_serializers import EventSerializer, EventTypeSerializer
 from members.models import Event, EventType
@@ -22,12 +24,13 @@ from members.models import Event, EventType
     partial_update=extend_schema(summary="Partially update event type"),
     destroy=extend_schema(summary="Delete event type"),
 )
-class EventTypeViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
+class EventTypeViewSet(CollectionETagViewSetMixin, DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
     queryset = EventType.objects.all()
     serializer_class = EventTypeSerializer
     permission_classes = [IsAuthenticated, DepartmentRoleModelPermissions]
     include_central_records = True
     ordering = ["name"]
+    etag_models = [EventType, Event]  # event_count
 
     def get_queryset(self):
         """
@@ -68,6 +71,7 @@ class EventViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
     search_fields = ["member__name", "member__lastname", "notes", "type__name"]
     ordering_fields = ["datetime"]
     ordering = ["-datetime"]
+    pagination_class = OptionalCursorPagination
 
     def get_queryset(self):
         user = self.request.user
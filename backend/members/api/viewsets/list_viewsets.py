@@ -19,6 +19,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.renderers import BaseRenderer
 from rest_framework.response import Response
 
+from departments.access import get_department_access
 from jf_manager_backend.permissions import DepartmentRoleModelPermissions
 from members.api.serializers.list_serializers import (
     CreateFromEventTypeInputSerializer,
@@ -26,7 +27,11 @@ from members.api.serializers.list_serializers import (
     MemberListDetailSerializer,
     MemberListSerializer,
 )
-from members.api.viewsets.member_viewsets import MEMBER_EXPORT_COLUMNS, MEMBER_EXPORT_DEFAULT_COLUMNS
+from members.api.viewsets.member_viewsets import (
+    EXPORT_CHUNK_SIZE,
+    MEMBER_EXPORT_COLUMNS,
+    MEMBER_EXPORT_DEFAULT_COLUMNS,
+)
 from members.api_serializers import AttachmentSerializer
 from members.models import Attachment, Event, Member, MemberList, MemberListEntry
 
@@ -261,7 +266,7 @@ class MemberListViewSet(viewsets.ModelViewSet):
             else:
                 base_members = Member.objects.all()
         else:
-            dept_ids = list(user.department_roles.values_list("department_id", flat=True))
+            dept_ids = get_department_access(user, request).department_ids
             if dept_raw:
                 try:
                     dept_id = int(dept_raw)
@@ -355,7 +360,7 @@ class MemberListViewSet(viewsets.ModelViewSet):
 
         today = date.today()
 
-        for row_idx, entry in enumerate(entries, start=2):
+        for row_idx, entry in enumerate(entries.iterator(chunk_size=EXPORT_CHUNK_SIZE), start=2):
             member = entry.member
             parents = list(member.parent_set.all()[:2])
             p1 = parents[0] if len(parents) > 0 else None
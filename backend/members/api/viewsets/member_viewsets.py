@@ -19,6 +19,7 @@ from rest_framework.renderers import BaseRenderer
 from rest_framework.response import Response
 
 from departments.mixins import DepartmentScopeViewSetMixin
+from jf_manager_backend.mixins import SparseFieldsViewSetMixin
 from jf_manager_backend.permissions import DepartmentRoleModelPermissions
 from members.api_serializers import (
     AttachmentSerializer,
@@ -85,6 +86,9 @@ MEMBER_EXPORT_DEFAULT_COLUMNS = [
     "group",
 ]
 
+# Rows per fetch while streaming exports (server-side cursor on PostgreSQL, prefetches per chunk)
+EXPORT_CHUNK_SIZE = 500
+
 
 class PassthroughRenderer(BaseRenderer):
     """Return data as-is for binary responses."""
@@ -120,7 +124,7 @@ class PassthroughRenderer(BaseRenderer):
         responses={204: None, 409: None},
     ),
 )
-class MemberViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
+class MemberViewSet(SparseFieldsViewSetMixin, DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
     queryset = Member.objects.select_related("status", "group", "storage_location").prefetch_related(
         "parent_set", "departments"
     )
@@ -136,9 +140,11 @@ class MemberViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
     def get_queryset(self):
         """Filter members by department using M2M lookup."""
         user = self.request.user
-        base_qs = Member.objects.select_related("status", "group", "storage_location").prefetch_related(
-            "parent_set", "departments"
-        )
+        base_qs = Member.objects.select_related("status", "group", "storage_location")
+        if self.field_requested("parents"):
+            base_qs = base_qs.prefetch_related("parent_set")
+        if self.field_requested("department_ids"):
+            base_qs = base_qs.prefetch_related("departments")
 
         if self._user_is_org_wide(user):
             requested_dept = self._resolve_requested_department(user)
@@ -432,7 +438,7 @@ class MemberViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
 
         today = date.today()
 
-        for row_idx, member in enumerate(qs, start=2):
+        for row_idx, member in enumerate(qs.iterator(chunk_size=EXPORT_CHUNK_SIZE), start=2):
             parents = list(member.parent_set.all()[:2])
             p1 = parents[0] if len(parents) > 0 else None
             p2 = parents[1] if len(parents) > 1 else None
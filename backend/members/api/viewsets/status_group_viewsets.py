@@ -7,6 +7,7 @@ from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 
 from departments.mixins import DepartmentScopeViewSetMixin
+from jf_manager_backend.mixins import CollectionETagViewSetMixin
 from jf_manager_backend.permissions import DepartmentRoleModelPermissions
 from members.api_serializers import GroupSerializer, StatusSerializer
 from members.models import Group, Status
@@ -20,11 +21,12 @@ from members.models import Group, Status
     partial_update=extend_schema(summary="Partially update status"),
     destroy=extend_schema(summary="Delete status"),
 )
-class StatusViewSet(viewsets.ModelViewSet):
+class StatusViewSet(CollectionETagViewSetMixin, viewsets.ModelViewSet):
     queryset = Status.objects.all()
     serializer_class = StatusSerializer
     permission_classes = [IsAuthenticated, DepartmentRoleModelPermissions]
     ordering = ["name"]
+    etag_models = [Status]
 
 
 @extend_schema_view(
@@ -35,8 +37,9 @@ class StatusViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update group"),
     destroy=extend_schema(summary="Delete group"),
 )
-class GroupViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
+class GroupViewSet(CollectionETagViewSetMixin, DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
     queryset = Group.objects.all()
     serializer_class = GroupSerializer
     permission_classes = [IsAuthenticated, DepartmentRoleModelPermissions]
     ordering = ["name"]
+    etag_models = [Group]
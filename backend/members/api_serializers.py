@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from jf_manager_backend.serializers import SparseFieldsMixin
+
 from .models import Attachment, Event, EventType, Group, Member, Parent, Status
 
 User = get_user_model()
@@ -41,7 +43,7 @@ class ParentSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "full_name"]
 
 
-class MemberListSerializer(serializers.ModelSerializer):
+class MemberListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Lightweight serializer for list views"""
 
     status = StatusSerializer(read_only=True)
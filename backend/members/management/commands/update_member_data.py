@@ -18,7 +18,7 @@ class Command(BaseCommand):
 
         # Update existing members with missing data
         members_updated = 0
-        for member in Member.objects.all():
+        for member in Member.objects.iterator(chunk_size=500):
             if not member.joined:
                 member.joined = date(2020, 1, 1)
                 member.save()
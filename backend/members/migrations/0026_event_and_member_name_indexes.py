@@ -0,0 +1,26 @@
+# Generated by Django 5.0.14 on 2026-10-19 18:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("departments", "0003_department_color"),
+        ("inventory", "0016_transaction_location_indexes"),
+        ("members", "0025_add_layout_to_emailmessage"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["-datetime"], name="members_event_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["member", "-datetime"], name="members_event_member_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="member",
+            index=models.Index(fields=["lastname", "name"], name="members_member_name_idx"),
+        ),
+    ]
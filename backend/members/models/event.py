@@ -23,3 +23,10 @@ class Event(models.Model):
     datetime = models.DateField(verbose_name="Datum", null=False, blank=False)
     notes = models.TextField(blank=True, default="", verbose_name="Bemerkungen")
     member = models.ForeignKey(Member, blank=False, null=True, on_delete=models.CASCADE)
+
+    class Meta:
+        indexes = [
+            # Event list (newest first) and the events of one member
+            models.Index(fields=["-datetime"], name="members_event_date_idx"),
+            models.Index(fields=["member", "-datetime"], name="members_event_member_date_idx"),
+        ]
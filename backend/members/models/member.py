@@ -58,6 +58,12 @@ class Member(models.Model):
     # Generic relation to attachments
     attachments = GenericRelation("Attachment", related_query_name="member")
 
+    class Meta:
+        indexes = [
+            # Default ordering of the member list and exports
+            models.Index(fields=["lastname", "name"], name="members_member_name_idx"),
+        ]
+
     def get_absolute_url(self):
         """
         Returns the URL to access a particular member instance.
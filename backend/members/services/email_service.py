@@ -5,12 +5,12 @@ Handles recipient collection, personalization, and SMTP delivery.
 
 import logging
 
-from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
 from django.db import transaction
 from django.utils import timezone
 from django.utils.html import strip_tags
 
+from jf_manager_backend.email_backend import get_default_from_email
 from members.models import EmailMessage, EmailRecipient, Group, Member, Parent
 
 logger = logging.getLogger(__name__)
@@ -319,6 +319,7 @@ class MemberEmailService:
         attachments = list(email_message.attachments.all())
 
         pending_recipients = email_message.recipients.filter(status="pending")
+        from_email = get_default_from_email()
 
         for recipient in pending_recipients:
             try:
@@ -326,7 +327,7 @@ class MemberEmailService:
                 email = EmailMultiAlternatives(
                     subject=email_message.subject,
                     body=recipient.personalized_body_text,
-                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    from_email=from_email,
                     to=[recipient.email_address],
                 )
 
@@ -0,0 +1,6 @@
+from jf_manager_backend.etags import track_collection_versions
+
+from .models import Event, EventType, Group, Status
+
+# Event type lists carry an event_count.
+track_collection_versions(Status, Group, EventType, Event)
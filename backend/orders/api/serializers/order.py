@@ -5,6 +5,7 @@ Order serializers with nested items and computed fields
 from django.db.models import Count
 from rest_framework import serializers
 
+from jf_manager_backend.serializers import SparseFieldsMixin
 from orders.models import Order
 
 from .order_item import OrderItemCreateSerializer, OrderItemMinimalSerializer, OrderItemSerializer
@@ -149,7 +150,7 @@ class OrderUpdateSerializer(serializers.ModelSerializer):
         ]
 
 
-class OrderListSerializer(serializers.ModelSerializer):
+class OrderListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Lightweight serializer for list views"""
 
     member_name = serializers.CharField(source="member.get_full_name", read_only=True)
@@ -186,7 +187,7 @@ class OrderListSerializer(serializers.ModelSerializer):
 
     def get_items_summary(self, obj):
         """Get summary of items with quantities"""
-        items = obj.items.select_related("item").all()
+        items = obj.items.all()
         return [
             {"item_id": item.item.id, "item_name": item.item.name, "size": item.size or "", "quantity": item.quantity}
             for item in items
@@ -15,6 +15,8 @@ from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.response import Response
 
 from departments.mixins import DepartmentScopeViewSetMixin
+from jf_manager_backend.mixins import SparseFieldsViewSetMixin
+from jf_manager_backend.pagination import OptionalCursorPagination
 from jf_manager_backend.permissions import DepartmentRoleModelPermissions
 from orders.api.filters import OrderFilter
 from orders.api.permissions import CanManageOrders
@@ -28,8 +30,11 @@ from orders.api.serializers import (
 from orders.models import Order, OrderItem, OrderStatus
 from orders.notifications import OrderNotificationService
 
+# Orders per fetch while streaming the CSV export (server-side cursor on PostgreSQL)
+EXPORT_CHUNK_SIZE = 500
 
-class OrderViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
+
+class OrderViewSet(SparseFieldsViewSetMixin, DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
     """
     Comprehensive ViewSet for Order management
 
@@ -49,6 +54,7 @@ class OrderViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
     search_fields = ["member__name", "member__lastname", "notes", "items__item__name"]
     ordering_fields = ["order_date", "member__name", "member__lastname"]
     ordering = ["-order_date"]
+    pagination_class = OptionalCursorPagination
 
     def get_queryset(self):
         """Optimize queryset with prefetch, then apply department scope."""
@@ -57,10 +63,13 @@ class OrderViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
             "member__group",
             "ordered_by",
             "department",
-        ).prefetch_related("items__item", "items__status")
+        )
+        # List requests with ?fields= skip what is not rendered.
+        if self.action != "list" or self.field_requested("items_summary", "common_status"):
+            queryset = queryset.prefetch_related("items__item", "items__status")
 
         # For list view, add count annotation
-        if self.action == "list":
+        if self.action == "list" and self.field_requested("items_count"):
             queryset = queryset.annotate(_items_count=Count("items"))
 
         self.queryset = queryset
@@ -276,7 +285,7 @@ class OrderViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
             ]
         )
 
-        for order in queryset:
+        for order in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
             for item in order.items.all():
                 writer.writerow(
                     [
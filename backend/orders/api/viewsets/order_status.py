@@ -8,13 +8,14 @@ from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.response import Response
 
+from jf_manager_backend.mixins import CollectionETagViewSetMixin
 from jf_manager_backend.permissions import DepartmentRoleModelPermissions, OrgWideWritePermission
 from orders.api.filters import OrderStatusFilter
 from orders.api.serializers import OrderStatusSerializer
 from orders.models import OrderStatus
 
 
-class OrderStatusViewSet(viewsets.ModelViewSet):
+class OrderStatusViewSet(CollectionETagViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Order Status management
 
@@ -29,6 +30,7 @@ class OrderStatusViewSet(viewsets.ModelViewSet):
     search_fields = ["name", "code", "description"]
     ordering_fields = ["sort_order", "name", "code"]
     ordering = ["sort_order", "name"]
+    etag_models = [OrderStatus]
 
     @action(detail=False, methods=["get"])
     def active(self, request):
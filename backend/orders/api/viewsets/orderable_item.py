@@ -9,13 +9,14 @@ from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.response import Response
 
+from jf_manager_backend.mixins import CollectionETagViewSetMixin
 from jf_manager_backend.permissions import DepartmentRoleModelPermissions, OrgWideWritePermission
 from orders.api.filters import OrderableItemFilter
 from orders.api.serializers import OrderableItemCreateUpdateSerializer, OrderableItemSerializer
 from orders.models import OrderableItem
 
 
-class OrderableItemViewSet(viewsets.ModelViewSet):
+class OrderableItemViewSet(CollectionETagViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Orderable Items (catalog)
 
@@ -30,6 +31,7 @@ class OrderableItemViewSet(viewsets.ModelViewSet):
     search_fields = ["name", "category", "description"]
     ordering_fields = ["category", "name", "created_at"]
     ordering = ["category", "name"]
+    etag_models = [OrderableItem]
 
     def get_serializer_class(self):
         """Use different serializers for different actions"""
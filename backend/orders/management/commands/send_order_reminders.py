@@ -6,6 +6,8 @@ from django.utils import timezone
 from orders.models import OrderItem, OrderStatus
 from orders.notifications import OrderNotificationService
 
+CHUNK_SIZE = 500
+
 
 class Command(BaseCommand):
     help = "Send reminder notifications for pending orders"
@@ -41,7 +43,7 @@ class Command(BaseCommand):
 
         # Group by order
         orders_dict = {}
-        for item in pending_items:
+        for item in pending_items.iterator(chunk_size=CHUNK_SIZE):
             if item.order.pk not in orders_dict:
                 orders_dict[item.order.pk] = {"order": item.order, "items": []}
             orders_dict[item.order.pk]["items"].append(item)
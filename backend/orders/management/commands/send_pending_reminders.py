@@ -6,6 +6,8 @@ from django.utils import timezone
 from orders.models import Order, OrderStatus
 from orders.notifications import OrderNotificationService
 
+CHUNK_SIZE = 500
+
 
 class Command(BaseCommand):
     help = "Send reminder emails for pending order items"
@@ -47,7 +49,7 @@ class Command(BaseCommand):
 
         emails_sent = 0
 
-        for order in orders_with_pending:
+        for order in orders_with_pending.iterator(chunk_size=CHUNK_SIZE):
             # Get pending items for this order
             pending_items = order.items.filter(status__in=pending_statuses)
 
@@ -0,0 +1,16 @@
+# Generated by Django 5.0.14 on 2026-10-19 18:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("orders", "0008_add_email_layout_template"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="orderitem",
+            index=models.Index(fields=["status", "order"], name="orders_item_status_order_idx"),
+        ),
+    ]
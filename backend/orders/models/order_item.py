@@ -22,6 +22,10 @@ class OrderItem(models.Model):
     class Meta:
         verbose_name = "Bestellartikel"
         verbose_name_plural = "Bestellartikel"
+        indexes = [
+            # Items in a status per order (reminders, status filters, notification summaries)
+            models.Index(fields=["status", "order"], name="orders_item_status_order_idx"),
+        ]
 
     def __str__(self):
         size_info = f" (Größe: {self.size})" if self.size else ""
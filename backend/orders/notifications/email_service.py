@@ -8,9 +8,9 @@ order creation, status updates, bulk updates, reminders, and summaries.
 import logging
 from collections import defaultdict
 
-from django.conf import settings
 from django.core.mail import send_mail
 
+from jf_manager_backend.email_backend import get_default_from_email
 from users.models import CustomUser
 
 from ..models import Order, OrderItem, OrderStatus
@@ -422,7 +422,7 @@ class OrderNotificationService(BaseNotificationService):
                     subject=subject,
                     message=plain_message,
                     html_message=html_message,
-                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    from_email=get_default_from_email(),
                     recipient_list=[recipient_email],
                     fail_silently=False,
                 )
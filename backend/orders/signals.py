@@ -0,0 +1,5 @@
+from jf_manager_backend.etags import track_collection_versions
+
+from .models import OrderableItem, OrderStatus
+
+track_collection_versions(OrderStatus, OrderableItem)
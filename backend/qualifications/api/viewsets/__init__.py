@@ -17,6 +17,7 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from departments.mixins import DepartmentScopeViewSetMixin
+from jf_manager_backend.mixins import CollectionETagViewSetMixin
 from jf_manager_backend.permissions import DepartmentRoleModelPermissions, OrgWideWritePermission
 from members.api_serializers import AttachmentSerializer
 from members.models import Attachment
@@ -38,7 +39,7 @@ from ..serializers import (
 )
 
 
-class QualificationTypeViewSet(viewsets.ModelViewSet):
+class QualificationTypeViewSet(CollectionETagViewSetMixin, viewsets.ModelViewSet):
     """ViewSet for QualificationType"""
 
     queryset = QualificationType.objects.all().order_by("name")
@@ -47,6 +48,7 @@ class QualificationTypeViewSet(viewsets.ModelViewSet):
     filterset_fields = ["expires"]
     search_fields = ["name", "description"]
     ordering_fields = ["name"]
+    etag_models = [QualificationType]
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -5,3 +5,6 @@ class QualificationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "qualifications"
     verbose_name = "Qualifikationen & Sonderaufgaben"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-19 18:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("members", "0026_event_and_member_name_indexes"),
+        ("qualifications", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="qualification",
+            index=models.Index(
+                condition=models.Q(("date_expires__isnull", False)),
+                fields=["date_expires"],
+                name="qualif_date_expires_idx",
+            ),
+        ),
+    ]
@@ -55,6 +55,14 @@ class Qualification(models.Model):
             ("view_all_qualifications", "Kann alle Qualifikationen einsehen"),
             ("manage_qualifications", "Kann Qualifikationen verwalten"),
         ]
+        indexes = [
+            # Expired / expiring soon (filters and dashboard); most qualifications never expire
+            models.Index(
+                fields=["date_expires"],
+                name="qualif_date_expires_idx",
+                condition=models.Q(date_expires__isnull=False),
+            ),
+        ]
 
     type = models.ForeignKey(QualificationType, on_delete=models.CASCADE, verbose_name="Qualifikationstyp")
 
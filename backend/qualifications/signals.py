@@ -0,0 +1,5 @@
+from jf_manager_backend.etags import track_collection_versions
+
+from .models import QualificationType
+
+track_collection_versions(QualificationType)
@@ -5,6 +5,7 @@ from rest_framework import serializers
 
 from members.models import Member
 from servicebook.models import Attendance, Service
+from servicebook.services import defer_summary_refresh
 
 
 class AttendanceSerializer(serializers.ModelSerializer):
@@ -89,7 +90,7 @@ class AttendanceBulkUpdateSerializer(serializers.Serializer):
         updated = []
         deleted = []
 
-        with transaction.atomic():
+        with transaction.atomic(), defer_summary_refresh():
             # First, clean up any duplicate records for this service
             self._cleanup_duplicates(service)
 
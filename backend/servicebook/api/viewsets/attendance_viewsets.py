@@ -9,8 +9,9 @@ from rest_framework.permissions import DjangoModelPermissions, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from jf_manager_backend.pagination import OptionalCursorPagination
 from servicebook.models import Attendance
-from servicebook.selectors import get_attandance_list
+from servicebook.selectors import get_attandance_list, get_attendance_summary_of_member
 
 from ..serializers import (
     AttendanceBulkUpdateSerializer,
@@ -39,6 +40,7 @@ class AttendanceViewSet(viewsets.ModelViewSet):
     search_fields = ["person__name", "person__lastname"]
     ordering_fields = ["state", "id", "service__start"]
     ordering = ["-service__start"]
+    pagination_class = OptionalCursorPagination
 
     def get_queryset(self):
         """Get attendance list with optimized queries."""
@@ -109,20 +111,17 @@ class AttendanceViewSet(viewsets.ModelViewSet):
         attendances = member_attendances[:limit]
         serializer = self.get_serializer(attendances, many=True)
 
-        # Calculate summary statistics
-        total = member_attendances.count()
-        present = member_attendances.filter(state="A").count()
-        excused = member_attendances.filter(state="E").count()
-        absent = member_attendances.filter(state="F").count()
+        # Summary statistics come from the yearly attendance rollup
+        summary = get_attendance_summary_of_member(member_id)
 
         return Response(
             {
                 "attendances": serializer.data,
                 "summary": {
-                    "total": total,
-                    "present": present,
-                    "excused": excused,
-                    "absent": absent,
+                    "total": summary["total"],
+                    "present": summary["present"],
+                    "excused": summary["excused"],
+                    "absent": summary["absent"],
                 },
             }
         )
@@ -2,21 +2,26 @@
 
 from django.core.cache import cache
 from django.db.models import Count
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status, viewsets
 from rest_framework.authentication import SessionAuthentication, TokenAuthentication
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import DjangoModelPermissions, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from departments.mixins import DepartmentScopeViewSetMixin
+from members.models import Member
 from servicebook.models import Attendance, Service
 from servicebook.selectors import (
     get_attendance_over_time_data,
+    get_attendance_year_report,
     get_services_with_attendance_summary,
     get_top_lists_by_state,
 )
+from servicebook.services import defer_summary_refresh
 
 from ..serializers import (
     ServiceCreateSerializer,
@@ -76,23 +81,53 @@ class ServiceViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
         headers = self.get_success_headers(detail_serializer.data)
         return Response(detail_serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
+    def _scoped_members(self):
+        """
+        Members visible in the caller's department context.
+
+        Returns None for org-wide users without a ?department= filter, meaning
+        no restriction is needed.
+        """
+        user = self.request.user
+        requested_dept = self._resolve_requested_department(user)
+        if requested_dept is not None:
+            return Member.objects.filter(departments__id=requested_dept)
+        if self._user_is_org_wide(user):
+            return None
+        return Member.objects.filter(departments__id__in=self._user_department_ids(user))
+
+    def _requested_year(self, default=None):
+        """Parse the optional ?year= query param."""
+        raw = self.request.query_params.get("year")
+        if not raw:
+            return default
+        try:
+            return int(raw)
+        except (TypeError, ValueError) as exc:
+            raise ValidationError({"year": "Ungültiger Wert – muss eine Zahl sein."}) from exc
+
     @action(detail=False, methods=["get"])
     def statistics(self, request):
         """
         Get overall servicebook statistics.
 
+        Query params:
+        - year: Restrict the top lists to one calendar year (default: all years)
+
         Returns:
         - Total services count
         - Recent services summary
-        - Top attendance lists (most present, excused, absent)
+        - Top attendance lists (most present, excused, absent) for the caller's departments
         """
         services_count = Service.objects.count()
         recent_services = Service.objects.order_by("-start")[:5]
 
-        # Get top lists
-        top_present = get_top_lists_by_state("A", max_entries=7)
-        top_excused = get_top_lists_by_state("E", max_entries=7)
-        top_absent = get_top_lists_by_state("F", max_entries=7)
+        # Get top lists from the yearly attendance rollup
+        year = self._requested_year()
+        members = self._scoped_members()
+        top_present = get_top_lists_by_state("A", max_entries=7, year=year, members=members)
+        top_excused = get_top_lists_by_state("E", max_entries=7, year=year, members=members)
+        top_absent = get_top_lists_by_state("F", max_entries=7, year=year, members=members)
 
         return Response(
             {
@@ -106,6 +141,38 @@ class ServiceViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
             }
         )
 
+    @action(detail=False, methods=["get"])
+    def year_report(self, request):
+        """
+        Get the year-end attendance report.
+
+        Query params:
+        - year: Calendar year of the report (default: current year)
+
+        Returns one row per member of the caller's departments with their
+        present/excused/absent counts, read from the yearly attendance rollup.
+        """
+        year = self._requested_year(default=timezone.localdate().year)
+        summaries = get_attendance_year_report(year, members=self._scoped_members())
+        return Response(
+            {
+                "year": year,
+                "members": [
+                    {
+                        "id": summary.person_id,
+                        "name": summary.person.name,
+                        "lastname": summary.person.lastname,
+                        "full_name": summary.person.get_full_name(),
+                        "present": summary.present,
+                        "excused": summary.excused,
+                        "absent": summary.absent,
+                        "total": summary.total,
+                    }
+                    for summary in summaries
+                ],
+            }
+        )
+
     @action(detail=False, methods=["get"])
     def attendance_chart(self, request):
         """
@@ -176,6 +243,7 @@ class ServiceViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
 
     def perform_destroy(self, instance):
         """Handle service deletion and clear cache."""
-        instance.delete()
+        with defer_summary_refresh():
+            instance.delete()
         # Clear attendance cache when service is deleted
         cache.delete("attendance_over_time_data")
@@ -6,4 +6,4 @@ class ServicebookConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
 
     def ready(self):
-        pass
+        from . import signals  # noqa: F401
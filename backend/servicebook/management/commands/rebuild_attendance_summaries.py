@@ -0,0 +1,26 @@
+"""Management command to rebuild the yearly attendance rollup."""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from servicebook.services import rebuild_attendance_summaries
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the per-member, per-year attendance rollup from the attendance records"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--year",
+            type=int,
+            help="Only rebuild the given calendar year",
+        )
+
+    def handle(self, *args, **options):
+        year = options["year"]
+
+        with transaction.atomic():
+            count = rebuild_attendance_summaries(year=year)
+
+        scope = f"year {year}" if year else "all years"
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} attendance summary row(s) for {scope}."))
@@ -0,0 +1,68 @@
+# Generated by Django 5.0.14 on 2026-10-19 16:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import ExtractYear
+
+STATE_FIELDS = {"A": "present", "E": "excused", "F": "absent"}
+
+
+def backfill_attendance_summaries(apps, schema_editor):
+    """Aggregate existing attendances into the yearly rollup table."""
+    Attendance = apps.get_model("servicebook", "Attendance")
+    AttendanceYearSummary = apps.get_model("servicebook", "AttendanceYearSummary")
+
+    rows = (
+        Attendance.objects.filter(person__isnull=False, service__isnull=False, state__in=STATE_FIELDS.keys())
+        .annotate(year=ExtractYear("service__start"))
+        .values("person_id", "year", "state")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    buckets = {}
+    for row in rows:
+        counters = buckets.setdefault((row["person_id"], row["year"]), {"present": 0, "excused": 0, "absent": 0})
+        counters[STATE_FIELDS[row["state"]]] = row["count"]
+
+    AttendanceYearSummary.objects.bulk_create(
+        [AttendanceYearSummary(person_id=pid, year=year, **counters) for (pid, year), counters in buckets.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("members", "0025_add_layout_to_emailmessage"),
+        ("servicebook", "0007_service_training_session"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AttendanceYearSummary",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("year", models.PositiveSmallIntegerField(verbose_name="Jahr")),
+                ("present", models.PositiveIntegerField(default=0, verbose_name="Anwesend")),
+                ("excused", models.PositiveIntegerField(default=0, verbose_name="Entschuldigt")),
+                ("absent", models.PositiveIntegerField(default=0, verbose_name="Fehlend")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="Aktualisiert am")),
+                (
+                    "person",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="attendance_summaries",
+                        to="members.member",
+                        verbose_name="Mitglied",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Anwesenheitsübersicht (Jahr)",
+                "verbose_name_plural": "Anwesenheitsübersichten (Jahr)",
+                "indexes": [models.Index(fields=["year", "person"], name="servicebook_year_4867ee_idx")],
+                "unique_together": {("person", "year")},
+            },
+        ),
+        migrations.RunPython(backfill_attendance_summaries, migrations.RunPython.noop),
+    ]
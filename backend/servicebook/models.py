@@ -59,6 +59,55 @@ class Attendance(models.Model):
             models.Index(fields=["person", "service"]),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored member/service so the yearly rollup can be
+        # corrected when an attendance is moved to another member or service.
+        instance._loaded_keys = (instance.__dict__.get("person_id"), instance.__dict__.get("service_id"))
+        return instance
+
     def __str__(self):
         return f"{self.person.name} war {self.state} bei {self.service.__str__()}"
         # return self.person.name + " war " + self.state + " bei " + self.service.__str__()
+
+
+class AttendanceYearSummary(models.Model):
+    """
+    Per-member, per-year rollup of attendance states.
+
+    Maintained from Attendance/Service writes (see servicebook.signals) so
+    leaderboards, member statistics and year-end reports never need to scan
+    the full Attendance table.  The year is the local calendar year of
+    ``Service.start``.
+    """
+
+    person = models.ForeignKey(
+        Member,
+        on_delete=models.CASCADE,
+        related_name="attendance_summaries",
+        verbose_name="Mitglied",
+    )
+    year = models.PositiveSmallIntegerField(verbose_name="Jahr")
+    present = models.PositiveIntegerField(default=0, verbose_name="Anwesend")
+    excused = models.PositiveIntegerField(default=0, verbose_name="Entschuldigt")
+    absent = models.PositiveIntegerField(default=0, verbose_name="Fehlend")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Aktualisiert am")
+
+    # Maps Attendance.state to the counter column it is rolled up into
+    STATE_FIELDS = {"A": "present", "E": "excused", "F": "absent"}
+
+    class Meta:
+        verbose_name = "Anwesenheitsübersicht (Jahr)"
+        verbose_name_plural = "Anwesenheitsübersichten (Jahr)"
+        unique_together = [["person", "year"]]
+        indexes = [
+            models.Index(fields=["year", "person"]),
+        ]
+
+    @property
+    def total(self):
+        return self.present + self.excused + self.absent
+
+    def __str__(self):
+        return f"{self.person} {self.year}: {self.present}/{self.excused}/{self.absent}"
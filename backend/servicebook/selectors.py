@@ -1,12 +1,12 @@
 from collections import Counter
 
 from django.core.cache import cache
-from django.db.models import Count
+from django.db.models import Count, Sum
 from dynamic_preferences.registries import global_preferences_registry
 
 from members.models import Member
 
-from .models import Attendance, Service
+from .models import Attendance, AttendanceYearSummary, Service
 
 global_preferences = global_preferences_registry.manager()
 
@@ -40,15 +40,47 @@ def get_summary_of_attendances_per_service(service: Service):
     }
 
 
-def get_top_lists_by_state(state, max_entries=7):
+def get_top_lists_by_state(state, max_entries=7, year=None, members=None):
+    """
+    Leaderboard of members by number of attendances in the given state.
+
+    Reads from the yearly rollup table and groups by member id, so members with
+    identical names are kept apart.  ``year`` limits the list to one calendar
+    year, ``members`` (a Member queryset) limits it to e.g. a department.
+    """
+    field = AttendanceYearSummary.STATE_FIELDS[state]
+    summaries = AttendanceYearSummary.objects.all()
+    if year is not None:
+        summaries = summaries.filter(year=year)
+    if members is not None:
+        summaries = summaries.filter(person__in=members)
     return (
-        Attendance.objects.filter(state=state)
-        .values("person__name", "person__lastname")
-        .annotate(num_services=Count("person"))
-        .order_by("-num_services")[:max_entries]
+        summaries.values("person_id", "person__name", "person__lastname")
+        .annotate(num_services=Sum(field))
+        .filter(num_services__gt=0)
+        .order_by("-num_services", "person__lastname", "person__name")[:max_entries]
     )
 
 
+def get_attendance_summary_of_member(member: Member, year=None):
+    """Return present/excused/absent/total counts of a member from the yearly rollup."""
+    summaries = AttendanceYearSummary.objects.filter(person=member)
+    if year is not None:
+        summaries = summaries.filter(year=year)
+    totals = summaries.aggregate(present=Sum("present"), excused=Sum("excused"), absent=Sum("absent"))
+    totals = {key: value or 0 for key, value in totals.items()}
+    totals["total"] = totals["present"] + totals["excused"] + totals["absent"]
+    return totals
+
+
+def get_attendance_year_report(year, members=None):
+    """Per-member attendance rollup rows of one year, ordered by name."""
+    summaries = AttendanceYearSummary.objects.filter(year=year).select_related("person")
+    if members is not None:
+        summaries = summaries.filter(person__in=members)
+    return summaries.order_by("person__lastname", "person__name", "person_id")
+
+
 def get_attandance_alert_by_member(member: Member, n_not_present=5, n_last_items=10):
     """
     Determines if a member should receive an attendance alert based on their attendance record.
@@ -0,0 +1,163 @@
+"""
+Maintenance of the per-member, per-year attendance rollup.
+
+``AttendanceYearSummary`` rows are refreshed bucket by bucket (member + year)
+whenever attendance or service data changes.  A refresh re-aggregates only the
+affected members for a single year, which keeps the rollup exact without ever
+scanning the whole Attendance table.
+
+Bulk write paths should wrap their work in ``defer_summary_refresh()`` so all
+touched buckets are refreshed once at the end instead of once per row.
+"""
+
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Count
+from django.db.models.functions import ExtractYear
+from django.utils import timezone
+
+from .models import Attendance, AttendanceYearSummary, Service
+
+_pending = threading.local()
+
+SUMMARY_COUNTER_FIELDS = ["present", "excused", "absent"]
+
+
+def get_service_year(start):
+    """Return the local calendar year a service start belongs to."""
+    if timezone.is_aware(start):
+        start = timezone.localtime(start)
+    return start.year
+
+
+def get_year_bounds(year):
+    """Return the [start, end) datetimes of a local calendar year."""
+    start, end = datetime(year, 1, 1), datetime(year + 1, 1, 1)
+    if not settings.USE_TZ:
+        return start, end
+    tz = timezone.get_current_timezone()
+    return timezone.make_aware(start, tz), timezone.make_aware(end, tz)
+
+
+def refresh_attendance_summaries(person_ids, year):
+    """
+    Recompute the rollup rows of the given members for one year.
+
+    Runs one grouped aggregate over the members' attendances in that year and
+    upserts the result; buckets without any attendance are removed.
+    """
+    person_ids = {pid for pid in person_ids if pid is not None}
+    if not person_ids or year is None:
+        return
+
+    start, end = get_year_bounds(year)
+    counts = {pid: dict.fromkeys(SUMMARY_COUNTER_FIELDS, 0) for pid in person_ids}
+    rows = (
+        Attendance.objects.filter(
+            person_id__in=person_ids,
+            service__start__gte=start,
+            service__start__lt=end,
+            state__in=AttendanceYearSummary.STATE_FIELDS.keys(),
+        )
+        .values("person_id", "state")
+        .annotate(count=Count("id"))
+    )
+    for row in rows:
+        counts[row["person_id"]][AttendanceYearSummary.STATE_FIELDS[row["state"]]] = row["count"]
+
+    empty_ids = [pid for pid, values in counts.items() if not any(values.values())]
+    if empty_ids:
+        AttendanceYearSummary.objects.filter(person_id__in=empty_ids, year=year).delete()
+
+    summaries = [
+        AttendanceYearSummary(person_id=pid, year=year, **values)
+        for pid, values in counts.items()
+        if any(values.values())
+    ]
+    if summaries:
+        AttendanceYearSummary.objects.bulk_create(
+            summaries,
+            update_conflicts=True,
+            unique_fields=["person", "year"],
+            update_fields=[*SUMMARY_COUNTER_FIELDS, "updated_at"],
+        )
+
+
+def mark_summary_dirty(person_ids, year):
+    """Refresh the given buckets now, or collect them if a deferred refresh is active."""
+    pending = getattr(_pending, "buckets", None)
+    if pending is None:
+        refresh_attendance_summaries(person_ids, year)
+        return
+    if year is not None:
+        pending[year].update(pid for pid in person_ids if pid is not None)
+
+
+@contextmanager
+def defer_summary_refresh():
+    """
+    Collect rollup refreshes inside the block and run them once at the end.
+
+    Nested blocks are merged into the outermost one.  If the block raises, the
+    collected refreshes are dropped together with the surrounding transaction.
+    """
+    if getattr(_pending, "buckets", None) is not None:
+        yield
+        return
+
+    _pending.buckets = buckets = defaultdict(set)
+    try:
+        yield
+    finally:
+        _pending.buckets = None
+
+    for year, person_ids in buckets.items():
+        refresh_attendance_summaries(person_ids, year)
+
+
+def get_year_of_service_id(service_id):
+    """Look up the rollup year of a service by primary key."""
+    if service_id is None:
+        return None
+    start = Service.objects.filter(pk=service_id).values_list("start", flat=True).first()
+    return get_service_year(start) if start else None
+
+
+def rebuild_attendance_summaries(year=None, batch_size=1000):
+    """
+    Rebuild the rollup from scratch (optionally for a single year).
+
+    Intended for backfills and as a repair tool; normal writes keep the table
+    current through the servicebook signal handlers.
+    """
+    attendances = Attendance.objects.filter(
+        person__isnull=False,
+        service__isnull=False,
+        state__in=AttendanceYearSummary.STATE_FIELDS.keys(),
+    )
+    summaries_qs = AttendanceYearSummary.objects.all()
+    if year is not None:
+        start, end = get_year_bounds(year)
+        attendances = attendances.filter(service__start__gte=start, service__start__lt=end)
+        summaries_qs = summaries_qs.filter(year=year)
+
+    buckets = defaultdict(lambda: dict.fromkeys(SUMMARY_COUNTER_FIELDS, 0))
+    rows = (
+        attendances.annotate(year=ExtractYear("service__start"))
+        .values("person_id", "year", "state")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    for row in rows.iterator(chunk_size=batch_size):
+        buckets[(row["person_id"], row["year"])][AttendanceYearSummary.STATE_FIELDS[row["state"]]] = row["count"]
+
+    summaries_qs.delete()
+    AttendanceYearSummary.objects.bulk_create(
+        [AttendanceYearSummary(person_id=pid, year=y, **values) for (pid, y), values in buckets.items()],
+        batch_size=batch_size,
+    )
+    return len(buckets)
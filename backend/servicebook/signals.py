@@ -1,8 +1,9 @@
 from django.core.cache import cache
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
 from .models import Attendance, Service
+from .services import get_service_year, get_year_of_service_id, mark_summary_dirty
 
 
 def invalidate_attendance_cache():
@@ -17,25 +18,66 @@ def invalidate_service_caches():
     # Add more cache keys here as needed
 
 
+def _attendance_year(instance):
+    """Resolve the rollup year of an attendance without re-fetching a loaded service."""
+    if Attendance.service.is_cached(instance) and instance.service is not None:
+        return get_service_year(instance.service.start)
+    return get_year_of_service_id(instance.service_id)
+
+
+@receiver(pre_save, sender=Service)
+def service_pre_save(sender, instance, **kwargs):
+    """Remember the stored start year so a moved service can be re-rolled up."""
+    instance._summary_previous_year = None
+    if instance.pk:
+        instance._summary_previous_year = get_year_of_service_id(instance.pk)
+
+
 @receiver(post_save, sender=Service)
 def service_saved(sender, instance, **kwargs):
     """Invalidate cache when a service is created or updated"""
     invalidate_service_caches()
 
+    previous_year = getattr(instance, "_summary_previous_year", None)
+    current_year = get_service_year(instance.start)
+    if previous_year is not None and previous_year != current_year:
+        person_ids = set(instance.attendance_set.values_list("person_id", flat=True))
+        mark_summary_dirty(person_ids, previous_year)
+        mark_summary_dirty(person_ids, current_year)
+
+
+@receiver(pre_delete, sender=Service)
+def service_pre_delete(sender, instance, **kwargs):
+    """Remember the attendees, the cascade may delete the service before its attendances."""
+    instance._summary_person_ids = set(instance.attendance_set.values_list("person_id", flat=True))
+
 
 @receiver(post_delete, sender=Service)
 def service_deleted(sender, instance, **kwargs):
     """Invalidate cache when a service is deleted"""
     invalidate_service_caches()
 
+    mark_summary_dirty(getattr(instance, "_summary_person_ids", ()), get_service_year(instance.start))
+
 
 @receiver(post_save, sender=Attendance)
 def attendance_saved(sender, instance, **kwargs):
-    """Invalidate cache when an attendance record is created or updated"""
+    """Invalidate cache and refresh the yearly rollup when an attendance is created or updated"""
     invalidate_service_caches()
 
+    mark_summary_dirty([instance.person_id], _attendance_year(instance))
+
+    loaded_person_id, loaded_service_id = getattr(instance, "_loaded_keys", (None, None))
+    if (loaded_person_id, loaded_service_id) != (None, None) and (
+        loaded_person_id != instance.person_id or loaded_service_id != instance.service_id
+    ):
+        mark_summary_dirty([loaded_person_id], get_year_of_service_id(loaded_service_id))
+    instance._loaded_keys = (instance.person_id, instance.service_id)
+
 
 @receiver(post_delete, sender=Attendance)
 def attendance_deleted(sender, instance, **kwargs):
-    """Invalidate cache when an attendance record is deleted"""
+    """Invalidate cache and refresh the yearly rollup when an attendance record is deleted"""
     invalidate_service_caches()
+
+    mark_summary_dirty([instance.person_id], _attendance_year(instance))
@@ -0,0 +1,127 @@
+"""Tests for the yearly attendance rollup and the endpoints reading from it."""
+
+from datetime import datetime, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from departments.models import Department, UserDepartmentRole
+from members.models import Member
+from servicebook.models import Attendance, AttendanceYearSummary, Service
+from servicebook.services import rebuild_attendance_summaries
+
+User = get_user_model()
+
+
+def make_service(year, month=3, day=1, **kwargs):
+    start = timezone.make_aware(datetime(year, month, day, 18, 0))
+    return Service.objects.create(start=start, end=start + timedelta(hours=2), topic=f"Dienst {year}", **kwargs)
+
+
+class AttendanceYearSummaryTestCase(TestCase):
+    """The rollup follows attendance and service writes."""
+
+    def setUp(self):
+        self.member = Member.objects.create(name="Max", lastname="Mustermann")
+        self.service_2023 = make_service(2023)
+        self.service_2024 = make_service(2024)
+
+    def summary(self, year):
+        return AttendanceYearSummary.objects.filter(person=self.member, year=year).first()
+
+    def test_create_update_delete_keep_rollup_in_sync(self):
+        attendance = Attendance.objects.create(person=self.member, service=self.service_2024, state="A")
+        self.assertEqual((self.summary(2024).present, self.summary(2024).absent), (1, 0))
+
+        attendance.state = "F"
+        attendance.save()
+        self.assertEqual((self.summary(2024).present, self.summary(2024).absent), (0, 1))
+
+        attendance.delete()
+        self.assertIsNone(self.summary(2024))
+
+    def test_moving_attendance_to_other_service_updates_both_years(self):
+        Attendance.objects.create(person=self.member, service=self.service_2023, state="A")
+        attendance = Attendance.objects.get(person=self.member, service=self.service_2023)
+        attendance.service = self.service_2024
+        attendance.save()
+
+        self.assertIsNone(self.summary(2023))
+        self.assertEqual(self.summary(2024).present, 1)
+
+    def test_rescheduling_service_moves_counts_to_new_year(self):
+        Attendance.objects.create(person=self.member, service=self.service_2023, state="E")
+        self.service_2023.start = timezone.make_aware(datetime(2025, 1, 10, 18, 0))
+        self.service_2023.end = self.service_2023.start + timedelta(hours=2)
+        self.service_2023.save()
+
+        self.assertIsNone(self.summary(2023))
+        self.assertEqual(self.summary(2025).excused, 1)
+
+    def test_deleting_service_removes_counts(self):
+        Attendance.objects.create(person=self.member, service=self.service_2024, state="A")
+        self.service_2024.delete()
+        self.assertIsNone(self.summary(2024))
+
+    def test_rebuild_matches_attendance_table(self):
+        Attendance.objects.create(person=self.member, service=self.service_2023, state="A")
+        Attendance.objects.create(person=self.member, service=self.service_2024, state="F")
+        AttendanceYearSummary.objects.all().delete()
+
+        self.assertEqual(rebuild_attendance_summaries(), 2)
+        self.assertEqual(self.summary(2023).present, 1)
+        self.assertEqual(self.summary(2024).absent, 1)
+
+
+class AttendanceLeaderboardAPITestCase(TestCase):
+    """Leaderboards and year reports are keyed by member and department-scoped."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.dept_a = Department.objects.create(name="Abteilung A")
+        self.dept_b = Department.objects.create(name="Abteilung B")
+
+        # Two different members sharing the same name must not be merged
+        self.max_a = Member.objects.create(name="Max", lastname="Mustermann")
+        self.max_a.departments.add(self.dept_a)
+        self.max_b = Member.objects.create(name="Max", lastname="Mustermann")
+        self.max_b.departments.add(self.dept_b)
+
+        services = [make_service(2024, month=m) for m in (1, 2, 3)]
+        for service in services:
+            Attendance.objects.create(person=self.max_a, service=service, state="A")
+        Attendance.objects.create(person=self.max_b, service=services[0], state="A")
+        Attendance.objects.create(person=self.max_b, service=make_service(2023), state="A")
+
+    def test_top_list_keeps_same_named_members_apart(self):
+        admin = User.objects.create_user(username="admin", password="x", is_staff=True, is_superuser=True)
+        self.client.force_authenticate(user=admin)
+
+        response = self.client.get("/api/v1/servicebook/services/statistics/")
+        self.assertEqual(response.status_code, 200)
+        most_present = response.json()["top_lists"]["most_present"]
+        self.assertEqual(
+            [(e["person_id"], e["num_services"]) for e in most_present], [(self.max_a.id, 3), (self.max_b.id, 2)]
+        )
+
+        response = self.client.get("/api/v1/servicebook/services/statistics/", {"year": 2023})
+        most_present = response.json()["top_lists"]["most_present"]
+        self.assertEqual([(e["person_id"], e["num_services"]) for e in most_present], [(self.max_b.id, 1)])
+
+    def test_dept_scoped_user_only_sees_own_members(self):
+        user = User.objects.create_user(username="dept-b", password="x")
+        user.user_permissions.add(Permission.objects.get(codename="view_service"))
+        UserDepartmentRole.objects.create(user=user, department=self.dept_b)
+        self.client.force_authenticate(user=user)
+
+        response = self.client.get("/api/v1/servicebook/services/statistics/")
+        self.assertEqual(response.status_code, 200)
+        ids = [e["person_id"] for e in response.json()["top_lists"]["most_present"]]
+        self.assertEqual(ids, [self.max_b.id])
+
+        response = self.client.get("/api/v1/servicebook/services/year_report/", {"year": 2024})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(row["id"], row["present"]) for row in response.json()["members"]], [(self.max_b.id, 1)])
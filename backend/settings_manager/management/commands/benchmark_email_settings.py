@@ -0,0 +1,83 @@
+"""
+Benchmark the per-request cost of resolving email settings.
+
+Compares the former EmailConfigMiddleware behaviour (reloading all seven
+``email__*`` preferences on every request) with the lazy
+PreferencesEmailBackend, which resolves a cached snapshot only when mail is
+actually sent.
+"""
+
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+from dynamic_preferences.registries import global_preferences_registry
+
+from jf_manager_backend.email_backend import PreferencesEmailBackend, get_email_settings
+
+EMAIL_PREFERENCE_KEYS = [
+    "email__email_host",
+    "email__email_port",
+    "email__email_use_tls",
+    "email__email_use_ssl",
+    "email__email_host_user",
+    "email__email_host_password",
+    "email__default_from_email",
+]
+
+
+def legacy_preference_reload():
+    """What EmailConfigMiddleware.process_request did on every request."""
+    global_preferences = global_preferences_registry.manager()
+    for key in EMAIL_PREFERENCE_KEYS:
+        global_preferences.get(key)
+
+
+class LegacyEmailConfigMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        legacy_preference_reload()
+        return self.get_response(request)
+
+
+class Command(BaseCommand):
+    help = "Measures per-request email configuration overhead before (middleware) and after (lazy backend)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=2000, help="Iterations per measurement")
+        parser.add_argument("--path", default="/health/", help="URL used for the request round-trip measurement")
+
+    def _per_call_us(self, func, iterations):
+        func()  # warm up caches
+        return timeit.timeit(func, number=iterations) / iterations * 1_000_000
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        path = options["path"]
+        client = Client()
+
+        from django.conf import settings
+
+        legacy_middleware = [*settings.MIDDLEWARE, f"{__name__}.LegacyEmailConfigMiddleware"]
+
+        results = [
+            ("preference reload (old, per request)", self._per_call_us(legacy_preference_reload, iterations)),
+            ("snapshot lookup (new, per sent mail)", self._per_call_us(get_email_settings, iterations)),
+            ("backend construction (new, per sent mail)", self._per_call_us(PreferencesEmailBackend, iterations)),
+        ]
+
+        with override_settings(MIDDLEWARE=legacy_middleware, ALLOWED_HOSTS=["*"]):
+            before = self._per_call_us(lambda: client.get(path), iterations)
+        with override_settings(ALLOWED_HOSTS=["*"]):
+            after = self._per_call_us(lambda: client.get(path), iterations)
+        results += [
+            (f"GET {path} with email middleware (before)", before),
+            (f"GET {path} without email middleware (after)", after),
+        ]
+
+        width = max(len(label) for label, _ in results)
+        for label, value in results:
+            self.stdout.write(f"{label:<{width}}  {value:10.1f} µs")
+        self.stdout.write(self.style.SUCCESS(f"Per-request overhead removed: {before - after:.1f} µs"))
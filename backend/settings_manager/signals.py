@@ -0,0 +1,30 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from dynamic_preferences.models import GlobalPreferenceModel
+
+from jf_manager_backend.email_backend import bump_email_settings_version
+from settings_manager.models import LDAPConfig, OIDCConfig
+from users.ldap_runtime import bump_ldap_config_version
+from users.oidc_metadata import bump_oidc_config_version
+
+
+@receiver(post_save, sender=GlobalPreferenceModel)
+@receiver(post_delete, sender=GlobalPreferenceModel)
+def global_preference_changed(sender, instance, **kwargs):
+    """Invalidate the cached email settings snapshot when an email preference changes"""
+    if instance.section == "email":
+        bump_email_settings_version()
+
+
+@receiver(post_save, sender=OIDCConfig)
+@receiver(post_delete, sender=OIDCConfig)
+def oidc_config_changed(sender, instance, **kwargs):
+    """Invalidate the cached OIDC configuration"""
+    bump_oidc_config_version()
+
+
+@receiver(post_save, sender=LDAPConfig)
+@receiver(post_delete, sender=LDAPConfig)
+def ldap_config_changed(sender, instance, **kwargs):
+    """Recompile the LDAP runtime settings in every process"""
+    bump_ldap_config_version()
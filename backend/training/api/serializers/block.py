@@ -3,7 +3,8 @@
 from rest_framework import serializers
 
 from members.models import Group
-from training.models import TrainingBlock, TrainingMedia
+from training.models import TrainingBlock
+from training.selectors import attach_block_media, get_block_attachments, get_block_media
 
 from .library_block import TrainingMediaSerializer
 
@@ -14,6 +15,12 @@ class GroupMiniSerializer(serializers.ModelSerializer):
         fields = ["id", "name"]
 
 
+class TrainingBlockListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        blocks = attach_block_media(data.all() if hasattr(data, "all") else data)
+        return super().to_representation(blocks)
+
+
 class TrainingBlockSerializer(serializers.ModelSerializer):
     groups = GroupMiniSerializer(many=True, read_only=True)
     library_block_title = serializers.CharField(source="library_block.title", read_only=True, default=None)
@@ -41,23 +48,15 @@ class TrainingBlockSerializer(serializers.ModelSerializer):
             "attachments",
         ]
         read_only_fields = ["created_at", "updated_at"]
+        list_serializer_class = TrainingBlockListSerializer
 
     def get_media(self, obj):
-        from django.contrib.contenttypes.models import ContentType
-
-        ct = ContentType.objects.get_for_model(obj)
-        qs = TrainingMedia.objects.filter(content_type=ct, object_id=obj.pk)
-        return TrainingMediaSerializer(qs, many=True, context=self.context).data
+        return TrainingMediaSerializer(get_block_media(obj), many=True, context=self.context).data
 
     def get_attachments(self, obj):
-        from django.contrib.contenttypes.models import ContentType
-
         from members.api.serializers import AttachmentSerializer
-        from members.models import Attachment
 
-        ct = ContentType.objects.get_for_model(obj)
-        qs = Attachment.objects.filter(content_type=ct, object_id=obj.pk)
-        return AttachmentSerializer(qs, many=True, context=self.context).data
+        return AttachmentSerializer(get_block_attachments(obj), many=True, context=self.context).data
 
 
 class TrainingBlockCreateSerializer(serializers.ModelSerializer):
@@ -1,8 +1,10 @@
 """Serializers for LibraryBlock, LibraryBlockCategory, LibraryBlockTag."""
 
+from django.core.files.storage import default_storage
 from rest_framework import serializers
 
 from training.models import LibraryBlock, LibraryBlockCategory, LibraryBlockTag, TrainingMedia
+from training.selectors import attach_block_media, get_block_media
 
 
 class LibraryBlockCategorySerializer(serializers.ModelSerializer):
@@ -19,16 +21,46 @@ class LibraryBlockTagSerializer(serializers.ModelSerializer):
 
 class TrainingMediaSerializer(serializers.ModelSerializer):
     url = serializers.SerializerMethodField()
+    original_url = serializers.SerializerMethodField()
+    renditions = serializers.SerializerMethodField()
 
     class Meta:
         model = TrainingMedia
-        fields = ["id", "url", "original_filename", "created_at"]
+        fields = [
+            "id",
+            "url",
+            "original_url",
+            "original_filename",
+            "width",
+            "height",
+            "status",
+            "renditions",
+            "created_at",
+        ]
 
     def get_url(self, obj):
+        """The 1200 px rendition once processed, the original until then."""
+        large = (obj.renditions or {}).get("large")
+        if large:
+            return default_storage.url(large["file"])
+        return self.get_original_url(obj)
+
+    def get_original_url(self, obj):
         if obj.file:
             return obj.file.url  # Relative path (e.g. /uploads/…); proxied by nginx/Vite
         return obj.url
 
+    def get_renditions(self, obj):
+        return {
+            name: {
+                "width": rendition["width"],
+                "height": rendition["height"],
+                "url": default_storage.url(rendition["file"]),
+                "webp_url": default_storage.url(rendition["webp"]) if rendition.get("webp") else None,
+            }
+            for name, rendition in (obj.renditions or {}).items()
+        }
+
 
 class LibraryBlockListSerializer(serializers.ModelSerializer):
     category_name = serializers.CharField(source="category.name", read_only=True)
@@ -57,6 +89,12 @@ class LibraryBlockListSerializer(serializers.ModelSerializer):
         ]
 
 
+class LibraryBlockMediaListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        blocks = attach_block_media(data.all() if hasattr(data, "all") else data, attachments=False)
+        return super().to_representation(blocks)
+
+
 class LibraryBlockDetailSerializer(serializers.ModelSerializer):
     category = LibraryBlockCategorySerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
@@ -99,13 +137,10 @@ class LibraryBlockDetailSerializer(serializers.ModelSerializer):
             "media",
         ]
         read_only_fields = ["export_uuid", "created_by", "created_at", "updated_at"]
+        list_serializer_class = LibraryBlockMediaListSerializer
 
     def get_media(self, obj):
-        from django.contrib.contenttypes.models import ContentType
-
-        ct = ContentType.objects.get_for_model(obj)
-        qs = TrainingMedia.objects.filter(content_type=ct, object_id=obj.pk)
-        return TrainingMediaSerializer(qs, many=True, context=self.context).data
+        return TrainingMediaSerializer(get_block_media(obj), many=True, context=self.context).data
 
     def update(self, instance, validated_data):
         tags = validated_data.pop("tags", None)
@@ -143,21 +178,19 @@ class LibraryBlockExportSerializer(serializers.ModelSerializer):
             "tags",
             "color",
             "nextcloud_folder_url",
+            "media",
         ]
+        list_serializer_class = LibraryBlockMediaListSerializer
 
     def get_tags(self, obj):
-        return list(obj.tags.values_list("name", flat=True))
+        return [tag.name for tag in obj.tags.all()]  # uses prefetch_related("tags")
 
     def get_media(self, obj):
-        from django.contrib.contenttypes.models import ContentType
-
-        ct = ContentType.objects.get_for_model(obj)
-        qs = TrainingMedia.objects.filter(content_type=ct, object_id=obj.pk)
         request = self.context.get("request")
         return [
             {
                 "original_filename": m.original_filename,
                 "url": request.build_absolute_uri(m.file.url) if (request and m.file) else m.url,
             }
-            for m in qs
+            for m in get_block_media(obj)
         ]
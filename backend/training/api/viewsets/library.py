@@ -1,13 +1,10 @@
 """ViewSets for LibraryBlock, LibraryBlockCategory, LibraryBlockTag."""
 
-import io
-import os
 import uuid as uuid_lib
 
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Count, Max
 from django_filters.rest_framework import DjangoFilterBackend
-from PIL import Image as PilImage
 from rest_framework import filters, status, viewsets
 from rest_framework.authentication import SessionAuthentication, TokenAuthentication
 from rest_framework.decorators import action
@@ -15,6 +12,7 @@ from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from jf_manager_backend.mixins import CollectionETagViewSetMixin
 from jf_manager_backend.permissions import OrgWideWritePermission
 from members.models import Attachment
 from training.api.filters import LibraryBlockFilter
@@ -27,56 +25,28 @@ from training.api.serializers import (
     LibraryBlockTagSerializer,
     TrainingMediaSerializer,
 )
+from training.media import create_training_media
 from training.models import LibraryBlock, LibraryBlockCategory, LibraryBlockTag, TrainingMedia
 
-# ── Image processing helper (shared with block.py) ────────────────────────────
 
-_MAX_IMAGE_WIDTH = 1200
-_JPEG_QUALITY = 85
-
-
-def _resize_and_optimise(original_file, filename: str):
-    """Downscale image to _MAX_IMAGE_WIDTH and re-encode, returning (BytesIO, new_name)."""
-    img = PilImage.open(original_file)
-    if img.mode in ("P", "LA"):
-        img = img.convert("RGBA")
-    elif img.mode == "L":
-        img = img.convert("RGB")
-
-    if img.width > _MAX_IMAGE_WIDTH:
-        ratio = _MAX_IMAGE_WIDTH / img.width
-        img = img.resize((int(img.width * ratio), int(img.height * ratio)), PilImage.LANCZOS)
-
-    buf = io.BytesIO()
-    if img.mode == "RGBA":
-        save_format, ext = "PNG", ".png"
-        buf_kwargs: dict = {"optimize": True}
-    else:
-        save_format, ext = "JPEG", ".jpg"
-        buf_kwargs = {"quality": _JPEG_QUALITY, "optimize": True}
-
-    img.save(buf, format=save_format, **buf_kwargs)
-    buf.seek(0)
-    base = os.path.splitext(filename)[0]
-    return buf, f"{base}{ext}"
-
-
-class LibraryBlockCategoryViewSet(viewsets.ModelViewSet):
+class LibraryBlockCategoryViewSet(CollectionETagViewSetMixin, viewsets.ModelViewSet):
     authentication_classes = [JWTAuthentication, TokenAuthentication, SessionAuthentication]
     permission_classes = [CanManageLibrary, OrgWideWritePermission]
     queryset = LibraryBlockCategory.objects.all()
     serializer_class = LibraryBlockCategorySerializer
     filter_backends = [filters.SearchFilter]
     search_fields = ["name"]
+    etag_models = [LibraryBlockCategory]
 
 
-class LibraryBlockTagViewSet(viewsets.ModelViewSet):
+class LibraryBlockTagViewSet(CollectionETagViewSetMixin, viewsets.ModelViewSet):
     authentication_classes = [JWTAuthentication, TokenAuthentication, SessionAuthentication]
     permission_classes = [CanManageLibrary, OrgWideWritePermission]
     queryset = LibraryBlockTag.objects.all()
     serializer_class = LibraryBlockTagSerializer
     filter_backends = [filters.SearchFilter]
     search_fields = ["name"]
+    etag_models = [LibraryBlockTag]
 
 
 class LibraryBlockViewSet(viewsets.ModelViewSet):
@@ -139,25 +109,10 @@ class LibraryBlockViewSet(viewsets.ModelViewSet):
         if image_file.size > 20 * 1024 * 1024:
             return Response({"detail": "Bild zu groß (max 20 MB)."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # ── Resize / optimise before saving ──────────────────────────────────
-        original_name = image_file.name
         try:
-            buf, new_name = _resize_and_optimise(image_file, original_name)
-            from django.core.files.uploadedfile import InMemoryUploadedFile
-
-            content_type = "image/jpeg" if new_name.endswith(".jpg") else "image/png"
-            image_file = InMemoryUploadedFile(buf, "file", new_name, content_type, buf.getbuffer().nbytes, None)
-        except Exception:
-            image_file.seek(0)  # fall back to original
-
-        ct = ContentType.objects.get_for_model(block)
-        media = TrainingMedia.objects.create(
-            content_type=ct,
-            object_id=block.pk,
-            file=image_file,
-            original_filename=original_name,
-            uploaded_by=request.user if request.user.is_authenticated else None,
-        )
+            media = create_training_media(block, image_file, request.user)
+        except (OSError, SyntaxError):
+            return Response({"detail": "Bild konnte nicht gelesen werden."}, status=status.HTTP_400_BAD_REQUEST)
         serializer = TrainingMediaSerializer(media, context={"request": request})
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -171,7 +126,7 @@ class LibraryBlockViewSet(viewsets.ModelViewSet):
         ids = request.data.get("ids", [])
         if not ids:
             return Response({"detail": "Keine IDs angegeben."}, status=status.HTTP_400_BAD_REQUEST)
-        blocks = LibraryBlock.objects.filter(pk__in=ids).prefetch_related("tags")
+        blocks = LibraryBlock.objects.filter(pk__in=ids).select_related("category").prefetch_related("tags")
         serializer = LibraryBlockExportSerializer(blocks, many=True, context={"request": request})
         return Response(
             {
@@ -296,8 +251,7 @@ class LibraryBlockViewSet(viewsets.ModelViewSet):
             media_id = request.query_params.get("media_id")
             try:
                 item = TrainingMedia.objects.get(pk=media_id, content_type=ct, object_id=block.pk)
-                if item.file and os.path.isfile(item.file.path):
-                    os.remove(item.file.path)
+                item.delete_files()
                 item.delete()
                 return Response(status=status.HTTP_204_NO_CONTENT)
             except TrainingMedia.DoesNotExist:
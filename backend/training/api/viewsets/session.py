@@ -20,6 +20,7 @@ from training.api.serializers import (
     TrainingSessionListSerializer,
 )
 from training.models import TrainingSession
+from training.recurrence import expand_series
 
 
 class TrainingSessionViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet):
@@ -143,7 +144,8 @@ class TrainingSessionViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet)
         """
         POST /api/v1/training/sessions/{id}/generate_series/
         Creates child sessions from the recurrence_rule on this session.
-        Idempotent: deletes existing children before regenerating.
+        Idempotent: children on dates that are still part of the series are
+        kept, others are removed, missing dates are created (see training.recurrence).
         """
         parent = self.get_object()
         if not parent.recurrence_rule:
@@ -169,55 +171,22 @@ class TrainingSessionViewSet(DepartmentScopeViewSetMixin, viewsets.ModelViewSet)
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        delta_map = {
-            "WEEKLY": datetime.timedelta(weeks=1),
-            "BIWEEKLY": datetime.timedelta(weeks=2),
-            "MONTHLY": None,  # handled separately
-        }
-        delta = delta_map.get(frequency)
-
-        # Delete previous children
-        parent.series_children.all().delete()
-
-        current_date = parent.date
-        created = []
-
-        while True:
-            # Advance to next occurrence
-            if frequency == "MONTHLY":
-                month = current_date.month + 1
-                year = current_date.year + (month - 1) // 12
-                month = ((month - 1) % 12) + 1
-                try:
-                    current_date = current_date.replace(year=year, month=month)
-                except ValueError:
-                    import calendar
-
-                    last_day = calendar.monthrange(year, month)[1]
-                    current_date = current_date.replace(year=year, month=month, day=last_day)
-            else:
-                current_date = current_date + delta
-
-            if current_date > end_date:
-                break
-
-            child = TrainingSession.objects.create(
-                title=parent.title,
-                description=parent.description,
-                date=current_date,
-                start_time=parent.start_time,
-                end_time=parent.end_time,
-                location=parent.location,
-                notes=parent.notes,
-                series_parent=parent,
-                department=parent.department,
-                created_by=request.user if request.user.is_authenticated else None,
+        try:
+            result = expand_series(
+                parent,
+                end_date,
+                frequency,
+                user=request.user if request.user.is_authenticated else None,
             )
-            child.groups.set(parent.groups.all())
-            self._sync_linked_servicebook_entry(child)
-            created.append(child.pk)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response(
-            {"created": len(created), "session_ids": created},
+            {
+                "created": len(result.created),
+                "kept": len(result.kept),
+                "removed": len(result.removed),
+                "session_ids": list(parent.series_children.order_by("date", "pk").values_list("pk", flat=True)),
+            },
             status=status.HTTP_201_CREATED,
         )
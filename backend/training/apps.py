@@ -7,4 +7,4 @@ class TrainingConfig(AppConfig):
     verbose_name = "Ausbildungsplanung"
 
     def ready(self):
-        pass
+        from . import signals  # noqa: F401
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from training.media import schedule_rendition_processing
+from training.models import TrainingMedia
+
+
+class Command(BaseCommand):
+    help = "Erzeugt die Bildvarianten für unverarbeitete (oder mit --all für alle) Trainings-Mediendateien"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Verarbeitet auch bereits fertige Dateien neu (z. B. nach Änderung der Bildgrößen)",
+        )
+
+    def handle(self, *args, **options):
+        media = TrainingMedia.objects.all()
+        if not options["all"]:
+            media = media.exclude(status=TrainingMedia.Status.READY)
+
+        count = 0
+        for media_id in media.values_list("pk", flat=True).iterator():
+            schedule_rendition_processing(media_id)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"{count} Mediendatei(en) zur Verarbeitung übergeben."))
@@ -0,0 +1,164 @@
+"""
+Image pipeline for training media uploads.
+
+The upload request only validates the image header and stores the original
+file unchanged; the renditions are produced afterwards by
+``training.tasks.process_training_media`` on the RQ worker (inline after the
+commit when no queue is configured or the job cannot be enqueued):
+
+- JPEG originals are decoded at reduced resolution (``Image.draft()``), so a
+  12 MP phone photo is never fully decoded,
+- each rendition is derived from the next larger one with ``thumbnail()``,
+- every width is stored in the fallback format (JPEG, PNG for transparent
+  images) and as WebP.
+
+When the renditions are ready, the URL of the original embedded in the
+block's rich-text content is replaced with the ``large`` rendition.
+"""
+
+import io
+import logging
+import os
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Value
+from django.db.models.functions import Replace
+from PIL import Image, ImageOps, features
+
+from .models import TrainingMedia
+
+logger = logging.getLogger(__name__)
+
+# Largest first: each rendition is downscaled from the previous one.
+RENDITION_WIDTHS = {"large": 1200, "medium": 600, "thumb": 320}
+EMBED_RENDITION = "large"
+RENDITION_DIR = "training/images/renditions"
+JPEG_QUALITY = 85
+WEBP_QUALITY = 80
+
+
+def read_image_size(file):
+    """Return ``(width, height)`` from the image header; raises on non-images."""
+    position = file.tell()
+    try:
+        with Image.open(file) as img:
+            return img.size
+    finally:
+        file.seek(position)
+
+
+def create_training_media(block, image_file, user=None):
+    """Store an uploaded image for ``block`` and schedule its renditions."""
+    width, height = read_image_size(image_file)
+    media = TrainingMedia.objects.create(
+        content_type=ContentType.objects.get_for_model(block),
+        object_id=block.pk,
+        file=image_file,
+        original_filename=image_file.name,
+        uploaded_by=user if user is not None and user.is_authenticated else None,
+        width=width,
+        height=height,
+    )
+    transaction.on_commit(lambda: schedule_rendition_processing(media.pk))
+    return media
+
+
+def schedule_rendition_processing(media_id):
+    """Enqueue the rendition job; without a reachable queue (no Redis) process inline."""
+    if getattr(settings, "RQ_QUEUES", {}).get("default"):
+        from .tasks import process_training_media  # local import avoids import-time RQ dependency
+
+        try:
+            process_training_media.delay(media_id)
+            return
+        except Exception:
+            # Runs after the upload committed: a queue outage must not fail the request or leave the media pending.
+            logger.exception("Enqueueing training media %s failed, processing inline", media_id)
+    process_media_id(media_id)
+
+
+def _open_for_renditions(file):
+    img = Image.open(file)
+    largest = max(RENDITION_WIDTHS.values())
+    # JPEG only: let the decoder scale down by 1/2, 1/4 or 1/8 while staying above the largest rendition.
+    img.draft("RGB", (largest, largest))
+    img = ImageOps.exif_transpose(img)
+    has_alpha = img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+    return img.convert("RGBA" if has_alpha else "RGB")
+
+
+def _encode(img, image_format, **options):
+    buffer = io.BytesIO()
+    img.save(buffer, format=image_format, **options)
+    return ContentFile(buffer.getvalue())
+
+
+def _save_rendition(stem, name, img):
+    fallback = (
+        ("PNG", ".png", {"optimize": True}) if img.mode == "RGBA" else ("JPEG", ".jpg", {"quality": JPEG_QUALITY})
+    )
+    image_format, extension, options = fallback
+    rendition = {
+        "width": img.width,
+        "height": img.height,
+        "file": default_storage.save(
+            f"{RENDITION_DIR}/{stem}_{name}{extension}", _encode(img, image_format, **options)
+        ),
+    }
+    if features.check("webp"):
+        rendition["webp"] = default_storage.save(
+            f"{RENDITION_DIR}/{stem}_{name}.webp", _encode(img, "WEBP", quality=WEBP_QUALITY, method=4)
+        )
+    return rendition
+
+
+def generate_renditions(media):
+    """Write all renditions of ``media`` to storage and return their metadata."""
+    stem = os.path.splitext(os.path.basename(media.file.name))[0]
+    with media.file.open("rb") as file:
+        img = _open_for_renditions(file)
+    renditions = {}
+    for name, width in RENDITION_WIDTHS.items():
+        img.thumbnail((width, width * 10), Image.LANCZOS)  # never upscales
+        renditions[name] = _save_rendition(stem, name, img)
+    return renditions
+
+
+def _swap_embedded_url(media, old_url, new_url):
+    """Point images embedded in the block content to the rendition instead of the original."""
+    model = media.content_type.model_class()
+    if model is None or old_url == new_url:
+        return
+    model.objects.filter(pk=media.object_id, content__contains=old_url).update(
+        content=Replace("content", Value(old_url), Value(new_url))
+    )
+
+
+def process_media(media):
+    """Generate the renditions of ``media`` and mark it ready (or failed)."""
+    try:
+        renditions = generate_renditions(media)
+    except Exception:
+        logger.exception("Rendering training media %s failed", media.pk)
+        media.status = TrainingMedia.Status.FAILED
+        media.save(update_fields=["status"])
+        return media
+
+    media.delete_rendition_files()
+    media.renditions = renditions
+    media.status = TrainingMedia.Status.READY
+    media.save(update_fields=["renditions", "status"])
+    _swap_embedded_url(media, media.file.url, default_storage.url(renditions[EMBED_RENDITION]["file"]))
+    return media
+
+
+def process_media_id(media_id):
+    """Process one TrainingMedia by id; returns its resulting status."""
+    media = TrainingMedia.objects.filter(pk=media_id).first()
+    if media is None:
+        return None
+    return process_media(media).status
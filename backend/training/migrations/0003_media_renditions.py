@@ -0,0 +1,48 @@
+# Generated by Django 5.0.14 on 2026-10-19 17:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("training", "0002_trainingsession_department"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="trainingmedia",
+            name="height",
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name="Höhe (Original)"),
+        ),
+        migrations.AddField(
+            model_name="trainingmedia",
+            name="renditions",
+            field=models.JSONField(blank=True, default=dict, verbose_name="Bildvarianten"),
+        ),
+        # Existing uploads were already downscaled in the request; they are served as they are.
+        migrations.AddField(
+            model_name="trainingmedia",
+            name="status",
+            field=models.CharField(
+                choices=[("pending", "In Bearbeitung"), ("ready", "Fertig"), ("failed", "Fehlgeschlagen")],
+                default="ready",
+                max_length=10,
+                verbose_name="Verarbeitungsstatus",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="trainingmedia",
+            name="status",
+            field=models.CharField(
+                choices=[("pending", "In Bearbeitung"), ("ready", "Fertig"), ("failed", "Fehlgeschlagen")],
+                default="pending",
+                max_length=10,
+                verbose_name="Verarbeitungsstatus",
+            ),
+        ),
+        migrations.AddField(
+            model_name="trainingmedia",
+            name="width",
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name="Breite (Original)"),
+        ),
+    ]
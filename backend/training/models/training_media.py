@@ -3,6 +3,7 @@ import uuid
 
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.core.files.storage import default_storage
 from django.db import models
 
 
@@ -16,8 +17,16 @@ class TrainingMedia(models.Model):
     Image/file uploaded directly into a block's rich-text editor.
     Linked to either a LibraryBlock or TrainingBlock via GenericFK.
     Allows cleanup when the parent block is deleted.
+
+    The original is stored unchanged; downscaled renditions are generated
+    off-request (see training.media) and listed in ``renditions``.
     """
 
+    class Status(models.TextChoices):
+        PENDING = "pending", "In Bearbeitung"
+        READY = "ready", "Fertig"
+        FAILED = "failed", "Fehlgeschlagen"
+
     class Meta:
         verbose_name = "Trainings-Mediendatei"
         verbose_name_plural = "Trainings-Mediendateien"
@@ -44,6 +53,13 @@ class TrainingMedia(models.Model):
         blank=True,
         verbose_name="Hochgeladen von",
     )
+    width = models.PositiveIntegerField(null=True, blank=True, verbose_name="Breite (Original)")
+    height = models.PositiveIntegerField(null=True, blank=True, verbose_name="Höhe (Original)")
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING, verbose_name="Verarbeitungsstatus"
+    )
+    # {"large": {"width": 1200, "height": 800, "file": "training/images/renditions/….jpg", "webp": "….webp"}, …}
+    renditions = models.JSONField(default=dict, blank=True, verbose_name="Bildvarianten")
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
@@ -54,3 +70,17 @@ class TrainingMedia(models.Model):
         if self.file:
             return self.file.url
         return ""
+
+    def rendition_names(self):
+        for rendition in (self.renditions or {}).values():
+            yield from (rendition[key] for key in ("file", "webp") if rendition.get(key))
+
+    def delete_rendition_files(self):
+        for name in self.rendition_names():
+            default_storage.delete(name)
+
+    def delete_files(self):
+        """Remove the original and all renditions from storage."""
+        self.delete_rendition_files()
+        if self.file:
+            self.file.delete(save=False)
@@ -0,0 +1,214 @@
+"""
+Recurrence expansion for training session series.
+
+``compute_occurrences()`` derives all dates of a series in memory;
+``expand_series()`` diffs them against the existing children of the parent:
+
+- children on a date that is still part of the series are kept with their
+  blocks and servicebook entry (and its attendance); title, times, location,
+  notes, department and groups are refreshed from the parent, and so are
+  start/end, topic and place of the linked service,
+- children on dates that dropped out are deleted; their linked service is
+  deleted too unless attendance was already recorded, then it is unlinked,
+- missing dates are created with ``bulk_create`` together with their group
+  rows and linked ``Service`` rows.
+
+A weekly series over a year therefore takes a handful of queries instead of
+several per occurrence.
+"""
+
+import calendar
+import datetime
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import TrainingSession
+
+MAX_OCCURRENCES = 500
+SESSION_FIELDS = ["title", "description", "start_time", "end_time", "location", "notes", "department"]
+SERVICE_FIELDS = ["start", "end", "topic", "place", "description", "department"]
+STEP_WEEKS = {
+    TrainingSession.RecurrenceFrequency.WEEKLY: 1,
+    TrainingSession.RecurrenceFrequency.BIWEEKLY: 2,
+}
+
+
+@dataclass
+class SeriesResult:
+    created: list[int] = field(default_factory=list)
+    kept: list[int] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+
+
+def _add_months(start, months):
+    """Same day-of-month ``months`` later, clamped to the month's last day."""
+    month_index = start.month - 1 + months
+    year, month = start.year + month_index // 12, month_index % 12 + 1
+    return start.replace(year=year, month=month, day=min(start.day, calendar.monthrange(year, month)[1]))
+
+
+def _occurrence(start, frequency, index):
+    if frequency == TrainingSession.RecurrenceFrequency.MONTHLY:
+        return _add_months(start, index)
+    return start + datetime.timedelta(weeks=STEP_WEEKS[frequency] * index)
+
+
+def compute_occurrences(start, frequency, end_date):
+    """
+    Dates after ``start`` up to and including ``end_date``.  Monthly series
+    stay on the day of ``start`` (31st → 30th/28th → 31st).  Raises
+    ValueError for unknown frequencies or series longer than MAX_OCCURRENCES.
+    """
+    if frequency not in TrainingSession.RecurrenceFrequency.values:
+        raise ValueError(f"Unbekannte Frequenz: {frequency}")
+
+    occurrences = []
+    index = 1
+    while (occurrence := _occurrence(start, frequency, index)) <= end_date:
+        occurrences.append(occurrence)
+        if len(occurrences) > MAX_OCCURRENCES:
+            raise ValueError(f"Eine Serie darf höchstens {MAX_OCCURRENCES} Termine haben.")
+        index += 1
+    return occurrences
+
+
+def _aware(date_value, time_value):
+    moment = datetime.datetime.combine(date_value, time_value)
+    if timezone.is_naive(moment):
+        return timezone.make_aware(moment, timezone.get_current_timezone())
+    return moment
+
+
+def _remove_children(children):
+    from servicebook.models import Service
+
+    services = Service.objects.filter(training_session__in=children)
+    services.filter(attendance__isnull=True).delete()
+    services.update(training_session=None)
+    TrainingSession.objects.filter(pk__in=[child.pk for child in children]).delete()
+
+
+def _session_values(parent):
+    """Fields every child copies from the series parent."""
+    return {
+        "title": parent.title,
+        "description": parent.description,
+        "start_time": parent.start_time,
+        "end_time": parent.end_time,
+        "location": parent.location,
+        "notes": parent.notes,
+        "department_id": parent.department_id,
+    }
+
+
+def _service_values(child):
+    """Fields of the linked service derived from its session."""
+    return {
+        "start": _aware(child.date, child.start_time),
+        "end": _aware(child.date, child.end_time),
+        "topic": child.title,
+        "place": child.location,
+        "description": child.description,
+        "department_id": child.department_id,
+    }
+
+
+def _apply(instance, values):
+    """Set ``values`` on ``instance``; returns whether anything changed."""
+    changed = False
+    for name, value in values.items():
+        if getattr(instance, name) != value:
+            setattr(instance, name, value)
+            changed = True
+    return changed
+
+
+def _set_groups(children, group_ids):
+    """Link the children to exactly ``group_ids``, keeping links that already match."""
+    Through = TrainingSession.groups.through
+    child_ids = [child.pk for child in children]
+    Through.objects.filter(trainingsession_id__in=child_ids).exclude(group_id__in=group_ids).delete()
+    existing = set(
+        Through.objects.filter(trainingsession_id__in=child_ids).values_list("trainingsession_id", "group_id")
+    )
+    Through.objects.bulk_create(
+        [
+            Through(trainingsession_id=child_id, group_id=group_id)
+            for child_id in child_ids
+            for group_id in group_ids
+            if (child_id, group_id) not in existing
+        ]
+    )
+
+
+def _update_children(parent, children, group_ids):
+    """Copy the parent's fields onto kept children and their services in bulk."""
+    from servicebook.models import Service
+    from servicebook.signals import invalidate_service_caches
+
+    now = timezone.now()  # bulk_update does not apply auto_now
+    values = _session_values(parent)
+    changed = [child for child in children if _apply(child, values)]
+    for child in changed:
+        child.updated_at = now
+    TrainingSession.objects.bulk_update(changed, [*SESSION_FIELDS, "updated_at"])
+
+    by_session = {child.pk: child for child in children}
+    services = [
+        service
+        for service in Service.objects.filter(training_session__in=children)
+        if _apply(service, _service_values(by_session[service.training_session_id]))
+    ]
+    Service.objects.bulk_update(services, SERVICE_FIELDS)
+    if services:
+        invalidate_service_caches()  # bulk_update bypasses the post_save signal
+
+    _set_groups(children, group_ids)
+
+
+def _create_children(parent, dates, user, group_ids):
+    from servicebook.models import Service
+    from servicebook.signals import invalidate_service_caches
+
+    values = _session_values(parent)
+    children = TrainingSession.objects.bulk_create(
+        [TrainingSession(**values, date=occurrence, series_parent=parent, created_by=user) for occurrence in dates]
+    )
+
+    Through = TrainingSession.groups.through
+    Through.objects.bulk_create(
+        [Through(trainingsession_id=child.pk, group_id=group_id) for child in children for group_id in group_ids]
+    )
+
+    Service.objects.bulk_create([Service(**_service_values(child), training_session=child) for child in children])
+    invalidate_service_caches()  # bulk_create bypasses the post_save signal
+    return children
+
+
+def expand_series(parent, end_date, frequency, user=None):
+    """Bring the children of ``parent`` in line with its recurrence; returns a SeriesResult."""
+    occurrences = set(compute_occurrences(parent.date, frequency, end_date))
+    result = SeriesResult()
+
+    with transaction.atomic():
+        keep, remove = {}, []
+        for child in parent.series_children.order_by("date", "pk"):
+            if child.date in occurrences and child.date not in keep:
+                keep[child.date] = child
+            else:
+                remove.append(child)
+        if remove:
+            _remove_children(remove)
+
+        group_ids = list(parent.groups.values_list("pk", flat=True))
+        if keep:
+            _update_children(parent, list(keep.values()), group_ids)
+        missing = sorted(occurrences - keep.keys())
+        created = _create_children(parent, missing, user, group_ids) if missing else []
+
+    result.kept = [child.pk for child in keep.values()]
+    result.removed = [child.pk for child in remove]
+    result.created = [child.pk for child in created]
+    return result
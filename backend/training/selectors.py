@@ -0,0 +1,52 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+
+from .models import TrainingMedia
+
+
+def attach_generic_related(objects, queryset, to_attr):
+    """
+    Load the rows of a generic relation (``content_type``/``object_id``) for
+    all ``objects`` of one model with a single query and store them as a list
+    in ``obj.<to_attr>``.  Returns the objects as a list.
+    """
+    objects = list(objects)
+    if not objects:
+        return objects
+    content_type = ContentType.objects.get_for_model(objects[0])  # cached by ContentType
+    related = defaultdict(list)
+    for row in queryset.filter(content_type=content_type, object_id__in=[obj.pk for obj in objects]):
+        related[row.object_id].append(row)
+    for obj in objects:
+        setattr(obj, to_attr, related.get(obj.pk, []))
+    return objects
+
+
+def attach_block_media(blocks, attachments=True):
+    """
+    Attach ``prefetched_media`` (and ``prefetched_attachments``) to a list of
+    TrainingBlock/LibraryBlock objects: one query per relation, independent of
+    the number of blocks.
+    """
+    from members.models import Attachment
+
+    blocks = attach_generic_related(blocks, TrainingMedia.objects.all(), "prefetched_media")
+    if attachments:
+        attach_generic_related(blocks, Attachment.objects.all(), "prefetched_attachments")
+    return blocks
+
+
+def get_block_media(block):
+    """Media of one block, from ``attach_block_media()`` if it ran."""
+    if not hasattr(block, "prefetched_media"):
+        attach_block_media([block], attachments=False)
+    return block.prefetched_media
+
+
+def get_block_attachments(block):
+    if not hasattr(block, "prefetched_attachments"):
+        from members.models import Attachment
+
+        attach_generic_related([block], Attachment.objects.all(), "prefetched_attachments")
+    return block.prefetched_attachments
@@ -0,0 +1,5 @@
+from jf_manager_backend.etags import track_collection_versions
+
+from .models import LibraryBlockCategory, LibraryBlockTag
+
+track_collection_versions(LibraryBlockCategory, LibraryBlockTag)
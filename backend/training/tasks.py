@@ -0,0 +1,13 @@
+import django_rq
+
+
+@django_rq.job("default")
+def process_training_media(media_id: int) -> str | None:
+    """
+    RQ task: generate the responsive renditions of one TrainingMedia.
+
+    Returns the resulting status (None if the media was deleted meanwhile).
+    """
+    from training.media import process_media_id  # local import keeps Pillow out of the enqueueing process
+
+    return process_media_id(media_id)
@@ -4,6 +4,7 @@ from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 from rest_framework import serializers
 
+from departments.access import get_department_access
 from departments.api.serializers.department import UserDepartmentRoleMiniSerializer
 from departments.models import Department
 
@@ -102,7 +103,7 @@ class UserInfoSerializer(serializers.ModelSerializer):
         if is_org_wide:
             return value
 
-        allowed_ids = set(actor.department_roles.values_list("department_id", flat=True))
+        allowed_ids = set(get_department_access(actor).department_ids)
         if value.id not in allowed_ids:
             raise serializers.ValidationError("Sie können nur eine Abteilung auswählen, für die Sie berechtigt sind.")
         return value
@@ -10,6 +10,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+from jf_manager_backend.email_backend import get_default_from_email
 from orders.notifications.template_service import TemplateRenderer
 
 from .api_serializers import (
@@ -40,9 +41,9 @@ def _send_external_auth_password_info(user):
 
     if auth_source == "oidc":
         try:
-            from settings_manager.models import OIDCConfig
+            from users.oidc_metadata import get_oidc_config
 
-            config = OIDCConfig.get_or_create_default()
+            config = get_oidc_config()
             if config:
                 provider_name = config.provider_name or ""
                 issuer_url = config.issuer_url or ""
@@ -62,7 +63,7 @@ def _send_external_auth_password_info(user):
     send_mail(
         subject,
         plain_message,
-        settings.DEFAULT_FROM_EMAIL,
+        get_default_from_email(),
         [user.email],
         html_message=html_message,
         fail_silently=True,
@@ -155,7 +156,7 @@ class UserViewSet(viewsets.ModelViewSet):
                 send_mail(
                     subject,
                     plain_message,
-                    settings.DEFAULT_FROM_EMAIL,
+                    get_default_from_email(),
                     [user.email],
                     html_message=html_message,
                     fail_silently=False,
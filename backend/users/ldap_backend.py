@@ -1,13 +1,12 @@
-from django.conf import settings
-from django_auth_ldap.backend import LDAPBackend
-from django_auth_ldap.config import ActiveDirectoryGroupType, GroupOfNamesType, LDAPSearch
+import contextlib
+import logging
 
-from settings_manager.models import LDAPConfig
-from users.ldap_tls import apply_ldap_tls_options
+import ldap
+from django_auth_ldap.backend import LDAPBackend
 
+from users.ldap_runtime import get_ldap_runtime
 
-def _set_setting(name, value):
-    setattr(settings, name, value)
+logger = logging.getLogger("users.ldap_backend")
 
 
 class ConfigurableLDAPBackend(LDAPBackend):
@@ -15,75 +14,61 @@ class ConfigurableLDAPBackend(LDAPBackend):
     LDAP backend that reads runtime configuration from LDAPConfig.
     Returns None when LDAP is disabled/misconfigured so Django can fall back to
     ModelBackend for local accounts.
-    """
-
-    def _active_config(self):
-        return LDAPConfig.objects.order_by("id").first()
-
-    def _configure_runtime(self):
-        config = self._active_config()
-        if not config or not config.enabled:
-            return False
 
-        if not config.server_uri or not config.user_search_base_dn or not config.user_search_filter:
-            return False
-
-        try:
-            import ldap
-        except Exception:
-            return False
-
-        try:
-            apply_ldap_tls_options(config)
-        except Exception:
-            return False
-
-        _set_setting("AUTH_LDAP_SERVER_URI", config.server_uri)
-        _set_setting("AUTH_LDAP_START_TLS", config.start_tls)
-        _set_setting("AUTH_LDAP_BIND_DN", config.bind_dn)
-        _set_setting("AUTH_LDAP_BIND_PASSWORD", config.bind_password or "")
-        _set_setting("AUTH_LDAP_ALWAYS_UPDATE_USER", True)
-
-        _set_setting(
-            "AUTH_LDAP_USER_SEARCH",
-            LDAPSearch(config.user_search_base_dn, ldap.SCOPE_SUBTREE, config.user_search_filter),
-        )
-
-        if config.group_search_base_dn:
-            _set_setting(
-                "AUTH_LDAP_GROUP_SEARCH",
-                LDAPSearch(config.group_search_base_dn, ldap.SCOPE_SUBTREE, config.group_search_filter),
-            )
-            if config.group_type == LDAPConfig.GroupType.ACTIVE_DIRECTORY:
-                _set_setting("AUTH_LDAP_GROUP_TYPE", ActiveDirectoryGroupType())
-            else:
-                _set_setting("AUTH_LDAP_GROUP_TYPE", GroupOfNamesType())
-
-            _set_setting("AUTH_LDAP_MIRROR_GROUPS", config.mirror_groups)
-            _set_setting("AUTH_LDAP_REQUIRE_GROUP", config.require_group or None)
-        else:
-            _set_setting("AUTH_LDAP_GROUP_SEARCH", None)
-            _set_setting("AUTH_LDAP_GROUP_TYPE", None)
-            _set_setting("AUTH_LDAP_MIRROR_GROUPS", False)
-            _set_setting("AUTH_LDAP_REQUIRE_GROUP", None)
+    The configuration is compiled once per process (see users.ldap_runtime) and
+    searches run on pooled connections bound as the service account.
+    """
 
-        return True
+    _runtime = None
 
     def authenticate(self, request, username=None, password=None, **kwargs):
-        import contextlib
-
-        if not self._configure_runtime():
+        runtime = get_ldap_runtime()
+        if runtime is None:
             return None
+
+        self._runtime = runtime
+        self.settings = runtime.settings
         user = super().authenticate(request, username=username, password=password, **kwargs)
         if user is not None:
-            with contextlib.suppress(Exception):
-                self._sync_department_roles(user)
             with contextlib.suppress(Exception):
                 if user.auth_source != "ldap":
                     user.auth_source = "ldap"
                     user.save(update_fields=["auth_source"])
         return user
 
+    def authenticate_ldap_user(self, ldap_user, password):
+        pool = self._runtime.pool
+        try:
+            connection = pool.acquire()
+        except Exception as exc:
+            logger.warning("LDAP: no connection available for '%s': %s", ldap_user._username, exc)
+            return None
+
+        # Hand the pooled, service-bound connection to django-auth-ldap. The
+        # user bind in _LDAPUser.authenticate() marks it as unbound, in which
+        # case it is re-bound as the service account before going back.
+        ldap_user._connection = connection
+        ldap_user._connection_bound = True
+        user = None
+        discard = True
+        try:
+            user = ldap_user.authenticate(password)
+            if user is not None:
+                with contextlib.suppress(Exception):
+                    self._sync_department_roles(user)
+                if not ldap_user._connection_bound:
+                    connection.simple_bind_s(self.settings.BIND_DN, self.settings.BIND_PASSWORD)
+                # Failed logins may stem from a dead connection, so only
+                # connections of successful logins are reused.
+                discard = False
+        except ldap.LDAPError as exc:
+            logger.warning("LDAP: re-binding pooled connection failed: %s", exc)
+        finally:
+            ldap_user._connection = None
+            ldap_user._connection_bound = False
+            pool.release(connection, discard=discard)
+        return user
+
     def _sync_department_roles(self, user):
         """
         After a successful LDAP login, sync UserDepartmentRole records based on
@@ -94,19 +79,16 @@ class ConfigurableLDAPBackend(LDAPBackend):
         - Merge the mapped auth groups into the role
 
         If ``revoke_on_mismatch=True`` is set on a mapping and the user is NOT
-        in the LDAP group, the corresponding UserDepartmentRole is removed.
+        in the LDAP group, the corresponding UserDepartmentRole is removed
+        unless another mapping grants the same department.
         """
         from departments.models import UserDepartmentRole
         from settings_manager.models import LDAPDepartmentRoleMapping
 
-        config = self._active_config()
-        if not config:
-            return
-
         mappings = list(
-            LDAPDepartmentRoleMapping.objects.filter(ldap_config=config)
-            .select_related("department")
-            .prefetch_related("auth_groups")
+            LDAPDepartmentRoleMapping.objects.filter(ldap_config_id=self._runtime.config_id).prefetch_related(
+                "auth_groups"
+            )
         )
         if not mappings:
             return
@@ -121,19 +103,33 @@ class ConfigurableLDAPBackend(LDAPBackend):
         except Exception:
             return
 
+        granted: dict[int, set[int]] = {}
+        revoked: set[int] = set()
         for mapping in mappings:
-            is_member = mapping.ldap_group_dn in user_group_dns
-
-            if is_member:
-                role, _ = UserDepartmentRole.objects.get_or_create(
-                    user=user,
-                    department=mapping.department,
-                )
-                existing_ids = set(role.groups.values_list("id", flat=True))
-                mapped_ids = set(mapping.auth_groups.values_list("id", flat=True))
-                role.groups.set(list(existing_ids | mapped_ids))
+            if mapping.ldap_group_dn in user_group_dns:
+                granted.setdefault(mapping.department_id, set()).update(g.pk for g in mapping.auth_groups.all())
             elif mapping.revoke_on_mismatch:
-                UserDepartmentRole.objects.filter(
-                    user=user,
-                    department=mapping.department,
-                ).delete()
+                revoked.add(mapping.department_id)
+        revoked -= granted.keys()
+
+        if revoked:
+            UserDepartmentRole.objects.filter(user=user, department_id__in=revoked).delete()
+
+        if not granted:
+            return
+
+        roles = {
+            role.department_id: role
+            for role in UserDepartmentRole.objects.filter(user=user, department_id__in=granted).prefetch_related(
+                "groups"
+            )
+        }
+        for department_id, group_ids in granted.items():
+            role = roles.get(department_id)
+            if role is None:
+                role, _ = UserDepartmentRole.objects.get_or_create(user=user, department_id=department_id)
+                missing = group_ids
+            else:
+                missing = group_ids - {group.pk for group in role.groups.all()}
+            if missing:
+                role.groups.add(*missing)
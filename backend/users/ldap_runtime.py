@@ -0,0 +1,242 @@
+"""
+Compiled LDAP runtime configuration and service-account connection pool.
+
+ConfigurableLDAPBackend used to reload LDAPConfig, re-apply the TLS options and
+rewrite a dozen AUTH_LDAP_* values in django.conf.settings on every login, and
+django-auth-ldap then opened a fresh connection per attempt.
+
+Here LDAPConfig is compiled once per process into an LDAPRuntime holding a
+django-auth-ldap LDAPSettings object and a bounded pool of connections bound as
+the service account (AUTH_LDAP_BIND_DN).  The runtime is rebuilt when the
+version key in the shared cache changes; settings_manager.signals bumps it on
+every LDAPConfig save/delete, so all worker processes pick up changes.
+"""
+
+import contextlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from jf_manager_backend.cache_versions import bump_cache_version, get_cache_version
+
+logger = logging.getLogger("users.ldap_runtime")
+
+LDAP_CONFIG_VERSION_KEY = "ldap_config:version"
+LDAP_POOL_ACQUIRE_TIMEOUT = 10  # seconds
+
+
+def get_ldap_config_version() -> int:
+    return get_cache_version(LDAP_CONFIG_VERSION_KEY)
+
+
+def bump_ldap_config_version():
+    """Force every process to recompile its LDAP runtime."""
+    bump_cache_version(LDAP_CONFIG_VERSION_KEY)
+
+
+class LDAPPoolTimeout(Exception):
+    pass
+
+
+class LDAPConnectionPool:
+    """
+    Bounded, thread-safe pool of LDAP connections.
+
+    ``factory`` must return a ready-to-use (bound) connection.  Connections
+    idle for longer than ``max_idle`` seconds are closed instead of reused, as
+    most directory servers drop idle clients silently.
+    """
+
+    def __init__(self, factory, max_size=5, max_idle=60, acquire_timeout=LDAP_POOL_ACQUIRE_TIMEOUT):
+        self._factory = factory
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.acquire_timeout = acquire_timeout
+        self._idle = []  # [(connection, released_at)], most recently used last
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def size(self):
+        return self._size
+
+    def acquire(self):
+        deadline = time.monotonic() + self.acquire_timeout
+        stale = []
+        try:
+            with self._condition:
+                while True:
+                    while self._idle:
+                        connection, released_at = self._idle.pop()
+                        if time.monotonic() - released_at <= self.max_idle:
+                            return connection
+                        self._size -= 1
+                        stale.append(connection)
+
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise LDAPPoolTimeout(f"No LDAP connection available within {self.acquire_timeout}s")
+                    self._condition.wait(remaining)
+        finally:
+            for connection in stale:
+                self._close(connection)
+
+        try:
+            return self._factory()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, connection, discard=False):
+        with self._condition:
+            discard = discard or self._closed
+            if discard:
+                self._size -= 1
+            else:
+                self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+        if discard:
+            self._close(connection)
+
+    @contextlib.contextmanager
+    def connection(self):
+        connection = self.acquire()
+        try:
+            yield connection
+        except BaseException:
+            self.release(connection, discard=True)
+            raise
+        self.release(connection)
+
+    def close(self):
+        """Close idle connections; connections in use are closed on release."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+        for connection, _ in idle:
+            self._close(connection)
+
+    @staticmethod
+    def _close(connection):
+        with contextlib.suppress(Exception):
+            connection.unbind_s()
+
+
+@dataclass(frozen=True)
+class LDAPRuntime:
+    config_id: int
+    settings: object  # django_auth_ldap.config.LDAPSettings
+    pool: LDAPConnectionPool
+
+
+# (version, LDAPRuntime | None) of the runtime compiled in this process
+_runtime = None
+_runtime_lock = threading.Lock()
+
+
+def get_ldap_runtime():
+    """
+    Return the compiled LDAPRuntime, or None when LDAP is disabled,
+    misconfigured or python-ldap is not installed.
+    """
+    global _runtime
+
+    version = get_ldap_config_version()
+    current = _runtime
+    if current is not None and current[0] == version:
+        return current[1]
+
+    with _runtime_lock:
+        current = _runtime
+        if current is not None and current[0] == version:
+            return current[1]
+
+        try:
+            runtime = _compile_runtime()
+        except Exception as exc:
+            # Not cached: e.g. a CA file that is mounted later should be picked
+            # up on the next login attempt without saving LDAPConfig again.
+            logger.warning("LDAP runtime configuration failed: %s", exc)
+            return None
+
+        _runtime = (version, runtime)
+        if current is not None and current[1] is not None:
+            current[1].pool.close()
+        return runtime
+
+
+def _compile_runtime():
+    from settings_manager.models import LDAPConfig
+
+    config = LDAPConfig.objects.order_by("id").first()
+    if not config or not config.enabled:
+        return None
+
+    if not config.server_uri or not config.user_search_base_dn or not config.user_search_filter:
+        return None
+
+    try:
+        import ldap
+        from django_auth_ldap.config import ActiveDirectoryGroupType, GroupOfNamesType, LDAPSearch, LDAPSettings
+    except ImportError:
+        return None
+
+    from users.ldap_tls import apply_ldap_tls_options
+
+    apply_ldap_tls_options(config)
+
+    values = {
+        "SERVER_URI": config.server_uri,
+        "START_TLS": config.start_tls,
+        "BIND_DN": config.bind_dn,
+        "BIND_PASSWORD": config.bind_password or "",
+        "ALWAYS_UPDATE_USER": True,
+        "USER_SEARCH": LDAPSearch(config.user_search_base_dn, ldap.SCOPE_SUBTREE, config.user_search_filter),
+    }
+
+    if config.group_search_base_dn:
+        values["GROUP_SEARCH"] = LDAPSearch(config.group_search_base_dn, ldap.SCOPE_SUBTREE, config.group_search_filter)
+        if config.group_type == LDAPConfig.GroupType.ACTIVE_DIRECTORY:
+            values["GROUP_TYPE"] = ActiveDirectoryGroupType()
+        else:
+            values["GROUP_TYPE"] = GroupOfNamesType()
+        values["MIRROR_GROUPS"] = config.mirror_groups
+        values["REQUIRE_GROUP"] = config.require_group or None
+    else:
+        values["GROUP_SEARCH"] = None
+        values["GROUP_TYPE"] = None
+        values["MIRROR_GROUPS"] = False
+        values["REQUIRE_GROUP"] = None
+
+    # LDAPConfig wins over any static AUTH_LDAP_* values in django.conf.settings.
+    ldap_settings = LDAPSettings()
+    for name, value in values.items():
+        setattr(ldap_settings, name, value)
+
+    def connect():
+        connection = ldap.initialize(ldap_settings.SERVER_URI, bytes_mode=False)
+        for option, value in ldap_settings.CONNECTION_OPTIONS.items():
+            connection.set_option(option, value)
+        if ldap_settings.START_TLS:
+            connection.start_tls_s()
+        connection.simple_bind_s(ldap_settings.BIND_DN, ldap_settings.BIND_PASSWORD)
+        return connection
+
+    pool = LDAPConnectionPool(
+        connect,
+        max_size=getattr(settings, "LDAP_POOL_SIZE", 5),
+        max_idle=getattr(settings, "LDAP_POOL_MAX_IDLE", 60),
+    )
+    logger.debug("LDAP runtime compiled for %s (pool size %d)", config.server_uri, pool.max_size)
+    return LDAPRuntime(config_id=config.pk, settings=ldap_settings, pool=pool)
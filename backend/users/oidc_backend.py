@@ -29,10 +29,17 @@ class JFManagerOIDCBackend(OIDCAuthenticationBackend):
     # Config helpers
     # ---------------------------------------------------------------------------
 
-    def _get_config(self):
-        from settings_manager.models import OIDCConfig
-
-        return OIDCConfig.get_or_create_default()
+    def _get_config(self, request=None):
+        # mozilla-django-oidc calls get_settings() several times from __init__,
+        # and Django instantiates every backend on each has_perm() call, so the
+        # config is resolved once per instance from the cached snapshot.
+        config = getattr(self, "_oidc_config", None)
+        if config is None or request is not None:
+            from users.oidc_metadata import get_oidc_config
+
+            config = get_oidc_config(request)
+            self._oidc_config = config
+        return config
 
     def get_settings(self, attr, *args):
         """
@@ -40,11 +47,13 @@ class JFManagerOIDCBackend(OIDCAuthenticationBackend):
         django.conf.settings.  Falls back to super() for non-provider settings
         (e.g. OIDC_VERIFY_SSL, OIDC_TIMEOUT, etc.).
         """
+        # OIDC_RP_CLIENT_SECRET stays at its empty default: it is only used by
+        # mozilla-django-oidc's own code exchange, which OIDCCallbackView
+        # replaces, and the cached snapshot deliberately does not contain it.
         config = self._get_config()
 
         db_map = {
             "OIDC_RP_CLIENT_ID": config.client_id,
-            "OIDC_RP_CLIENT_SECRET": config.client_secret,
             "OIDC_RP_SCOPES": config.scope,
         }
 
@@ -63,7 +72,7 @@ class JFManagerOIDCBackend(OIDCAuthenticationBackend):
     # ---------------------------------------------------------------------------
 
     def authenticate(self, request, **kwargs):
-        config = self._get_config()
+        config = self._get_config(request)
         if not config or not config.enabled:
             logger.debug("OIDC is disabled — skipping JFManagerOIDCBackend")
             return None
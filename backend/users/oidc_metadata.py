@@ -0,0 +1,251 @@
+"""
+Cached OIDC provider metadata.
+
+Login start and callback used to fetch the discovery document and the JWKS
+from the IdP on every request, and JFManagerOIDCBackend read OIDCConfig from
+the database for every single setting lookup.  This module keeps all three in
+the Django cache:
+
+- The non-secret OIDCConfig fields are cached as an OIDCSettings snapshot
+  under a version key that settings_manager.signals bumps on every
+  save/delete, and memoized on the request.  The client secret is never put
+  into the cache; the token exchange reads it with get_oidc_client_secret().
+- The discovery document is cached per issuer URL.
+- The JWKS is cached per jwks_uri and re-fetched when a token is signed with an
+  unknown ``kid`` (key rotation at the IdP), at most once per
+  OIDC_JWKS_MIN_REFRESH_INTERVAL so forged ``kid`` values cannot hammer the IdP.
+"""
+
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, fields
+from urllib.parse import urlparse, urlunparse
+
+import requests
+from django.core.cache import cache
+
+from jf_manager_backend.cache_versions import bump_cache_version, get_cache_version
+
+logger = logging.getLogger("users.oidc_metadata")
+
+OIDC_CONFIG_VERSION_KEY = "oidc_config:version"
+OIDC_CONFIG_TIMEOUT = 300
+OIDC_DISCOVERY_TIMEOUT = 3600
+OIDC_JWKS_TIMEOUT = 3600
+OIDC_JWKS_MIN_REFRESH_INTERVAL = 60
+OIDC_HTTP_TIMEOUT = 10
+
+
+# ---------------------------------------------------------------------------
+# OIDCConfig
+# ---------------------------------------------------------------------------
+
+
+def get_oidc_config_version() -> int:
+    return get_cache_version(OIDC_CONFIG_VERSION_KEY)
+
+
+def bump_oidc_config_version():
+    """Invalidate the cached OIDCConfig."""
+    bump_cache_version(OIDC_CONFIG_VERSION_KEY)
+
+
+@dataclass(frozen=True)
+class OIDCSettings:
+    """Snapshot of OIDCConfig without ``client_secret``, safe to keep in a shared cache."""
+
+    enabled: bool
+    provider_name: str
+    issuer_url: str
+    client_id: str
+    scope: str
+    groups_claim: str
+    staff_group: str
+    admin_group: str
+    require_group_mapping: bool
+    hide_local_login: bool
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**{f.name: getattr(config, f.name) for f in fields(cls)})
+
+
+def get_oidc_config(request=None) -> OIDCSettings:
+    """
+    Return the OIDC settings from the cache.
+
+    When a request is given, the settings are memoized on it so every caller
+    within the same request shares one lookup.
+    """
+    if request is not None:
+        config = getattr(request, "_oidc_config", None)
+        if config is not None:
+            return config
+
+    key = f"oidc_config:v{get_oidc_config_version()}"
+    config = cache.get(key)
+    if config is None:
+        from settings_manager.models import OIDCConfig
+
+        config = OIDCSettings.from_config(OIDCConfig.get_or_create_default())
+        cache.set(key, config, OIDC_CONFIG_TIMEOUT)
+
+    if request is not None:
+        request._oidc_config = config
+    return config
+
+
+def get_oidc_client_secret() -> str:
+    """Decrypted client secret, read from the database whenever the token exchange needs it."""
+    from settings_manager.models import OIDCConfig
+
+    return OIDCConfig.get_or_create_default().client_secret
+
+
+# ---------------------------------------------------------------------------
+# URL validation / fetching
+# ---------------------------------------------------------------------------
+
+
+def validate_oidc_url(url: str, label: str = "URL", *, allowed_host: str | None = None) -> str:
+    """
+    Validate that a URL used for outbound OIDC requests is safe:
+      - Must be https:// (no http, file, ftp, …)
+      - Must have a non-empty netloc (no bare paths or localhost tricks)
+      - If allowed_host is provided, the URL's hostname must match it exactly
+        (prevents the discovery document from redirecting JWKS to a different server).
+
+    Returns the validated URL unchanged.
+    Raises ValueError with a descriptive message on failure.
+    """
+    parsed = urlparse(url)
+    if parsed.scheme != "https":
+        raise ValueError(f"OIDC {label} muss ein HTTPS-URL sein (erhalten: {parsed.scheme!r}).")
+    if not parsed.netloc:
+        raise ValueError(f"OIDC {label} hat keinen gültigen Host.")
+    if allowed_host is not None and parsed.hostname != allowed_host:
+        raise ValueError(
+            f"OIDC {label} zeigt auf einen anderen Host ({parsed.hostname!r}) als der"
+            f" konfigurierte Issuer ({allowed_host!r}). Anfrage abgelehnt."
+        )
+    return url
+
+
+def fetch_discovery_document(issuer_url: str) -> dict:
+    """
+    Fetch the OIDC Discovery Document from {issuer_url}/.well-known/openid-configuration.
+    Returns the parsed JSON dict.
+    Raises requests.RequestException on network errors or non-200 responses.
+    """
+    # Validate user-provided issuer_url first.
+    validate_oidc_url(issuer_url, "Issuer-URL")
+    parsed = urlparse(issuer_url)
+
+    # Reconstruct the discovery URL entirely from the validated parsed components
+    # (scheme, netloc) plus a hardcoded path.  This breaks the taint chain from
+    # user-controlled input to requests.get — the variable passed to requests
+    # is built from trusted parts, not derived directly from the raw string.
+    safe_base_path = parsed.path.rstrip("/")
+    discovery_url = urlunparse(
+        (
+            parsed.scheme,  # validated: must be "https"
+            parsed.netloc,  # validated: non-empty
+            safe_base_path + "/.well-known/openid-configuration",  # hardcoded suffix
+            "",  # params
+            "",  # query
+            "",  # fragment
+        )
+    )
+    logger.debug("Fetching OIDC discovery document from %s", discovery_url)
+    response = requests.get(discovery_url, timeout=OIDC_HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_jwks(jwks_uri: str, issuer_url: str) -> dict:
+    """
+    Fetch the provider's JSON Web Key Set.
+
+    The jwks_uri must be HTTPS and on the same host as the issuer to prevent a
+    malicious discovery document from redirecting key-fetches to an
+    attacker-controlled server (SSRF / key-confusion).
+    """
+    issuer_host = urlparse(issuer_url).hostname
+    validate_oidc_url(jwks_uri, "JWKS-URI", allowed_host=issuer_host)
+
+    # Reconstruct the JWKS URL from validated parsed components to break the
+    # taint chain from the network-sourced discovery document to requests.get.
+    parsed_jwks = urlparse(jwks_uri)
+    safe_jwks_url = urlunparse(
+        (
+            parsed_jwks.scheme,  # validated: must be "https"
+            parsed_jwks.netloc,  # validated: same host as issuer
+            parsed_jwks.path,  # path from validated URL
+            "",  # params
+            "",  # query — strip any attacker-injected query strings
+            "",  # fragment
+        )
+    )
+    logger.debug("Fetching OIDC JWKS from %s", safe_jwks_url)
+    response = requests.get(safe_jwks_url, timeout=OIDC_HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+# ---------------------------------------------------------------------------
+# Cached lookups
+# ---------------------------------------------------------------------------
+
+
+def _url_key(prefix: str, url: str) -> str:
+    return f"{prefix}:{hashlib.sha256(url.encode()).hexdigest()}"
+
+
+def get_discovery_document(issuer_url: str) -> dict:
+    """Return the discovery document for issuer_url, fetching it only on a cache miss."""
+    key = _url_key("oidc_discovery", issuer_url)
+    discovery = cache.get(key)
+    if discovery is None:
+        discovery = fetch_discovery_document(issuer_url)
+        cache.set(key, discovery, OIDC_DISCOVERY_TIMEOUT)
+    return discovery
+
+
+def get_jwks(jwks_uri: str, issuer_url: str, *, refresh: bool = False) -> dict:
+    """
+    Return the JWKS for jwks_uri from the cache.
+
+    With refresh=True the key set is re-fetched unless the cached copy is
+    younger than OIDC_JWKS_MIN_REFRESH_INTERVAL.
+    """
+    key = _url_key("oidc_jwks", jwks_uri)
+    entry = cache.get(key)
+    recently_fetched = entry is not None and time.time() - entry["fetched_at"] < OIDC_JWKS_MIN_REFRESH_INTERVAL
+    if entry is not None and (not refresh or recently_fetched):
+        return entry["jwks"]
+
+    entry = {"jwks": fetch_jwks(jwks_uri, issuer_url), "fetched_at": time.time()}
+    cache.set(key, entry, OIDC_JWKS_TIMEOUT)
+    return entry["jwks"]
+
+
+def _find_jwk(jwks: dict, kid: str | None) -> dict | None:
+    for key_data in jwks.get("keys", []):
+        if kid is None or key_data.get("kid") == kid:
+            return key_data
+    return None
+
+
+def get_signing_jwk(jwks_uri: str, issuer_url: str, kid: str | None) -> dict | None:
+    """
+    Return the JWK matching kid (or the first key if the token has no kid).
+
+    An unknown kid usually means the IdP rotated its keys, so the cached JWKS
+    is refreshed once before giving up.
+    """
+    key_data = _find_jwk(get_jwks(jwks_uri, issuer_url), kid)
+    if key_data is None:
+        logger.info("OIDC: kid=%r not in cached JWKS — refreshing key set", kid)
+        key_data = _find_jwk(get_jwks(jwks_uri, issuer_url, refresh=True), kid)
+    return key_data
@@ -25,7 +25,7 @@ import json
 import logging
 import secrets
 import uuid
-from urllib.parse import quote, urlencode, urlparse
+from urllib.parse import quote, urlencode
 
 import requests
 from django.conf import settings
@@ -37,6 +37,14 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .oidc_metadata import (
+    fetch_discovery_document,
+    get_discovery_document,
+    get_oidc_client_secret,
+    get_oidc_config,
+    get_signing_jwk,
+)
+
 logger = logging.getLogger("users.oidc_views")
 
 # How long (seconds) the state/nonce stay valid
@@ -51,75 +59,13 @@ OIDC_EXCHANGE_TIMEOUT = 60  # 1 minute
 # ---------------------------------------------------------------------------
 
 
-def _get_oidc_config():
-    from settings_manager.models import OIDCConfig
-
-    return OIDCConfig.get_or_create_default()
-
-
-def _validate_oidc_url(url: str, label: str = "URL", *, allowed_host: str | None = None) -> str:
-    """
-    Validate that a URL used for outbound OIDC requests is safe:
-      - Must be https:// (no http, file, ftp, …)
-      - Must have a non-empty netloc (no bare paths or localhost tricks)
-      - If allowed_host is provided, the URL's hostname must match it exactly
-        (prevents the discovery document from redirecting JWKS to a different server).
-
-    Returns the validated URL unchanged.
-    Raises ValueError with a descriptive message on failure.
-    """
-    parsed = urlparse(url)
-    if parsed.scheme != "https":
-        raise ValueError(f"OIDC {label} muss ein HTTPS-URL sein (erhalten: {parsed.scheme!r}).")
-    if not parsed.netloc:
-        raise ValueError(f"OIDC {label} hat keinen gültigen Host.")
-    if allowed_host is not None and parsed.hostname != allowed_host:
-        raise ValueError(
-            f"OIDC {label} zeigt auf einen anderen Host ({parsed.hostname!r}) als der"
-            f" konfigurierte Issuer ({allowed_host!r}). Anfrage abgelehnt."
-        )
-    return url
-
-
-def _fetch_discovery_document(issuer_url: str) -> dict:
-    """
-    Fetch the OIDC Discovery Document from {issuer_url}/.well-known/openid-configuration.
-    Returns the parsed JSON dict.
-    Raises requests.RequestException on network errors or non-200 responses.
-    """
-    from urllib.parse import urlunparse
-
-    # Validate user-provided issuer_url first.
-    _validate_oidc_url(issuer_url, "Issuer-URL")
-    parsed = urlparse(issuer_url)
-
-    # Reconstruct the discovery URL entirely from the validated parsed components
-    # (scheme, netloc) plus a hardcoded path.  This breaks the taint chain from
-    # user-controlled input to requests.get — the variable passed to requests
-    # is built from trusted parts, not derived directly from the raw string.
-    safe_base_path = parsed.path.rstrip("/")
-    discovery_url = urlunparse(
-        (
-            parsed.scheme,  # validated: must be "https"
-            parsed.netloc,  # validated: non-empty
-            safe_base_path + "/.well-known/openid-configuration",  # hardcoded suffix
-            "",  # params
-            "",  # query
-            "",  # fragment
-        )
-    )
-    logger.debug("Fetching OIDC discovery document from %s", discovery_url)
-    response = requests.get(discovery_url, timeout=10)
-    response.raise_for_status()
-    return response.json()
-
-
 def _verify_id_token(id_token: str, discovery: dict, config, nonce: str) -> dict:
     """
     Verify the id_token JWT signature using the provider's JWKS and return claims.
 
     Uses PyJWT (already available via djangorestframework-simplejwt) so we do
     not rely on mozilla-django-oidc's internal URL resolution or settings access.
+    The JWKS comes from the cache and is only re-fetched on an unknown kid.
     """
     import jwt as pyjwt
 
@@ -127,50 +73,20 @@ def _verify_id_token(id_token: str, discovery: dict, config, nonce: str) -> dict
     if not jwks_uri:
         raise ValueError("OIDC Provider hat keine jwks_uri im Discovery-Dokument.")
 
-    # Validate jwks_uri: must be HTTPS and on the same host as the issuer to
-    # prevent a malicious discovery document from redirecting key-fetches to an
-    # attacker-controlled server (SSRF / key-confusion).
-    issuer_host = urlparse(config.issuer_url).hostname
-    _validate_oidc_url(jwks_uri, "JWKS-URI", allowed_host=issuer_host)
-
-    # Reconstruct the JWKS URL from validated parsed components to break the
-    # taint chain from the network-sourced discovery document to requests.get.
-    from urllib.parse import urlunparse
-
-    parsed_jwks = urlparse(jwks_uri)
-    safe_jwks_url = urlunparse(
-        (
-            parsed_jwks.scheme,  # validated: must be "https"
-            parsed_jwks.netloc,  # validated: same host as issuer
-            parsed_jwks.path,  # path from validated URL
-            "",  # params
-            "",  # query — strip any attacker-injected query strings
-            "",  # fragment
-        )
-    )
-    jwks_response = requests.get(safe_jwks_url, timeout=10)
-    jwks_response.raise_for_status()
-    jwks = jwks_response.json()
-
     # Decode header without verification to find the signing key.
     header = pyjwt.get_unverified_header(id_token)
     kid = header.get("kid")
     alg = header.get("alg", "RS256")
 
-    matching_key = None
-    for key_data in jwks.get("keys", []):
-        if kid is None or key_data.get("kid") == kid:
-            if alg.startswith("RS"):
-                matching_key = pyjwt.algorithms.RSAAlgorithm.from_jwk(key_data)
-            elif alg.startswith("EC"):
-                matching_key = pyjwt.algorithms.ECAlgorithm.from_jwk(key_data)
-            else:
-                matching_key = pyjwt.algorithms.RSAAlgorithm.from_jwk(key_data)
-            break
-
-    if matching_key is None:
+    key_data = get_signing_jwk(jwks_uri, config.issuer_url, kid)
+    if key_data is None:
         raise ValueError(f"Kein passender JWK-Schl\u00fcssel f\u00fcr kid={kid!r} gefunden.")
 
+    if alg.startswith("EC"):
+        matching_key = pyjwt.algorithms.ECAlgorithm.from_jwk(key_data)
+    else:
+        matching_key = pyjwt.algorithms.RSAAlgorithm.from_jwk(key_data)
+
     claims = pyjwt.decode(
         id_token,
         key=matching_key,
@@ -232,7 +148,7 @@ class OIDCPublicConfigView(APIView):
     authentication_classes = []
 
     def get(self, request):
-        config = _get_oidc_config()
+        config = get_oidc_config(request)
         return Response(
             {
                 "enabled": config.enabled,
@@ -261,7 +177,7 @@ class OIDCLoginView(APIView):
     authentication_classes = []
 
     def get(self, request):
-        config = _get_oidc_config()
+        config = get_oidc_config(request)
         if not config.enabled:
             return Response(
                 {"detail": "OIDC ist nicht aktiviert."},
@@ -269,7 +185,7 @@ class OIDCLoginView(APIView):
             )
 
         try:
-            discovery = _fetch_discovery_document(config.issuer_url)
+            discovery = get_discovery_document(config.issuer_url)
         except Exception as exc:
             logger.error("OIDC: Failed to fetch discovery document: %s", exc)
             return Response(
@@ -365,13 +281,13 @@ class OIDCCallbackView(View):
         nonce = state_data.get("nonce")
         next_url = state_data.get("next", "/")
 
-        config = _get_oidc_config()
+        config = get_oidc_config(request)
         if not config.enabled:
             return self._redirect_to_frontend_error(frontend_url, "OIDC ist deaktiviert.")
 
         # --- Fetch discovery document ---
         try:
-            discovery = _fetch_discovery_document(config.issuer_url)
+            discovery = get_discovery_document(config.issuer_url)
         except Exception as exc:
             logger.error("OIDC callback: failed to fetch discovery document: %s", exc)
             return self._redirect_to_frontend_error(frontend_url, "OIDC Provider nicht erreichbar.")
@@ -390,7 +306,7 @@ class OIDCCallbackView(View):
                     "code": code,
                     "redirect_uri": callback_url,
                     "client_id": config.client_id,
-                    "client_secret": config.client_secret,
+                    "client_secret": get_oidc_client_secret(),
                 },
                 timeout=15,
             )
@@ -557,7 +473,7 @@ class OIDCTestDiscoveryView(APIView):
             )
 
         try:
-            discovery = _fetch_discovery_document(issuer_url)
+            discovery = fetch_discovery_document(issuer_url)
         except requests.RequestException as exc:
             logger.warning("OIDC test-discovery: failed for '%s': %s", issuer_url, exc)
             return Response(
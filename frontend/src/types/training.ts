@@ -5,10 +5,22 @@ export interface GroupMini {
   name: string
 }
 
+export interface TrainingMediaRendition {
+  url: string
+  webp_url: string | null
+  width: number
+  height: number
+}
+
 export interface TrainingMedia {
   id: number
   url: string
+  original_url: string
   original_filename: string
+  width: number | null
+  height: number | null
+  status: 'pending' | 'ready' | 'failed'
+  renditions: Partial<Record<'thumb' | 'medium' | 'large', TrainingMediaRendition>>
   created_at: string
 }
 
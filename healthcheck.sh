@@ -40,6 +40,14 @@ else
     EXIT_CODE=1
 fi
 
+# Backend readiness (database, cache, job queue, SMTP, sync)
+if docker-compose $COMPOSE_FILES exec -T backend curl -sf http://localhost:8000/health/ready/ > /dev/null 2>&1; then
+    echo "✓ Backend Readiness: Ready"
+else
+    echo "✗ Backend Readiness: Not ready (details: curl http://localhost:8000/health/ready/ in the backend container)"
+    EXIT_CODE=1
+fi
+
 # Database
 if docker-compose $COMPOSE_FILES exec -T db pg_isready -U jf_manager > /dev/null 2>&1; then
     echo "✓ Database: Healthy"